@@ -4,7 +4,7 @@ This module provides standardized error codes and other constants used across
 all SDK endpoints.
 """
 
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 # ---------------------------------------------------------------------------
 # HTTP status code constants
@@ -13,6 +13,9 @@ from typing import List
 # Successful response
 HTTP_OK: str = "200"
 
+# Conditional request matched the cached representation
+HTTP_NOT_MODIFIED: int = 304
+
 # Prefix used to identify client error status codes (4xx)
 CLIENT_ERROR_PREFIX: str = "4"
 
@@ -57,3 +60,54 @@ NGS_ERROR_CODES: List[str] = ["400", "401", "403", "404", "4XX", "500", "5XX"]
 # Error codes for parameterless endpoints (no query/path params to validate)
 # Excludes 400 (no params to be invalid) and 403/404
 PARAMETERLESS_ERROR_CODES: List[str] = ["401", "4XX", "500", "5XX"]
+
+# ---------------------------------------------------------------------------
+# Response cache TTL policies (seconds; None = never expires, 0 = never cached)
+# ---------------------------------------------------------------------------
+
+# Default per-operation TTLs applied by griddy.core.cache.ResponseCache.
+# Live scoreboards and in-game stats change every few seconds; historical
+# game stats are immutable once a game is final.
+DEFAULT_CACHE_TTL_POLICIES: Dict[str, Optional[float]] = {
+    "getLive*": 5,
+    "getNgsLiveScores": 5,
+    "getHistorical*": None,
+}
+
+# Default per-path TTLs applied by griddy.core.pagecache.PageCache to
+# scraped pages. A box score never changes once the game is final; pages of
+# past seasons are frozen by the season rule rather than listed here.
+DEFAULT_PAGE_CACHE_TTL_RULES: Dict[str, Optional[float]] = {
+    "/boxscores/*.htm": None,
+}
+
+# TTL of scraped pages that no rule freezes, such as current-season pages
+DEFAULT_PAGE_CACHE_TTL: float = 3600.0
+
+# Size cap of the on-disk page cache (compressed bytes)
+DEFAULT_PAGE_CACHE_MAX_BYTES: int = 512 * 1024 * 1024
+
+# ---------------------------------------------------------------------------
+# Batch fan-out
+# ---------------------------------------------------------------------------
+
+# Maximum number of in-flight requests for BaseGriddySDK.gather()
+DEFAULT_BATCH_CONCURRENCY: int = 10
+
+# Pages kept in flight by the generated iter_*/aiter_* pagination helpers
+DEFAULT_PAGINATION_PREFETCH: int = 4
+
+# Status codes whose Retry-After header overrides the computed backoff delay
+RETRY_AFTER_STATUS_CODES: Tuple[int, ...] = (429, 503)
+
+# ---------------------------------------------------------------------------
+# HTTP connection pooling
+# ---------------------------------------------------------------------------
+
+# Pool limits for the clients BaseGriddySDK creates (see HttpOptions)
+DEFAULT_MAX_CONNECTIONS: int = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS: int = 50
+DEFAULT_KEEPALIVE_EXPIRY: float = 30.0
+
+# Preferred order of content codings advertised in Accept-Encoding
+PREFERRED_CONTENT_ENCODINGS: Tuple[str, ...] = ("br", "zstd", "gzip", "deflate")
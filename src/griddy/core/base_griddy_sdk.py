@@ -9,11 +9,12 @@ import asyncio
 import warnings
 from abc import abstractmethod
 from types import TracebackType
-from typing import Any, Dict, Optional
-
-import httpx
+from typing import Any, Dict, Iterable, List, Optional
 
+from griddy.core._constants import DEFAULT_BATCH_CONCURRENCY
+from griddy.core.batch import BatchItem, gather_async
 from griddy.core.httpclient import AsyncHttpClient, HttpClient
+from griddy.core.transport import ConnectionPool, HttpOptions
 from griddy.core.types import UNSET, OptionalNullable
 from griddy.core.utils.logger import Logger, get_default_logger
 from griddy.core.utils.retries import RetryConfig
@@ -67,14 +68,31 @@ class BaseGriddySDK:
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        http_options: Optional[HttpOptions] = None,
+        connection_pool: Optional[ConnectionPool] = None,
         **extra_config: Any,
     ) -> None:
-        """Shared init logic for all top-level SDKs."""
+        """Shared init logic for all top-level SDKs.
+
+        Clients not supplied by the caller are built from *connection_pool*
+        (sharing its transports) or else from *http_options*.
+        """
 
         # 1. HTTP client creation + validation
+        if http_options is not None and connection_pool is not None:
+            raise ValueError(
+                "Pass either http_options or connection_pool, not both; "
+                "a ConnectionPool carries its own HttpOptions."
+            )
+        if http_options is None:
+            http_options = HttpOptions()
+
         client_supplied = True
         if client is None:
-            client = httpx.Client(follow_redirects=True)
+            if connection_pool is not None:
+                client = connection_pool.create_client()
+            else:
+                client = http_options.create_client()
             client_supplied = False
 
         if not issubclass(type(client), HttpClient):
@@ -84,7 +102,10 @@ class BaseGriddySDK:
 
         async_client_supplied = True
         if async_client is None:
-            async_client = httpx.AsyncClient(follow_redirects=True)
+            if connection_pool is not None:
+                async_client = connection_pool.create_async_client()
+            else:
+                async_client = http_options.create_async_client()
             async_client_supplied = False
 
         if not issubclass(type(async_client), AsyncHttpClient):
@@ -125,6 +146,69 @@ class BaseGriddySDK:
         self.sdk_configuration._hooks = hooks
         self.sdk_configuration = hooks.sdk_init(self.sdk_configuration)
 
+    # ------------------------------------------------------------------
+    # Batch fan-out
+    # ------------------------------------------------------------------
+
+    async def gather_async(
+        self,
+        calls: Iterable[BatchItem],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: bool = True,
+    ) -> List[Any]:
+        """Run many endpoint calls concurrently, preserving input order.
+
+        Args:
+            calls: Items built with :func:`griddy.core.batch.call`, un-awaited
+                coroutines, or zero-argument callables returning awaitables.
+            concurrency: Maximum number of calls in flight at once.
+            return_exceptions: Put a failing call's exception in its result
+                slot (default) instead of cancelling the batch and raising.
+
+        Returns:
+            One result (or exception) per call, in input order.
+        """
+        return await gather_async(
+            calls, concurrency=concurrency, return_exceptions=return_exceptions
+        )
+
+    def gather(
+        self,
+        calls: Iterable[BatchItem],
+        *,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        return_exceptions: bool = True,
+    ) -> List[Any]:
+        """Synchronous facade over :meth:`gather_async`.
+
+        The batch runs on an event loop owned by this SDK instance, which is
+        reused across calls so the async client's pooled connections stay
+        valid. It is closed by :meth:`close`.
+
+        Raises:
+            RuntimeError: If called while an event loop is already running in
+                this thread; ``await gather_async(...)`` instead.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            raise RuntimeError(
+                "gather() cannot be called from a running event loop; "
+                "use 'await gather_async(...)' instead."
+            )
+
+        loop = getattr(self, "_batch_loop", None)
+        if loop is None or loop.is_closed():
+            loop = self._batch_loop = asyncio.new_event_loop()
+        return loop.run_until_complete(
+            self.gather_async(
+                calls, concurrency=concurrency, return_exceptions=return_exceptions
+            )
+        )
+
     # ------------------------------------------------------------------
     # Context managers
     # ------------------------------------------------------------------
@@ -170,22 +254,32 @@ class BaseGriddySDK:
 
         # Best-effort cleanup of the async client so that a single
         # ``close()`` or sync context-manager exit silences __del__.
+        batch_loop = getattr(self, "_batch_loop", None)
         if (
             self.sdk_configuration.async_client is not None
             and not self.sdk_configuration.async_client_supplied
         ):
-            try:
-                loop = asyncio.get_running_loop()
-                asyncio.run_coroutine_threadsafe(
-                    self.sdk_configuration.async_client.aclose(), loop
+            if batch_loop is not None and not batch_loop.is_closed():
+                # Connections opened by gather() belong to the batch loop.
+                batch_loop.run_until_complete(
+                    self.sdk_configuration.async_client.aclose()
                 )
-            except RuntimeError:
+            else:
                 try:
-                    asyncio.run(self.sdk_configuration.async_client.aclose())
+                    loop = asyncio.get_running_loop()
+                    asyncio.run_coroutine_threadsafe(
+                        self.sdk_configuration.async_client.aclose(), loop
+                    )
                 except RuntimeError:
-                    pass  # best effort
+                    try:
+                        asyncio.run(self.sdk_configuration.async_client.aclose())
+                    except RuntimeError:
+                        pass  # best effort
         self.sdk_configuration.async_client = None
 
+        if batch_loop is not None and not batch_loop.is_closed():
+            batch_loop.close()
+
     async def aclose(self) -> None:
         """Close all SDK-owned HTTP clients (async entry-point)."""
         if (
@@ -202,6 +296,10 @@ class BaseGriddySDK:
             await self.sdk_configuration.async_client.aclose()
         self.sdk_configuration.async_client = None
 
+        batch_loop = getattr(self, "_batch_loop", None)
+        if batch_loop is not None and not batch_loop.is_closed():
+            batch_loop.close()
+
     # ------------------------------------------------------------------
     # ResourceWarning on garbage collection
     # ------------------------------------------------------------------
@@ -1,5 +1,6 @@
 """Base SDK class and endpoint configuration dataclasses used by all SDK endpoints."""
 
+import inspect
 from dataclasses import dataclass, field
 from typing import (
     Any,
@@ -21,6 +22,7 @@ from griddy.core import utils
 from griddy.core._constants import (
     CLIENT_ERROR_PREFIX,
     DEFAULT_RETRY_STATUS_CODES,
+    HTTP_NOT_MODIFIED,
     HTTP_OK,
     SERVER_ERROR_PREFIX,
 )
@@ -30,6 +32,7 @@ from griddy.core.hooks import (
     BeforeRequestContext,
 )
 from griddy.core.hooks.types import HookContext
+from griddy.core.jsoncodec import get_json_codec
 from griddy.core.types import UNSET, OptionalNullable
 from griddy.core.utils import RetryConfig, SerializedRequestBody, get_body_content
 from griddy.core.utils.unmarshal_json_response import unmarshal_json_response
@@ -296,11 +299,128 @@ class BaseSDK(Generic[T_Config]):
             http_res, error_status_codes, lambda _: http_res_text
         )
 
+    def _response_cache_key(
+        self, config: EndpointConfig, base_url: str
+    ) -> Optional[str]:
+        """Return the response-cache key for *config*, or ``None`` if uncached.
+
+        Only ``GET`` endpoints are cached, and only when a ``ResponseCache``
+        is configured and the operation's TTL policy is not ``0``.
+        """
+        cache = self.sdk_configuration.response_cache
+        if cache is None or config.method.upper() != "GET":
+            return None
+        if not cache.is_cacheable(config.operation_id):
+            return None
+        return cache.make_key(
+            config.operation_id, config.request, base_url, config.return_raw_json
+        )
+
+    def _decode_raw_json(self, body: bytes) -> Any:
+        """Decode *body* with the configured JSON codec, without validation."""
+        return get_json_codec(self.sdk_configuration.json_codec).loads(body)
+
+    def _decode_cached_body(self, config: EndpointConfig, body: bytes) -> Any:
+        """Decode a raw JSON body from the disk cache tier into a result."""
+        if config.return_raw_json:
+            return self._decode_raw_json(body)
+        return utils.unmarshal_json(body, config.response_type)
+
+    def _get_cached_response(
+        self, config: EndpointConfig, key: str
+    ) -> Tuple[bool, Any]:
+        """Look *key* up in the configured response cache."""
+        return self.sdk_configuration.response_cache.get(
+            key, lambda body: self._decode_cached_body(config, body)
+        )
+
+    def _add_conditional_headers(
+        self, req: httpx.Request, key: Optional[str]
+    ) -> Dict[str, str]:
+        """Attach ``If-None-Match`` / ``If-Modified-Since`` for a cached entry."""
+        if key is None:
+            return {}
+        validators = self.sdk_configuration.response_cache.conditional_headers(key)
+        for header, value in validators.items():
+            req.headers[header] = value
+        return validators
+
+    def _resolve_not_modified(
+        self, config: EndpointConfig, key: str, http_res: httpx.Response
+    ) -> Tuple[bool, Any]:
+        """Turn a ``304 Not Modified`` into the cached result for *key*."""
+        return self.sdk_configuration.response_cache.revalidated(
+            key,
+            config.operation_id,
+            lambda body: self._decode_cached_body(config, body),
+            http_res.headers,
+        )
+
+    def _store_cached_response(
+        self, config: EndpointConfig, key: str, result: Any, http_res: httpx.Response
+    ) -> None:
+        """Store a freshly fetched result and its validators in the cache."""
+        self.sdk_configuration.response_cache.set(
+            key, config.operation_id, result, http_res.content, http_res.headers
+        )
+
+    def _response_memo_key(
+        self, config: EndpointConfig, base_url: str
+    ) -> Optional[str]:
+        """Return the response-memo key for *config*, or ``None``.
+
+        Only ``GET`` endpoints are memoized, and only when a ``ResponseMemo``
+        is configured and covers the operation.
+        """
+        memo = self.sdk_configuration.response_memo
+        if memo is None or config.method.upper() != "GET":
+            return None
+        if not memo.applies_to(config.operation_id):
+            return None
+        return memo.make_key(config.operation_id, config.request, base_url)
+
+    def _coalesce_key(self, config: EndpointConfig, base_url: str) -> Optional[str]:
+        """Return the in-flight coalescing key for *config*, or ``None``.
+
+        Only ``GET`` endpoints are coalesced, and only when a
+        ``RequestCoalescer`` is configured.
+        """
+        if self.sdk_configuration.request_coalescer is None:
+            return None
+        if config.method.upper() != "GET":
+            return None
+        return self.sdk_configuration.request_coalescer.make_key(
+            config.operation_id,
+            config.request,
+            base_url,
+            config.http_headers,
+            config.return_raw_json,
+        )
+
     def _execute_endpoint(self, config: EndpointConfig) -> T:
-        """Execute a sync API request using the given endpoint configuration."""
+        """Execute a sync API request using the given endpoint configuration.
+
+        Identical concurrent calls share one upstream request when a
+        ``request_coalescer`` is configured.
+        """
         base_url = self._resolve_base_url(config.server_url)
+        key = self._coalesce_key(config, base_url)
+        if key is None:
+            return self._fetch_endpoint(config, base_url)
+        return self.sdk_configuration.request_coalescer.run(
+            key, lambda: self._fetch_endpoint(config, base_url)
+        )
+
+    def _fetch_endpoint(self, config: EndpointConfig, base_url: str) -> T:
+        """Serve *config* from the cache or the network (sync)."""
         timeout_ms = self._resolve_timeout(config.timeout_ms)
 
+        cache_key = self._response_cache_key(config, base_url)
+        if cache_key is not None:
+            hit, cached = self._get_cached_response(config, cache_key)
+            if hit:
+                return cached
+
         req = self._build_request(
             method=config.method,
             path=config.path,
@@ -318,27 +438,79 @@ class BaseSDK(Generic[T_Config]):
             get_serialized_body=config.get_serialized_body,
         )
 
+        validators = self._add_conditional_headers(req, cache_key)
+
         retry_config = self._resolve_retry_config(config.retries)
+        hook_ctx = self._create_hook_context(config.operation_id, base_url)
         http_res = self.do_request(
-            hook_ctx=self._create_hook_context(config.operation_id, base_url),
+            hook_ctx=hook_ctx,
             request=req,
             error_status_codes=config.error_status_codes,
             retry_config=retry_config,
         )
 
-        if config.return_raw_json:
-            if utils.match_response(http_res, HTTP_OK, "application/json"):
-                return http_res.json()
+        if cache_key is not None and http_res.status_code == HTTP_NOT_MODIFIED:
+            found, cached = self._resolve_not_modified(config, cache_key, http_res)
+            if found:
+                return cached
+            # The entry was evicted mid-flight; fetch the full body instead.
+            for header in validators:
+                del req.headers[header]
+            http_res = self.do_request(
+                hook_ctx=hook_ctx,
+                request=req,
+                error_status_codes=config.error_status_codes,
+                retry_config=retry_config,
+            )
 
-        return self._handle_json_response(
-            http_res, config.response_type, config.error_status_codes
-        )
+        memo_key = self._response_memo_key(config, base_url)
+        if config.return_raw_json and utils.match_response(
+            http_res, HTTP_OK, "application/json"
+        ):
+            result = self._decode_raw_json(http_res.content)
+        elif memo_key is not None and utils.match_response(
+            http_res, HTTP_OK, "application/json"
+        ):
+            result = self.sdk_configuration.response_memo.decode(
+                memo_key,
+                http_res.content,
+                lambda: self._handle_json_response(
+                    http_res, config.response_type, config.error_status_codes
+                ),
+            )
+        else:
+            result = self._handle_json_response(
+                http_res, config.response_type, config.error_status_codes
+            )
+
+        if cache_key is not None:
+            self._store_cached_response(config, cache_key, result, http_res)
+        return result
 
     async def _execute_endpoint_async(self, config: EndpointConfig) -> T:
-        """Execute an async API request using the given endpoint configuration."""
+        """Execute an async API request using the given endpoint configuration.
+
+        Identical concurrent calls share one upstream request when a
+        ``request_coalescer`` is configured.
+        """
         base_url = self._resolve_base_url(config.server_url)
+        key = self._coalesce_key(config, base_url)
+        if key is None:
+            return await self._fetch_endpoint_async(config, base_url)
+        return await self.sdk_configuration.request_coalescer.run_async(
+            key, lambda: self._fetch_endpoint_async(config, base_url)
+        )
+
+    async def _fetch_endpoint_async(self, config: EndpointConfig, base_url: str) -> T:
+        """Serve *config* from the cache or the network (async)."""
         timeout_ms = self._resolve_timeout(config.timeout_ms)
 
+        cache_key = self._response_cache_key(config, base_url)
+        if cache_key is not None:
+            hit, cached = self._get_cached_response(config, cache_key)
+            if hit:
+                return cached
+
         req = self._build_request_async(
             method=config.method,
             path=config.path,
@@ -356,21 +528,112 @@ class BaseSDK(Generic[T_Config]):
             get_serialized_body=config.get_serialized_body,
         )
 
+        validators = self._add_conditional_headers(req, cache_key)
+
         retry_config = self._resolve_retry_config(config.retries)
+        hook_ctx = self._create_hook_context(config.operation_id, base_url)
 
         http_res = await self.do_request_async(
-            hook_ctx=self._create_hook_context(config.operation_id, base_url),
+            hook_ctx=hook_ctx,
             request=req,
             error_status_codes=config.error_status_codes,
             retry_config=retry_config,
         )
 
-        if config.return_raw_json:
-            if utils.match_response(http_res, HTTP_OK, "application/json"):
-                return http_res.json()
+        if cache_key is not None and http_res.status_code == HTTP_NOT_MODIFIED:
+            found, cached = self._resolve_not_modified(config, cache_key, http_res)
+            if found:
+                return cached
+            # The entry was evicted mid-flight; fetch the full body instead.
+            for header in validators:
+                del req.headers[header]
+            http_res = await self.do_request_async(
+                hook_ctx=hook_ctx,
+                request=req,
+                error_status_codes=config.error_status_codes,
+                retry_config=retry_config,
+            )
+
+        memo_key = self._response_memo_key(config, base_url)
+        if config.return_raw_json and utils.match_response(
+            http_res, HTTP_OK, "application/json"
+        ):
+            result = self._decode_raw_json(http_res.content)
+        elif memo_key is not None and utils.match_response(
+            http_res, HTTP_OK, "application/json"
+        ):
+            result = self.sdk_configuration.response_memo.decode(
+                memo_key,
+                http_res.content,
+                lambda: self._handle_json_response(
+                    http_res, config.response_type, config.error_status_codes
+                ),
+            )
+        else:
+            result = await self._handle_json_response_async(
+                http_res, config.response_type, config.error_status_codes
+            )
+
+        if cache_key is not None:
+            self._store_cached_response(config, cache_key, result, http_res)
+        return result
+
+    def _open_stream(self, config: EndpointConfig) -> httpx.Response:
+        """Send *config*'s request and return the response with its body unread.
+
+        The response cache, memo and coalescer are bypassed; the caller reads
+        the body with ``iter_bytes()`` and must close the response.
+        """
+        base_url = self._resolve_base_url(config.server_url)
+        req = self._build_request(
+            method=config.method,
+            path=config.path,
+            base_url=base_url,
+            url_variables=None,
+            request=config.request,
+            request_body_required=config.request_body_required,
+            request_has_path_params=config.request_has_path_params,
+            request_has_query_params=config.request_has_query_params,
+            user_agent_header=config.user_agent_header,
+            accept_header_value=config.accept_header_value,
+            http_headers=config.http_headers,
+            security=self.sdk_configuration.security,
+            timeout_ms=self._resolve_timeout(config.timeout_ms),
+            get_serialized_body=config.get_serialized_body,
+        )
+        return self.do_request(
+            hook_ctx=self._create_hook_context(config.operation_id, base_url),
+            request=req,
+            error_status_codes=config.error_status_codes,
+            stream=True,
+            retry_config=self._resolve_retry_config(config.retries),
+        )
 
-        return await self._handle_json_response_async(
-            http_res, config.response_type, config.error_status_codes
+    async def _open_stream_async(self, config: EndpointConfig) -> httpx.Response:
+        """Async variant of :meth:`_open_stream`; read with ``aiter_bytes()``."""
+        base_url = self._resolve_base_url(config.server_url)
+        req = self._build_request_async(
+            method=config.method,
+            path=config.path,
+            base_url=base_url,
+            url_variables=None,
+            request=config.request,
+            request_body_required=config.request_body_required,
+            request_has_path_params=config.request_has_path_params,
+            request_has_query_params=config.request_has_query_params,
+            user_agent_header=config.user_agent_header,
+            accept_header_value=config.accept_header_value,
+            http_headers=config.http_headers,
+            security=self.sdk_configuration.security,
+            timeout_ms=self._resolve_timeout(config.timeout_ms),
+            get_serialized_body=config.get_serialized_body,
+        )
+        return await self.do_request_async(
+            hook_ctx=self._create_hook_context(config.operation_id, base_url),
+            request=req,
+            error_status_codes=config.error_status_codes,
+            stream=True,
+            retry_config=self._resolve_retry_config(config.retries),
         )
 
     def _build_request_async(
@@ -604,7 +867,10 @@ class BaseSDK(Generic[T_Config]):
         via the sync client, error handling with ``after_error`` hook, and
         finally the ``after_success`` hook. When ``retry_config`` is provided,
         the entire pipeline is wrapped in a retry loop that re-attempts on
-        matching status codes.
+        matching status codes, honouring ``Retry-After`` and the SDK's
+        ``retry_budget``. When the configuration carries a ``rate_limiter``,
+        every attempt waits for a token for the request's host before it is
+        sent.
 
         Args:
             hook_ctx: ``HookContext`` passed to each lifecycle hook, carrying
@@ -627,6 +893,7 @@ class BaseSDK(Generic[T_Config]):
         """
         client = self.sdk_configuration.client
         logger = self.sdk_configuration.debug_logger
+        rate_limiter = self.sdk_configuration.rate_limiter
 
         hooks = self.sdk_configuration.hooks
 
@@ -645,6 +912,9 @@ class BaseSDK(Generic[T_Config]):
                 if client is None:
                     raise ValueError("client is required")
 
+                if rate_limiter is not None:
+                    rate_limiter.acquire(req.url.host)
+
                 http_res = client.send(req, stream=stream)
             except Exception as e:
                 original_error = e
@@ -673,6 +943,9 @@ class BaseSDK(Generic[T_Config]):
             )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
+                if stream:
+                    # Error bodies are small; read them for hooks and errors.
+                    http_res.read()
                 result, err = hooks.after_error(
                     AfterErrorContext(hook_ctx), http_res, None
                 )
@@ -688,7 +961,14 @@ class BaseSDK(Generic[T_Config]):
             return http_res
 
         if retry_config is not None:
-            http_res = utils.retry(do, utils.Retries(retry_config[0], retry_config[1]))
+            http_res = utils.retry(
+                do,
+                utils.Retries(
+                    retry_config[0],
+                    retry_config[1],
+                    self.sdk_configuration.retry_budget,
+                ),
+            )
         else:
             http_res = do()
 
@@ -709,17 +989,23 @@ class BaseSDK(Generic[T_Config]):
 
         Runs the same hook lifecycle (``before_request`` → send →
         ``after_error`` / ``after_success``) using the async HTTP client.
+        Hooks are dispatched through their ``*_async`` variants, so hooks
+        implementing the async hook protocols are awaited instead of blocking
+        the event loop.
         See :meth:`do_request` for full parameter and behaviour details.
         """
         client = self.sdk_configuration.async_client
         logger = self.sdk_configuration.debug_logger
+        rate_limiter = self.sdk_configuration.rate_limiter
 
         hooks = self.sdk_configuration.hooks
 
         async def do():
             http_res = None
             try:
-                req = hooks.before_request(BeforeRequestContext(hook_ctx), request)
+                req = await _call_hook_async(
+                    hooks, "before_request", BeforeRequestContext(hook_ctx), request
+                )
                 logger.debug(
                     "Request:\nMethod: %s\nURL: %s\nHeaders: %s\nBody: %s",
                     req.method,
@@ -731,10 +1017,15 @@ class BaseSDK(Generic[T_Config]):
                 if client is None:
                     raise ValueError("client is required")
 
+                if rate_limiter is not None:
+                    await rate_limiter.acquire_async(req.url.host)
+
                 http_res = await client.send(req, stream=stream)
             except Exception as e:
                 original_error = e
-                _, e = hooks.after_error(AfterErrorContext(hook_ctx), None, e)
+                _, e = await _call_hook_async(
+                    hooks, "after_error", AfterErrorContext(hook_ctx), None, e
+                )
                 if e is not None:
                     logger.debug("Request Exception", exc_info=True)
                     raise e
@@ -759,8 +1050,10 @@ class BaseSDK(Generic[T_Config]):
             )
 
             if utils.match_status_codes(error_status_codes, http_res.status_code):
-                result, err = hooks.after_error(
-                    AfterErrorContext(hook_ctx), http_res, None
+                if stream:
+                    await http_res.aread()
+                result, err = await _call_hook_async(
+                    hooks, "after_error", AfterErrorContext(hook_ctx), http_res, None
                 )
                 if err is not None:
                     logger.debug("Request Exception", exc_info=True)
@@ -775,12 +1068,31 @@ class BaseSDK(Generic[T_Config]):
 
         if retry_config is not None:
             http_res = await utils.retry_async(
-                do, utils.Retries(retry_config[0], retry_config[1])
+                do,
+                utils.Retries(
+                    retry_config[0],
+                    retry_config[1],
+                    self.sdk_configuration.retry_budget,
+                ),
             )
         else:
             http_res = await do()
 
         if not utils.match_status_codes(error_status_codes, http_res.status_code):
-            http_res = hooks.after_success(AfterSuccessContext(hook_ctx), http_res)
+            http_res = await _call_hook_async(
+                hooks, "after_success", AfterSuccessContext(hook_ctx), http_res
+            )
 
         return http_res
+
+
+async def _call_hook_async(hooks: Any, name: str, *args: Any) -> Any:
+    """Await ``hooks.<name>_async`` when available, else call ``hooks.<name>``.
+
+    Keeps custom hook dispatchers that only implement the sync interface
+    working on the async request path.
+    """
+    async_fn = getattr(hooks, f"{name}_async", None)
+    if inspect.iscoroutinefunction(async_fn):
+        return await async_fn(*args)
+    return getattr(hooks, name)(*args)
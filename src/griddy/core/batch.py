@@ -0,0 +1,146 @@
+"""Concurrent fan-out of many independent endpoint calls.
+
+A batch is a sequence of endpoint invocations that are executed on the
+SDK's async path with at most ``concurrency`` requests in flight. Results
+come back in input order; by default a failing call yields its exception
+in place of a result instead of aborting the whole batch.
+
+Example:
+    >>> from griddy.core.batch import call
+    >>> box_scores = nfl.gather(
+    ...     [call(nfl.games.get_box_score, game_id=g) for g in game_ids],
+    ...     concurrency=8,
+    ... )
+"""
+
+import asyncio
+import inspect
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Tuple, Union
+
+from griddy.core._constants import DEFAULT_BATCH_CONCURRENCY
+
+
+@dataclass(frozen=True)
+class BatchCall:
+    """A deferred endpoint invocation.
+
+    ``func`` is always a coroutine function; it is only called when a
+    worker picks the item up, so no request starts before a concurrency
+    slot is free.
+    """
+
+    func: Callable[..., Awaitable[Any]]
+    args: Tuple[Any, ...] = ()
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+    def start(self) -> Awaitable[Any]:
+        """Invoke the endpoint and return its awaitable."""
+        return self.func(*self.args, **self.kwargs)
+
+
+BatchItem = Union[BatchCall, Awaitable[Any], Callable[[], Awaitable[Any]]]
+
+
+def call(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> BatchCall:
+    """Describe one endpoint invocation for :meth:`gather`.
+
+    Either flavour of a generated endpoint may be passed: a sync endpoint
+    such as ``nfl.games.get_box_score`` is swapped for its ``_async`` twin
+    so the request runs through ``do_request_async``.
+
+    Args:
+        func: A bound endpoint method (sync or async).
+        *args: Positional arguments for the endpoint.
+        **kwargs: Keyword arguments for the endpoint.
+
+    Returns:
+        A :class:`BatchCall` ready to be gathered.
+
+    Raises:
+        TypeError: If *func* is synchronous and has no ``_async`` counterpart.
+    """
+    return BatchCall(_resolve_async(func), args, kwargs)
+
+
+async def gather_async(
+    calls: Iterable[BatchItem],
+    *,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    return_exceptions: bool = True,
+) -> List[Any]:
+    """Run *calls* concurrently with at most *concurrency* in flight.
+
+    Args:
+        calls: :class:`BatchCall` objects, un-awaited coroutines, or
+            zero-argument callables returning awaitables.
+        concurrency: Maximum number of calls running at once.
+        return_exceptions: When ``True`` (the default) an exception raised
+            by a call is placed in its result slot. When ``False`` the first
+            failure cancels the remaining calls and is re-raised.
+
+    Returns:
+        One result (or exception) per call, in input order.
+
+    Raises:
+        ValueError: If *concurrency* is less than 1.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+    items = list(calls)
+    results: List[Any] = [None] * len(items)
+    pending = iter(range(len(items)))
+
+    async def worker() -> None:
+        for index in pending:
+            try:
+                results[index] = await _start(items[index])
+            except Exception as exc:
+                if not return_exceptions:
+                    raise
+                results[index] = exc
+
+    workers = [
+        asyncio.ensure_future(worker()) for _ in range(min(concurrency, len(items)))
+    ]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        # Coroutines that never got a slot would otherwise warn on GC.
+        for index in pending:
+            if inspect.iscoroutine(items[index]):
+                items[index].close()
+    return results
+
+
+def _start(item: BatchItem) -> Awaitable[Any]:
+    """Turn a batch item into an awaitable."""
+    if isinstance(item, BatchCall):
+        return item.start()
+    if inspect.isawaitable(item):
+        return item
+    if callable(item):
+        return item()
+    raise TypeError(
+        f"Batch items must be BatchCall objects, awaitables or callables, "
+        f"got {type(item).__name__}"
+    )
+
+
+def _resolve_async(func: Callable[..., Any]) -> Callable[..., Awaitable[Any]]:
+    """Return the coroutine-function flavour of an endpoint method."""
+    if inspect.iscoroutinefunction(func):
+        return func
+
+    owner = getattr(func, "__self__", None)
+    twin = getattr(owner, f"{getattr(func, '__name__', '')}_async", None)
+    if owner is None or not inspect.iscoroutinefunction(twin):
+        raise TypeError(
+            f"{getattr(func, '__qualname__', func)!r} is not an async endpoint "
+            f"and has no '_async' counterpart"
+        )
+    return twin
@@ -0,0 +1,504 @@
+"""Tiered response cache for SDK endpoint calls.
+
+Provides :class:`ResponseCache`, an in-memory LRU tier backed by an optional
+on-disk tier, used by :meth:`griddy.core.basesdk.BaseSDK._execute_endpoint`
+to short-circuit repeat calls for data that cannot change (a closed season,
+a historical box score) while keeping live endpoints fresh.
+
+Entries are keyed on the operation ID, the resolved base URL and the
+serialized request model. Expiry is governed by per-operation TTL policies:
+
+- ``None`` — the entry never expires.
+- ``0`` — the operation is never cached.
+- any positive number — the entry expires after that many seconds.
+
+When a response carries ``ETag`` or ``Last-Modified`` headers, the expired
+entry is kept and the next request is sent with ``If-None-Match`` /
+``If-Modified-Since``; a ``304 Not Modified`` then returns the cached model
+without downloading or validating the body again.
+
+Example::
+
+    from griddy.core.cache import ResponseCache
+    from griddy.nfl import GriddyNFL
+
+    cache = ResponseCache(
+        max_entries=2048,
+        disk_path="~/.cache/griddy",
+        ttl_policies={"getFootballGames": 3600},
+    )
+    nfl = GriddyNFL(nfl_auth=auth, response_cache=cache)
+    nfl.games.get_games(season=2015, season_type="REG", week=1)
+    print(cache.stats())
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from griddy.core._constants import DEFAULT_CACHE_TTL_POLICIES
+from griddy.core.jsoncodec import JsonCodec, get_json_codec
+
+TTL = Optional[float]
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for a :class:`ResponseCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    memory_hits: int = 0
+    disk_hits: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    revalidations: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of cache lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from either tier (0.0 when unused)."""
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+
+_MISSING = object()
+
+
+@dataclass
+class _MemoryEntry:
+    """A single in-memory cache entry."""
+
+    value: Any
+    expires_at: Optional[float]
+    validators: Dict[str, str] = field(default_factory=dict)
+    stale: bool = False
+
+    def is_fresh(self, now: float) -> bool:
+        """Return ``True`` if the entry has not yet expired."""
+        return _is_fresh(self.expires_at, now)
+
+
+class ResponseCache:
+    """Two-tier (memory LRU + optional disk) cache for unmarshalled responses.
+
+    The memory tier stores the unmarshalled result object and is bounded by
+    ``max_entries`` with least-recently-used eviction. The disk tier, when a
+    ``disk_path`` is given, stores the raw JSON body so entries survive
+    process restarts; disk hits are decoded and promoted to memory.
+
+    All operations are guarded by a lock so a single cache can be shared
+    between threads and between the sync and async request paths.
+
+    Args:
+        max_entries: Maximum number of entries held in the memory tier.
+        default_ttl: TTL in seconds for operations without a policy.
+            ``None`` caches forever, ``0`` disables caching.
+        ttl_policies: Mapping of operation ID (or ``fnmatch`` pattern) to TTL.
+            Merged over :data:`~griddy.core._constants.DEFAULT_CACHE_TTL_POLICIES`.
+        disk_path: Directory for the on-disk tier, or ``None`` to disable it.
+        revalidate: Keep ``ETag`` / ``Last-Modified`` validators from
+            responses so expired entries can be revalidated with a
+            conditional request instead of re-downloaded.
+        clock: Time source returning seconds since the epoch.
+        json_codec: Codec for the disk tier's envelopes, or ``None`` for the
+            process default (see :mod:`griddy.core.jsoncodec`).
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        default_ttl: TTL = 300.0,
+        ttl_policies: Optional[Mapping[str, TTL]] = None,
+        disk_path: Optional[Union[str, os.PathLike]] = None,
+        revalidate: bool = True,
+        clock: Callable[[], float] = time.time,
+        json_codec: Optional[JsonCodec] = None,
+    ) -> None:
+        """Initialize the cache tiers and TTL policies."""
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.revalidate = revalidate
+        self.ttl_policies: Dict[str, TTL] = {
+            **DEFAULT_CACHE_TTL_POLICIES,
+            **(ttl_policies or {}),
+        }
+        self.disk_path: Optional[Path] = None
+        if disk_path is not None:
+            self.disk_path = Path(disk_path).expanduser()
+            self.disk_path.mkdir(parents=True, exist_ok=True)
+
+        self._clock = clock
+        self.json_codec = json_codec
+        self._memory: "OrderedDict[str, _MemoryEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = CacheStats()
+
+    # ------------------------------------------------------------------
+    # Keys and policies
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def make_key(
+        operation_id: str, request: Any, base_url: str = "", raw_json: bool = False
+    ) -> str:
+        """Build a cache key from the operation ID, base URL and request model.
+
+        Pydantic request models are serialized to JSON by alias so that two
+        equal requests always produce the same key regardless of field order.
+        Keys are always written with the standard library, so they stay the
+        same whichever :mod:`~griddy.core.jsoncodec` codec is in use and
+        persisted disk-tier entries keep matching.
+        Raw-JSON calls (``raw_json=True``) get their own key, since their
+        result is a plain ``dict`` rather than the typed response model.
+        """
+        if request is None:
+            payload = "null"
+        elif isinstance(request, PydanticBaseModel):
+            payload = _stable_json(request.model_dump(mode="json", by_alias=True))
+        else:
+            payload = _stable_json(request)
+        key = f"{base_url}|{operation_id}|{payload}"
+        return key + "|raw" if raw_json else key
+
+    def ttl_for(self, operation_id: str) -> TTL:
+        """Return the TTL for *operation_id*.
+
+        Exact operation IDs take precedence over ``fnmatch`` patterns; the
+        first matching pattern wins. Falls back to ``default_ttl``.
+        """
+        if operation_id in self.ttl_policies:
+            return self.ttl_policies[operation_id]
+        for pattern, ttl in self.ttl_policies.items():
+            if fnmatch.fnmatchcase(operation_id, pattern):
+                return ttl
+        return self.default_ttl
+
+    def is_cacheable(self, operation_id: str) -> bool:
+        """Return ``True`` unless the operation's TTL is ``0``."""
+        ttl = self.ttl_for(operation_id)
+        return ttl is None or ttl > 0
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get(
+        self, key: str, decode: Optional[Callable[[bytes], Any]] = None
+    ) -> Tuple[bool, Any]:
+        """Look *key* up in memory, then on disk.
+
+        Expired entries that carry HTTP validators are kept (as stale entries)
+        so they can later be revalidated; other expired entries are dropped.
+
+        Args:
+            key: A key produced by :meth:`make_key`.
+            decode: Callable turning a raw JSON body from the disk tier back
+                into a result object. When ``None`` the disk tier is skipped.
+
+        Returns:
+            A ``(hit, value)`` tuple. ``value`` is ``None`` on a miss.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                if entry.is_fresh(now):
+                    self._memory.move_to_end(key)
+                    self._stats.hits += 1
+                    self._stats.memory_hits += 1
+                    return True, entry.value
+                if not entry.stale:
+                    entry.stale = True
+                    self._stats.expirations += 1
+                if not entry.validators:
+                    del self._memory[key]
+
+        if self.disk_path is not None and decode is not None:
+            envelope = self._disk_read(key)
+            if envelope is not None and _is_fresh(envelope["expires_at"], now):
+                value = decode(envelope["body"].encode("utf-8"))
+                with self._lock:
+                    self._memory_put(
+                        key, value, envelope["expires_at"], envelope["validators"]
+                    )
+                    self._stats.hits += 1
+                    self._stats.disk_hits += 1
+                return True, value
+
+        with self._lock:
+            self._stats.misses += 1
+        return False, None
+
+    def set(
+        self,
+        key: str,
+        operation_id: str,
+        value: Any,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> None:
+        """Store *value* under *key* using the TTL policy of *operation_id*.
+
+        Args:
+            key: A key produced by :meth:`make_key`.
+            operation_id: Operation whose TTL policy applies.
+            value: The unmarshalled result to keep in memory.
+            body: Raw JSON body to persist in the disk tier, if enabled.
+            headers: Response headers; ``ETag`` and ``Last-Modified`` are
+                kept as validators for conditional revalidation.
+        """
+        ttl = self.ttl_for(operation_id)
+        if ttl is not None and ttl <= 0:
+            return
+
+        expires_at = None if ttl is None else self._clock() + ttl
+        validators = _validators_from_headers(headers) if self.revalidate else {}
+        with self._lock:
+            self._memory_put(key, value, expires_at, validators)
+            self._stats.stores += 1
+
+        if self.disk_path is not None and body is not None:
+            self._disk_write(key, body, expires_at, validators)
+
+    # ------------------------------------------------------------------
+    # Conditional revalidation
+    # ------------------------------------------------------------------
+
+    def conditional_headers(self, key: str) -> Dict[str, str]:
+        """Return ``If-None-Match`` / ``If-Modified-Since`` headers for *key*.
+
+        Returns an empty dict when revalidation is disabled or no entry with
+        validators exists in either tier.
+        """
+        if not self.revalidate:
+            return {}
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry.validators:
+                return dict(entry.validators)
+
+        if self.disk_path is not None:
+            envelope = self._disk_read(key)
+            if envelope is not None:
+                return dict(envelope["validators"])
+        return {}
+
+    def revalidated(
+        self,
+        key: str,
+        operation_id: str,
+        decode: Optional[Callable[[bytes], Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Tuple[bool, Any]:
+        """Refresh a stale entry after a ``304 Not Modified`` response.
+
+        The entry's expiry is reset from the TTL policy of *operation_id* and
+        any updated validators in *headers* replace the stored ones. The
+        cached value is returned without re-decoding when it is in memory;
+        entries found only on disk are decoded once with *decode*.
+
+        Returns:
+            A ``(found, value)`` tuple. ``found`` is ``False`` if the entry was
+            evicted after the conditional request was sent.
+        """
+        ttl = self.ttl_for(operation_id)
+        expires_at = None if ttl is None else self._clock() + ttl
+        fresh_validators = _validators_from_headers(headers)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                entry.expires_at = expires_at
+                entry.stale = False
+                entry.validators.update(fresh_validators)
+                self._memory.move_to_end(key)
+                self._stats.revalidations += 1
+                value = entry.value
+                validators = dict(entry.validators)
+            else:
+                value = _MISSING
+
+        envelope = None
+        if self.disk_path is not None:
+            envelope = self._disk_read(key)
+
+        if value is _MISSING:
+            if envelope is None or decode is None:
+                return False, None
+            value = decode(envelope["body"].encode("utf-8"))
+            validators = {**envelope["validators"], **fresh_validators}
+            with self._lock:
+                self._memory_put(key, value, expires_at, validators)
+                self._stats.revalidations += 1
+
+        if envelope is not None:
+            self._disk_write(
+                key, envelope["body"].encode("utf-8"), expires_at, validators
+            )
+        return True, value
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def invalidate(self, key: str) -> None:
+        """Remove *key* from both tiers."""
+        with self._lock:
+            self._memory.pop(key, None)
+        if self.disk_path is not None:
+            self._disk_file(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Remove every entry from both tiers. Statistics are preserved."""
+        with self._lock:
+            self._memory.clear()
+        if self.disk_path is not None:
+            for path in self.disk_path.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> CacheStats:
+        """Return a snapshot of the hit/miss counters."""
+        with self._lock:
+            return replace(self._stats)
+
+    def reset_stats(self) -> None:
+        """Zero all hit/miss counters."""
+        with self._lock:
+            self._stats = CacheStats()
+
+    def __len__(self) -> int:
+        """Return the number of entries in the memory tier."""
+        return len(self._memory)
+
+    # ------------------------------------------------------------------
+    # Tier internals
+    # ------------------------------------------------------------------
+
+    def _memory_put(
+        self,
+        key: str,
+        value: Any,
+        expires_at: Optional[float],
+        validators: Dict[str, str],
+    ) -> None:
+        """Insert into the memory tier, evicting LRU entries. Caller holds the lock."""
+        self._memory[key] = _MemoryEntry(
+            value=value, expires_at=expires_at, validators=dict(validators)
+        )
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self._stats.evictions += 1
+
+    def _disk_file(self, key: str) -> Path:
+        """Return the on-disk path for *key*."""
+        assert self.disk_path is not None
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.disk_path / f"{digest}.json"
+
+    def _disk_read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Read the on-disk envelope for *key*.
+
+        Expired envelopes without validators are deleted and reported as
+        absent; expired envelopes with validators are returned so they can
+        be revalidated.
+        """
+        path = self._disk_file(key)
+        try:
+            envelope = get_json_codec(self.json_codec).loads(path.read_bytes())
+        except OSError, ValueError:
+            return None
+
+        if envelope.get("key") != key:
+            return None
+
+        envelope.setdefault("validators", {})
+        expires_at = envelope.get("expires_at")
+        if not _is_fresh(expires_at, self._clock()) and not envelope["validators"]:
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self._stats.expirations += 1
+            return None
+        return envelope
+
+    def _disk_write(
+        self,
+        key: str,
+        body: bytes,
+        expires_at: Optional[float],
+        validators: Dict[str, str],
+    ) -> None:
+        """Atomically persist *body* for *key*.
+
+        I/O errors are ignored, and bodies that are not UTF-8 stay in the
+        memory tier only.
+        """
+        assert self.disk_path is not None
+        try:
+            text = body.decode("utf-8")
+        except UnicodeDecodeError:
+            return
+        envelope = {
+            "key": key,
+            "expires_at": expires_at,
+            "validators": validators,
+            "body": text,
+        }
+        payload = get_json_codec(self.json_codec).dumps(envelope)
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.disk_path, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                fh.write(payload)
+            os.replace(tmp, self._disk_file(key))
+            tmp = None
+        except OSError:
+            pass
+        finally:
+            if tmp is not None:
+                Path(tmp).unlink(missing_ok=True)
+
+
+def _stable_json(value: Any) -> str:
+    """Encode *value* as sorted, compact JSON with the standard library."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _is_fresh(expires_at: Optional[float], now: float) -> bool:
+    """Return ``True`` if an entry expiring at *expires_at* is still fresh."""
+    return expires_at is None or expires_at > now
+
+
+def _validators_from_headers(headers: Optional[Mapping[str, str]]) -> Dict[str, str]:
+    """Map ``ETag`` / ``Last-Modified`` response headers to request validators."""
+    if not headers:
+        return {}
+    headers = {name.lower(): value for name, value in headers.items()}
+    validators = {}
+    etag = headers.get("etag")
+    if etag:
+        validators["If-None-Match"] = etag
+    last_modified = headers.get("last-modified")
+    if last_modified:
+        validators["If-Modified-Since"] = last_modified
+    return validators
@@ -0,0 +1,149 @@
+"""Coalescing of identical in-flight endpoint calls.
+
+When several callers ask for exactly the same resource at the same moment
+(the current schedule at the top of every minute, say), a
+:class:`RequestCoalescer` lets the first caller — the *leader* — perform the
+upstream call while the others wait for it and receive the same unmarshalled
+result. Nothing is kept once the leader finishes: coalescing only joins
+requests that overlap in time, use :class:`~griddy.core.cache.ResponseCache`
+to reuse results across time.
+
+Only ``GET`` endpoints are coalesced. Calls are identical when they share the
+operation ID, resolved base URL, serialized request model and extra headers.
+Followers receive the *same* result object as the leader, so treat results
+as read-only when coalescing is enabled. If the leader fails, every follower
+sees the same exception.
+
+Sync callers (threads) and async callers (coroutines on one event loop) are
+coalesced separately.
+
+Example::
+
+    from griddy.core.coalesce import RequestCoalescer
+    from griddy.nfl import GriddyNFL
+
+    nfl = GriddyNFL(nfl_auth=auth, request_coalescer=RequestCoalescer())
+"""
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, TypeVar
+
+from griddy.core.cache import ResponseCache
+
+T = TypeVar("T")
+
+
+@dataclass
+class CoalescerStats:
+    """Counters for a :class:`RequestCoalescer`."""
+
+    leaders: int = 0
+    followers: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of calls that were served by another caller's request."""
+        return self.followers
+
+
+class RequestCoalescer:
+    """Share one upstream call between identical concurrent requests."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_async: Dict[str, asyncio.Task] = {}
+        self._stats = CoalescerStats()
+
+    @staticmethod
+    def make_key(
+        operation_id: str,
+        request: Any,
+        base_url: str = "",
+        http_headers: Optional[Mapping[str, str]] = None,
+        raw_json: bool = False,
+    ) -> str:
+        """Build the key identifying identical calls.
+
+        Reuses :meth:`ResponseCache.make_key` and appends any per-call headers,
+        since they may change what the server returns. Raw-JSON and typed
+        calls never share a result.
+        """
+        key = ResponseCache.make_key(operation_id, request, base_url, raw_json)
+        if http_headers:
+            key += "|" + json.dumps(
+                {k.lower(): v for k, v in http_headers.items()},
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        return key
+
+    def stats(self) -> CoalescerStats:
+        """Return a snapshot of the leader/follower counters."""
+        with self._lock:
+            return CoalescerStats(self._stats.leaders, self._stats.followers)
+
+    def run(self, key: str, fn: Callable[[], T]) -> T:
+        """Call *fn*, or wait for an identical call already in flight.
+
+        Args:
+            key: A key produced by :meth:`make_key`.
+            fn: Performs the upstream call; only invoked by the leader.
+
+        Returns:
+            The leader's result, shared by every caller with the same *key*.
+        """
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self._stats.leaders += 1
+            else:
+                self._stats.followers += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    async def run_async(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async variant of :meth:`run`.
+
+        The upstream call runs in its own task and each caller awaits it
+        through :func:`asyncio.shield`, so cancelling one caller does not
+        cancel the request for the others.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            task = self._inflight_async.get(key)
+            if task is None or task.get_loop() is not loop:
+                task = loop.create_task(fn())
+                task.add_done_callback(lambda t: self._discard_async(key, t))
+                self._inflight_async[key] = task
+                self._stats.leaders += 1
+            else:
+                self._stats.followers += 1
+        return await asyncio.shield(task)
+
+    def _discard_async(self, key: str, task: asyncio.Task) -> None:
+        with self._lock:
+            if self._inflight_async.get(key) is task:
+                del self._inflight_async[key]
+        # Consume the exception when every caller has been cancelled.
+        if not task.cancelled():
+            task.exception()
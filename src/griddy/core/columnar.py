@@ -0,0 +1,299 @@
+"""Columnar results for list-shaped responses.
+
+Responses such as ``WeeklyPassingStatsResponse`` or ``FootballRostersResponse``
+are mostly one long list of rows, and are usually turned straight into a
+DataFrame. :func:`fetch_columns` requests the raw JSON for an endpoint and
+turns those rows into one array per field without building a model per row:
+
+- ``backend="python"`` returns a ``dict`` of :class:`array.array` for ``int``,
+  ``float`` and ``bool`` fields without nulls, and of lists otherwise.
+- ``backend="numpy"`` returns a ``dict`` of NumPy arrays (``int64``,
+  ``float64`` with ``NaN`` for nulls, ``bool`` or ``object``).
+- ``backend="arrow"`` returns a ``pyarrow.Table``.
+
+Columns are keyed by the row model's snake_case field names; each value is
+read from the field's JSON alias. Values are not validated, and nested
+objects are left as parsed JSON.
+
+Rows are found like :mod:`griddy.core.pagination` finds them: the first
+``List[<model>]`` field of the response. Pass a dotted path such as
+``rows="drives.plays"`` to pick another field or to flatten nested lists.
+
+Example::
+
+    from griddy.core.columnar import fetch_columns
+
+    columns = fetch_columns(
+        nfl.stats.passing.get_weekly_summary,
+        season=2025,
+        season_type="REG",
+        week="WEEK_1",
+        backend="numpy",
+    )
+    pandas.DataFrame(columns)
+"""
+
+import array
+import math
+import types
+import typing
+from dataclasses import replace
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+
+import pydantic
+from typing_extensions import Annotated, TypeAliasType
+
+from griddy.core.pagination import rows_field
+
+Backend = Literal["python", "numpy", "arrow"]
+
+_NUMPY_INSTALL_MSG = (
+    "NumPy is required for backend='numpy' but is not installed. "
+    "Install it with: pip install numpy"
+)
+_ARROW_INSTALL_MSG = (
+    "PyArrow is required for backend='arrow' but is not installed. "
+    "Install it with: pip install pyarrow"
+)
+
+
+def fetch_columns(
+    endpoint: Callable[..., Any],
+    *args: Any,
+    rows: Optional[str] = None,
+    backend: Backend = "python",
+    **kwargs: Any,
+) -> Any:
+    """Call *endpoint* and return its rows as columns.
+
+    Args:
+        endpoint: A bound endpoint method, e.g.
+            ``nfl.stats.passing.get_weekly_summary``.
+        *args: Positional arguments for the endpoint.
+        rows: Dotted path of the rows field (default: the first list of
+            models in the response).
+        backend: ``"python"``, ``"numpy"`` or ``"arrow"``.
+        **kwargs: Keyword arguments for the endpoint.
+    """
+    sdk, config = _raw_json_config(endpoint, args, kwargs)
+    return to_columns(
+        sdk._execute_endpoint(config), config.response_type, rows, backend
+    )
+
+
+async def fetch_columns_async(
+    endpoint: Callable[..., Any],
+    *args: Any,
+    rows: Optional[str] = None,
+    backend: Backend = "python",
+    **kwargs: Any,
+) -> Any:
+    """Async variant of :func:`fetch_columns`."""
+    sdk, config = _raw_json_config(endpoint, args, kwargs)
+    data = await sdk._execute_endpoint_async(config)
+    return to_columns(data, config.response_type, rows, backend)
+
+
+def to_columns(
+    data: Dict[str, Any],
+    response_type: Any,
+    rows: Optional[str] = None,
+    backend: Backend = "python",
+) -> Any:
+    """Convert a parsed JSON response of *response_type* to columns.
+
+    Args:
+        data: The response body parsed as JSON.
+        response_type: The response model the body conforms to.
+        rows: Dotted path of the rows field, by field name.
+        backend: ``"python"``, ``"numpy"`` or ``"arrow"``.
+    """
+    if backend not in _COLUMN_BUILDERS:
+        raise ValueError(
+            f"backend must be one of {sorted(_COLUMN_BUILDERS)}, got {backend!r}"
+        )
+    keys, row_type = rows_path(response_type, rows or rows_field(response_type))
+    records = [data]
+    for key in keys:
+        records = [
+            item
+            for record in records
+            if record is not None
+            for item in (record.get(key) or ())
+        ]
+    return _COLUMN_BUILDERS[backend](records, column_plan(row_type))
+
+
+@lru_cache(maxsize=None)
+def column_plan(row_type: Any) -> Tuple[Tuple[str, str, Optional[type]], ...]:
+    """Return ``(field name, JSON key, scalar type)`` for each field of *row_type*.
+
+    The scalar type is ``int``, ``float``, ``bool`` or ``str`` when the field
+    holds one (optionally nullable), else ``None``.
+    """
+    return tuple(
+        (name, info.alias or name, _scalar_type(info.annotation))
+        for name, info in row_type.model_fields.items()
+    )
+
+
+@lru_cache(maxsize=None)
+def rows_path(response_type: Any, path: str) -> Tuple[Tuple[str, ...], Any]:
+    """Resolve a dotted field-name *path* to JSON keys and the row model.
+
+    Raises:
+        ValueError: If a name in *path* is not a field of its model.
+        TypeError: If a field in *path* is not a list of models.
+    """
+    keys = []
+    model = response_type
+    for name in path.split("."):
+        try:
+            info = model.model_fields[name]
+        except KeyError:
+            raise ValueError(
+                f"{model.__name__} has no field {name!r} (rows={path!r})"
+            ) from None
+        keys.append(info.alias or name)
+        model = _list_item_model(info.annotation)
+        if model is None:
+            raise TypeError(f"{path!r} does not lead to a list of models")
+    return tuple(keys), model
+
+
+# ---------------------------------------------------------------------------
+# Backends
+# ---------------------------------------------------------------------------
+
+_TYPECODES = {int: "q", float: "d", bool: "b"}
+
+
+def _python_columns(records: List[dict], plan: tuple) -> Dict[str, Any]:
+    columns: Dict[str, Any] = {}
+    for name, key, scalar in plan:
+        values = [record.get(key) for record in records]
+        columns[name] = values
+        typecode = _TYPECODES.get(scalar)
+        if typecode is None:
+            continue
+        if scalar is float:
+            values = [math.nan if v is None else v for v in values]
+        try:
+            columns[name] = array.array(typecode, values)
+        except TypeError, OverflowError:
+            pass  # nulls in an int/bool column, or an unexpected value
+    return columns
+
+
+def _numpy_columns(records: List[dict], plan: tuple) -> Dict[str, Any]:
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(_NUMPY_INSTALL_MSG) from None
+
+    columns: Dict[str, Any] = {}
+    for name, key, scalar in plan:
+        values = [record.get(key) for record in records]
+        column = None
+        try:
+            if scalar is int and None not in values:
+                column = np.array(values, dtype=np.int64)
+            elif scalar in (int, float):
+                column = np.array(values, dtype=np.float64)  # None -> NaN
+            elif scalar is bool and None not in values:
+                column = np.array(values, dtype=np.bool_)
+        except TypeError, ValueError:
+            pass
+        if column is None:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+        columns[name] = column
+    return columns
+
+
+def _arrow_columns(records: List[dict], plan: tuple) -> Any:
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise ImportError(_ARROW_INSTALL_MSG) from None
+
+    arrow_types = {
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+        str: pa.string(),
+    }
+    columns: Dict[str, Any] = {}
+    for name, key, scalar in plan:
+        values = [record.get(key) for record in records]
+        try:
+            columns[name] = pa.array(values, type=arrow_types.get(scalar))
+        except pa.ArrowException:
+            columns[name] = pa.array([None if v is None else str(v) for v in values])
+    return pa.table(columns)
+
+
+_COLUMN_BUILDERS: Dict[str, Callable[[List[dict], tuple], Any]] = {
+    "python": _python_columns,
+    "numpy": _numpy_columns,
+    "arrow": _arrow_columns,
+}
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _raw_json_config(
+    endpoint: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]
+) -> Tuple[Any, Any]:
+    """Build *endpoint*'s config with ``return_raw_json`` switched on."""
+    sdk = getattr(endpoint, "__self__", None)
+    config_fn = getattr(endpoint, "__wrapped__", None)
+    if sdk is None or config_fn is None:
+        raise TypeError(
+            f"{endpoint!r} is not a bound endpoint method generated by @sdk_endpoints"
+        )
+    config = config_fn(sdk, *args, **kwargs)
+    return sdk, replace(config, return_raw_json=True)
+
+
+def _strip_optional(annotation: Any) -> Any:
+    while True:
+        origin = typing.get_origin(annotation)
+        if origin is Annotated:
+            annotation = typing.get_args(annotation)[0]
+            continue
+        if isinstance(origin, TypeAliasType):
+            # Nullable[T] / OptionalNullable[T]
+            annotation = typing.get_args(annotation)[0]
+            continue
+        if origin in (typing.Union, types.UnionType):
+            members = [a for a in typing.get_args(annotation) if a is not type(None)]
+            if len(members) == 1:
+                annotation = members[0]
+                continue
+        return annotation
+
+
+def _list_item_model(annotation: Any) -> Optional[type]:
+    annotation = _strip_optional(annotation)
+    if typing.get_origin(annotation) is not list:
+        return None
+    (item,) = typing.get_args(annotation) or (None,)
+    item = _strip_optional(item)
+    if isinstance(item, type) and issubclass(item, pydantic.BaseModel):
+        return item
+    return None
+
+
+def _scalar_type(annotation: Any) -> Optional[type]:
+    annotation = _strip_optional(annotation)
+    if typing.get_origin(annotation) is Literal:
+        kinds = {type(v) for v in typing.get_args(annotation)}
+        return kinds.pop() if len(kinds) == 1 and kinds <= {int, str} else None
+    if annotation in (int, float, bool, str):
+        return annotation
+    return None
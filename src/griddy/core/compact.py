@@ -0,0 +1,163 @@
+"""Compact, read-only rows for large collections of models.
+
+Every pydantic model instance carries its own ``__dict__``, fields-set and
+private attributes. For a season of play-by-play, or a live team-stats feed
+with well over a hundred fields per entry, that overhead outweighs the data.
+:func:`compact` converts a model into a :class:`CompactRow`: an immutable,
+tuple-backed row whose field names, accessors and conversion back to the model
+are held once on a class generated per model by :func:`compact_type`.
+
+Nested models are compacted too and lists become tuples, so a row and
+everything under it is read-only. :meth:`CompactRow.to_model` rebuilds the
+original model, including which fields were set, so serialization round-trips.
+
+Example::
+
+    from griddy.core.compact import compact_many
+
+    plays = compact_many(
+        play
+        for game_id in game_ids
+        for drive in nfl.games.get_play_by_play(game_id=game_id).drives or ()
+        for play in drive.plays or ()
+    )
+    plays[0].description
+    plays[0].to_model()
+"""
+
+import threading
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, ClassVar, Dict, FrozenSet, Iterable, List, Tuple, Type, TypeVar
+
+from pydantic import BaseModel as PydanticBaseModel
+
+from griddy.core.types.basemodel import Unset
+
+M = TypeVar("M", bound=PydanticBaseModel)
+
+_fields_sets: Dict[FrozenSet[str], FrozenSet[str]] = {}
+_fields_sets_lock = threading.Lock()
+
+
+class CompactRow(tuple):
+    """Immutable row holding one model's field values in declaration order.
+
+    Rows are created with :func:`compact`; field values are read as
+    attributes, like on the model. The class for each model is generated by
+    :func:`compact_type`, and the fields-set of the original instance is kept
+    as a shared frozenset in the last slot.
+    """
+
+    __slots__ = ()
+
+    _model: ClassVar[Type[PydanticBaseModel]]
+    _fields: ClassVar[Tuple[str, ...]]
+
+    @classmethod
+    def from_model(cls, instance: PydanticBaseModel) -> "CompactRow":
+        """Build a row from *instance*, compacting nested models."""
+        values = instance.__dict__
+        return tuple.__new__(
+            cls,
+            [_pack(values[name]) for name in cls._fields]
+            + [_intern(instance.model_fields_set)],
+        )
+
+    def to_model(self) -> PydanticBaseModel:
+        """Rebuild the full model instance, without validating it again."""
+        return self._model.model_construct(
+            _fields_set=set(self[-1]),
+            **{name: _unpack(value) for name, value in zip(self._fields, self)},
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Rows are equal when they share a model and values."""
+        return type(other) is type(self) and tuple.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        """Inverse of :meth:`__eq__`."""
+        return not self == other
+
+    def __hash__(self) -> int:
+        """Hash like the underlying tuple."""
+        return tuple.__hash__(self)
+
+    def __repr__(self) -> str:
+        """Show the row like the model's repr."""
+        fields = ", ".join(
+            f"{name}={value!r}" for name, value in zip(self._fields, self)
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle via the model class, since row classes are generated."""
+        return _rebuild, (self._model, tuple(self))
+
+
+@lru_cache(maxsize=None)
+def compact_type(model: Type[M]) -> Type[CompactRow]:
+    """Return the :class:`CompactRow` subclass for *model*.
+
+    The class is generated on first use and reused afterwards; it exposes
+    each model field as a read-only attribute.
+    """
+    fields = tuple(model.model_fields)
+    namespace: Dict[str, Any] = {
+        "__slots__": (),
+        "__module__": __name__,
+        "__doc__": f"Compact, read-only row of :class:`{model.__name__}`.",
+        "_model": model,
+        "_fields": fields,
+    }
+    for index, name in enumerate(fields):
+        namespace[name] = property(
+            itemgetter(index), doc=model.model_fields[name].description
+        )
+    return type(f"Compact{model.__name__}", (CompactRow,), namespace)
+
+
+def compact(instance: PydanticBaseModel) -> CompactRow:
+    """Convert a model instance to its compact, read-only row."""
+    return compact_type(type(instance)).from_model(instance)
+
+
+def compact_many(instances: Iterable[PydanticBaseModel]) -> List[CompactRow]:
+    """Convert many model instances, e.g. every play of a season, to rows."""
+    return [compact(instance) for instance in instances]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _pack(value: Any) -> Any:
+    if isinstance(value, PydanticBaseModel) and not isinstance(value, Unset):
+        return compact(value)
+    if isinstance(value, list):
+        return tuple([_pack(item) for item in value])
+    return value
+
+
+def _unpack(value: Any) -> Any:
+    if isinstance(value, CompactRow):
+        return value.to_model()
+    if type(value) is tuple:
+        return [_unpack(item) for item in value]
+    return value
+
+
+def _intern(fields_set: set) -> FrozenSet[str]:
+    # Instances parsed from the same feed almost always set the same fields,
+    # so one frozenset is shared by all of them.
+    key = frozenset(fields_set)
+    shared = _fields_sets.get(key)
+    if shared is None:
+        with _fields_sets_lock:
+            shared = _fields_sets.setdefault(key, key)
+    return shared
+
+
+def _rebuild(model: Type[PydanticBaseModel], values: Tuple[Any, ...]) -> CompactRow:
+    return tuple.__new__(compact_type(model), values)
@@ -3,6 +3,10 @@
 import functools
 from typing import Callable
 
+from griddy.core._constants import DEFAULT_PAGINATION_PREFETCH
+from griddy.core.pagination import aiter_rows, is_paginated, iter_rows
+from griddy.core.streaming import aiter_streamed, iter_streamed, streamed_rows
+
 
 def sdk_endpoints(cls: type) -> type:
     """Auto-generate sync/async endpoint wrappers from config methods.
@@ -14,6 +18,19 @@ def sdk_endpoints(cls: type) -> type:
     - ``<name>_async(self, ...)`` — calls the config method then
       ``_execute_endpoint_async``
 
+    Config methods that accept both ``limit`` and ``offset`` also get
+    auto-paginating row iterators (see :mod:`griddy.core.pagination`):
+
+    - ``iter_<name>(self, ..., prefetch=4)`` — sync generator of rows
+    - ``aiter_<name>(self, ..., prefetch=4)`` — async generator of rows
+
+    where a leading ``get_`` is dropped from ``<name>``
+    (``_get_weekly_summary_config`` -> ``iter_weekly_summary``).
+
+    Config methods marked with :func:`griddy.core.streaming.stream_rows`
+    instead get ``iter_<name>`` / ``aiter_<name>`` methods that parse the
+    response incrementally and yield each row as soon as it has arrived.
+
     The generated methods inherit the parameter signature and docstring from
     the config method via ``functools.wraps``.  If a method with the target
     name already exists on the class it is **not** overwritten, allowing
@@ -49,6 +66,36 @@ def sdk_endpoints(cls: type) -> type:
         if async_name not in vars(cls):
             setattr(cls, async_name, _make_async(config_method, cls, async_name))
 
+        # get_weekly_summary -> iter_weekly_summary / aiter_weekly_summary
+        rows_name = public_name.removeprefix("get_")
+        iter_name = f"iter_{rows_name}"
+        aiter_name = f"aiter_{rows_name}"
+
+        rows = streamed_rows(config_method)
+        if rows is not None:
+            if iter_name not in vars(cls):
+                setattr(
+                    cls,
+                    iter_name,
+                    _make_stream_iter(config_method, cls, iter_name, rows),
+                )
+            if aiter_name not in vars(cls):
+                setattr(
+                    cls,
+                    aiter_name,
+                    _make_stream_aiter(config_method, cls, aiter_name, rows),
+                )
+            continue
+
+        if not is_paginated(config_method):
+            continue
+
+        if iter_name not in vars(cls):
+            setattr(cls, iter_name, _make_iter(config_method, cls, iter_name))
+
+        if aiter_name not in vars(cls):
+            setattr(cls, aiter_name, _make_aiter(config_method, cls, aiter_name))
+
     return cls
 
 
@@ -76,3 +123,55 @@ def _make_async(cfg_fn: Callable, cls: type, method_name: str) -> Callable:
     wrapper.__name__ = method_name
     wrapper.__qualname__ = f"{cls.__qualname__}.{method_name}"
     return wrapper
+
+
+def _make_iter(cfg_fn: Callable, cls: type, method_name: str) -> Callable:
+    """Create a sync generator that yields every row across all pages."""
+
+    @functools.wraps(cfg_fn)
+    def wrapper(self, *args, prefetch: int = DEFAULT_PAGINATION_PREFETCH, **kwargs):
+        return iter_rows(self, cfg_fn, args, kwargs, prefetch)
+
+    wrapper.__name__ = method_name
+    wrapper.__qualname__ = f"{cls.__qualname__}.{method_name}"
+    return wrapper
+
+
+def _make_aiter(cfg_fn: Callable, cls: type, method_name: str) -> Callable:
+    """Create an async generator that yields every row across all pages."""
+
+    @functools.wraps(cfg_fn)
+    def wrapper(self, *args, prefetch: int = DEFAULT_PAGINATION_PREFETCH, **kwargs):
+        return aiter_rows(self, cfg_fn, args, kwargs, prefetch)
+
+    wrapper.__name__ = method_name
+    wrapper.__qualname__ = f"{cls.__qualname__}.{method_name}"
+    return wrapper
+
+
+def _make_stream_iter(
+    cfg_fn: Callable, cls: type, method_name: str, rows: str
+) -> Callable:
+    """Create a sync generator that yields rows as the response streams in."""
+
+    @functools.wraps(cfg_fn)
+    def wrapper(self, *args, **kwargs):
+        return iter_streamed(self, cfg_fn, args, kwargs, rows)
+
+    wrapper.__name__ = method_name
+    wrapper.__qualname__ = f"{cls.__qualname__}.{method_name}"
+    return wrapper
+
+
+def _make_stream_aiter(
+    cfg_fn: Callable, cls: type, method_name: str, rows: str
+) -> Callable:
+    """Create an async generator that yields rows as the response streams in."""
+
+    @functools.wraps(cfg_fn)
+    def wrapper(self, *args, **kwargs):
+        return aiter_streamed(self, cfg_fn, args, kwargs, rows)
+
+    wrapper.__name__ = method_name
+    wrapper.__qualname__ = f"{cls.__qualname__}.{method_name}"
+    return wrapper
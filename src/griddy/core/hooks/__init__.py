@@ -4,6 +4,9 @@ from .types import (
     AfterErrorHook,
     AfterSuccessContext,
     AfterSuccessHook,
+    AsyncAfterErrorHook,
+    AsyncAfterSuccessHook,
+    AsyncBeforeRequestHook,
     BeforeRequestContext,
     BeforeRequestHook,
     HookContext,
@@ -16,6 +19,9 @@ __all__ = [
     "AfterErrorHook",
     "AfterSuccessContext",
     "AfterSuccessHook",
+    "AsyncAfterErrorHook",
+    "AsyncAfterSuccessHook",
+    "AsyncBeforeRequestHook",
     "BeforeRequestContext",
     "BeforeRequestHook",
     "HookContext",
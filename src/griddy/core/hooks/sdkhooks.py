@@ -7,6 +7,9 @@ from .types import (
     AfterErrorHook,
     AfterSuccessContext,
     AfterSuccessHook,
+    AsyncAfterErrorHook,
+    AsyncAfterSuccessHook,
+    AsyncBeforeRequestHook,
     BeforeRequestContext,
     BeforeRequestHook,
     Hooks,
@@ -91,3 +94,53 @@ class SDKHooks(Hooks):
                 raise result
             response, error = result
         return response, error
+
+    # ------------------------------------------------------------------
+    # Async dispatch: awaits the async variant where a hook provides one
+    # ------------------------------------------------------------------
+
+    async def before_request_async(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> httpx.Request:
+        """Async variant of :meth:`before_request`."""
+        for hook in self.before_request_hooks:
+            if isinstance(hook, AsyncBeforeRequestHook):
+                out = await hook.before_request_async(hook_ctx, request)
+            else:
+                out = hook.before_request(hook_ctx, request)
+            if isinstance(out, Exception):
+                raise out
+            request = out
+
+        return request
+
+    async def after_success_async(
+        self, hook_ctx: AfterSuccessContext, response: httpx.Response
+    ) -> httpx.Response:
+        """Async variant of :meth:`after_success`."""
+        for hook in self.after_success_hooks:
+            if isinstance(hook, AsyncAfterSuccessHook):
+                out = await hook.after_success_async(hook_ctx, response)
+            else:
+                out = hook.after_success(hook_ctx, response)
+            if isinstance(out, Exception):
+                raise out
+            response = out
+        return response
+
+    async def after_error_async(
+        self,
+        hook_ctx: AfterErrorContext,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> Tuple[Optional[httpx.Response], Optional[Exception]]:
+        """Async variant of :meth:`after_error`."""
+        for hook in self.after_error_hooks:
+            if isinstance(hook, AsyncAfterErrorHook):
+                result = await hook.after_error_async(hook_ctx, response, error)
+            else:
+                result = hook.after_error(hook_ctx, response, error)
+            if isinstance(result, Exception):
+                raise result
+            response, error = result
+        return response, error
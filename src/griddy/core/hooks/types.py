@@ -116,6 +116,48 @@ class AfterErrorHook(ABC):
         pass
 
 
+class AsyncBeforeRequestHook(ABC):
+    """Abstract hook awaited before each HTTP request on the async path.
+
+    Hooks that do I/O (e.g. token refresh) should implement this alongside
+    :class:`BeforeRequestHook` so the async request path never blocks the
+    event loop. Hooks implementing only the sync interface are still called
+    (synchronously) from the async path.
+    """
+
+    @abstractmethod
+    async def before_request_async(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        """Inspect or modify the request before sending."""
+        pass
+
+
+class AsyncAfterSuccessHook(ABC):
+    """Abstract hook awaited after a successful HTTP response on the async path."""
+
+    @abstractmethod
+    async def after_success_async(
+        self, hook_ctx: AfterSuccessContext, response: httpx.Response
+    ) -> Union[httpx.Response, Exception]:
+        """Inspect or modify the response after success."""
+        pass
+
+
+class AsyncAfterErrorHook(ABC):
+    """Abstract hook awaited after an HTTP error or exception on the async path."""
+
+    @abstractmethod
+    async def after_error_async(
+        self,
+        hook_ctx: AfterErrorContext,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> Union[Tuple[Optional[httpx.Response], Optional[Exception]], Exception]:
+        """Handle or modify the error response and exception."""
+        pass
+
+
 class Hooks(ABC):
     """Abstract base for hook registries."""
 
@@ -0,0 +1,108 @@
+"""Pluggable BeautifulSoup tree builders for the HTML-scraping SDKs.
+
+PFR and DraftBuzz parsers query BeautifulSoup documents. Which tree builder
+builds them is configurable:
+
+- ``"html.parser"``: the standard library; always available and the default.
+- ``"lxml"``: C-backed and faster; needs ``pip install lxml``.
+
+``"auto"`` picks the fastest installed builder. Naming a builder that is not
+installed falls back to ``"html.parser"``. Every parser produces the same
+output under each builder.
+
+Example::
+
+    from griddy.core.htmlparser import set_html_parser
+    from griddy.pfr import GriddyPFR
+
+    set_html_parser("auto")  # process-wide default
+    pfr = GriddyPFR(html_parser="lxml")  # this SDK only
+"""
+
+from typing import List, Literal, Optional, Union
+
+from bs4 import BeautifulSoup, NavigableString, PageElement
+from bs4.builder import builder_registry
+
+ParserName = Literal["auto", "html.parser", "lxml"]
+
+_PARSERS = ("html.parser", "lxml")
+
+# Preference order for "auto".
+_AUTO_ORDER = ("lxml",)
+
+_default_parser: str = "html.parser"
+
+
+def _installed(name: str) -> bool:
+    return builder_registry.lookup(name) is not None
+
+
+def get_html_parser(parser: Optional[str] = None) -> str:
+    """Resolve *parser* to the name of an installed tree builder.
+
+    Args:
+        parser: A builder name, ``"auto"``, or ``None`` for the process
+            default set by :func:`set_html_parser`.
+
+    Raises:
+        ValueError: If *parser* is an unknown name.
+    """
+    if parser is None:
+        return _default_parser
+    if parser == "auto":
+        return next((name for name in _AUTO_ORDER if _installed(name)), "html.parser")
+    if parser not in _PARSERS:
+        raise ValueError(
+            f"Unknown HTML parser {parser!r}; expected one of "
+            f"{', '.join(['auto', *_PARSERS])}"
+        )
+    return parser if _installed(parser) else "html.parser"
+
+
+def set_html_parser(parser: Union[ParserName, str]) -> str:
+    """Set the process-wide default tree builder and return its name.
+
+    The default is used by SDKs created without an ``html_parser`` and when
+    a parser is called directly with an HTML string.
+    """
+    global _default_parser
+    _default_parser = get_html_parser(parser)
+    return _default_parser
+
+
+def make_soup(markup: str, parser: Optional[str] = None) -> BeautifulSoup:
+    """Parse a whole HTML document with the tree builder *parser* selects."""
+    return BeautifulSoup(markup, get_html_parser(parser))
+
+
+def parse_fragment(markup: str, parser: Optional[str] = None) -> List[PageElement]:
+    """Parse an HTML fragment into the nodes it contains.
+
+    ``html.parser`` parses fragments as-is. lxml builds a whole document: it
+    moves leading ``<link>``/``<meta>``/``<style>``/``<script>`` tags into
+    ``<head>``, keeps leading comments outside ``<html>`` and, with some
+    libxml2 versions, wraps leading bare text in ``<p>``. Those nodes are
+    gathered in source order and the synthetic ``<p>`` is unwrapped, so the
+    result matches ``html.parser`` for any fragment that is valid where it
+    stands (lxml still drops a stray ``<td>`` outside a table), ready to
+    splice into a tree with ``replace_with(*nodes)``.
+    """
+    if "<" not in markup and "&" not in markup:
+        return [NavigableString(markup)]
+    features = get_html_parser(parser)
+    soup = BeautifulSoup(markup, features)
+    if features == "html.parser" or soup.html is None:
+        return list(soup.contents)
+
+    nodes = [node for node in soup.contents if node is not soup.html]
+    for section in (soup.head, soup.body):
+        if section is not None:
+            nodes.extend(section.contents)
+    if (
+        nodes
+        and not markup.lstrip().startswith("<")
+        and getattr(nodes[0], "name", None) == "p"
+    ):
+        nodes[:1] = list(nodes[0].contents)
+    return nodes
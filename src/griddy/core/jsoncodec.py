@@ -0,0 +1,210 @@
+"""Pluggable JSON codecs for encoding and decoding outside pydantic.
+
+Typed responses are validated straight from the response bytes by
+pydantic-core. Everything else goes through a :class:`JsonCodec`: raw JSON
+responses (``return_raw_json`` and :mod:`griddy.core.columnar`), request
+bodies and JSON-serialized parameters (``marshal_json``), the
+:class:`~griddy.core.cache.ResponseCache` disk tier and
+:func:`~griddy.core.utils.serializers.dump_json`. Cache keys are always
+written with the standard library so they do not change with the codec.
+
+Three codecs are available:
+
+- ``"json"``: the standard library; always available and the default.
+- ``"orjson"``: needs ``pip install orjson``.
+- ``"msgspec"``: needs ``pip install msgspec``.
+
+``"auto"`` picks the fastest installed codec. Naming a codec that is not
+installed falls back to the standard library.
+
+All codecs write compact JSON and decode each other's output to the same
+value. The standard-library codec escapes non-ASCII characters
+(``"D\\u00e9troit"``), as ``json.dumps`` always has, so request bodies sent
+with the default codec stay unchanged; ``orjson`` and ``msgspec`` write them
+as UTF-8. Floats that need an exponent (``1e-07`` vs. ``1e-7``) may also be
+written differently.
+
+Example::
+
+    from griddy.core.jsoncodec import set_json_codec
+    from griddy.nfl import GriddyNFL
+
+    set_json_codec("auto")  # process-wide default
+    nfl = GriddyNFL(nfl_auth=auth, json_codec="orjson")  # this SDK only
+"""
+
+import json
+from typing import Any, Callable, Literal, Optional, Union
+
+CodecName = Literal["auto", "json", "orjson", "msgspec"]
+
+
+class JsonCodec:
+    """Standard-library JSON codec; the base class for faster codecs.
+
+    Every codec raises ``ValueError`` for malformed input and ``TypeError``
+    for values it cannot encode.
+    """
+
+    name = "json"
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document from ``bytes`` or ``str``."""
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        sort_keys: bool = False,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> str:
+        """Encode *obj* as compact JSON text.
+
+        Args:
+            obj: The value to encode.
+            sort_keys: Write object keys in sorted order.
+            default: Called for values the codec cannot encode; returns an
+                encodable replacement or raises ``TypeError``.
+        """
+        return json.dumps(
+            obj,
+            separators=(",", ":"),
+            sort_keys=sort_keys,
+            default=default,
+        )
+
+    def __repr__(self) -> str:
+        """Return ``<JsonCodec name>``."""
+        return f"<{type(self).__name__} {self.name}>"
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by ``orjson``."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        """Import ``orjson``; raises ``ImportError`` if it is not installed."""
+        import orjson
+
+        self._orjson = orjson
+        # Let ``default`` see datetimes and dataclasses, as the stdlib does,
+        # and accept the non-str keys the stdlib coerces to strings.
+        self._options = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document from ``bytes`` or ``str``."""
+        return self._orjson.loads(data)
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        sort_keys: bool = False,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> str:
+        """Encode *obj* as compact JSON text."""
+        options = self._options
+        if sort_keys:
+            options |= self._orjson.OPT_SORT_KEYS
+        return self._orjson.dumps(obj, default=default, option=options).decode()
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by ``msgspec``.
+
+    ``msgspec`` encodes datetimes, UUIDs and dataclasses natively, differently
+    from what a ``default`` hook would produce, so encodes that pass
+    ``default`` use the standard library.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        """Import ``msgspec``; raises ``ImportError`` if it is not installed."""
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+        self._sorted_encoder = msgspec.json.Encoder(order="sorted")
+
+    def loads(self, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """Decode a JSON document from ``bytes`` or ``str``."""
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
+
+    def dumps(
+        self,
+        obj: Any,
+        *,
+        sort_keys: bool = False,
+        default: Optional[Callable[[Any], Any]] = None,
+    ) -> str:
+        """Encode *obj* as compact JSON text."""
+        if default is not None:
+            return super().dumps(obj, sort_keys=sort_keys, default=default)
+        encoder = self._sorted_encoder if sort_keys else self._encoder
+        return encoder.encode(obj).decode()
+
+
+_CODECS = {"json": JsonCodec, "orjson": OrjsonCodec, "msgspec": MsgspecCodec}
+
+# Preference order for "auto".
+_AUTO_ORDER = ("orjson", "msgspec")
+
+_default_codec: JsonCodec = JsonCodec()
+
+
+def get_json_codec(codec: Union[CodecName, JsonCodec, None] = None) -> JsonCodec:
+    """Resolve *codec* to a :class:`JsonCodec` instance.
+
+    Args:
+        codec: A codec instance (returned as-is), a codec name, or ``None``
+            for the process default set by :func:`set_json_codec`.
+
+    Raises:
+        ValueError: If *codec* is an unknown name.
+    """
+    if codec is None:
+        return _default_codec
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec == "auto":
+        for name in _AUTO_ORDER:
+            try:
+                return _CODECS[name]()
+            except ImportError:
+                continue
+        return JsonCodec()
+    if codec not in _CODECS:
+        raise ValueError(
+            f"Unknown JSON codec {codec!r}; expected one of "
+            f"{', '.join(['auto', *_CODECS])}"
+        )
+    try:
+        return _CODECS[codec]()
+    except ImportError:
+        return JsonCodec()
+
+
+def set_json_codec(codec: Union[CodecName, JsonCodec]) -> JsonCodec:
+    """Set the process-wide default codec and return it.
+
+    The default is used wherever no SDK configuration is at hand: request
+    bodies, the disk cache and
+    :func:`~griddy.core.utils.serializers.dump_json`, and by SDKs
+    created without a ``json_codec``.
+    """
+    global _default_codec
+    _default_codec = get_json_codec(codec)
+    return _default_codec
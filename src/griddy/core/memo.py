@@ -0,0 +1,129 @@
+"""Skip validation of response bodies that have not changed.
+
+Live endpoints are polled far more often than their data changes: between
+plays, ``getLiveGameScores`` or ``getLivePlayerStatistics`` return the same
+bytes poll after poll, and validating those bodies into models dominates the
+per-poll CPU cost. A :class:`ResponseMemo` remembers the last body and result
+for each call; when the next response body is byte-identical, the previous
+result is returned without parsing or validating anything.
+
+Unlike :class:`~griddy.core.cache.ResponseCache`, the request is always sent,
+so results are never stale. Calls are identical when they share the operation
+ID, resolved base URL and serialized request model. Repeat polls receive the
+*same* result object, so treat results as read-only when a memo is enabled.
+
+Example::
+
+    from griddy.core.memo import ResponseMemo
+    from griddy.nfl import GriddyNFL
+
+    memo = ResponseMemo(operations=["getLive*"])
+    nfl = GriddyNFL(nfl_auth=auth, response_memo=memo)
+    while game_on:
+        stats = nfl.football_stats.live.get_player_statistics(game_id=game_id)
+        ...
+    print(memo.stats())
+"""
+
+import fnmatch
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, Tuple, TypeVar
+
+from griddy.core.cache import ResponseCache
+
+T = TypeVar("T")
+
+
+@dataclass
+class MemoStats:
+    """Hit/miss counters for a :class:`ResponseMemo`."""
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of responses whose body was unchanged (0.0 when unused)."""
+        total = self.hits + self.misses
+        if total == 0:
+            return 0.0
+        return self.hits / total
+
+
+class ResponseMemo:
+    """Reuse the previous result when a response body is byte-identical.
+
+    Args:
+        operations: Operation IDs (or ``fnmatch`` patterns) to memoize.
+            ``None`` memoizes every ``GET`` operation.
+        max_entries: Number of distinct calls remembered, least recently
+            used first out.
+    """
+
+    def __init__(
+        self, operations: Optional[Iterable[str]] = None, max_entries: int = 256
+    ) -> None:
+        """Initialize the memo with its operation filter and size bound."""
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.operations = None if operations is None else tuple(operations)
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[bytes, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = MemoStats()
+
+    make_key = staticmethod(ResponseCache.make_key)
+
+    def applies_to(self, operation_id: str) -> bool:
+        """Return ``True`` if responses of *operation_id* are memoized."""
+        if self.operations is None:
+            return True
+        return any(
+            fnmatch.fnmatchcase(operation_id, pattern) for pattern in self.operations
+        )
+
+    def decode(self, key: str, body: bytes, decode: Callable[[], T]) -> T:
+        """Return the previous result for *key* if *body* is unchanged.
+
+        Args:
+            key: A key produced by :meth:`make_key`.
+            body: The raw response body.
+            decode: Parses and validates *body*; only called when it changed.
+
+        Returns:
+            The memoized result, or the freshly decoded one.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == body:
+            with self._lock:
+                self._stats.hits += 1
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            return entry[1]
+
+        result = decode()
+        with self._lock:
+            self._stats.misses += 1
+            self._entries[key] = (body, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Forget every remembered response."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> MemoStats:
+        """Return a snapshot of the hit/miss counters."""
+        with self._lock:
+            return MemoStats(self._stats.hits, self._stats.misses)
+
+    def __len__(self) -> int:
+        """Return the number of remembered calls."""
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,398 @@
+"""Compressed on-disk cache for scraped HTML pages.
+
+PFR and DraftBuzz pages are rendered by a headless browser (Browserless or
+Playwright), which takes seconds per page and, behind a paid proxy, costs
+money. Many of those pages never change: a 2015 box score or the 1995 draft
+reads the same forever. :class:`PageCache` keeps each fetched page on disk,
+gzip-compressed in a file named by the SHA-256 of its URL. ``GriddyPFR``
+and ``GriddyDraftBuzz`` consult it before scraping and only store a page
+once it has parsed and validated, so a challenge or error page is never
+kept. :class:`CachedScrapingBackend` / :class:`AsyncCachedScrapingBackend`
+put it in front of any other scraping backend; they store every page they
+fetch.
+
+How long a page stays fresh is decided from its URL path:
+
+1. ``ttl_rules``: ``fnmatch`` patterns on the path, first match wins,
+   merged over :data:`~griddy.core._constants.DEFAULT_PAGE_CACHE_TTL_RULES`
+   (box scores never expire).
+2. The season rule: a path naming a season before the current one
+   (``/years/2015/``, ``/teams/nwe/2015.htm``) never expires.
+3. ``default_ttl`` for everything else, such as current-season pages.
+
+As in :class:`~griddy.core.cache.ResponseCache`, ``None`` never expires and
+``0`` is never cached. The freshness of a stored page is worked out from its
+URL at read time, so a season's pages freeze once the season is over. The
+cache is capped at ``max_bytes`` of compressed pages, evicting the least
+recently used ones first.
+
+Example::
+
+    from griddy.core.pagecache import PageCache
+    from griddy.pfr import GriddyPFR
+
+    cache = PageCache("~/.cache/griddy/pages", max_bytes=256 * 1024 * 1024)
+    pfr = GriddyPFR(page_cache=cache)
+    pfr.games.get_game_details(game_id="201509100nwe")
+    print(cache.stats())
+"""
+
+import asyncio
+import fnmatch
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+from griddy.core._constants import (
+    DEFAULT_PAGE_CACHE_MAX_BYTES,
+    DEFAULT_PAGE_CACHE_TTL,
+    DEFAULT_PAGE_CACHE_TTL_RULES,
+)
+
+TTL = Optional[float]
+
+_SUFFIX = ".html.gz"
+
+# A four-digit season in a URL path, not part of a longer number such as
+# the date in a box score ID.
+_SEASON_RE = re.compile(r"(?<!\d)(?:19|20)\d{2}(?!\d)")
+
+
+@dataclass
+class PageCacheStats:
+    """Counters and size of a :class:`PageCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Total number of cache lookups."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from disk (0.0 when unused)."""
+        if self.lookups == 0:
+            return 0.0
+        return self.hits / self.lookups
+
+
+def current_season(now: float) -> int:
+    """Return the NFL season under way at *now* (seconds since the epoch).
+
+    A season runs from September to the Super Bowl in February, so January
+    and February belong to the previous year's season.
+    """
+    date = time.gmtime(now)
+    return date.tm_year if date.tm_mon >= 3 else date.tm_year - 1
+
+
+class PageCache:
+    """Size-capped, gzip-compressed page store keyed by URL.
+
+    Each page is one file holding a JSON header line (URL and time stored)
+    followed by the HTML, written atomically. The least-recently-used order
+    is kept in memory and persisted through file modification times, which
+    are bumped on every hit, so it survives restarts. All bookkeeping is
+    guarded by a lock so a cache can be shared between threads and between
+    the sync and async backends.
+
+    Args:
+        directory: Directory holding the cached pages; created if missing.
+        max_bytes: Cap on the compressed size of all pages. Least recently
+            used pages are evicted to stay under it.
+        default_ttl: TTL in seconds for pages no rule matches.
+        ttl_rules: Mapping of URL path ``fnmatch`` pattern to TTL, merged
+            over :data:`~griddy.core._constants.DEFAULT_PAGE_CACHE_TTL_RULES`.
+        freeze_past_seasons: Never expire pages whose path names a season
+            before the current one.
+        compresslevel: gzip level, 1 (fastest) to 9 (smallest).
+        clock: Time source returning seconds since the epoch.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, os.PathLike],
+        max_bytes: int = DEFAULT_PAGE_CACHE_MAX_BYTES,
+        default_ttl: TTL = DEFAULT_PAGE_CACHE_TTL,
+        ttl_rules: Optional[Mapping[str, TTL]] = None,
+        freeze_past_seasons: bool = True,
+        compresslevel: int = 6,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Create the cache directory and TTL rules."""
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.directory = Path(directory).expanduser()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.ttl_rules: Dict[str, TTL] = dict(ttl_rules or {})
+        for pattern, ttl in DEFAULT_PAGE_CACHE_TTL_RULES.items():
+            self.ttl_rules.setdefault(pattern, ttl)
+        self.freeze_past_seasons = freeze_past_seasons
+        self.compresslevel = compresslevel
+
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._stats = PageCacheStats()
+        # File name -> compressed size, least recently used first. Loaded
+        # from the directory on first use.
+        self._entries: "Optional[OrderedDict[str, int]]" = None
+        self._size = 0
+
+    # ------------------------------------------------------------------
+    # Policies
+    # ------------------------------------------------------------------
+
+    def ttl_for(self, url: str) -> TTL:
+        """Return the TTL of the page at *url*.
+
+        ``ttl_rules`` are tried in order against the URL path, then the
+        season rule; falls back to ``default_ttl``.
+        """
+        path = urlsplit(url).path or "/"
+        for pattern, ttl in self.ttl_rules.items():
+            if fnmatch.fnmatchcase(path, pattern):
+                return ttl
+        if self.freeze_past_seasons:
+            seasons = _SEASON_RE.findall(path)
+            if seasons and max(map(int, seasons)) < current_season(self._clock()):
+                return None
+        return self.default_ttl
+
+    # ------------------------------------------------------------------
+    # Lookup / store
+    # ------------------------------------------------------------------
+
+    def get(self, url: str) -> Optional[str]:
+        """Return the cached HTML of *url*, or ``None`` if absent or expired."""
+        name = self._file_name(url)
+        path = self.directory / name
+        now = self._clock()
+        page = self._read(path, url)
+        if page is not None:
+            stored_at, html = page
+            ttl = self.ttl_for(url)
+            if ttl is None or stored_at + ttl > now:
+                try:
+                    os.utime(path, (now, now))
+                except OSError:
+                    pass
+                with self._lock:
+                    entries = self._index()
+                    if name in entries:
+                        entries.move_to_end(name)
+                    self._stats.hits += 1
+                return html
+            path.unlink(missing_ok=True)
+            with self._lock:
+                self._forget(name)
+                self._stats.expirations += 1
+
+        with self._lock:
+            self._stats.misses += 1
+        return None
+
+    def set(self, url: str, html: str) -> None:
+        """Store the HTML of *url*, evicting least recently used pages.
+
+        Empty pages, pages whose TTL is ``0`` and pages larger than
+        ``max_bytes`` once compressed are not stored.
+        """
+        ttl = self.ttl_for(url)
+        if not html or (ttl is not None and ttl <= 0):
+            return
+
+        now = self._clock()
+        header = json.dumps({"url": url, "stored_at": now})
+        payload = gzip.compress(
+            f"{header}\n{html}".encode("utf-8"),
+            compresslevel=self.compresslevel,
+            mtime=0,
+        )
+        if len(payload) > self.max_bytes:
+            return
+
+        name = self._file_name(url)
+        tmp = None
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(payload)
+            os.replace(tmp, self.directory / name)
+            tmp = None
+            os.utime(self.directory / name, (now, now))
+        except OSError:
+            return
+        finally:
+            if tmp is not None:
+                Path(tmp).unlink(missing_ok=True)
+
+        with self._lock:
+            entries = self._index()
+            self._forget(name)
+            entries[name] = len(payload)
+            self._size += len(payload)
+            self._stats.stores += 1
+            while self._size > self.max_bytes:
+                evicted, size = entries.popitem(last=False)
+                self._size -= size
+                (self.directory / evicted).unlink(missing_ok=True)
+                self._stats.evictions += 1
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def invalidate(self, url: str) -> None:
+        """Remove the page of *url*."""
+        name = self._file_name(url)
+        (self.directory / name).unlink(missing_ok=True)
+        with self._lock:
+            self._forget(name)
+
+    def clear(self) -> None:
+        """Remove every page. Statistics are preserved."""
+        with self._lock:
+            for path in self.directory.glob(f"*{_SUFFIX}"):
+                path.unlink(missing_ok=True)
+            self._entries = OrderedDict()
+            self._size = 0
+
+    def stats(self) -> PageCacheStats:
+        """Return a snapshot of the counters and the cache's current size."""
+        with self._lock:
+            entries = self._index()
+            return replace(self._stats, entries=len(entries), size_bytes=self._size)
+
+    def reset_stats(self) -> None:
+        """Zero all counters."""
+        with self._lock:
+            self._stats = PageCacheStats()
+
+    def __len__(self) -> int:
+        """Return the number of cached pages."""
+        with self._lock:
+            return len(self._index())
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _file_name(url: str) -> str:
+        """Return the file name of the page of *url*."""
+        return hashlib.sha256(url.encode("utf-8")).hexdigest() + _SUFFIX
+
+    def _index(self) -> "OrderedDict[str, int]":
+        """Return the LRU index, scanning the directory on first use.
+
+        Caller holds the lock.
+        """
+        if self._entries is None:
+            found = []
+            for path in self.directory.glob(f"*{_SUFFIX}"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                found.append((stat.st_mtime, path.name, stat.st_size))
+            found.sort()
+            self._entries = OrderedDict((name, size) for _, name, size in found)
+            self._size = sum(size for _, _, size in found)
+        return self._entries
+
+    def _forget(self, name: str) -> None:
+        """Drop *name* from the LRU index. Caller holds the lock."""
+        size = self._index().pop(name, None)
+        if size is not None:
+            self._size -= size
+
+    @staticmethod
+    def _read(path: Path, url: str) -> Optional[Tuple[float, str]]:
+        """Return ``(stored_at, html)`` from the file at *path*.
+
+        ``None`` if the file is missing, unreadable, or holds another URL.
+        """
+        try:
+            data = gzip.decompress(path.read_bytes())
+            header, _, body = data.partition(b"\n")
+            meta: Dict[str, Any] = json.loads(header)
+            if meta.get("url") != url:
+                return None
+            return float(meta["stored_at"]), body.decode("utf-8")
+        except OSError, EOFError, ValueError, KeyError, TypeError, zlib.error:
+            return None
+
+
+class CachedScrapingBackend:
+    """Synchronous scraping backend that serves pages from a :class:`PageCache`.
+
+    Pages missing from *cache* are fetched with *backend* and stored as
+    they are, unchecked; the PFR and DraftBuzz SDKs use the cache directly
+    so they can store only pages that parsed.
+
+    Args:
+        backend: The backend that fetches pages, such as Browserless.
+        cache: Where fetched pages are kept.
+    """
+
+    def __init__(self, backend: Any, cache: PageCache) -> None:
+        """Wrap *backend* with *cache*."""
+        self.backend = backend
+        self.cache = cache
+
+    def get_page_content(self, url: str, wait_for_element: str) -> str:
+        """Return the HTML of *url* from the cache, fetching it on a miss."""
+        html = self.cache.get(url)
+        if html is None:
+            html = self.backend.get_page_content(url, wait_for_element=wait_for_element)
+            self.cache.set(url, html)
+        return html
+
+
+class AsyncCachedScrapingBackend:
+    """Asynchronous counterpart of :class:`CachedScrapingBackend`.
+
+    Args:
+        backend: The async backend that fetches pages.
+        cache: Where fetched pages are kept.
+    """
+
+    def __init__(self, backend: Any, cache: PageCache) -> None:
+        """Wrap *backend* with *cache*."""
+        self.backend = backend
+        self.cache = cache
+
+    async def get_page_content(self, url: str, wait_for_element: str) -> str:
+        """Return the HTML of *url* from the cache, fetching it on a miss.
+
+        Cache reads and writes run in a worker thread so disk I/O never
+        blocks the event loop.
+        """
+        html = await asyncio.to_thread(self.cache.get, url)
+        if html is None:
+            html = await self.backend.get_page_content(
+                url, wait_for_element=wait_for_element
+            )
+            await asyncio.to_thread(self.cache.set, url, html)
+        return html
@@ -0,0 +1,169 @@
+"""Auto-pagination for ``limit``/``offset`` endpoints.
+
+:func:`griddy.core.decorators.sdk_endpoints` generates ``iter_<name>`` and
+``aiter_<name>`` methods for every config method that accepts both ``limit``
+and ``offset``. The generated iterators fetch the first page, read ``total``
+from it, then keep up to ``prefetch`` further pages in flight while yielding
+rows one at a time. Only the pages inside that window are held in memory.
+
+The rows of a page are the first field of the response model typed as a
+list of models (``passers``, ``rushers``, ``defenders``, ``offense``, ...).
+"""
+
+import asyncio
+import inspect
+import typing
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Deque, Dict, Iterator, Optional
+
+import pydantic
+
+from griddy.core._constants import DEFAULT_PAGINATION_PREFETCH
+
+
+def is_paginated(config_fn: Callable[..., Any]) -> bool:
+    """Return ``True`` if *config_fn* takes ``limit`` and ``offset`` params."""
+    return {"limit", "offset"} <= _parameters(config_fn)
+
+
+@lru_cache(maxsize=None)
+def rows_field(response_type: type) -> str:
+    """Return the name of the field that holds the rows of *response_type*.
+
+    Raises:
+        TypeError: If the model has no ``List[<model>]`` field.
+    """
+    for name, info in response_type.model_fields.items():
+        if typing.get_origin(info.annotation) is not list:
+            continue
+        (item_type,) = typing.get_args(info.annotation) or (None,)
+        if isinstance(item_type, type) and issubclass(item_type, pydantic.BaseModel):
+            return name
+    raise TypeError(f"{response_type.__name__} has no list-of-models field to page")
+
+
+class _Pager:
+    """Builds the endpoint config for each page of a paginated call."""
+
+    def __init__(
+        self,
+        sdk: Any,
+        config_fn: Callable[..., Any],
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ):
+        self._sdk = sdk
+        self._config_fn = config_fn
+        self._args = args
+        self._kwargs = kwargs
+        self.first = config_fn(sdk, *args, **kwargs)
+        self.limit: Optional[int] = getattr(self.first.request, "limit", None)
+        self.start: int = getattr(self.first.request, "offset", None) or 0
+        self._has_page = "page" in _parameters(config_fn)
+
+    def offsets(self, total: int) -> range:
+        """Offsets of the pages that follow the first one."""
+        if not self.limit or self.limit <= 0:
+            return range(0)
+        return range(self.start + self.limit, total, self.limit)
+
+    def config(self, offset: int) -> Any:
+        """Endpoint config for the page starting at *offset*."""
+        kwargs = dict(self._kwargs, offset=offset)
+        if self._has_page:
+            kwargs["page"] = offset // self.limit + 1
+        return self._config_fn(self._sdk, *self._args, **kwargs)
+
+
+def iter_rows(
+    sdk: Any,
+    config_fn: Callable[..., Any],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    prefetch: int = DEFAULT_PAGINATION_PREFETCH,
+) -> Iterator[Any]:
+    """Yield every row of a paginated endpoint (sync).
+
+    Pages after the first are fetched on a small thread pool sharing the
+    SDK's pooled ``httpx.Client``.
+    """
+    _check_prefetch(prefetch)
+    pager = _Pager(sdk, config_fn, args, kwargs)
+    first = sdk._execute_endpoint(pager.first)
+    field = rows_field(type(first))
+    offsets = iter(pager.offsets(first.total))
+    pending: Deque[Future] = deque()
+    pool = ThreadPoolExecutor(max_workers=prefetch)
+
+    def launch() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            pending.append(pool.submit(sdk._execute_endpoint, pager.config(offset)))
+
+    try:
+        for _ in range(prefetch):
+            launch()
+        rows = getattr(first, field)
+        del first
+        yield from rows
+        while pending:
+            rows = getattr(pending.popleft().result(), field)
+            launch()
+            if not rows:
+                break
+            yield from rows
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_rows(
+    sdk: Any,
+    config_fn: Callable[..., Any],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    prefetch: int = DEFAULT_PAGINATION_PREFETCH,
+) -> AsyncIterator[Any]:
+    """Yield every row of a paginated endpoint (async)."""
+    _check_prefetch(prefetch)
+    pager = _Pager(sdk, config_fn, args, kwargs)
+    first = await sdk._execute_endpoint_async(pager.first)
+    field = rows_field(type(first))
+    offsets = iter(pager.offsets(first.total))
+    pending: Deque[asyncio.Future] = deque()
+
+    def launch() -> None:
+        offset = next(offsets, None)
+        if offset is not None:
+            pending.append(
+                asyncio.ensure_future(sdk._execute_endpoint_async(pager.config(offset)))
+            )
+
+    try:
+        for _ in range(prefetch):
+            launch()
+        rows = getattr(first, field)
+        del first
+        for row in rows:
+            yield row
+        while pending:
+            rows = getattr(await pending.popleft(), field)
+            launch()
+            if not rows:
+                break
+            for row in rows:
+                yield row
+    finally:
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _parameters(config_fn: Callable[..., Any]) -> set:
+    return set(inspect.signature(config_fn).parameters)
+
+
+def _check_prefetch(prefetch: int) -> None:
+    if prefetch < 1:
+        raise ValueError(f"prefetch must be at least 1, got {prefetch}")
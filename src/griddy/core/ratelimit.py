@@ -0,0 +1,157 @@
+"""Client-side, per-host token-bucket rate limiting.
+
+:class:`RateLimiter` holds one :class:`TokenBucket` per host and is consulted
+by :meth:`griddy.core.basesdk.BaseSDK.do_request` (and its async twin) before
+every send, including retries. It lives on ``SDKConfiguration``, so every
+lazily-created sub-SDK of a top-level SDK shares it; pass the same instance to
+several SDKs to share a budget across them.
+
+Waiting is reservation based: each caller takes the next free slot and sleeps
+until it arrives, so concurrent coroutines queue in FIFO order instead of
+waking up and retrying. Sync callers block with :func:`time.sleep`; async
+callers ``await asyncio.sleep`` and never block the event loop.
+
+Example::
+
+    from griddy.core.ratelimit import RateLimit, RateLimiter
+    from griddy.nfl import GriddyNFL
+
+    limiter = RateLimiter({"pro.nfl.com": RateLimit(rate=5, burst=10)})
+    nfl = GriddyNFL(nfl_auth=auth, rate_limiter=limiter)
+"""
+
+import asyncio
+import fnmatch
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Mapping, Optional, Union
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A sustained request rate with an allowed burst.
+
+    Attributes:
+        rate: Requests per second refilled into the bucket.
+        burst: Bucket capacity, i.e. requests that may be sent back to back.
+    """
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError(f"rate must be positive, got {self.rate}")
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+
+
+class TokenBucket:
+    """Thread-safe token bucket usable from sync and async code."""
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limit = limit
+        self._clock = clock
+        self._tokens = float(limit.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long to wait before using it.
+
+        The bucket may go negative: later callers are handed later slots, so
+        waiters are served in the order they called :meth:`reserve`.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                float(self.limit.burst),
+                self._tokens + (now - self._updated) * self.limit.rate,
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.limit.rate
+
+    def acquire(self) -> None:
+        """Block the calling thread until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait without blocking the event loop until a token is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+class RateLimiter:
+    """Per-host collection of token buckets.
+
+    Args:
+        limits: Mapping of host (or ``fnmatch`` pattern such as
+            ``"*.nfl.com"``) to a :class:`RateLimit` or ``(rate, burst)``
+            tuple. Exact host matches win over patterns.
+        default: Limit applied to hosts not listed in *limits*; ``None``
+            leaves them unthrottled.
+        clock: Monotonic clock, injectable for tests.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Mapping[str, Union[RateLimit, tuple]]] = None,
+        default: Optional[Union[RateLimit, tuple]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limits: Dict[str, RateLimit] = {
+            host: _as_limit(limit) for host, limit in (limits or {}).items()
+        }
+        self.default = None if default is None else _as_limit(default)
+        self._clock = clock
+        self._buckets: Dict[str, Optional[TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, host: str) -> Optional[TokenBucket]:
+        """Return the bucket governing *host*, or ``None`` if unthrottled."""
+        try:
+            return self._buckets[host]
+        except KeyError:
+            pass
+        with self._lock:
+            if host not in self._buckets:
+                limit = self._limit_for(host)
+                self._buckets[host] = (
+                    None if limit is None else TokenBucket(limit, self._clock)
+                )
+            return self._buckets[host]
+
+    def acquire(self, host: str) -> None:
+        """Block until a request to *host* may be sent."""
+        bucket = self.bucket_for(host)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, host: str) -> None:
+        """Await until a request to *host* may be sent."""
+        bucket = self.bucket_for(host)
+        if bucket is not None:
+            await bucket.acquire_async()
+
+    def _limit_for(self, host: str) -> Optional[RateLimit]:
+        if host in self.limits:
+            return self.limits[host]
+        for pattern, limit in self.limits.items():
+            if fnmatch.fnmatchcase(host, pattern):
+                return limit
+        return self.default
+
+
+def _as_limit(limit: Union[RateLimit, tuple]) -> RateLimit:
+    return limit if isinstance(limit, RateLimit) else RateLimit(*limit)
@@ -3,9 +3,14 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Tuple, Union
 
+from griddy.core.cache import ResponseCache
+from griddy.core.coalesce import RequestCoalescer
 from griddy.core.httpclient import AsyncHttpClient, HttpClient
+from griddy.core.jsoncodec import JsonCodec
+from griddy.core.memo import ResponseMemo
+from griddy.core.ratelimit import RateLimiter
 from griddy.core.types import UNSET, OptionalNullable
-from griddy.core.utils import Logger, RetryConfig, remove_suffix
+from griddy.core.utils import Logger, RetryBudget, RetryConfig, remove_suffix
 
 
 @dataclass
@@ -25,6 +30,14 @@ class SDKConfiguration:
     user_agent: str = "griddy-sdk-python"
     retry_config: OptionalNullable[RetryConfig] = field(default_factory=lambda: UNSET)
     timeout_ms: Optional[int] = None
+    response_cache: Optional[ResponseCache] = field(default=None, repr=False)
+    rate_limiter: Optional[RateLimiter] = field(default=None, repr=False)
+    request_coalescer: Optional[RequestCoalescer] = field(default=None, repr=False)
+    response_memo: Optional[ResponseMemo] = field(default=None, repr=False)
+    retry_budget: Optional[RetryBudget] = field(default=None, repr=False)
+    # Decodes raw JSON responses only; request bodies and the disk cache
+    # tier use the process default (see set_json_codec).
+    json_codec: Optional[JsonCodec] = field(default=None, repr=False)
     _hooks: Optional[Any] = field(default=None, init=False, repr=False)
 
     @property
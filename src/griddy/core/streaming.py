@@ -0,0 +1,223 @@
+"""Incremental parsing of large list-shaped responses.
+
+Play-by-play and Film Room responses run to several megabytes, and decoding
+them the usual way buffers the whole body and validates every play before
+the first one is available. Config methods marked with :func:`stream_rows`
+get ``iter_<name>`` and ``aiter_<name>`` methods from
+:func:`griddy.core.decorators.sdk_endpoints` that instead read the response
+as it arrives, parse each row out of the JSON with :class:`JsonItemScanner`
+and validate it on its own. Only the rows of the current network chunk are
+held in memory.
+
+Example::
+
+    for play in nfl.games.iter_play_by_play(game_id=game_id):
+        print(play.description)
+"""
+
+import codecs
+import json
+import re
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import httpx
+
+from griddy.core import utils
+from griddy.core._constants import HTTP_OK
+from griddy.core.columnar import rows_path
+from griddy.core.utils.serializers import get_type_adapter
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+_STREAM_ROWS_ATTR = "__griddy_stream_rows__"
+
+# A complete or truncated string, or a structural character. The closing
+# quote group is empty when the chunk ends inside the string.
+_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*("?)|[{}\[\]:,]')
+_ITEM_GAP = re.compile(r"[\s,]*")
+_DECODER = json.JSONDecoder()
+
+
+def stream_rows(rows: str) -> Callable[[F], F]:
+    """Mark a config method whose response rows can be streamed.
+
+    Args:
+        rows: Dotted path of the rows field by field name, e.g.
+            ``"drives.plays"``; nested lists are flattened.
+    """
+
+    def mark(config_fn: F) -> F:
+        setattr(config_fn, _STREAM_ROWS_ATTR, rows)
+        return config_fn
+
+    return mark
+
+
+def streamed_rows(config_fn: Callable[..., Any]) -> Optional[str]:
+    """Return the rows path *config_fn* was marked with, if any."""
+    return getattr(config_fn, _STREAM_ROWS_ATTR, None)
+
+
+class JsonItemScanner:
+    """Parse the items of a nested JSON array out of a body fed in chunks.
+
+    The array is addressed by the object keys leading to it; every key but
+    the last must hold an array of objects, whose items are walked in turn
+    (``("drives", "plays")`` yields each play of each drive). Everything
+    outside the array is skipped without being parsed, and each item is
+    decoded by the C JSON scanner as soon as it is complete.
+
+    Args:
+        keys: JSON object keys leading to the array.
+    """
+
+    def __init__(self, keys: Sequence[str]) -> None:
+        """Initialize the scanner for the array at *keys*."""
+        # One entry per enclosing container: the key of its current member
+        # for objects, ``None`` for arrays.
+        self._target: List[Optional[str]] = [
+            part for key in keys for part in (key, None)
+        ][:-1]
+        self._stack: List[List[Any]] = []
+        self._expect_key = False
+        self._in_items = False
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._text = ""
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add *chunk* to the body and return the items it completed."""
+        text = self._text + self._utf8.decode(chunk)
+        items: List[Any] = []
+        pos = 0
+        while True:
+            if self._in_items:
+                pos = _ITEM_GAP.match(text, pos).end()
+                if pos == len(text):
+                    break
+                if text[pos] == "]":
+                    self._close_container()
+                    self._in_items = False
+                    pos += 1
+                    continue
+                try:
+                    item, end = _DECODER.raw_decode(text, pos)
+                except json.JSONDecodeError:
+                    break  # the item continues in the next chunk
+                if end == len(text):
+                    break  # a number may continue in the next chunk
+                items.append(item)
+                pos = end
+                continue
+
+            match = _TOKEN.search(text, pos)
+            if match is None:
+                pos = len(text)
+                break
+            token = match.group()
+            if token[0] == '"':
+                if not match.group(1):
+                    pos = match.start()
+                    break
+                if self._expect_key:
+                    self._stack[-1][1] = json.loads(token)
+                    self._expect_key = False
+            elif token in "{[":
+                self._in_items = token == "[" and self._at_target()
+                self._stack.append([token == "{", None])
+                self._expect_key = token == "{"
+            elif token in "}]":
+                self._close_container()
+            elif token == ",":
+                self._expect_key = bool(self._stack) and self._stack[-1][0]
+            pos = match.end()
+
+        self._text = text[pos:]
+        return items
+
+    def close(self) -> None:
+        """Check that the whole body was consumed.
+
+        Raises:
+            ValueError: If the body was truncated or is not valid JSON.
+        """
+        if self._in_items or (self._text + self._utf8.decode(b"", True)).strip():
+            raise ValueError("JSON body is truncated or malformed")
+
+    def _close_container(self) -> None:
+        self._stack.pop()
+        self._expect_key = False
+
+    def _at_target(self) -> bool:
+        stack = self._stack
+        return (
+            len(stack) == len(self._target)
+            and [frame[1] for frame in stack] == self._target
+        )
+
+
+def iter_streamed(
+    sdk: Any,
+    config_fn: Callable[..., Any],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    rows: str,
+) -> Iterator[Any]:
+    """Yield the validated rows of a streamed endpoint response (sync)."""
+    config = config_fn(sdk, *args, **kwargs)
+    keys, row_type = rows_path(config.response_type, rows)
+    http_res = sdk._open_stream(config)
+    try:
+        if not _is_json_ok(http_res):
+            http_res.read()
+            sdk._handle_json_response(
+                http_res, config.response_type, config.error_status_codes
+            )
+        validate = get_type_adapter(row_type).validate_python
+        scanner = JsonItemScanner(keys)
+        for chunk in http_res.iter_bytes():
+            for item in scanner.feed(chunk):
+                yield validate(item)
+        scanner.close()
+    finally:
+        http_res.close()
+
+
+async def aiter_streamed(
+    sdk: Any,
+    config_fn: Callable[..., Any],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    rows: str,
+) -> AsyncIterator[Any]:
+    """Yield the validated rows of a streamed endpoint response (async)."""
+    config = config_fn(sdk, *args, **kwargs)
+    keys, row_type = rows_path(config.response_type, rows)
+    http_res = await sdk._open_stream_async(config)
+    try:
+        if not _is_json_ok(http_res):
+            await http_res.aread()
+            sdk._handle_json_response(
+                http_res, config.response_type, config.error_status_codes
+            )
+        validate = get_type_adapter(row_type).validate_python
+        scanner = JsonItemScanner(keys)
+        async for chunk in http_res.aiter_bytes():
+            for item in scanner.feed(chunk):
+                yield validate(item)
+        scanner.close()
+    finally:
+        await http_res.aclose()
+
+
+def _is_json_ok(http_res: httpx.Response) -> bool:
+    return utils.match_response(http_res, HTTP_OK, "application/json")
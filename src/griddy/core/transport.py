@@ -0,0 +1,229 @@
+"""Connection pooling, HTTP/2 and compression options for SDK HTTP clients.
+
+:class:`HttpOptions` describes how :meth:`BaseGriddySDK._init_sdk` builds the
+default ``httpx`` clients: pool limits, keep-alive expiry, HTTP/2 and the
+``Accept-Encoding`` header. :class:`ConnectionPool` owns one sync and one
+async transport built from those options. Pass the same pool to
+``GriddyNFL``, ``GriddyPFR`` and ``GriddyDraftBuzz`` so they share keep-alive
+connections.
+
+HTTP/2 needs the ``h2`` package (``pip install "httpx[http2]"``). Brotli and
+zstd are only advertised when the package ``httpx`` decodes them with is
+installed (``pip install "httpx[brotli,zstd]"``).
+
+Example::
+
+    from griddy.core.transport import ConnectionPool, HttpOptions
+    from griddy.nfl import GriddyNFL
+    from griddy.pfr import GriddyPFR
+
+    pool = ConnectionPool(HttpOptions(max_connections=200, http2=True))
+    nfl = GriddyNFL(nfl_auth=auth, connection_pool=pool)
+    pfr = GriddyPFR(connection_pool=pool)
+    ...
+    pool.close()
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import Any, Dict, FrozenSet, Optional, Tuple
+
+import httpx
+
+from griddy.core._constants import (
+    DEFAULT_KEEPALIVE_EXPIRY,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    PREFERRED_CONTENT_ENCODINGS,
+)
+
+# Optional packages httpx decodes each content coding with; gzip and deflate
+# only need the standard library.
+_DECODER_PACKAGES: Dict[str, Tuple[str, ...]] = {
+    "br": ("brotli", "brotlicffi"),
+    "zstd": ("zstandard",),
+}
+
+
+@lru_cache(maxsize=None)
+def _decodable_encodings() -> FrozenSet[str]:
+    """Content codings whose decoder package is installed."""
+    return frozenset(
+        coding
+        for coding in PREFERRED_CONTENT_ENCODINGS
+        if coding not in _DECODER_PACKAGES
+        or any(find_spec(package) is not None for package in _DECODER_PACKAGES[coding])
+    )
+
+
+@dataclass(frozen=True)
+class HttpOptions:
+    """Settings for the HTTP clients an SDK creates for itself.
+
+    Attributes:
+        max_connections: Maximum concurrent connections (``None`` = no limit).
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection is kept open.
+        http2: Negotiate HTTP/2 so concurrent requests share one connection.
+        compression: Advertise every content coding ``httpx`` can decode,
+            best first. When ``False`` responses are requested uncompressed.
+        follow_redirects: Follow HTTP redirects.
+    """
+
+    max_connections: Optional[int] = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: Optional[int] = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: Optional[float] = DEFAULT_KEEPALIVE_EXPIRY
+    http2: bool = False
+    compression: bool = True
+    follow_redirects: bool = True
+
+    @property
+    def limits(self) -> httpx.Limits:
+        """Pool limits for ``httpx`` transports."""
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def accept_encoding(self) -> str:
+        """Value of the ``Accept-Encoding`` header sent by SDK clients."""
+        if not self.compression:
+            return "identity"
+        return ", ".join(
+            coding
+            for coding in PREFERRED_CONTENT_ENCODINGS
+            if coding in _decodable_encodings()
+        )
+
+    def client_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments shared by sync and async client construction."""
+        return {
+            "follow_redirects": self.follow_redirects,
+            "headers": {"Accept-Encoding": self.accept_encoding},
+        }
+
+    def create_client(
+        self, transport: Optional[httpx.BaseTransport] = None
+    ) -> httpx.Client:
+        """Build a sync client, optionally on a shared *transport*."""
+        if transport is None:
+            return httpx.Client(
+                limits=self.limits, http2=self.http2, **self.client_kwargs()
+            )
+        return httpx.Client(transport=transport, **self.client_kwargs())
+
+    def create_async_client(
+        self, transport: Optional[httpx.AsyncBaseTransport] = None
+    ) -> httpx.AsyncClient:
+        """Build an async client, optionally on a shared *transport*."""
+        if transport is None:
+            return httpx.AsyncClient(
+                limits=self.limits, http2=self.http2, **self.client_kwargs()
+            )
+        return httpx.AsyncClient(transport=transport, **self.client_kwargs())
+
+
+class ConnectionPool:
+    """Sync and async transports shared by several SDK instances.
+
+    Clients created from the pool do not close its transports when they are
+    closed; call :meth:`close` / :meth:`aclose` (or use the pool as a context
+    manager) once every SDK using it is done.
+
+    Args:
+        options: Pool, HTTP/2 and compression settings.
+    """
+
+    def __init__(self, options: Optional[HttpOptions] = None) -> None:
+        """Create one sync and one async transport from *options*.
+
+        Args:
+            options: Pool, HTTP/2 and compression settings; defaults to
+                :class:`HttpOptions` ``()``.
+        """
+        self.options = options or HttpOptions()
+        self._transport = httpx.HTTPTransport(
+            limits=self.options.limits, http2=self.options.http2
+        )
+        self._async_transport = httpx.AsyncHTTPTransport(
+            limits=self.options.limits, http2=self.options.http2
+        )
+
+    def create_client(self) -> httpx.Client:
+        """Build a sync client on the shared transport."""
+        return self.options.create_client(_SharedTransport(self._transport))
+
+    def create_async_client(self) -> httpx.AsyncClient:
+        """Build an async client on the shared transport."""
+        return self.options.create_async_client(
+            _SharedAsyncTransport(self._async_transport)
+        )
+
+    def close(self) -> None:
+        """Close the sync transport.
+
+        The async transport is left open: its connections belong to the
+        event loop that opened them and can only be released by awaiting
+        :meth:`aclose` on that loop. Pools used by async SDKs should be
+        closed with :meth:`aclose` or ``async with``.
+        """
+        self._transport.close()
+
+    async def aclose(self) -> None:
+        """Close both transports."""
+        self._transport.close()
+        await self._async_transport.aclose()
+
+    def __enter__(self) -> "ConnectionPool":
+        """Enter the pool context manager."""
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        """Exit the pool context manager, closing the sync transport.
+
+        See :meth:`close` for why the async transport stays open.
+        """
+        self.close()
+
+    async def __aenter__(self) -> "ConnectionPool":
+        """Enter the async pool context manager."""
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        """Exit the async pool context manager, closing both transports."""
+        await self.aclose()
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Delegating transport whose ``close`` leaves the shared pool open."""
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        """Wrap the pool's *transport*."""
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        """Send *request* over the shared transport."""
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        """Do nothing; the owning :class:`ConnectionPool` closes the transport."""
+        pass
+
+
+class _SharedAsyncTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`_SharedTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        """Wrap the pool's async *transport*."""
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send *request* over the shared async transport."""
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        """Do nothing; the owning :class:`ConnectionPool` closes the transport."""
+        pass
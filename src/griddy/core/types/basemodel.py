@@ -18,29 +18,48 @@ class BaseModel(PydanticBaseModel):
     def serialize_model(self, handler: Any) -> dict[str, Any]:
         """Serialize the model using aliases, omitting unset optional-nullable fields."""
         serialized = handler(self)
+        fields_set = self.__pydantic_fields_set__
 
         m = {}
 
-        for n, f in type(self).model_fields.items():
-            k = f.alias or n
+        for n, k, keep_none, keep_none_if_set in _serialization_plan(type(self)):
             val = serialized.get(n)
-            serialized.pop(n, None)
 
-            is_optional = not f.is_required()
-            is_nullable = isinstance(f.default, Unset)
-            optional_nullable = is_optional and is_nullable
-            is_set = self.__pydantic_fields_set__.intersection({n})  # pylint: disable=no-member
-
-            if val is not None and val != UNSET_SENTINEL:
-                m[k] = val
-            elif val != UNSET_SENTINEL and (
-                not is_optional or (optional_nullable and is_set)
-            ):
+            if val is None:
+                if keep_none or (keep_none_if_set and n in fields_set):
+                    m[k] = val
+            elif val != UNSET_SENTINEL:
                 m[k] = val
 
         return m
 
 
+# Per-class ``(name, key, keep_none, keep_none_if_set)`` for every field;
+# see _serialization_plan().
+_serialization_plans: dict[type, tuple[tuple[str, str, bool, bool], ...]] = {}
+
+
+def _serialization_plan(cls: type) -> tuple[tuple[str, str, bool, bool], ...]:
+    """Return how each field of *cls* is serialized, computing it on first use.
+
+    ``None`` is kept for required fields, and for optional-nullable fields
+    (default ``UNSET``) only when they were set explicitly.
+    """
+    plan = _serialization_plans.get(cls)
+    if plan is None:
+        plan = tuple(
+            (
+                n,
+                f.alias or n,
+                f.is_required(),
+                not f.is_required() and isinstance(f.default, Unset),
+            )
+            for n, f in cls.model_fields.items()
+        )
+        _serialization_plans[cls] = plan
+    return plan
+
+
 class Unset(BaseModel):
     """Sentinel model representing an explicitly unset value."""
 
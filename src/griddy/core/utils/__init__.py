@@ -42,14 +42,18 @@ if TYPE_CHECKING:
     from .retries import (
         BackoffStrategy,
         Retries,
+        RetryBudget,
         RetryConfig,
+        parse_retry_after,
         retry,
         retry_async,
         retry_on_rate_limit,
     )
     from .security import get_security, get_security_from_env
     from .serializers import (
+        dump_json,
         get_pydantic_model,
+        get_type_adapter,
         marshal_json,
         serialize_decimal,
         serialize_float,
@@ -85,6 +89,7 @@ __all__ = [
     "Cookie",
     "cookies_to_dict",
     "cookies_to_header",
+    "dump_json",
     "extract_cookies_as_dict",
     "extract_cookies_as_header",
     "extract_cookies_for_url",
@@ -99,6 +104,7 @@ __all__ = [
     "get_global_from_env",
     "get_headers",
     "get_pydantic_model",
+    "get_type_adapter",
     "get_query_params",
     "get_response_headers",
     "get_security",
@@ -117,6 +123,7 @@ __all__ = [
     "parse_cookies_txt",
     "parse_date",
     "parse_datetime",
+    "parse_retry_after",
     "PathParamMetadata",
     "QueryParamMetadata",
     "remove_suffix",
@@ -125,6 +132,7 @@ __all__ = [
     "retry",
     "retry_async",
     "retry_on_rate_limit",
+    "RetryBudget",
     "RetryConfig",
     "safe_float",
     "safe_int",
@@ -160,6 +168,7 @@ _dynamic_imports: dict[str, str] = {
     "Cookie": ".cookies",
     "cookies_to_dict": ".cookies",
     "cookies_to_header": ".cookies",
+    "dump_json": ".serializers",
     "extract_cookies_as_dict": ".cookies",
     "extract_cookies_as_header": ".cookies",
     "extract_cookies_for_url": ".cookies",
@@ -174,6 +183,7 @@ _dynamic_imports: dict[str, str] = {
     "get_global_from_env": ".values",
     "get_headers": ".headers",
     "get_pydantic_model": ".serializers",
+    "get_type_adapter": ".serializers",
     "get_query_params": ".queryparams",
     "get_response_headers": ".headers",
     "get_security": ".security",
@@ -192,6 +202,7 @@ _dynamic_imports: dict[str, str] = {
     "parse_cookies_txt": ".cookies",
     "parse_date": ".datetimes",
     "parse_datetime": ".datetimes",
+    "parse_retry_after": ".retries",
     "PathParamMetadata": ".metadata",
     "QueryParamMetadata": ".metadata",
     "remove_suffix": ".url",
@@ -200,6 +211,7 @@ _dynamic_imports: dict[str, str] = {
     "retry": ".retries",
     "retry_async": ".retries",
     "retry_on_rate_limit": ".retries",
+    "RetryBudget": ".retries",
     "RetryConfig": ".retries",
     "safe_float": ".converters",
     "safe_int": ".converters",
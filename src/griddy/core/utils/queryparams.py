@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Optional, get_type_hints
+from typing import Any, Dict, List, Optional, Tuple, get_type_hints
 
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
@@ -39,18 +39,10 @@ def _populate_query_params(
     if not isinstance(query_params, BaseModel):
         return globals_already_populated
 
-    param_fields: Dict[str, FieldInfo] = query_params.__class__.model_fields
-    param_field_types = get_type_hints(query_params.__class__)
-    for name in param_fields:
+    for name, f_name, metadata, field_type in _query_param_plan(query_params.__class__):
         if name in skip_fields:
             continue
 
-        field = param_fields[name]
-
-        metadata = find_field_metadata(field, QueryParamMetadata)
-        if not metadata:
-            continue
-
         value = getattr(query_params, name) if _is_set(query_params) else None
 
         value, global_found = _populate_from_globals(
@@ -59,11 +51,10 @@ def _populate_query_params(
         if global_found:
             globals_already_populated.append(name)
 
-        f_name = field.alias if field.alias is not None else name
         serialization = metadata.serialization
         if serialization is not None:
             serialized_parms = _get_serialized_params(
-                metadata, f_name, value, param_field_types[name]
+                metadata, f_name, value, field_type
             )
             for key, value in serialized_parms.items():
                 if key in query_param_values:
@@ -90,6 +81,36 @@ def _populate_query_params(
     return globals_already_populated
 
 
+# Per-class ``(name, key, metadata, type)`` for every query param field;
+# see _query_param_plan().
+_query_param_plans: Dict[
+    type, Tuple[Tuple[str, str, QueryParamMetadata, Any], ...]
+] = {}
+
+
+def _query_param_plan(
+    cls: type,
+) -> Tuple[Tuple[str, str, QueryParamMetadata, Any], ...]:
+    """Return the query param fields of *cls*, computing them on first use.
+
+    Fields without ``QueryParamMetadata`` are left out, so building a request
+    no longer inspects every field's metadata and type hints on each call.
+    """
+    plan = _query_param_plans.get(cls)
+    if plan is None:
+        field_types = get_type_hints(cls)
+        entries = []
+        for name, field in cls.model_fields.items():
+            metadata = find_field_metadata(field, QueryParamMetadata)
+            if not metadata:
+                continue
+            key = field.alias if field.alias is not None else name
+            entries.append((name, key, metadata, field_types[name]))
+        plan = tuple(entries)
+        _query_param_plans[cls] = plan
+    return plan
+
+
 def _populate_deep_object_query_params(
     field_name: str,
     obj: Any,
@@ -1,11 +1,16 @@
 import asyncio
 import random
+import threading
 import time
+from collections import deque
+from email.utils import parsedate_to_datetime
 from functools import wraps
-from typing import Any, Callable, List, TypeVar
+from typing import Any, Callable, Deque, List, Optional, TypeVar
 
 import httpx
 
+from griddy.core._constants import RETRY_AFTER_STATUS_CODES
+
 T = TypeVar("T")
 
 
@@ -82,16 +87,79 @@ class RetryConfig:
         self.retry_connection_errors = retry_connection_errors
 
 
+class RetryBudget:
+    """Caps retries at a fraction of requests over a sliding time window.
+
+    Every request deposits into the budget and every retry withdraws from it.
+    A retry is allowed while the retries in the last ``window`` seconds stay
+    below ``max(min_retries, ratio * requests)``. During a partial outage
+    this bounds the extra load retries add to roughly ``ratio`` instead of
+    multiplying traffic by the number of attempts. ``min_retries`` keeps
+    low-traffic clients able to retry at all.
+    """
+
+    ratio: float
+    window: float
+    min_retries: int
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        window: float = 10.0,
+        min_retries: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the budget with its ratio, window (seconds) and floor."""
+        self.ratio = ratio
+        self.window = window
+        self.min_retries = min_retries
+        self._clock = clock
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """Count one original (non-retry) request."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        """Reserve one retry, returning ``False`` if the budget is exhausted."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            allowed = max(self.min_retries, self.ratio * len(self._requests))
+            if len(self._retries) >= allowed:
+                return False
+            self._retries.append(now)
+            return True
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for events in (self._requests, self._retries):
+            while events and events[0] <= cutoff:
+                events.popleft()
+
+
 class Retries:
     """Retry state combining a RetryConfig with applicable status codes."""
 
     config: RetryConfig
     status_codes: List[str]
+    budget: Optional[RetryBudget]
 
-    def __init__(self, config: RetryConfig, status_codes: List[str]):
-        """Initialize with retry config and status codes."""
+    def __init__(
+        self,
+        config: RetryConfig,
+        status_codes: List[str],
+        budget: Optional[RetryBudget] = None,
+    ):
+        """Initialize with retry config, status codes and an optional budget."""
         self.config = config
         self.status_codes = status_codes
+        self.budget = budget
 
 
 class TemporaryError(Exception):
@@ -159,6 +227,7 @@ def retry(func: Callable[[], httpx.Response], retries: Retries) -> httpx.Respons
             retries.config.backoff.max_interval,
             retries.config.backoff.exponent,
             retries.config.backoff.max_elapsed_time,
+            budget=retries.budget,
         )
 
     return func()
@@ -209,6 +278,7 @@ async def retry_async(func: Callable[[], Any], retries: Retries) -> httpx.Respon
             retries.config.backoff.max_interval,
             retries.config.backoff.exponent,
             retries.config.backoff.max_elapsed_time,
+            budget=retries.budget,
         )
 
     return await func()
@@ -220,10 +290,23 @@ def retry_with_backoff(
     max_interval: int = 60000,
     exponent: float = 1.5,
     max_elapsed_time: int = 3600000,
+    budget: Optional[RetryBudget] = None,
 ) -> httpx.Response:
-    """Retry func with exponential backoff until success or max elapsed time."""
+    """Retry func with decorrelated-jitter backoff until success or max elapsed time.
+
+    Each delay is drawn uniformly between ``initial_interval`` and
+    ``2 * exponent`` times the previous delay (three times with the default
+    exponent of 1.5), capped at ``max_interval`` (milliseconds). Delays grow
+    from one attempt to the next without clients retrying in lockstep. A
+    ``Retry-After`` header on a 429 or 503 response overrides the computed
+    delay. Retrying stops, returning the last response (or re-raising the
+    last error), once ``max_elapsed_time`` would be exceeded or *budget*
+    denies another retry.
+    """
     start = round(time.time() * 1000)
-    retries = 0
+    previous = initial_interval / 1000
+    if budget is not None:
+        budget.record_request()
 
     while True:
         try:
@@ -231,16 +314,16 @@ def retry_with_backoff(
         except PermanentError as exception:
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
-            now = round(time.time() * 1000)
-            if now - start > max_elapsed_time:
+            delay = _next_delay(
+                exception, previous, initial_interval, max_interval, exponent
+            )
+            previous = delay
+            if _should_give_up(start, delay, max_elapsed_time, budget):
                 if isinstance(exception, TemporaryError):
                     return exception.response
 
                 raise
-            sleep = (initial_interval / 1000) * exponent**retries + random.uniform(0, 1)
-            sleep = min(sleep, max_interval / 1000)
-            time.sleep(sleep)
-            retries += 1
+            time.sleep(delay)
 
 
 async def retry_with_backoff_async(
@@ -249,10 +332,13 @@ async def retry_with_backoff_async(
     max_interval: int = 60000,
     exponent: float = 1.5,
     max_elapsed_time: int = 3600000,
+    budget: Optional[RetryBudget] = None,
 ) -> httpx.Response:
     """Async variant of retry_with_backoff."""
     start = round(time.time() * 1000)
-    retries = 0
+    previous = initial_interval / 1000
+    if budget is not None:
+        budget.record_request()
 
     while True:
         try:
@@ -260,13 +346,73 @@ async def retry_with_backoff_async(
         except PermanentError as exception:
             raise exception.inner
         except Exception as exception:  # pylint: disable=broad-exception-caught
-            now = round(time.time() * 1000)
-            if now - start > max_elapsed_time:
+            delay = _next_delay(
+                exception, previous, initial_interval, max_interval, exponent
+            )
+            previous = delay
+            if _should_give_up(start, delay, max_elapsed_time, budget):
                 if isinstance(exception, TemporaryError):
                     return exception.response
 
                 raise
-            sleep = (initial_interval / 1000) * exponent**retries + random.uniform(0, 1)
-            sleep = min(sleep, max_interval / 1000)
-            await asyncio.sleep(sleep)
-            retries += 1
+            await asyncio.sleep(delay)
+
+
+def _next_delay(
+    exception: Exception,
+    previous: float,
+    initial_interval: int,
+    max_interval: int,
+    exponent: float = 1.5,
+) -> float:
+    """Return the next sleep in seconds.
+
+    Uses the server's ``Retry-After`` when present, otherwise decorrelated
+    jitter: ``min(max_interval, uniform(initial_interval, previous * 2 *
+    exponent))``, where *previous* is the last sleep in seconds.
+    """
+    if isinstance(exception, TemporaryError):
+        retry_after = parse_retry_after(exception.response)
+        if retry_after is not None:
+            return retry_after
+
+    base = initial_interval / 1000
+    ceiling = max(base, previous * 2 * exponent)
+    return min(max_interval / 1000, random.uniform(base, ceiling))
+
+
+def _should_give_up(
+    start: int,
+    delay: float,
+    max_elapsed_time: int,
+    budget: Optional[RetryBudget],
+) -> bool:
+    """Return ``True`` if the next retry would exceed the time or retry budget."""
+    now = round(time.time() * 1000)
+    if now - start > max_elapsed_time:
+        return True
+    if now + delay * 1000 - start > max_elapsed_time:
+        return True
+    return budget is not None and not budget.try_spend()
+
+
+def parse_retry_after(response: httpx.Response) -> Optional[float]:
+    """Return the ``Retry-After`` delay in seconds for a 429/503 response.
+
+    Both the delta-seconds and HTTP-date forms are accepted. Returns ``None``
+    for other status codes or when the header is missing or malformed.
+    """
+    if response.status_code not in RETRY_AFTER_STATUS_CODES:
+        return None
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except TypeError, ValueError:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
@@ -3,14 +3,24 @@ import json
 import typing
 from datetime import date, datetime, time
 from decimal import Decimal
-from typing import Any, Callable, Dict, List, Tuple, Union, get_args
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+    get_args,
+)
 
 import httpx
 import typing_extensions
-from pydantic import ConfigDict, create_model
-from pydantic_core import from_json
+from pydantic import ConfigDict, PydanticUserError, TypeAdapter, create_model
 from typing_extensions import get_origin
 
+from griddy.core.jsoncodec import JsonCodec, get_json_codec
 from griddy.core.types.basemodel import BaseModel, Nullable, OptionalNullable, Unset
 
 
@@ -149,43 +159,99 @@ def validate_const(v: Any) -> Callable:
 
 
 def unmarshal_json(raw: bytes | str, typ: Any) -> Any:
-    """Deserialize a raw JSON bytes/string into the given type."""
-    return unmarshal(from_json(raw), typ)
+    """Deserialize a raw JSON bytes/string into the given type.
+
+    Parsing and validation run in a single pass inside pydantic-core, so no
+    intermediate ``dict`` tree is built. Pass ``bytes`` where available to
+    skip decoding the payload to ``str`` as well.
+    """
+    return get_type_adapter(typ).validate_json(raw)
 
 
 def unmarshal(val: Any, typ: Any) -> Any:
     """Coerce a parsed value into the given Pydantic-compatible type."""
-    unmarshaller = create_model(
-        "Unmarshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
+    return get_type_adapter(typ).validate_python(val)
+
+
+# Compiled validators keyed by type; see get_type_adapter().
+_type_adapters: Dict[Any, TypeAdapter] = {}
+
+
+def get_type_adapter(typ: Any) -> TypeAdapter:
+    """Return the cached ``TypeAdapter`` for *typ*, building it on first use.
+
+    Building a validator is far more expensive than running it, so each type
+    is compiled once per process. Unhashable type expressions are compiled on
+    every call.
+    """
+    try:
+        return _type_adapters[typ]
+    except KeyError:
+        return _type_adapters.setdefault(typ, _build_type_adapter(typ))
+    except TypeError:
+        return _build_type_adapter(typ)
+
+
+def warmup(types: Iterable[Any]) -> int:
+    """Compile validators for *types* ahead of the first request.
+
+    Returns:
+        The number of types whose validator was compiled by this call.
+    """
+    compiled = 0
+    for typ in types:
+        if typ not in _type_adapters:
+            get_type_adapter(typ)
+            compiled += 1
+    return compiled
+
+
+def _build_type_adapter(typ: Any) -> TypeAdapter:
+    try:
+        return TypeAdapter(typ, config=_ADAPTER_CONFIG)
+    except PydanticUserError:
+        # Models, dataclasses and TypedDicts carry their own config.
+        return TypeAdapter(typ)
+
 
-    m = unmarshaller(body=val)
+_ADAPTER_CONFIG = ConfigDict(populate_by_name=True, arbitrary_types_allowed=True)
 
-    # pyright: ignore[reportAttributeAccessIssue]
-    return m.body  # type: ignore
 
+def marshal_json(val: Any, typ: Any, codec: Optional[JsonCodec] = None) -> str:
+    """Serialize a value to a JSON string using a Pydantic model wrapper.
 
-def marshal_json(val: Any, typ: Any) -> str:
-    """Serialize a value to a JSON string using a Pydantic model wrapper."""
+    The dumped value is encoded with *codec*, or the process default from
+    :func:`griddy.core.jsoncodec.get_json_codec`.
+    """
     if is_nullable(typ) and val is None:
         return "null"
 
-    marshaller = create_model(
-        "Marshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
-
-    m = marshaller(body=val)
+    m = _get_marshaller(typ)(body=val)
 
     d = m.model_dump(by_alias=True, mode="json", exclude_none=True)
 
     if len(d) == 0:
         return ""
 
-    return json.dumps(d[next(iter(d))], separators=(",", ":"))
+    return get_json_codec(codec).dumps(d[next(iter(d))])
+
+
+# Wrapper models keyed by type; see _get_marshaller().
+_marshallers: Dict[Any, type] = {}
+
+
+def _get_marshaller(typ: Any) -> type:
+    # Like get_type_adapter(): build the wrapper model once per type.
+    try:
+        return _marshallers[typ]
+    except KeyError:
+        return _marshallers.setdefault(typ, _build_marshaller(typ))
+    except TypeError:
+        return _build_marshaller(typ)
+
+
+def _build_marshaller(typ: Any) -> type:
+    return create_model("Marshaller", body=(typ, ...), __config__=_ADAPTER_CONFIG)
 
 
 def is_nullable(field: Any) -> bool:
@@ -271,6 +337,22 @@ def _get_typing_objects_by_name_of(name: str) -> Tuple[Any, ...]:
     return result
 
 
+def _isoformat_default(o: Any) -> str:
+    """Return ISO format for datetime objects; raise ``TypeError`` otherwise."""
+    if isinstance(o, (datetime, date, time)):
+        return o.isoformat()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def dump_json(obj: Any, codec: Optional[JsonCodec] = None) -> str:
+    """Encode parsed data as compact JSON, writing datetimes in ISO format.
+
+    The codec-backed counterpart of ``json.dumps(obj, cls=DateTimeEncoder)``
+    for exporting parser output such as PFR player profiles.
+    """
+    return get_json_codec(codec).dumps(obj, default=_isoformat_default)
+
+
 class DateTimeEncoder(json.JSONEncoder):
     """JSON encoder that serializes datetime, date, and time objects to ISO format."""
 
@@ -13,6 +13,10 @@ def unmarshal_json_response(
 ) -> Any:
     """Unmarshal a JSON HTTP response into the given type.
 
+    Without *body*, the raw ``http_res.content`` bytes are validated directly,
+    skipping the decode to ``str``. The text is only decoded if validation
+    fails and an error needs it.
+
     Args:
         typ: The Pydantic model type to unmarshal into.
         http_res: The HTTP response.
@@ -21,16 +25,15 @@ def unmarshal_json_response(
             If None, the raw Pydantic ValidationError is re-raised.
         body: Optional pre-read body text.
     """
-    if body is None:
-        body = http_res.text
+    raw = http_res.content if body is None else body
     try:
-        return unmarshal_json(body, typ)
+        return unmarshal_json(raw, typ)
     except Exception as e:
         if validation_error_cls is not None:
             raise validation_error_cls(
                 "Response validation failed",
                 http_res,
                 e,
-                body,
+                http_res.text if body is None else body,
             ) from e
         raise
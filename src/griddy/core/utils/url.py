@@ -4,6 +4,7 @@ from typing import (
     Dict,
     List,
     Optional,
+    Tuple,
     Union,
     get_args,
     get_origin,
@@ -55,18 +56,12 @@ def _populate_path_params(
     if not isinstance(path_params, BaseModel):
         return globals_already_populated
 
-    path_param_fields: Dict[str, FieldInfo] = path_params.__class__.model_fields
-    path_param_field_types = get_type_hints(path_params.__class__)
-    for name in path_param_fields:
+    for name, f_name, param_metadata, field_type in _path_param_plan(
+        path_params.__class__
+    ):
         if name in skip_fields:
             continue
 
-        field = path_param_fields[name]
-
-        param_metadata = find_field_metadata(field, PathParamMetadata)
-        if param_metadata is None:
-            continue
-
         param = getattr(path_params, name) if _is_set(path_params) else None
         param, global_found = _populate_from_globals(
             name, param, PathParamMetadata, gbls
@@ -77,11 +72,10 @@ def _populate_path_params(
         if not _is_set(param):
             continue
 
-        f_name = field.alias if field.alias is not None else name
         serialization = param_metadata.serialization
         if serialization is not None:
             serialized_params = _get_serialized_params(
-                param_metadata, f_name, param, path_param_field_types[name]
+                param_metadata, f_name, param, field_type
             )
             for key, value in serialized_params.items():
                 path_param_values[key] = value
@@ -136,6 +130,34 @@ def _populate_path_params(
     return globals_already_populated
 
 
+# Per-class ``(name, key, metadata, type)`` for every path param field;
+# see _path_param_plan().
+_path_param_plans: Dict[type, Tuple[Tuple[str, str, PathParamMetadata, Any], ...]] = {}
+
+
+def _path_param_plan(
+    cls: type,
+) -> Tuple[Tuple[str, str, PathParamMetadata, Any], ...]:
+    """Return the path param fields of *cls*, computing them on first use.
+
+    Fields without ``PathParamMetadata`` are left out, so building a request
+    no longer inspects every field's metadata and type hints on each call.
+    """
+    plan = _path_param_plans.get(cls)
+    if plan is None:
+        field_types = get_type_hints(cls)
+        entries = []
+        for name, field in cls.model_fields.items():
+            metadata = find_field_metadata(field, PathParamMetadata)
+            if metadata is None:
+                continue
+            key = field.alias if field.alias is not None else name
+            entries.append((name, key, metadata, field_types[name]))
+        plan = tuple(entries)
+        _path_param_plans[cls] = plan
+    return plan
+
+
 def is_optional(field: Any) -> bool:
     """Check if a type annotation is Optional (Union with None)."""
     return get_origin(field) is Union and type(None) in get_args(field)
@@ -8,6 +8,7 @@ from functools import cached_property
 from typing import Any, Optional
 
 from griddy.core.decorators import sdk_endpoints
+from griddy.core.htmlparser import make_soup
 from griddy.draftbuzz.parsers import ProspectProfileParser
 
 from ..basesdk import BaseSDK, EndpointConfig
@@ -132,7 +133,8 @@ class Prospects(BaseSDK):
         except Exception:
             return None
 
-        return self._parser.parse_stats(html, position=position)
+        soup = make_soup(html, self.sdk_configuration.html_parser)
+        return self._parser.parse_stats(soup, position=position)
 
     async def _fetch_stats_async(self, *, slug: str, position: str) -> Any:
         """Async version of :meth:`_fetch_stats`."""
@@ -152,7 +154,8 @@ class Prospects(BaseSDK):
         except Exception:
             return None
 
-        return self._parser.parse_stats(html, position=position)
+        soup = make_soup(html, self.sdk_configuration.html_parser)
+        return self._parser.parse_stats(soup, position=position)
 
     @staticmethod
     def _build_stats_slug(slug: str) -> str:
@@ -1,9 +1,22 @@
 """Shared helper functions for DraftBuzz HTML parsers."""
 
 import re
-from typing import Optional
+from typing import Optional, Union
 
-from bs4 import Tag
+from bs4 import BeautifulSoup, Tag
+
+from griddy.core.htmlparser import make_soup
+
+
+def as_soup(html: Union[str, BeautifulSoup]) -> BeautifulSoup:
+    """Return *html* as a parsed document, parsing it only if it is a string.
+
+    Strings are parsed with the default builder (see
+    :mod:`griddy.core.htmlparser`).
+    """
+    if isinstance(html, BeautifulSoup):
+        return html
+    return make_soup(html)
 
 
 def get_tag_with_title_containing(tag: Tag, search_str: str) -> Optional[Tag]:
@@ -6,13 +6,14 @@ SDK-compatible parser that returns plain dicts for Pydantic validation.
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from ..constants import POSITION_TO_GROUP_MAP
 from ..errors.parsing_error import ParsingError
 from ._helpers import (
+    as_soup,
     get_tag_with_text,
     get_tag_with_title_containing,
     get_text_following_label,
@@ -30,17 +31,19 @@ class ProspectProfileParser:
     Stats are parsed from a separate stats page and merged in.
     """
 
-    def parse_profile(self, html: str, *, position: str) -> dict[str, Any]:
+    def parse_profile(
+        self, html: Union[str, BeautifulSoup], *, position: str
+    ) -> dict[str, Any]:
         """Parse the main prospect profile page.
 
         Args:
-            html: Raw HTML of the prospect profile page.
+            html: Raw HTML or parsed document of the prospect profile page.
             position: Canonical position group (e.g. ``"QB"``, ``"WR"``).
 
         Returns:
             A dict matching the ``ProspectProfile`` schema (without stats).
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         basic_info = self._parse_basic_info(soup)
         rtgs_table, comps_table = self._extract_ratings_comps_tables(soup)
@@ -62,18 +65,18 @@ class ProspectProfileParser:
         return result
 
     def parse_stats(
-        self, html: str, *, position: str
+        self, html: Union[str, BeautifulSoup], *, position: str
     ) -> Optional[list[dict[str, Any]]]:
         """Parse the prospect stats page.
 
         Args:
-            html: Raw HTML of the prospect stats page.
+            html: Raw HTML or parsed document of the prospect stats page.
             position: Canonical position group.
 
         Returns:
             A list of stat dicts (one per season), or None if no stats found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
         return self._parse_stats_page(soup, position)
 
     # ------------------------------------------------------------------
@@ -4,17 +4,19 @@ Extracts prospect names, positions, schools, and rankings from the
 ``#positionRankTable`` on each position rankings page.
 """
 
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from bs4 import BeautifulSoup
 
+from ._helpers import as_soup
+
 
 class RankingsParser:
     """Parses an NFL Draft Buzz position rankings page into a dict."""
 
     def parse_position_rankings(
         self,
-        html: str,
+        html: Union[str, BeautifulSoup],
         *,
         position: str,
         year: int,
@@ -23,7 +25,7 @@ class RankingsParser:
         """Parse a position rankings page.
 
         Args:
-            html: Raw HTML of the rankings page.
+            html: Raw HTML or parsed document of the rankings page.
             position: The position being ranked (e.g. ``"QB"``).
             year: Draft year.
             page: Page number.
@@ -31,7 +33,7 @@ class RankingsParser:
         Returns:
             A dict matching the ``PositionRankings`` schema.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
         entries = self._extract_entries(soup)
         total_pages = self._extract_total_pages(soup)
 
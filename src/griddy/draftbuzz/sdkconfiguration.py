@@ -1,6 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional, Tuple
 
+from griddy.core.pagecache import PageCache
 from griddy.core.sdkconfiguration import SDKConfiguration as CoreSDKConfiguration
 
 from ._version import __user_agent__, __version__
@@ -20,6 +21,8 @@ class SDKConfiguration(CoreSDKConfiguration):
     server_type: str = "default"
     scraping_backend: Optional[Any] = field(default=None, repr=False)
     async_scraping_backend: Optional[Any] = field(default=None, repr=False)
+    html_parser: Optional[str] = None
+    page_cache: Optional[PageCache] = field(default=None, repr=False)
 
     def __post_init__(self) -> None:
         """Set default server index to 0 if not provided."""
@@ -1,4 +1,5 @@
 from ._version import __user_agent__, __version__
+from ._warmup import warmup, warmup_in_background
 from .sdk import GriddyNFL
 from .sdkconfiguration import SERVERS, SDKConfiguration
 
@@ -8,6 +9,8 @@ __all__ = [
     "SERVERS",
     "VERSION",
     "USER_AGENT",
+    "warmup",
+    "warmup_in_background",
 ]
 
 VERSION: str = __version__
@@ -1,18 +1,30 @@
+import asyncio
 import base64
 import json
+import threading
 import time
-from typing import Any, Dict, Union
+from typing import Any, Dict, Optional, Union
 from uuid import uuid4
 
 import httpx
 
 from griddy import settings
-from griddy.nfl._hooks.types import BeforeRequestContext, BeforeRequestHook
+from griddy.core.httpclient import AsyncHttpClient, HttpClient
+from griddy.nfl._hooks.types import (
+    AsyncBeforeRequestHook,
+    BeforeRequestContext,
+    BeforeRequestHook,
+)
 from griddy.nfl.models import NFLAuth, Security
 
 
-class HackAuthHook(BeforeRequestHook):
-    """Before-request hook that injects required NFL headers and auto-refreshes expired auth tokens."""
+class HackAuthHook(BeforeRequestHook, AsyncBeforeRequestHook):
+    """Before-request hook that injects required NFL headers and auto-refreshes expired auth tokens.
+
+    Refreshes are single-flight: however many requests notice the token is
+    about to expire, one refresh POST is sent on the SDK's pooled client and
+    the other requests wait for its result.
+    """
 
     refresh_req_data = {
         "clientKey": settings.NFL.client_key,
@@ -33,25 +45,67 @@ class HackAuthHook(BeforeRequestHook):
         "peacockUUID": "undefined",
     }
 
-    def _do_refresh_token(self, refresh_token: str) -> Dict[str, Any]:
+    #: Seconds before expiry at which a request waits for a refresh.
+    refresh_window: float = 30
+    #: Seconds before expiry at which a refresh starts in the background while
+    #: requests keep using the current token.
+    refresh_ahead: float = 300
+    #: Minimum seconds between two background refresh attempts, so a failing
+    #: token endpoint is not hit again by every request.
+    background_retry_interval: float = 30
+
+    def __init__(self) -> None:
+        """Create the lock and state shared by the sync and async refresh paths."""
+        self._refresh_lock = threading.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._background_lock = threading.Lock()
+        self._next_background_attempt = 0.0
+
+    def _do_refresh_token(
+        self, refresh_token: str, client: HttpClient
+    ) -> Dict[str, Any]:
         """Exchange a refresh token for new auth credentials via the NFL token endpoint.
 
+        The request is sent directly on *client*, bypassing the hook chain.
+
         Args:
             refresh_token: The current refresh token to exchange.
+            client: The SDK's pooled ``client``.
 
         Returns:
             Parsed JSON response containing new access token, refresh token, and expiry.
         """
         refresh_url = f"{settings.NFL.token_url}/refresh"
         data = {**self.refresh_req_data, "refreshToken": refresh_token}
-        response = httpx.post(url=refresh_url, data=data)
+        response = client.send(client.build_request("POST", refresh_url, data=data))
         response.raise_for_status()
         return response.json()
 
-    def before_request(
-        self, hook_ctx: BeforeRequestContext, request: httpx.Request
-    ) -> Union[httpx.Request, Exception]:
-        """Add required NFL headers and refresh the auth token if it is near expiry."""
+    async def _do_refresh_token_async(
+        self, refresh_token: str, client: AsyncHttpClient
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_do_refresh_token` using the SDK's pooled client.
+
+        The request is sent directly on *client*, bypassing the hook chain.
+
+        Args:
+            refresh_token: The current refresh token to exchange.
+            client: The SDK's ``async_client``.
+
+        Returns:
+            Parsed JSON response containing new access token, refresh token, and expiry.
+        """
+        refresh_url = f"{settings.NFL.token_url}/refresh"
+        data = {**self.refresh_req_data, "refreshToken": refresh_token}
+        response = await client.send(
+            client.build_request("POST", refresh_url, data=data)
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @staticmethod
+    def _add_nfl_headers(request: httpx.Request) -> None:
+        """Set the browser-like headers the NFL APIs expect."""
         request.headers["referer"] = "https://nextgenstats.nfl.com/"
         request.headers["x-override-env"] = "false"
         request.headers["sec-fetch-dest"] = "empty"
@@ -59,15 +113,145 @@ class HackAuthHook(BeforeRequestHook):
         request.headers["sec-fetch-site"] = "same-origin"
         request.headers["authority"] = "nextgenstats.nfl.com"
 
-        auth_info = hook_ctx.config.custom_auth_info
-        if (
-            auth_info.expires_in is not None
-            and (auth_info.expires_in - time.time()) < 30
-        ):
-            resp_data = self._do_refresh_token(refresh_token=auth_info.refresh_token)
-            new_auth = NFLAuth.model_validate(resp_data)
-            hook_ctx.config.custom_auth_info = new_auth
-            hook_ctx.config.security = Security(nfl_auth=new_auth.access_token)
-            request.headers["Authorization"] = f"Bearer {new_auth.access_token}"
+    @staticmethod
+    def _seconds_left(auth_info: NFLAuth) -> float:
+        """Seconds until the access token expires (``inf`` if unknown)."""
+        if auth_info is None or auth_info.expires_in is None:
+            return float("inf")
+        return auth_info.expires_in - time.time()
+
+    @staticmethod
+    def _store_refreshed_auth(config: Any, resp_data: Dict[str, Any]) -> None:
+        """Store refreshed credentials on the SDK configuration."""
+        new_auth = NFLAuth.model_validate(resp_data)
+        config.custom_auth_info = new_auth
+        config.security = Security(nfl_auth=new_auth.access_token)
+
+    @staticmethod
+    def _apply_current_auth(config: Any, request: httpx.Request) -> None:
+        """Point the outgoing request at the configuration's current token."""
+        auth_info = config.custom_auth_info
+        if auth_info is not None and auth_info.access_token:
+            request.headers["Authorization"] = f"Bearer {auth_info.access_token}"
+
+    # ------------------------------------------------------------------
+    # Sync refresh
+    # ------------------------------------------------------------------
+
+    def _refresh(self, config: Any, window: float) -> bool:
+        """Refresh the token unless another thread already did.
+
+        Callers are serialized on a lock and the expiry is re-checked once it
+        is held, so concurrent requests share a single refresh POST.
+
+        Returns:
+            ``True`` if this call performed a refresh.
+        """
+        with self._refresh_lock:
+            auth_info = config.custom_auth_info
+            if self._seconds_left(auth_info) >= window:
+                return False
+            resp_data = self._do_refresh_token(
+                refresh_token=auth_info.refresh_token, client=config.client
+            )
+            self._store_refreshed_auth(config, resp_data)
+            return True
+
+    def _background_attempt_due(self) -> bool:
+        """Claim the next background refresh attempt if one is due.
+
+        At most one attempt starts per :attr:`background_retry_interval`,
+        whether or not the previous one succeeded.
+        """
+        with self._background_lock:
+            now = time.monotonic()
+            if now < self._next_background_attempt:
+                return False
+            self._next_background_attempt = now + self.background_retry_interval
+            return True
+
+    def _refresh_in_background(self, config: Any) -> None:
+        """Start a daemon thread that refreshes ahead of expiry."""
+        if self._refresh_lock.locked() or not self._background_attempt_due():
+            return
+
+        def run() -> None:
+            try:
+                self._refresh(config, self.refresh_ahead)
+            except Exception as e:
+                # The blocking refresh inside the window will retry and raise.
+                config.debug_logger.debug("Background token refresh failed: %s", e)
+
+        threading.Thread(target=run, name="griddy-token-refresh", daemon=True).start()
+
+    def before_request(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        """Add required NFL headers and refresh the auth token if it is near expiry.
+
+        Inside :attr:`refresh_window` the request waits for a (shared) refresh.
+        Inside :attr:`refresh_ahead` a refresh starts in the background and the
+        request goes out with the still-valid current token.
+        """
+        self._add_nfl_headers(request)
+
+        config = hook_ctx.config
+        seconds_left = self._seconds_left(config.custom_auth_info)
+        if seconds_left < self.refresh_window:
+            self._refresh(config, self.refresh_window)
+            self._apply_current_auth(config, request)
+        elif seconds_left < self.refresh_ahead:
+            self._refresh_in_background(config)
 
         return request
+
+    # ------------------------------------------------------------------
+    # Async refresh
+    # ------------------------------------------------------------------
+
+    async def _run_refresh_async(self, config: Any, window: float) -> None:
+        """Refresh the token on the async client unless it has *window* seconds left."""
+        auth_info = config.custom_auth_info
+        if self._seconds_left(auth_info) >= window:
+            return
+        resp_data = await self._do_refresh_token_async(
+            refresh_token=auth_info.refresh_token, client=config.async_client
+        )
+        self._store_refreshed_auth(config, resp_data)
+
+    def _refresh_task_for(self, config: Any, window: float) -> asyncio.Task:
+        """Return the in-flight refresh task, starting one if there is none."""
+        task = self._refresh_task
+        loop = asyncio.get_running_loop()
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._run_refresh_async(config, window))
+            task.add_done_callback(_consume_exception)
+            self._refresh_task = task
+        return task
+
+    async def before_request_async(
+        self, hook_ctx: BeforeRequestContext, request: httpx.Request
+    ) -> Union[httpx.Request, Exception]:
+        """Async variant of :meth:`before_request`.
+
+        Concurrent coroutines await one shared refresh task, sent through the
+        SDK's pooled ``async_client``. The task is shielded so cancelling one
+        waiting request does not abort the refresh for the others.
+        """
+        self._add_nfl_headers(request)
+
+        config = hook_ctx.config
+        seconds_left = self._seconds_left(config.custom_auth_info)
+        if seconds_left < self.refresh_window:
+            await asyncio.shield(self._refresh_task_for(config, self.refresh_window))
+            self._apply_current_auth(config, request)
+        elif seconds_left < self.refresh_ahead and self._background_attempt_due():
+            self._refresh_task_for(config, self.refresh_ahead)
+
+        return request
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    # Mark background failures as retrieved; waiters still see them via await.
+    if not task.cancelled():
+        task.exception()
@@ -0,0 +1,112 @@
+"""Precompile response validators before the first request.
+
+NFL models defer building their validators until first use (see
+:class:`griddy.nfl.types.BaseModel`), so the first response of each type
+pays for importing its model modules and compiling a ``TypeAdapter`` (see
+:func:`griddy.core.utils.serializers.get_type_adapter`), and the first call of
+each endpoint pays for building its request model. Long-running services can
+move that cost to startup:
+
+    >>> from griddy.nfl import warmup
+    >>> warmup()  # doctest: +SKIP
+
+or off the critical path entirely:
+
+    >>> from griddy.nfl import warmup_in_background
+    >>> thread = warmup_in_background()  # doctest: +SKIP
+"""
+
+import importlib
+import pkgutil
+import threading
+import warnings
+from typing import List
+
+import pydantic
+
+from griddy.core.utils.serializers import warmup as _warmup_types
+
+RESPONSES_PACKAGE = "griddy.nfl.models.responses"
+REQUESTS_PACKAGE = "griddy.nfl.models.requests"
+
+
+def _model_types(package_name: str) -> List[type]:
+    """Return every pydantic model defined in the modules of *package_name*.
+
+    Modules that fail to import are skipped with a ``RuntimeWarning`` so one
+    broken model does not prevent warming up the rest.
+    """
+    package = importlib.import_module(package_name)
+    types = []
+    for info in pkgutil.iter_modules(package.__path__):
+        name = f"{package_name}.{info.name}"
+        try:
+            module = importlib.import_module(name)
+        except ImportError as e:
+            warnings.warn(f"Skipping {name}: {e}", RuntimeWarning, stacklevel=3)
+            continue
+        types.extend(
+            obj
+            for obj in vars(module).values()
+            if isinstance(obj, type)
+            and issubclass(obj, pydantic.BaseModel)
+            and obj.__module__ == module.__name__
+        )
+    return types
+
+
+def response_types() -> List[type]:
+    """Return every response model defined in :data:`RESPONSES_PACKAGE`."""
+    return _model_types(RESPONSES_PACKAGE)
+
+
+def request_types() -> List[type]:
+    """Return every request model defined in :data:`REQUESTS_PACKAGE`."""
+    return _model_types(REQUESTS_PACKAGE)
+
+
+def _skip(model: type, error: Exception) -> None:
+    warnings.warn(
+        f"Skipping {model.__module__}.{model.__qualname__}: {error}",
+        RuntimeWarning,
+        stacklevel=3,
+    )
+
+
+def warmup() -> int:
+    """Compile validators for every NFL response and request model.
+
+    Models that fail to build are skipped with a ``RuntimeWarning`` so one
+    broken model does not stop the rest from warming up.
+
+    Returns:
+        The number of types compiled by this call; ``0`` when they were all
+        compiled already.
+    """
+    compiled = 0
+    for model in response_types():
+        try:
+            compiled += _warmup_types([model])
+        except Exception as e:
+            _skip(model, e)
+    for model in request_types():
+        if model.__pydantic_complete__:
+            continue
+        try:
+            model.model_rebuild()
+        except Exception as e:
+            _skip(model, e)
+            continue
+        compiled += 1
+    return compiled
+
+
+def warmup_in_background() -> threading.Thread:
+    """Run :func:`warmup` in a daemon thread and return the started thread.
+
+    Requests made before it finishes build what they need themselves, so
+    nothing waits on the thread; ``join()`` it to wait for the warm-up.
+    """
+    thread = threading.Thread(target=warmup, name="griddy-nfl-warmup", daemon=True)
+    thread.start()
+    return thread
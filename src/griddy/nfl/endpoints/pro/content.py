@@ -9,6 +9,7 @@ from griddy.core._constants import (
     STATS_ERROR_CODES,
 )
 from griddy.core.decorators import sdk_endpoints
+from griddy.core.streaming import stream_rows
 from griddy.nfl import models, utils
 from griddy.nfl.basesdk import EndpointConfig
 from griddy.nfl.endpoints.pro import ProSDK
@@ -124,6 +125,7 @@ class Content(ProSDK, GameContentMixin):
         )
 
     # TODO: Consider how this method signature might be cleaned up
+    @stream_rows("plays")
     def _get_filmroom_plays_config(
         self,
         *,
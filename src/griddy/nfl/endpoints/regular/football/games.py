@@ -4,6 +4,7 @@ from typing import List, Mapping, Optional
 
 from griddy.core._constants import COLLECTION_ERROR_CODES, RESOURCE_ERROR_CODES
 from griddy.core.decorators import sdk_endpoints
+from griddy.core.streaming import stream_rows
 from griddy.nfl import models, utils
 from griddy.nfl.basesdk import BaseSDK, EndpointConfig
 from griddy.nfl.types import UNSET, OptionalNullable
@@ -132,6 +133,7 @@ class Games(BaseSDK):
             retries=retries,
         )
 
+    @stream_rows("drives.plays")
     def _get_play_by_play_config(
         self,
         *,
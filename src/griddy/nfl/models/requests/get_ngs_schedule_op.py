@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing_extensions import Annotated
+
 from griddy.nfl.types import BaseModel
 from griddy.nfl.utils import FieldMetadata, QueryParamMetadata
 
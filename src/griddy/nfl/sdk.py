@@ -18,6 +18,13 @@ from uuid import uuid4
 from griddy import settings
 from griddy.core._lazy_load import LazySubSDKMixin
 from griddy.core.base_griddy_sdk import BaseGriddySDK
+from griddy.core.cache import ResponseCache
+from griddy.core.coalesce import RequestCoalescer
+from griddy.core.jsoncodec import CodecName, JsonCodec, get_json_codec
+from griddy.core.memo import ResponseMemo
+from griddy.core.ratelimit import RateLimiter
+from griddy.core.transport import ConnectionPool, HttpOptions
+from griddy.core.utils import RetryBudget
 
 from ..nfl import models
 from ._hooks import SDKHooks
@@ -212,6 +219,14 @@ class GriddyNFL(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_coalescer: Optional[RequestCoalescer] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        http_options: Optional[HttpOptions] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        response_memo: Optional[ResponseMemo] = None,
+        json_codec: Union[CodecName, JsonCodec, None] = None,
     ) -> None:
         """Initialize the GriddyNFL client.
 
@@ -228,6 +243,30 @@ class GriddyNFL(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
             retry_config: Configuration for automatic request retries.
             timeout_ms: Request timeout in milliseconds.
             debug_logger: Custom logger for debug output.
+            response_cache: Optional :class:`~griddy.core.cache.ResponseCache`
+                used to serve repeat ``GET`` calls from memory or disk.
+            rate_limiter: Optional :class:`~griddy.core.ratelimit.RateLimiter`
+                applying per-host token buckets to every request. Pass the
+                same instance to several SDKs to share one budget.
+            request_coalescer: Optional
+                :class:`~griddy.core.coalesce.RequestCoalescer` that lets
+                identical concurrent ``GET`` calls share one upstream request.
+            retry_budget: Optional :class:`~griddy.core.utils.RetryBudget`
+                capping retries at a fraction of requests. Pass the same
+                instance to several SDKs to share one budget.
+            http_options: Pool limits, HTTP/2 and compression settings for
+                the clients this SDK creates. See
+                :class:`~griddy.core.transport.HttpOptions`.
+            connection_pool: A :class:`~griddy.core.transport.ConnectionPool`
+                whose transports are shared with other SDK instances.
+                Mutually exclusive with *http_options*.
+            response_memo: Optional :class:`~griddy.core.memo.ResponseMemo`
+                that returns the previous result without re-validating when
+                a polled ``GET`` endpoint answers with an unchanged body.
+            json_codec: Codec (or codec name such as ``"orjson"``) used to
+                decode raw JSON responses. ``None`` uses the process default;
+                see :mod:`griddy.core.jsoncodec`. Request bodies always use
+                the process default.
 
         Example:
             >>> nfl = GriddyNFL(nfl_auth={"accessToken": "your_token"})
@@ -245,7 +284,15 @@ class GriddyNFL(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
             retry_config=retry_config,
             timeout_ms=timeout_ms,
             debug_logger=debug_logger,
+            http_options=http_options,
+            connection_pool=connection_pool,
             custom_auth_info=nfl_auth,
+            response_cache=response_cache,
+            rate_limiter=rate_limiter,
+            request_coalescer=request_coalescer,
+            retry_budget=retry_budget,
+            response_memo=response_memo,
+            json_codec=None if json_codec is None else get_json_codec(json_codec),
         )
 
     # ------------------------------------------------------------------
@@ -287,6 +334,14 @@ class GriddyNFL(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
         retry_config: OptionalNullable[RetryConfig] = UNSET,
         timeout_ms: Optional[int] = None,
         debug_logger: Optional[Logger] = None,
+        response_cache: Optional[ResponseCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        request_coalescer: Optional[RequestCoalescer] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        http_options: Optional[HttpOptions] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        response_memo: Optional[ResponseMemo] = None,
+        json_codec: Union[CodecName, JsonCodec, None] = None,
     ) -> "GriddyNFL":
         """Create a GriddyNFL instance by authenticating via browser.
 
@@ -305,6 +360,30 @@ class GriddyNFL(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
             retry_config: Configuration for automatic request retries.
             timeout_ms: Request timeout in milliseconds.
             debug_logger: Custom logger for debug output.
+            response_cache: Optional :class:`~griddy.core.cache.ResponseCache`
+                used to serve repeat ``GET`` calls from memory or disk.
+            rate_limiter: Optional :class:`~griddy.core.ratelimit.RateLimiter`
+                applying per-host token buckets to every request. Pass the
+                same instance to several SDKs to share one budget.
+            request_coalescer: Optional
+                :class:`~griddy.core.coalesce.RequestCoalescer` that lets
+                identical concurrent ``GET`` calls share one upstream request.
+            retry_budget: Optional :class:`~griddy.core.utils.RetryBudget`
+                capping retries at a fraction of requests. Pass the same
+                instance to several SDKs to share one budget.
+            http_options: Pool limits, HTTP/2 and compression settings for
+                the clients this SDK creates. See
+                :class:`~griddy.core.transport.HttpOptions`.
+            connection_pool: A :class:`~griddy.core.transport.ConnectionPool`
+                whose transports are shared with other SDK instances.
+                Mutually exclusive with *http_options*.
+            response_memo: Optional :class:`~griddy.core.memo.ResponseMemo`
+                that returns the previous result without re-validating when
+                a polled ``GET`` endpoint answers with an unchanged body.
+            json_codec: Codec (or codec name such as ``"orjson"``) used to
+                decode raw JSON responses. ``None`` uses the process default;
+                see :mod:`griddy.core.jsoncodec`. Request bodies always use
+                the process default.
 
         Returns:
             A fully-initialized GriddyNFL instance.
@@ -343,4 +422,12 @@ class GriddyNFL(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
             retry_config=retry_config,
             timeout_ms=timeout_ms,
             debug_logger=debug_logger,
+            http_options=http_options,
+            connection_pool=connection_pool,
+            response_cache=response_cache,
+            rate_limiter=rate_limiter,
+            request_coalescer=request_coalescer,
+            retry_budget=retry_budget,
+            response_memo=response_memo,
+            json_codec=json_codec,
         )
@@ -2,13 +2,14 @@ from griddy.core.types import *  # noqa: F401,F403
 from griddy.core.types import (
     UNSET,
     UNSET_SENTINEL,
-    BaseModel,
     Nullable,
     OptionalNullable,
     UnrecognizedInt,
     UnrecognizedStr,
 )
 
+from .basemodel import BaseModel
+
 __all__ = [
     "BaseModel",
     "Nullable",
@@ -1,11 +1,24 @@
+from pydantic import ConfigDict
+
 from griddy.core.types.basemodel import *  # noqa: F401,F403
 from griddy.core.types.basemodel import (
     UNSET,
     UNSET_SENTINEL,  # noqa: F401
-    BaseModel,
     Nullable,
     OptionalNullable,
     UnrecognizedInt,
     UnrecognizedStr,
     Unset,
 )
+from griddy.core.types.basemodel import BaseModel as _CoreBaseModel
+
+
+class BaseModel(_CoreBaseModel):
+    """Base for NFL models; validators are built on first use, not at import.
+
+    Importing a model module only collects its fields. The schema and
+    validator are built the first time the model (or a ``TypeAdapter`` over
+    it) validates data, or ahead of time by :func:`griddy.nfl.warmup`.
+    """
+
+    model_config = ConfigDict(defer_build=True)
@@ -1,15 +1,15 @@
 import functools
-import json
 import typing
 from decimal import Decimal
 from typing import Any, Callable, Dict, List, Tuple, Union, get_args
 
 import httpx
 import typing_extensions
-from pydantic import ConfigDict, create_model
-from pydantic_core import from_json
 from typing_extensions import get_origin
 
+from griddy.core.jsoncodec import get_json_codec
+from griddy.core.utils.serializers import marshal_json, unmarshal  # noqa: F401
+
 from ..types.basemodel import BaseModel, Nullable, OptionalNullable, Unset
 
 
@@ -149,42 +149,7 @@ def validate_const(v: Any) -> Callable:
 
 def unmarshal_json(raw: bytes | str, typ: Any) -> Any:
     """Deserialize a raw JSON bytes/string into the given type."""
-    return unmarshal(from_json(raw), typ)
-
-
-def unmarshal(val: Any, typ: Any) -> Any:
-    """Coerce a parsed value into the given Pydantic-compatible type."""
-    unmarshaller = create_model(
-        "Unmarshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
-
-    m = unmarshaller(body=val)
-
-    # pyright: ignore[reportAttributeAccessIssue]
-    return m.body  # type: ignore
-
-
-def marshal_json(val: Any, typ: Any) -> str:
-    """Serialize a value to a JSON string using a Pydantic model wrapper."""
-    if is_nullable(typ) and val is None:
-        return "null"
-
-    marshaller = create_model(
-        "Marshaller",
-        body=(typ, ...),
-        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
-    )
-
-    m = marshaller(body=val)
-
-    d = m.model_dump(by_alias=True, mode="json", exclude_none=True)
-
-    if len(d) == 0:
-        return ""
-
-    return json.dumps(d[next(iter(d))], separators=(",", ":"))
+    return unmarshal(get_json_codec().loads(raw), typ)
 
 
 def is_nullable(field: Any) -> bool:
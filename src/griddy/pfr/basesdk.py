@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Protocol, Type, Union
 from urllib.parse import urlencode
@@ -6,6 +7,7 @@ from bs4 import BeautifulSoup
 
 from griddy.core.basesdk import BaseEndpointConfig
 from griddy.core.basesdk import BaseSDK as CoreBaseSDK
+from griddy.core.htmlparser import make_soup
 
 from . import errors, models
 from .backends import AsyncScrapingBackend, ScrapingBackend
@@ -18,13 +20,17 @@ from .utils.browserless import AsyncBrowserless, Browserless, BrowserlessConfig
 class PfrParser(Protocol):
     """Protocol that all PFR parsers must satisfy.
 
-    Parse methods must accept an HTML string and return a plain ``dict``
-    (for single-model endpoints) or a ``list[dict]`` (for list endpoints).
+    Parse methods receive the page as a ``BeautifulSoup`` document, already
+    parsed and with hidden tables uncommented by
+    :meth:`BaseSDK._preprocess_html`, and return a plain ``dict`` (for
+    single-model endpoints) or a ``list[dict]`` (for list endpoints).
     Pydantic model construction is handled by the base SDK, not the parser.
     """
 
-    def __call__(self, html: str) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
-        """Parse raw HTML and return a dict or list of dicts for model validation."""
+    def __call__(
+        self, html: BeautifulSoup
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]]]:
+        """Parse the document and return a dict or list of dicts for model validation."""
         ...
 
 
@@ -60,6 +66,10 @@ class BaseSDK(CoreBaseSDK[SDKConfiguration]):
         2. A ``BrowserlessConfig`` passed directly or pre-set by GriddyPFR.
         3. A default :class:`Browserless` instance (requires env vars).
 
+        With a ``sdk_config.page_cache``, pages are read from it before
+        either backend is asked, and a fetched page is only stored once it
+        has parsed and validated (see :mod:`griddy.core.pagecache`).
+
         Args:
             sdk_config: PFR SDK configuration with server details.
             parent_ref: Optional reference to the parent SDK instance.
@@ -114,21 +124,28 @@ class BaseSDK(CoreBaseSDK[SDKConfiguration]):
         return url
 
     @staticmethod
-    def _preprocess_html(html: str) -> str:
-        """Pre-process raw HTML before passing it to a parser.
+    def _preprocess_html(html: str, parser: Optional[str] = None) -> BeautifulSoup:
+        """Parse raw HTML into the document handed to a parser.
 
         Uncomments hidden ``<table>`` elements that PFR wraps in HTML
         comments so they are visible to downstream BeautifulSoup queries.
+        The page is parsed once here; parsers query the returned tree
+        rather than re-parsing the HTML.
+
+        Args:
+            html: Raw page HTML.
+            parser: Tree builder name (see :mod:`griddy.core.htmlparser`);
+                ``None`` uses the process default.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html, parser)
         uncomment_tables(soup)
-        return str(soup)
+        return soup
 
     def _parse_and_validate(self, config: EndpointConfig, html: str) -> Any:
-        """Pre-process HTML, run the endpoint parser, and validate results into Pydantic models."""
-        html = self._preprocess_html(html)
+        """Parse HTML once, run the endpoint parser, and validate results into Pydantic models."""
+        soup = self._preprocess_html(html, self.sdk_configuration.html_parser)
         try:
-            result = config.parser(html)
+            result = config.parser(soup)
         except ParsingError:
             raise
 
@@ -136,6 +153,67 @@ class BaseSDK(CoreBaseSDK[SDKConfiguration]):
             return [config.response_type.model_validate(item) for item in result]
         return config.response_type.model_validate(result)
 
+    def _cached_page(self, url: str) -> Optional[str]:
+        """Return the HTML of *url* from the page cache, if configured and fresh."""
+        page_cache = self.sdk_configuration.page_cache
+        if page_cache is None:
+            return None
+        return page_cache.get(url)
+
+    def _store_page(self, url: str, html: str) -> None:
+        """Keep a page that parsed and validated in the page cache."""
+        page_cache = self.sdk_configuration.page_cache
+        if page_cache is not None:
+            page_cache.set(url, html)
+
+    def _discard_cached_page(self, url: str) -> None:
+        """Drop *url* from the page cache so a page that failed to parse is
+        fetched again next time."""
+        page_cache = self.sdk_configuration.page_cache
+        if page_cache is not None:
+            page_cache.invalidate(url)
+
+    def _parse_page(
+        self, config: EndpointConfig, url: str, html: str, cached: bool
+    ) -> Any:
+        """Parse and validate *html*, keeping the page cache consistent.
+
+        A freshly fetched page is stored only after it validates, so a
+        challenge or error page never reaches the cache; a cached page that
+        no longer parses is dropped.
+        """
+        try:
+            result = self._parse_and_validate(config, html)
+        except Exception as exc:
+            if isinstance(exc, ParsingError):
+                exc.url = url
+            if cached:
+                self._discard_cached_page(url)
+            raise
+        if not cached:
+            self._store_page(url, html)
+        return result
+
+    async def _parse_page_async(
+        self, config: EndpointConfig, url: str, html: str, cached: bool
+    ) -> Any:
+        """Async version of :meth:`_parse_page`.
+
+        Page cache reads and writes touch the disk, so they run in a worker
+        thread instead of blocking the event loop.
+        """
+        try:
+            result = self._parse_and_validate(config, html)
+        except Exception as exc:
+            if isinstance(exc, ParsingError):
+                exc.url = url
+            if cached:
+                await asyncio.to_thread(self._discard_cached_page, url)
+            raise
+        if not cached:
+            await asyncio.to_thread(self._store_page, url, html)
+        return result
+
     def _execute_endpoint(self, config: EndpointConfig) -> Any:
         """Execute a PFR scraping endpoint using its configuration.
 
@@ -144,16 +222,14 @@ class BaseSDK(CoreBaseSDK[SDKConfiguration]):
         """
         url = self._build_url(config)
 
-        html = self.browserless.get_page_content(
-            url,
-            wait_for_element=config.wait_for_element,
-        )
-
-        try:
-            return self._parse_and_validate(config, html)
-        except ParsingError as exc:
-            exc.url = url
-            raise
+        html = self._cached_page(url)
+        cached = html is not None
+        if not cached:
+            html = self.browserless.get_page_content(
+                url,
+                wait_for_element=config.wait_for_element,
+            )
+        return self._parse_page(config, url, html, cached)
 
     async def _execute_endpoint_async(self, config: EndpointConfig) -> Any:
         """Async version of :meth:`_execute_endpoint`.
@@ -162,13 +238,11 @@ class BaseSDK(CoreBaseSDK[SDKConfiguration]):
         """
         url = self._build_url(config)
 
-        html = await self.async_browserless.get_page_content(
-            url,
-            wait_for_element=config.wait_for_element,
-        )
-
-        try:
-            return self._parse_and_validate(config, html)
-        except ParsingError as exc:
-            exc.url = url
-            raise
+        html = await asyncio.to_thread(self._cached_page, url)
+        cached = html is not None
+        if not cached:
+            html = await self.async_browserless.get_page_content(
+                url,
+                wait_for_element=config.wait_for_element,
+            )
+        return await self._parse_page_async(config, url, html, cached)
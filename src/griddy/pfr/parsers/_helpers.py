@@ -1,8 +1,10 @@
 """Shared helper functions for PFR HTML parsers."""
 
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Comment, Tag
+
+from griddy.core.htmlparser import make_soup, parse_fragment
 
 
 def safe_int(value: str) -> Optional[int]:
@@ -54,6 +56,113 @@ def safe_pct(value: str) -> Optional[float]:
         return None
 
 
+def as_soup(html: Union[str, BeautifulSoup]) -> BeautifulSoup:
+    """Return *html* as a parsed document, parsing it only if it is a string.
+
+    Parsers accept either the raw page or the tree already built by
+    :meth:`griddy.pfr.basesdk.BaseSDK._preprocess_html`, so a page fetched
+    through the SDK is parsed exactly once. Strings are parsed with the
+    default builder (see :mod:`griddy.core.htmlparser`).
+    """
+    if isinstance(html, BeautifulSoup):
+        return html
+    return make_soup(html)
+
+
+def _classes_of(tag: Tag) -> List[str]:
+    classes = tag.attrs.get("class")
+    if not classes:
+        return []
+    if isinstance(classes, str):
+        classes = classes.split()
+    return list(dict.fromkeys(classes))
+
+
+class PageIndex:
+    """Lookups of a document's elements by id, class, and tag name.
+
+    Built in a single traversal of the tree, so a parser that reads a dozen
+    tables from one page walks it once instead of once per ``soup.find``.
+    Results are in document order and match what the equivalent
+    ``soup.find``/``soup.find_all`` call returns.
+    """
+
+    def __init__(self, soup: BeautifulSoup) -> None:
+        self._ids: Dict[str, List[Tag]] = {}
+        self._classes: Dict[str, List[Tag]] = {}
+        self._names: Dict[str, List[Tag]] = {}
+        for node in soup.descendants:
+            if not isinstance(node, Tag):
+                continue
+            self._names.setdefault(node.name, []).append(node)
+            element_id = node.attrs.get("id")
+            if element_id is not None:
+                self._ids.setdefault(element_id, []).append(node)
+            for class_name in _classes_of(node):
+                self._classes.setdefault(class_name, []).append(node)
+
+    def find_all(
+        self,
+        name: Optional[str] = None,
+        id: Union[str, bool, None] = None,
+        class_: Optional[str] = None,
+    ) -> List[Tag]:
+        """Return every element matching *name*, *id*, and *class_*.
+
+        *id* may be ``True`` to match any element that has an id. At least
+        one of *name*, a string *id*, or *class_* must be given.
+        """
+        if isinstance(id, str):
+            candidates = self._ids.get(id, [])
+            if class_ is not None:
+                candidates = [t for t in candidates if class_ in _classes_of(t)]
+        elif class_ is not None:
+            candidates = self._classes.get(class_, [])
+        elif name is not None:
+            candidates = self._names.get(name, [])
+        else:
+            raise ValueError("PageIndex lookups need a name, an id, or a class")
+        return [
+            tag
+            for tag in candidates
+            if (name is None or tag.name == name)
+            and (id is not True or "id" in tag.attrs)
+        ]
+
+    def find(
+        self,
+        name: Optional[str] = None,
+        id: Union[str, bool, None] = None,
+        class_: Optional[str] = None,
+    ) -> Optional[Tag]:
+        """Return the first element :meth:`find_all` would, or ``None``."""
+        matches = self.find_all(name, id=id, class_=class_)
+        return matches[0] if matches else None
+
+
+def page_index(soup: BeautifulSoup) -> PageIndex:
+    """Return the :class:`PageIndex` of *soup*, building it on first use.
+
+    The index is cached on the document, so the helpers of one parser share
+    it; :func:`uncomment_tables` and :func:`uncomment_all` drop it because
+    they change the tree.
+    """
+    index = vars(soup).get("_page_index")
+    if index is None:
+        index = soup._page_index = PageIndex(soup)
+    return index
+
+
+def _replace_comment(soup: BeautifulSoup, comment: Comment) -> None:
+    """Splice *comment*'s content, parsed with *soup*'s builder, in its place."""
+    vars(soup).pop("_page_index", None)
+    nodes = parse_fragment(comment, soup.builder.NAME)
+    if nodes:
+        comment.replace_with(*nodes)
+    else:
+        comment.extract()
+
+
 def uncomment_tables(soup: BeautifulSoup) -> None:
     """Replace HTML comment nodes that contain ``<table`` tags with
     their parsed content so that subsequent ``soup.find`` calls can
@@ -61,5 +170,15 @@ def uncomment_tables(soup: BeautifulSoup) -> None:
     """
     for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
         if "<table" in comment:
-            fragment = BeautifulSoup(comment, "html.parser")
-            comment.replace_with(fragment)
+            _replace_comment(soup, comment)
+
+
+def uncomment_all(soup: BeautifulSoup) -> None:
+    """Replace every HTML comment node with its parsed content.
+
+    Profile pages hide whole sections (not just tables) inside comments;
+    this is the in-tree equivalent of stripping the ``<!--``/``-->`` markers
+    from the raw HTML before parsing it.
+    """
+    for comment in soup.find_all(string=lambda t: isinstance(t, Comment)):
+        _replace_comment(soup, comment)
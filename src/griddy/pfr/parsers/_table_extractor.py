@@ -0,0 +1,327 @@
+"""Compiled row extraction for PFR ``data-stat`` tables.
+
+Every cell of a PFR stats table carries a ``data-stat`` attribute, and most
+parsers turn a table into one dict per ``<tbody>`` row. The table's
+:class:`~griddy.pfr.parsers._column_registry.ColumnMetadata` casts numeric
+columns, and a few columns (player, team, links) get handlers of their own.
+:class:`TableExtractor` does this for any table. It works out once per
+column, from the table's header, what to do with that column's cells,
+instead of testing every cell against the metadata's sets. It then casts
+each numeric column in one pass over its values.
+
+Example::
+
+    _PICKS = TableExtractor(
+        DRAFT,
+        {
+            "player": cell("player", href="player_href", csv_id="player_id"),
+            "pos": cell("pos", or_none),
+        },
+    )
+
+    _PICKS.rows(table)  # [{"player": ..., "draft_round": 1, ...}, ...]
+    _PICKS.columns(table)  # {"player": [...], "draft_round": [1, ...], ...}
+"""
+
+from functools import lru_cache
+from types import MappingProxyType
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+from bs4 import NavigableString, Tag
+
+from ._column_registry import ColumnMetadata
+from ._helpers import safe_float, safe_int, safe_pct
+
+Converter = Callable[[str], Any]
+CellHandler = Callable[[Tag, str, Dict[str, Any]], None]
+HrefWhen = Literal["link", "href", "always"]
+
+_NO_COLUMNS = ColumnMetadata()
+
+
+_CELL_NAMES = frozenset({"th", "td"})
+
+
+def cell_text(tag: Tag) -> str:
+    """Return ``tag.get_text(strip=True)``.
+
+    Most cells hold one string, directly or inside a single link, which is
+    returned without walking the tag's descendants.
+    """
+    node = tag
+    while True:
+        contents = node.contents
+        if not contents:
+            return ""
+        if len(contents) != 1:
+            break
+        child = contents[0]
+        if type(child) is NavigableString:
+            return child.strip()
+        if not isinstance(child, Tag):
+            break
+        node = child
+    return tag.get_text(strip=True)
+
+
+def to_int(text: str) -> Optional[int]:
+    """:func:`safe_int` that answers blank and all-digit cells without
+    raising and catching an exception."""
+    if text.isdecimal():
+        return int(text)
+    if not text:
+        return None
+    return safe_int(text)
+
+
+def to_float(text: str) -> Optional[float]:
+    """:func:`safe_float` that answers blank cells without raising."""
+    if not text:
+        return None
+    return safe_float(text)
+
+
+def or_none(text: str) -> Optional[str]:
+    """Return *text*, or ``None`` for a blank cell."""
+    return text or None
+
+
+@lru_cache(maxsize=None)
+def column_converters(
+    metadata: ColumnMetadata, float_converter: Converter = to_float
+) -> Mapping[str, Converter]:
+    """Map each numeric column of *metadata* to the function that casts it.
+
+    ``int_columns`` take precedence over ``float_columns``, which take
+    precedence over ``pct_columns``, as in the parsers' ``elif`` chains.
+    """
+    plan: Dict[str, Converter] = dict.fromkeys(metadata.pct_columns, safe_pct)
+    plan.update(dict.fromkeys(metadata.float_columns, float_converter))
+    plan.update(dict.fromkeys(metadata.int_columns, to_int))
+    return MappingProxyType(plan)
+
+
+def cell(
+    key: Optional[str],
+    convert: Optional[Converter] = None,
+    *,
+    href: Optional[str] = None,
+    href_when: HrefWhen = "link",
+    csv_id: Optional[str] = None,
+) -> CellHandler:
+    """Build a handler for a column that needs more than a cast.
+
+    Args:
+        key: Row key for the cell's text, or ``None`` to drop the text.
+        convert: Applied to the text before storing it.
+        href: Row key for the ``href`` of the cell's first ``<a>``.
+        href_when: When to store *href*: ``"link"`` whenever the cell has
+            an ``<a>``, ``"href"`` only if that link has a non-empty
+            ``href``, ``"always"`` storing ``None`` when it has neither.
+        csv_id: Row key for the cell's ``data-append-csv`` id, if present.
+    """
+
+    def handle(tag: Tag, text: str, row: Dict[str, Any]) -> None:
+        if key is not None:
+            row[key] = text if convert is None else convert(text)
+        if csv_id is not None:
+            value = tag.get("data-append-csv")
+            if value:
+                row[csv_id] = value
+        if href is not None:
+            link = tag.find("a")
+            if href_when == "link":
+                if link:
+                    row[href] = link.get("href")
+            elif link and link.get("href"):
+                row[href] = link["href"]
+            elif href_when == "always":
+                row[href] = None
+
+    return handle
+
+
+def skip(tag: Tag, text: str, row: Dict[str, Any]) -> None:
+    """Handler for a column whose cells are left out of the row."""
+
+
+# A resolved column: cast its text with a converter under its own name
+# (deferred, so the whole column is cast at once), or run a handler.
+_Action = Tuple[Optional[Converter], Optional[CellHandler]]
+
+
+class TableExtractor:
+    """Turns the ``<tbody>`` rows of a PFR table into dicts or columns.
+
+    The cells of a row are its ``<th>`` and ``<td>`` children, each looked
+    up by its ``data-stat``: a column with a handler in
+    *cells* runs it; otherwise a numeric column of *metadata* is cast, and
+    any other column is passed to *default* (or left out when *default* is
+    ``None``). The outcome is resolved once per column name and reused for
+    every cell, table, and page.
+
+    Args:
+        metadata: The table's numeric columns.
+        cells: Handlers for columns that need more than a cast; they win
+            over *metadata*.
+        float_converter: Casts ``float_columns``; PFR parsers that keep
+            integral values as ``int`` pass :func:`safe_numeric`.
+        default: Converter for columns that are neither handled nor numeric,
+            stored under the column's name.
+        skip_classes: ``<tr>`` classes marking rows to skip.
+        blank: Cell texts that count as empty. A row whose cells are all
+            empty is dropped; with ``None``, a row is dropped only when it
+            yields an empty dict.
+        normalize: Applied to each cell's text before anything else.
+    """
+
+    def __init__(
+        self,
+        metadata: ColumnMetadata = _NO_COLUMNS,
+        cells: Optional[Mapping[str, CellHandler]] = None,
+        *,
+        float_converter: Converter = to_float,
+        default: Optional[Converter] = None,
+        skip_classes: Collection[str] = ("thead",),
+        blank: Optional[Collection[str]] = ("",),
+        normalize: Optional[Converter] = None,
+    ) -> None:
+        self._converters = column_converters(metadata, float_converter)
+        self._cells = dict(cells or {})
+        self._default = default
+        self._skip_classes = frozenset(skip_classes)
+        self._blank = None if blank is None else frozenset(blank)
+        self._normalize = normalize
+        self._plan: Dict[str, _Action] = {}
+
+    def _resolve(self, stat: str) -> _Action:
+        action = self._plan.get(stat)
+        if action is None:
+            handler = self._cells.get(stat)
+            if handler is not None:
+                action = (None, handler)
+            else:
+                action = (self._converters.get(stat, self._default), None)
+            self._plan[stat] = action
+        return action
+
+    def compile(self, table: Tag) -> None:
+        """Resolve the columns named in *table*'s header ahead of its rows."""
+        thead = table.find("thead")
+        header = thead.find_all("tr")[-1:] if thead is not None else []
+        for tr in header:
+            for th in tr.find_all(["th", "td"]):
+                stat = th.get("data-stat")
+                if stat:
+                    self._resolve(stat)
+
+    def extract_row(
+        self,
+        tr: Tag,
+        deferred: Optional[List[Tuple[str, Converter, str]]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Return the dict for one ``<tr>``, or ``None`` if it is blank.
+
+        Numeric cells are cast straight away unless a *deferred* list is
+        given, in which case ``(column, converter, text)`` is appended to it
+        for the caller to cast in bulk.
+        """
+        row: Dict[str, Any] = {}
+        all_blank = True
+        blank = self._blank
+        normalize = self._normalize
+        plan = self._plan
+        for tag in tr.children:
+            if tag.name not in _CELL_NAMES:
+                continue
+            stat = tag.get("data-stat")
+            if not stat:
+                continue
+            text = cell_text(tag)
+            if normalize is not None:
+                text = normalize(text)
+            if blank is not None and all_blank and text not in blank:
+                all_blank = False
+            converter, handler = plan.get(stat) or self._resolve(stat)
+            if handler is not None:
+                handler(tag, text, row)
+            elif converter is not None:
+                if deferred is None:
+                    row[stat] = converter(text)
+                else:
+                    deferred.append((stat, converter, text))
+        if blank is not None and all_blank:
+            return None
+        if blank is None and not row and not deferred:
+            return None
+        return row
+
+    def _scan(
+        self, table: Tag
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Tuple[Converter, List[int], List[str]]]]:
+        """Extract the handled cells of each row, and gather the text of every
+        cast column with the index of the row it belongs to."""
+        rows: List[Dict[str, Any]] = []
+        columns: Dict[str, Tuple[Converter, List[int], List[str]]] = {}
+        tbody = table.find("tbody")
+        if tbody is None:
+            return rows, columns
+
+        self.compile(table)
+        skip_classes = self._skip_classes
+        for tr in tbody.find_all("tr"):
+            if skip_classes and not skip_classes.isdisjoint(tr.get("class") or ()):
+                continue
+            deferred: List[Tuple[str, Converter, str]] = []
+            row = self.extract_row(tr, deferred)
+            if row is None:
+                continue
+            index = len(rows)
+            rows.append(row)
+            for stat, converter, text in deferred:
+                column = columns.get(stat)
+                if column is None:
+                    column = columns[stat] = (converter, [], [])
+                column[1].append(index)
+                column[2].append(text)
+        return rows, columns
+
+    def rows(self, table: Tag) -> List[Dict[str, Any]]:
+        """Return one dict per kept ``<tbody>`` row of *table*."""
+        rows, columns = self._scan(table)
+        for stat, (converter, indices, texts) in columns.items():
+            for index, value in zip(indices, map(converter, texts)):
+                rows[index][stat] = value
+        return rows
+
+    def columns(self, table: Tag) -> Dict[str, List[Any]]:
+        """Return *table* as one list per row key, aligned by row.
+
+        A row that lacks a key has ``None`` in that key's list.
+        """
+        rows, columns = self._scan(table)
+        count = len(rows)
+        result: Dict[str, List[Any]] = {}
+        for index, row in enumerate(rows):
+            for key, value in row.items():
+                column = result.get(key)
+                if column is None:
+                    column = result[key] = [None] * count
+                column[index] = value
+        for stat, (converter, indices, texts) in columns.items():
+            column = result.get(stat)
+            if column is None:
+                column = result[stat] = [None] * count
+            for index, value in zip(indices, map(converter, texts)):
+                column[index] = value
+        return result
@@ -6,12 +6,73 @@ Handles three page types:
 - ``/years/{year}/probowl.htm`` — Pro Bowl roster (table ``#pro_bowl``)
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from ._column_registry import AWARDS
-from ._helpers import safe_float, safe_int
+from ._helpers import as_soup, page_index
+from ._table_extractor import TableExtractor, cell, or_none, to_int
+
+_PLAYER = cell("player", href="player_href", csv_id="player_id")
+_POS = cell("pos", or_none)
+
+
+def _probowl_player(tag: Tag, text: str, row: Dict[str, Any]) -> None:
+    """Read a Pro Bowl player cell, whose name may carry markers:
+    ``%`` (did not play) and ``+`` (replacement)."""
+    player_id = tag.get("data-append-csv")
+    if player_id:
+        row["player_id"] = player_id
+
+    link = tag.find("a")
+    if link:
+        row["player"] = link.get_text(strip=True)
+        row["player_href"] = link.get("href")
+    else:
+        row["player"] = text
+
+    # Bold = starter
+    row["is_starter"] = tag.find("strong") is not None
+
+    # Check for markers in text outside the <a> tag
+    link_text = link.get_text(strip=True) if link else ""
+    suffix = text[len(link_text) :]
+    row["did_not_play"] = "%" in suffix
+    row["is_replacement"] = "+" in suffix
+
+
+_AWARD_WINNERS = TableExtractor(
+    cells={
+        "year_id": cell("year", to_int, href="year_href"),
+        "league_id": cell("league", or_none),
+        "pos": _POS,
+        "player": _PLAYER,
+        "team": cell("team", href="team_href"),
+        "voting": cell(None, href="voting_href"),
+    },
+)
+
+_HOF_PLAYERS = TableExtractor(
+    AWARDS,
+    {
+        "ranker": cell("rank", to_int),
+        "player": _PLAYER,
+        "pos": _POS,
+        "year_induction": cell("year_induction", to_int, href="year_induction_href"),
+    },
+)
+
+_PRO_BOWL_PLAYERS = TableExtractor(
+    AWARDS,
+    {
+        "pos": _POS,
+        "player": _probowl_player,
+        "conference_id": cell("conference", or_none),
+        "team": cell("team", href="team_href"),
+        "all_pro_string": cell("all_pro_string", or_none),
+    },
+)
 
 
 class AwardsParser:
@@ -21,232 +82,59 @@ class AwardsParser:
     # Award History — /awards/{award}.htm
     # ------------------------------------------------------------------
 
-    def parse_award(self, html: str, *, award: str) -> Dict[str, Any]:
+    def parse_award(
+        self, html: Union[str, BeautifulSoup], *, award: str
+    ) -> Dict[str, Any]:
         """Parse an award history page and return a dict for model validation.
 
         Returns:
             A dict with keys ``award``, ``winners``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="awards")
+        table = page_index(soup).find("table", id="awards")
         if table is None:
             return {"award": award, "winners": []}
 
-        winners = self._parse_award_rows(table)
+        winners = _AWARD_WINNERS.rows(table)
         return {"award": award, "winners": winners}
 
-    @staticmethod
-    def _parse_award_rows(table: Tag) -> List[Dict[str, Any]]:
-        """Extract award winner rows from the awards table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        winners: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-                if text:
-                    all_empty = False
-
-                if stat == "year_id":
-                    row["year"] = safe_int(text)
-                    link = cell.find("a")
-                    if link:
-                        row["year_href"] = link.get("href")
-                elif stat == "league_id":
-                    row["league"] = text or None
-                elif stat == "pos":
-                    row["pos"] = text or None
-                elif stat == "player":
-                    row["player"] = text
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                    link = cell.find("a")
-                    if link:
-                        row["player_href"] = link.get("href")
-                elif stat == "team":
-                    row["team"] = text
-                    link = cell.find("a")
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat == "voting":
-                    link = cell.find("a")
-                    if link:
-                        row["voting_href"] = link.get("href")
-
-            if not all_empty:
-                winners.append(row)
-
-        return winners
-
     # ------------------------------------------------------------------
     # Hall of Fame — /hof/
     # ------------------------------------------------------------------
 
-    def parse_hof(self, html: str) -> Dict[str, Any]:
+    def parse_hof(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the Hall of Fame page and return a dict for model validation.
 
         Returns:
             A dict with key ``players``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="hof_players")
+        table = page_index(soup).find("table", id="hof_players")
         if table is None:
             return {"players": []}
 
-        players = self._parse_hof_rows(table)
+        players = _HOF_PLAYERS.rows(table)
         return {"players": players}
 
-    @staticmethod
-    def _parse_hof_rows(table: Tag) -> List[Dict[str, Any]]:
-        """Extract HOF player rows from the hof_players table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        players: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-                if text:
-                    all_empty = False
-
-                if stat == "ranker":
-                    row["rank"] = safe_int(text)
-                elif stat == "player":
-                    row["player"] = text
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                    link = cell.find("a")
-                    if link:
-                        row["player_href"] = link.get("href")
-                elif stat == "pos":
-                    row["pos"] = text or None
-                elif stat == "year_induction":
-                    row["year_induction"] = safe_int(text)
-                    link = cell.find("a")
-                    if link:
-                        row["year_induction_href"] = link.get("href")
-                elif stat in AWARDS.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in AWARDS.float_columns:
-                    row[stat] = safe_float(text)
-
-            if not all_empty:
-                players.append(row)
-
-        return players
-
     # ------------------------------------------------------------------
     # Pro Bowl Roster — /years/{year}/probowl.htm
     # ------------------------------------------------------------------
 
-    def parse_probowl(self, html: str, *, year: int) -> Dict[str, Any]:
+    def parse_probowl(
+        self, html: Union[str, BeautifulSoup], *, year: int
+    ) -> Dict[str, Any]:
         """Parse a Pro Bowl roster page and return a dict for model validation.
 
         Returns:
             A dict with keys ``year``, ``players``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="pro_bowl")
+        table = page_index(soup).find("table", id="pro_bowl")
         if table is None:
             return {"year": year, "players": []}
 
-        players = self._parse_probowl_rows(table)
+        players = _PRO_BOWL_PLAYERS.rows(table)
         return {"year": year, "players": players}
-
-    @staticmethod
-    def _parse_probowl_rows(table: Tag) -> List[Dict[str, Any]]:
-        """Extract Pro Bowl player rows from the pro_bowl table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        players: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-                if text:
-                    all_empty = False
-
-                if stat == "pos":
-                    row["pos"] = text or None
-                elif stat == "player":
-                    # Player name may have markers: % (did not play), + (replacement)
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-
-                    link = cell.find("a")
-                    if link:
-                        row["player"] = link.get_text(strip=True)
-                        row["player_href"] = link.get("href")
-                    else:
-                        row["player"] = text
-
-                    # Bold = starter
-                    row["is_starter"] = cell.find("strong") is not None
-
-                    # Check for markers in text outside the <a> tag
-                    full_text = cell.get_text(strip=True)
-                    link_text = link.get_text(strip=True) if link else ""
-                    suffix = full_text[len(link_text) :]
-                    row["did_not_play"] = "%" in suffix
-                    row["is_replacement"] = "+" in suffix
-                elif stat == "conference_id":
-                    row["conference"] = text or None
-                elif stat == "team":
-                    row["team"] = text
-                    link = cell.find("a")
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat == "all_pro_string":
-                    row["all_pro_string"] = text or None
-                elif stat in AWARDS.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in AWARDS.float_columns:
-                    row[stat] = safe_float(text)
-
-            if not all_empty:
-                players.append(row)
-
-        return players
@@ -5,13 +5,13 @@ with career stats (passing, rushing, receiving).
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class BirthdaysParser:
@@ -48,7 +48,7 @@ class BirthdaysParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from h1 inside #content."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h1 = content.find("h1")
             if h1:
@@ -140,11 +140,11 @@ class BirthdaysParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the birthdays page.
 
         Args:
-            html: Raw HTML of the PFR birthdays page.
+            html: Raw HTML or parsed document of the PFR birthdays page.
 
         Returns:
             A dict ready for ``Birthdays.model_validate()``.
@@ -152,17 +152,17 @@ class BirthdaysParser:
         Raises:
             ParsingError: If the birthdays table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
         month, day = self._extract_month_day(title)
 
-        table = soup.find("table", id="birthdays")
+        table = page_index(soup).find("table", id="birthdays")
         if table is None:
             raise ParsingError(
                 "Could not find birthdays table in the HTML.",
                 selector="birthdays",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         players = self._parse_table(table)
@@ -8,14 +8,14 @@ Filtered page (``/friv/birthplaces.cgi?country=...&state=...``):
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
 from ._column_registry import BIRTHPLACES_FILTERED, BIRTHPLACES_LANDING
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class BirthplacesParser:
@@ -26,7 +26,7 @@ class BirthplacesParser:
     @staticmethod
     def _extract_landing_title(soup: BeautifulSoup) -> str:
         """Extract the landing page title from the h2 section heading."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -116,11 +116,11 @@ class BirthplacesParser:
 
         return entries
 
-    def parse_landing(self, html: str) -> Dict[str, Any]:
+    def parse_landing(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the birthplaces landing page.
 
         Args:
-            html: Raw HTML of the PFR birthplaces landing page.
+            html: Raw HTML or parsed document of the PFR birthplaces landing page.
 
         Returns:
             A dict ready for ``BirthplaceLanding.model_validate()``.
@@ -128,16 +128,16 @@ class BirthplacesParser:
         Raises:
             ParsingError: If the birthplaces table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_landing_title(soup)
 
-        table = soup.find("table", id="birthplaces")
+        table = page_index(soup).find("table", id="birthplaces")
         if table is None:
             raise ParsingError(
                 "Could not find birthplaces table in the HTML.",
                 selector="birthplaces",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         locations = self._parse_landing_table(table)
@@ -152,7 +152,7 @@ class BirthplacesParser:
     @staticmethod
     def _extract_filtered_title(soup: BeautifulSoup) -> str:
         """Extract the filtered page title from h1 inside #content."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h1 = content.find("h1")
             if h1:
@@ -240,11 +240,11 @@ class BirthplacesParser:
 
         return entries
 
-    def parse_filtered(self, html: str) -> Dict[str, Any]:
+    def parse_filtered(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the birthplaces filtered (by location) page.
 
         Args:
-            html: Raw HTML of the PFR birthplaces filtered page.
+            html: Raw HTML or parsed document of the PFR birthplaces filtered page.
 
         Returns:
             A dict ready for ``BirthplaceFiltered.model_validate()``.
@@ -252,17 +252,17 @@ class BirthplacesParser:
         Raises:
             ParsingError: If the birthplaces table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_filtered_title(soup)
         country, state = self._extract_country_state(title)
 
-        table = soup.find("table", id="birthplaces")
+        table = page_index(soup).find("table", id="birthplaces")
         if table is None:
             raise ParsingError(
                 "Could not find birthplaces table in the HTML.",
                 selector="birthplaces",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         players = self._parse_filtered_table(table)
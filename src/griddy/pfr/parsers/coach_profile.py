@@ -5,7 +5,7 @@ containing coaching bio, results, ranks, history, and coaching tree.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
@@ -15,8 +15,10 @@ from ._column_registry import (
     COACH_RANKS,
     COACH_RESULTS,
     COACH_RESULTS_FOOTER,
+    ColumnMetadata,
 )
-from ._helpers import safe_float, safe_int
+from ._helpers import as_soup, page_index, uncomment_all
+from ._table_extractor import TableExtractor, cell, column_converters
 
 # Columns in coaching_results where we extract hrefs.
 _RESULTS_LINK_COLUMNS = {
@@ -25,6 +27,34 @@ _RESULTS_LINK_COLUMNS = {
     "g": "g_href",
 }
 
+
+def _coach_table(
+    metadata: ColumnMetadata, link_columns: Optional[Dict[str, str]] = None
+) -> TableExtractor:
+    """Extractor for a coach table: cast *metadata*'s columns, keep the rest
+    as text, and store the href of each column in *link_columns* (``None``
+    when the cell has no link)."""
+    converters = column_converters(metadata)
+    links = {
+        stat: cell(stat, converters.get(stat), href=href, href_when="always")
+        for stat, href in (link_columns or {}).items()
+    }
+    return TableExtractor(
+        metadata,
+        links,
+        default=str,
+        skip_classes=("thead", "over_header"),
+        blank=None,
+    )
+
+
+_COACHING_RESULTS = _coach_table(COACH_RESULTS, _RESULTS_LINK_COLUMNS)
+_COACHING_RANKS = _coach_table(COACH_RANKS)
+_COACHING_HISTORY = _coach_table(
+    COACH_HISTORY, {"coach_employer": "coach_employer_href"}
+)
+_CHALLENGE_RESULTS = _coach_table(COACH_CHALLENGES, {"game_date": "game_date_href"})
+
 # Meta label -> field name mapping for simple text fields.
 _META_LABEL_MAP: Dict[str, str] = {
     "College": "college",
@@ -36,19 +66,19 @@ _META_LABEL_MAP: Dict[str, str] = {
 class CoachProfileParser:
     """Parses PFR coach profile pages into comprehensive data dicts."""
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR coach profile page into a JSON-serializable dict.
 
         Args:
-            html: Raw HTML string of a PFR coach profile page.
+            html: Raw HTML string or parsed document of a PFR coach profile page.
 
         Returns:
             A dict with keys: bio, coaching_results, coaching_results_totals,
             coaching_ranks, coaching_history, challenge_results, worked_for,
             employed.
         """
-        cleaned = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        soup = BeautifulSoup(cleaned, "html.parser")
+        soup = as_soup(html)
+        uncomment_all(soup)
 
         result: Dict[str, Any] = {}
         result["bio"] = self._parse_bio(soup)
@@ -91,7 +121,7 @@ class CoachProfileParser:
     @classmethod
     def _parse_bio(cls, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract coach bio from the ``#meta`` div."""
-        meta_div = soup.find("div", id="meta")
+        meta_div = page_index(soup).find("div", id="meta")
         if meta_div is None:
             return {"name": ""}
 
@@ -213,16 +243,11 @@ class CoachProfileParser:
         self, soup: BeautifulSoup
     ) -> tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """Parse the ``coaching_results`` table body and footer."""
-        table = soup.find("table", id="coaching_results")
+        table = page_index(soup).find("table", id="coaching_results")
         if table is None:
             return [], []
 
-        rows = self._parse_table_body(
-            table,
-            int_columns=COACH_RESULTS.int_columns,
-            float_columns=COACH_RESULTS.float_columns,
-            link_columns=_RESULTS_LINK_COLUMNS,
-        )
+        rows = _COACHING_RESULTS.rows(table)
 
         totals = self._parse_coaching_results_footer(table)
 
@@ -237,6 +262,7 @@ class CoachProfileParser:
         if tfoot is None:
             return []
 
+        footer_converters = column_converters(COACH_RESULTS_FOOTER)
         totals: List[Dict[str, Any]] = []
 
         for tr in tfoot.find_all("tr"):
@@ -250,10 +276,8 @@ class CoachProfileParser:
                 # The year_id cell in the footer contains the label (e.g. "29 yrs")
                 if stat == "year_id":
                     row_data["label"] = text
-                elif stat in COACH_RESULTS_FOOTER.int_columns:
-                    row_data[stat] = safe_int(text)
-                elif stat in COACH_RESULTS_FOOTER.float_columns:
-                    row_data[stat] = safe_float(text)
+                elif stat in footer_converters:
+                    row_data[stat] = footer_converters[stat](text)
                 elif stat == "team":
                     row_data[stat] = text if text else None
                 else:
@@ -271,14 +295,11 @@ class CoachProfileParser:
 
     def _parse_coaching_ranks(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the ``coaching_ranks`` table."""
-        table = soup.find("table", id="coaching_ranks")
+        table = page_index(soup).find("table", id="coaching_ranks")
         if table is None:
             return []
 
-        return self._parse_table_body(
-            table,
-            int_columns=COACH_RANKS.int_columns,
-        )
+        return _COACHING_RANKS.rows(table)
 
     # ------------------------------------------------------------------
     # Coaching History table
@@ -286,15 +307,11 @@ class CoachProfileParser:
 
     def _parse_coaching_history(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the ``coaching_history`` table."""
-        table = soup.find("table", id="coaching_history")
+        table = page_index(soup).find("table", id="coaching_history")
         if table is None:
             return []
 
-        return self._parse_table_body(
-            table,
-            int_columns=COACH_HISTORY.int_columns,
-            link_columns={"coach_employer": "coach_employer_href"},
-        )
+        return _COACHING_HISTORY.rows(table)
 
     # ------------------------------------------------------------------
     # Challenge Results table
@@ -302,15 +319,11 @@ class CoachProfileParser:
 
     def _parse_challenge_results(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the ``challenge_results`` table."""
-        table = soup.find("table", id="challenge_results")
+        table = page_index(soup).find("table", id="challenge_results")
         if table is None:
             return []
 
-        return self._parse_table_body(
-            table,
-            int_columns=COACH_CHALLENGES.int_columns,
-            link_columns={"game_date": "game_date_href"},
-        )
+        return _CHALLENGE_RESULTS.rows(table)
 
     # ------------------------------------------------------------------
     # Coaching Tree tables (worked_for, employed)
@@ -321,7 +334,7 @@ class CoachProfileParser:
         soup: BeautifulSoup, table_id: str
     ) -> List[Dict[str, Any]]:
         """Parse a coaching tree table (``worked_for`` or ``employed``)."""
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
@@ -355,67 +368,3 @@ class CoachProfileParser:
                 entries.append(row_data)
 
         return entries
-
-    # ------------------------------------------------------------------
-    # Generic table body parser
-    # ------------------------------------------------------------------
-
-    @staticmethod
-    def _parse_table_body(
-        table: Tag,
-        *,
-        int_columns: Optional[set] = None,
-        float_columns: Optional[set] = None,
-        link_columns: Optional[Dict[str, str]] = None,
-    ) -> List[Dict[str, Any]]:
-        """Parse a table's tbody rows with type casting and link extraction.
-
-        Args:
-            table: The BeautifulSoup ``<table>`` tag.
-            int_columns: Column names to cast to int.
-            float_columns: Column names to cast to float.
-            link_columns: Mapping of column name -> href field name.
-        """
-        int_columns = int_columns or set()
-        float_columns = float_columns or set()
-        link_columns = link_columns or {}
-
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        records: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            classes = tr.get("class") or []
-            if "thead" in classes or "over_header" in classes:
-                continue
-
-            row_data: Dict[str, Any] = {}
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-
-                if stat in int_columns:
-                    row_data[stat] = safe_int(text)
-                elif stat in float_columns:
-                    row_data[stat] = safe_float(text)
-                else:
-                    row_data[stat] = text
-
-                # Extract links.
-                if stat in link_columns:
-                    link = cell.find("a")
-                    href_field = link_columns[stat]
-                    row_data[href_field] = (
-                        link["href"] if link and link.get("href") else None
-                    )
-
-            if row_data:
-                records.append(row_data)
-
-        return records
@@ -5,13 +5,13 @@ who played only a single game in the NFL, with their career statistics
 from that one game.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 # Columns that should be parsed as integers.
 _INT_COLS = frozenset(
@@ -55,7 +55,7 @@ class CupsOfCoffeeParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from ``<h2>`` inside ``#content``."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -126,11 +126,11 @@ class CupsOfCoffeeParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the cups of coffee page.
 
         Args:
-            html: Raw HTML of the PFR cups of coffee page.
+            html: Raw HTML or parsed document of the PFR cups of coffee page.
 
         Returns:
             A dict ready for ``CupsOfCoffee.model_validate()``.
@@ -138,16 +138,16 @@ class CupsOfCoffeeParser:
         Raises:
             ParsingError: If the coffee table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        table = soup.find("table", id="coffee")
+        table = page_index(soup).find("table", id="coffee")
         if table is None:
             raise ParsingError(
                 "Could not find coffee table in the HTML.",
                 selector="coffee",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_table(table)
@@ -6,12 +6,65 @@ Handles three page types:
 - ``/teams/{team}/draft.htm`` — team-specific draft history (table ``#draft``)
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from ._column_registry import DRAFT
-from ._helpers import safe_float, safe_int
+from ._helpers import as_soup, page_index
+from ._table_extractor import TableExtractor, cell, or_none, to_int
+
+_PLAYER = cell("player", href="player_href", csv_id="player_id")
+_COLLEGE = cell("college", href="college_href")
+
+
+def _draft_info(tag: Tag, text: str, row: Dict[str, Any]) -> None:
+    """Split combine draft info ("Team Name / Nth / Nth pick / Year")."""
+    row["draft_info"] = text or None
+    if text:
+        parts = [p.strip() for p in text.split("/")]
+        if len(parts) >= 3:
+            row["drafted_team"] = parts[0]
+            row["drafted_round"] = parts[1]
+            row["drafted_pick"] = parts[2]
+        # Year is in a link inside the cell
+        link = tag.find("a")
+        if link:
+            row["drafted_year"] = to_int(link.get_text(strip=True))
+
+
+_YEAR_DRAFT = TableExtractor(
+    DRAFT,
+    {
+        "player": _PLAYER,
+        "team": cell("team", href="team_href"),
+        "college_id": _COLLEGE,
+        "college_link": cell(None, href="college_stats_href"),
+        "pos": cell("pos", or_none),
+    },
+)
+
+_COMBINE = TableExtractor(
+    DRAFT,
+    {
+        "player": _PLAYER,
+        "school_name": cell("school", href="school_href"),
+        "college": cell(None, href="college_stats_href"),
+        "height": cell("height", or_none),
+        "draft_info": _draft_info,
+        "pos": cell("pos", or_none),
+    },
+)
+
+_TEAM_DRAFT = TableExtractor(
+    DRAFT,
+    {
+        "year_id": cell("year", to_int, href="year_href"),
+        "player": _PLAYER,
+        "college_id": _COLLEGE,
+        "pos": cell("pos", or_none),
+    },
+)
 
 
 class DraftParser:
@@ -21,239 +74,61 @@ class DraftParser:
     # Year Draft — /years/{year}/draft.htm
     # ------------------------------------------------------------------
 
-    def parse_year_draft(self, html: str, *, year: int) -> Dict[str, Any]:
+    def parse_year_draft(
+        self, html: Union[str, BeautifulSoup], *, year: int
+    ) -> Dict[str, Any]:
         """Parse a year draft page and return a dict for model validation.
 
         Returns:
             A dict with keys ``year``, ``picks``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="drafts")
+        table = page_index(soup).find("table", id="drafts")
         if table is None:
             return {"year": year, "picks": []}
 
-        picks = self._parse_year_draft_rows(table)
+        picks = _YEAR_DRAFT.rows(table)
         return {"year": year, "picks": picks}
 
-    @staticmethod
-    def _parse_year_draft_rows(table: Tag) -> List[Dict[str, Any]]:
-        """Extract draft pick rows from the year draft table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        picks: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-                if text:
-                    all_empty = False
-
-                if stat == "player":
-                    row["player"] = text
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                    link = cell.find("a")
-                    if link:
-                        row["player_href"] = link.get("href")
-                elif stat == "team":
-                    row["team"] = text
-                    link = cell.find("a")
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat == "college_id":
-                    row["college"] = text
-                    link = cell.find("a")
-                    if link:
-                        row["college_href"] = link.get("href")
-                elif stat == "college_link":
-                    link = cell.find("a")
-                    if link:
-                        row["college_stats_href"] = link.get("href")
-                elif stat in DRAFT.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in DRAFT.float_columns:
-                    row[stat] = safe_float(text)
-                elif stat == "pos":
-                    row["pos"] = text or None
-
-            if not all_empty:
-                picks.append(row)
-
-        return picks
-
     # ------------------------------------------------------------------
     # Combine — /draft/{year}-combine.htm
     # ------------------------------------------------------------------
 
-    def parse_combine(self, html: str, *, year: int) -> Dict[str, Any]:
+    def parse_combine(
+        self, html: Union[str, BeautifulSoup], *, year: int
+    ) -> Dict[str, Any]:
         """Parse a combine page and return a dict for model validation.
 
         Returns:
             A dict with keys ``year``, ``entries``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="combine")
+        table = page_index(soup).find("table", id="combine")
         if table is None:
             return {"year": year, "entries": []}
 
-        entries = self._parse_combine_rows(table)
+        entries = _COMBINE.rows(table)
         return {"year": year, "entries": entries}
 
-    @staticmethod
-    def _parse_combine_rows(table: Tag) -> List[Dict[str, Any]]:
-        """Extract combine entry rows from the combine table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        entries: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-                if text:
-                    all_empty = False
-
-                if stat == "player":
-                    row["player"] = text
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                    link = cell.find("a")
-                    if link:
-                        row["player_href"] = link.get("href")
-                elif stat == "school_name":
-                    row["school"] = text
-                    link = cell.find("a")
-                    if link:
-                        row["school_href"] = link.get("href")
-                elif stat == "college":
-                    link = cell.find("a")
-                    if link:
-                        row["college_stats_href"] = link.get("href")
-                elif stat == "height":
-                    row["height"] = text or None
-                elif stat == "draft_info":
-                    row["draft_info"] = text or None
-                    # Parse draft info: "Team Name / Nth / Nth pick / Year"
-                    if text:
-                        parts = [p.strip() for p in text.split("/")]
-                        if len(parts) >= 3:
-                            row["drafted_team"] = parts[0]
-                            row["drafted_round"] = parts[1]
-                            row["drafted_pick"] = parts[2]
-                        # Year is in a link inside the cell
-                        link = cell.find("a")
-                        if link:
-                            year_text = link.get_text(strip=True)
-                            row["drafted_year"] = safe_int(year_text)
-                elif stat == "pos":
-                    row["pos"] = text or None
-                elif stat in DRAFT.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in DRAFT.float_columns:
-                    row[stat] = safe_float(text)
-
-            if not all_empty:
-                entries.append(row)
-
-        return entries
-
     # ------------------------------------------------------------------
     # Team Draft — /teams/{team}/draft.htm
     # ------------------------------------------------------------------
 
-    def parse_team_draft(self, html: str, *, team: str) -> Dict[str, Any]:
+    def parse_team_draft(
+        self, html: Union[str, BeautifulSoup], *, team: str
+    ) -> Dict[str, Any]:
         """Parse a team draft page and return a dict for model validation.
 
         Returns:
             A dict with keys ``team``, ``picks``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="draft")
+        table = page_index(soup).find("table", id="draft")
         if table is None:
             return {"team": team, "picks": []}
 
-        picks = self._parse_team_draft_rows(table)
+        picks = _TEAM_DRAFT.rows(table)
         return {"team": team, "picks": picks}
-
-    @staticmethod
-    def _parse_team_draft_rows(table: Tag) -> List[Dict[str, Any]]:
-        """Extract draft pick rows from the team draft table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        picks: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-                if text:
-                    all_empty = False
-
-                if stat == "year_id":
-                    row["year"] = safe_int(text)
-                    link = cell.find("a")
-                    if link:
-                        row["year_href"] = link.get("href")
-                elif stat == "player":
-                    row["player"] = text
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                    link = cell.find("a")
-                    if link:
-                        row["player_href"] = link.get("href")
-                elif stat == "college_id":
-                    row["college"] = text
-                    link = cell.find("a")
-                    if link:
-                        row["college_href"] = link.get("href")
-                elif stat in DRAFT.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in DRAFT.float_columns:
-                    row[stat] = safe_float(text)
-                elif stat == "pos":
-                    row["pos"] = text or None
-
-            if not all_empty:
-                picks.append(row)
-
-        return picks
@@ -3,28 +3,28 @@
 Handles ``/executives/{ExecutiveId}.htm`` — bio, team results, and totals.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from bs4 import BeautifulSoup, Tag
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class ExecutiveProfileParser:
     """Parses a PFR executive profile page into structured data dicts."""
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a full executive profile page.
 
         Returns:
             A dict with keys ``bio``, ``exec_results``, and
             ``exec_results_totals``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         bio = self._parse_bio(soup)
 
-        table = soup.find("table", id="exec_results")
+        table = page_index(soup).find("table", id="exec_results")
         if table is None:
             return {
                 "bio": bio,
@@ -14,9 +14,9 @@ Handles:
   (table ``#fantasy_rz``)
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Union
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
 
 from ._column_registry import (
     FANTASY_MATCHUPS,
@@ -26,83 +26,95 @@ from ._column_registry import (
     FANTASY_RZ_RUSHING,
     FANTASY_TOP_PLAYERS,
 )
-from ._helpers import safe_int, safe_numeric, safe_pct
+from ._helpers import as_soup, page_index, safe_numeric
+from ._table_extractor import TableExtractor, cell, or_none, to_int
+
+_PLAYER = cell("player", or_none, href="player_href", csv_id="player_id")
+_TEAM = cell("team", or_none, href="team_href")
+_RANK = cell("rank", to_int)
+_LINK = cell(None, href="link_href")
+
+
+def _nbsp_to_space(text: str) -> str:
+    return text.replace("\xa0", " ")
+
+
+_TOP_PLAYERS = TableExtractor(
+    FANTASY_TOP_PLAYERS,
+    {
+        "ranker": _RANK,
+        "player": _PLAYER,
+        "team": _TEAM,
+        "fantasy_pos": cell("fantasy_pos", or_none),
+        "age": cell("age", to_int),
+    },
+    float_converter=safe_numeric,
+    normalize=_nbsp_to_space,
+)
+
+_MATCHUPS = TableExtractor(
+    FANTASY_MATCHUPS,
+    {
+        "player": _PLAYER,
+        "team": _TEAM,
+        "opp": cell("opp", or_none, href="opp_href"),
+        "injury": cell("injury", or_none),
+        "snaps": cell("snaps", or_none),
+        "at_or_vs": cell("at_or_vs", or_none),
+        "ranker": _RANK,
+    },
+    float_converter=safe_numeric,
+    normalize=_nbsp_to_space,
+)
+
+_POINTS_ALLOWED = TableExtractor(
+    FANTASY_POINTS_ALLOWED,
+    {"team": _TEAM},
+    float_converter=safe_numeric,
+    normalize=_nbsp_to_space,
+)
+
+_RZ_PASSING = TableExtractor(
+    FANTASY_RZ_PASSING,
+    {"player": _PLAYER, "team": _TEAM, "link": _LINK},
+    float_converter=safe_numeric,
+    normalize=_nbsp_to_space,
+)
+
+_RZ_RECEIVING = TableExtractor(
+    FANTASY_RZ_RECEIVING,
+    {"player": _PLAYER, "team": _TEAM, "link": _LINK},
+    normalize=_nbsp_to_space,
+)
+
+_RZ_RUSHING = TableExtractor(
+    FANTASY_RZ_RUSHING,
+    {"player": _PLAYER, "team": _TEAM, "link": _LINK},
+    normalize=_nbsp_to_space,
+)
 
 
 class FantasyParser:
     """Parses PFR Fantasy Rankings pages into structured data dicts."""
 
-    def parse_top_players(self, html: str) -> Dict[str, Any]:
+    def parse_top_players(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the top fantasy players page.
 
         Returns:
             A dict with key ``players``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="fantasy")
+        table = page_index(soup).find("table", id="fantasy")
         if table is None:
             return {"players": []}
 
-        players = self._parse_player_rows(table)
+        players = _TOP_PLAYERS.rows(table)
         return {"players": players}
 
-    def _parse_player_rows(self, table: Tag) -> List[Dict[str, Any]]:
-        """Extract player rows from the fantasy table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        players: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True).replace("\xa0", " ")
-                if text:
-                    all_empty = False
-
-                link = cell.find("a")
-
-                if stat == "ranker":
-                    row["rank"] = safe_int(text)
-                elif stat == "player":
-                    row["player"] = text or None
-                    if link:
-                        row["player_href"] = link.get("href")
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                elif stat == "team":
-                    row["team"] = text or None
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat == "fantasy_pos":
-                    row["fantasy_pos"] = text or None
-                elif stat == "age":
-                    row["age"] = safe_int(text)
-                elif stat in FANTASY_TOP_PLAYERS.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in FANTASY_TOP_PLAYERS.float_columns:
-                    row[stat] = safe_numeric(text)
-
-            if not all_empty:
-                players.append(row)
-
-        return players
-
     # ── Matchups (/fantasy/{position}-fantasy-matchups.htm) ──────────
 
-    def parse_matchups(self, html: str) -> Dict[str, Any]:
+    def parse_matchups(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a fantasy matchups page.
 
         Works for any position (QB, WR, RB, TE) since the parser reads
@@ -111,77 +123,18 @@ class FantasyParser:
         Returns:
             A dict with key ``players``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="fantasy_stats")
+        table = page_index(soup).find("table", id="fantasy_stats")
         if table is None:
             return {"players": []}
 
-        players = self._parse_matchup_rows(table)
+        players = _MATCHUPS.rows(table)
         return {"players": players}
 
-    def _parse_matchup_rows(self, table: Tag) -> List[Dict[str, Any]]:
-        """Extract player rows from the fantasy_stats matchup table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        players: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True).replace("\xa0", " ")
-                if text:
-                    all_empty = False
-
-                link = cell.find("a")
-
-                if stat == "player":
-                    row["player"] = text or None
-                    if link:
-                        row["player_href"] = link.get("href")
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                elif stat == "team":
-                    row["team"] = text or None
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat == "opp":
-                    row["opp"] = text or None
-                    if link:
-                        row["opp_href"] = link.get("href")
-                elif stat == "injury":
-                    row["injury"] = text or None
-                elif stat == "snaps":
-                    row["snaps"] = text or None
-                elif stat == "at_or_vs":
-                    row["at_or_vs"] = text or None
-                elif stat == "ranker":
-                    row["rank"] = safe_int(text)
-                elif stat in FANTASY_MATCHUPS.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in FANTASY_MATCHUPS.float_columns:
-                    row[stat] = safe_numeric(text)
-
-            if not all_empty:
-                players.append(row)
-
-        return players
-
     # ── Points Allowed (/years/{year}/fantasy-points-against-{pos}.htm) ──
 
-    def parse_points_allowed(self, html: str) -> Dict[str, Any]:
+    def parse_points_allowed(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a fantasy points allowed page.
 
         Works for any position (QB, WR, RB, TE) since the parser reads
@@ -190,252 +143,64 @@ class FantasyParser:
         Returns:
             A dict with key ``teams``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="fantasy_def")
+        table = page_index(soup).find("table", id="fantasy_def")
         if table is None:
             return {"teams": []}
 
-        teams = self._parse_points_allowed_rows(table)
+        teams = _POINTS_ALLOWED.rows(table)
         return {"teams": teams}
 
-    def _parse_points_allowed_rows(self, table: Tag) -> List[Dict[str, Any]]:
-        """Extract team rows from the fantasy_def table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        teams: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True).replace("\xa0", " ")
-                if text:
-                    all_empty = False
-
-                link = cell.find("a")
-
-                if stat == "team":
-                    row["team"] = text or None
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat in FANTASY_POINTS_ALLOWED.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in FANTASY_POINTS_ALLOWED.float_columns:
-                    row[stat] = safe_numeric(text)
-
-            if not all_empty:
-                teams.append(row)
-
-        return teams
-
     # ── Red Zone Passing (/years/{year}/redzone-passing.htm) ───────────
 
-    def parse_redzone_passing(self, html: str) -> Dict[str, Any]:
+    def parse_redzone_passing(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the red zone passing page.
 
         Returns:
             A dict with key ``players``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="fantasy_rz")
+        table = page_index(soup).find("table", id="fantasy_rz")
         if table is None:
             return {"players": []}
 
-        players = self._parse_rz_passing_rows(table)
+        players = _RZ_PASSING.rows(table)
         return {"players": players}
 
-    def _parse_rz_passing_rows(self, table: Tag) -> List[Dict[str, Any]]:
-        """Extract player rows from the red zone passing table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        players: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True).replace("\xa0", " ")
-                if text:
-                    all_empty = False
-
-                link = cell.find("a")
-
-                if stat == "player":
-                    row["player"] = text or None
-                    if link:
-                        row["player_href"] = link.get("href")
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                elif stat == "team":
-                    row["team"] = text or None
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat == "link":
-                    if link:
-                        row["link_href"] = link.get("href")
-                elif stat in FANTASY_RZ_PASSING.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in FANTASY_RZ_PASSING.float_columns:
-                    row[stat] = safe_numeric(text)
-
-            if not all_empty:
-                players.append(row)
-
-        return players
-
     # ── Red Zone Receiving (/years/{year}/redzone-receiving.htm) ───────
 
-    def parse_redzone_receiving(self, html: str) -> Dict[str, Any]:
+    def parse_redzone_receiving(
+        self, html: Union[str, BeautifulSoup]
+    ) -> Dict[str, Any]:
         """Parse the red zone receiving page.
 
         Returns:
             A dict with key ``players``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="fantasy_rz")
+        table = page_index(soup).find("table", id="fantasy_rz")
         if table is None:
             return {"players": []}
 
-        players = self._parse_rz_receiving_rows(table)
+        players = _RZ_RECEIVING.rows(table)
         return {"players": players}
 
-    def _parse_rz_receiving_rows(self, table: Tag) -> List[Dict[str, Any]]:
-        """Extract player rows from the red zone receiving table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        players: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True).replace("\xa0", " ")
-                if text:
-                    all_empty = False
-
-                link = cell.find("a")
-
-                if stat == "player":
-                    row["player"] = text or None
-                    if link:
-                        row["player_href"] = link.get("href")
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                elif stat == "team":
-                    row["team"] = text or None
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat == "link":
-                    if link:
-                        row["link_href"] = link.get("href")
-                elif stat in FANTASY_RZ_RECEIVING.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in FANTASY_RZ_RECEIVING.pct_columns:
-                    row[stat] = safe_pct(text)
-
-            if not all_empty:
-                players.append(row)
-
-        return players
-
     # ── Red Zone Rushing (/years/{year}/redzone-rushing.htm) ──────────
 
-    def parse_redzone_rushing(self, html: str) -> Dict[str, Any]:
+    def parse_redzone_rushing(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the red zone rushing page.
 
         Returns:
             A dict with key ``players``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="fantasy_rz")
+        table = page_index(soup).find("table", id="fantasy_rz")
         if table is None:
             return {"players": []}
 
-        players = self._parse_rz_rushing_rows(table)
+        players = _RZ_RUSHING.rows(table)
         return {"players": players}
-
-    def _parse_rz_rushing_rows(self, table: Tag) -> List[Dict[str, Any]]:
-        """Extract player rows from the red zone rushing table."""
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        players: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            if "thead" in (tr.get("class") or []):
-                continue
-
-            row: Dict[str, Any] = {}
-            all_empty = True
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat", "")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True).replace("\xa0", " ")
-                if text:
-                    all_empty = False
-
-                link = cell.find("a")
-
-                if stat == "player":
-                    row["player"] = text or None
-                    if link:
-                        row["player_href"] = link.get("href")
-                    player_id = cell.get("data-append-csv")
-                    if player_id:
-                        row["player_id"] = player_id
-                elif stat == "team":
-                    row["team"] = text or None
-                    if link:
-                        row["team_href"] = link.get("href")
-                elif stat == "link":
-                    if link:
-                        row["link_href"] = link.get("href")
-                elif stat in FANTASY_RZ_RUSHING.int_columns:
-                    row[stat] = safe_int(text)
-                elif stat in FANTASY_RZ_RUSHING.pct_columns:
-                    row[stat] = safe_pct(text)
-
-            if not all_empty:
-                players.append(row)
-
-        return players
@@ -6,17 +6,17 @@ drives, and more.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
-from ._helpers import safe_int, safe_numeric
+from ._helpers import as_soup, page_index, safe_int, safe_numeric
 
 
 class GameDetailsParser:
     """Parses PFR boxscore pages into comprehensive game data dicts."""
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR boxscore page into a comprehensive JSON-serializable dict.
 
         Extracts all game-specific data from
@@ -42,12 +42,12 @@ class GameDetailsParser:
         uncomment these tables before this parser runs.
 
         Args:
-            html: Raw HTML string of a PFR boxscore page.
+            html: Raw HTML string or parsed document of a PFR boxscore page.
 
         Returns:
             A dict with all extracted game data.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         result: Dict[str, Any] = {}
 
@@ -82,7 +82,7 @@ class GameDetailsParser:
         ``div.scorebox`` section, plus date/stadium/attendance metadata
         from ``div.scorebox_meta``.
         """
-        scorebox = soup.find("div", class_="scorebox")
+        scorebox = page_index(soup).find("div", class_="scorebox")
         if scorebox is None:
             return {}
 
@@ -152,7 +152,7 @@ class GameDetailsParser:
     @staticmethod
     def _parse_linescore(soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the quarter-by-quarter linescore table."""
-        table = soup.find("table", class_="linescore")
+        table = page_index(soup).find("table", class_="linescore")
         if table is None:
             return []
 
@@ -214,7 +214,7 @@ class GameDetailsParser:
 
         Skips mid-table header rows (``class="thead"``).
         """
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
@@ -268,7 +268,7 @@ class GameDetailsParser:
         table_id: str,
     ) -> Dict[str, Any]:
         """Parse a two-column key/value table (game_info, officials)."""
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return {}
 
@@ -296,7 +296,7 @@ class GameDetailsParser:
         The table has rows like "First Downs | 23 | 26" with columns
         stat, vis_stat, home_stat.
         """
-        table = soup.find("table", id="team_stats")
+        table = page_index(soup).find("table", id="team_stats")
         if table is None:
             return {}
 
@@ -4,13 +4,13 @@ Parses ``/friv/last-undefeated.htm`` which lists the last undefeated
 team(s) in every season along with their season outcomes.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 # Columns where we extract both text and an optional link.
 _LINK_COLS = frozenset(
@@ -36,7 +36,7 @@ class LastUndefeatedParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from ``<h2>`` inside ``#content``."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -113,11 +113,11 @@ class LastUndefeatedParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the last-undefeated-team page.
 
         Args:
-            html: Raw HTML of the PFR last-undefeated-team page.
+            html: Raw HTML or parsed document of the PFR last-undefeated-team page.
 
         Returns:
             A dict ready for ``LastUndefeated.model_validate()``.
@@ -125,16 +125,16 @@ class LastUndefeatedParser:
         Raises:
             ParsingError: If the undefeated_teams table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        table = soup.find("table", id="undefeated_teams")
+        table = page_index(soup).find("table", id="undefeated_teams")
         if table is None:
             raise ParsingError(
                 "Could not find undefeated_teams table in the HTML.",
                 selector="undefeated_teams",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_table(table)
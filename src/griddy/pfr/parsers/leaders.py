@@ -4,28 +4,30 @@ Handles ``/leaders/{stat}_{scope}.htm`` pages, extracting the leaders
 table into a list of entry dicts suitable for Pydantic validation.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from bs4 import BeautifulSoup
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class LeadersParser:
     """Parses PFR leader pages into structured data dicts."""
 
-    def parse(self, html: str, *, stat: str, scope: str) -> Dict[str, Any]:
+    def parse(
+        self, html: Union[str, BeautifulSoup], *, stat: str, scope: str
+    ) -> Dict[str, Any]:
         """Parse a leaders page and return a dict ready for model validation.
 
         Args:
-            html: Raw HTML content of the leaders page.
+            html: Raw HTML or parsed document of the leaders page.
             stat: The stat key (e.g. ``"pass_yds"``).
             scope: The scope (e.g. ``"career"``, ``"single_season"``).
 
         Returns:
             A dict with keys ``stat``, ``scope``, ``title``, ``entries``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = None
         h1 = soup.find("h1")
@@ -48,9 +50,9 @@ class LeadersParser:
         The table ID follows the pattern ``{stat}_leaders``
         (e.g. ``pass_yds_leaders``).
         """
-        table = soup.find("table", id=f"{stat}_leaders")
+        table = page_index(soup).find("table", id=f"{stat}_leaders")
         if table is None:
-            table = soup.find("table", class_="stats_table")
+            table = page_index(soup).find("table", class_="stats_table")
         if table is None:
             return []
 
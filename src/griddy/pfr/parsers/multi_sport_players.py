@@ -5,13 +5,13 @@ who played multiple sports professionally, with their NFL career
 statistics and links to other sports reference sites.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 # Columns that should be parsed as integers.
 _INT_COLS = frozenset(
@@ -56,7 +56,7 @@ class MultiSportPlayersParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from ``<h2>`` inside ``#content``."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -145,11 +145,11 @@ class MultiSportPlayersParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the multisport athletes page.
 
         Args:
-            html: Raw HTML of the PFR multisport athletes page.
+            html: Raw HTML or parsed document of the PFR multisport athletes page.
 
         Returns:
             A dict ready for ``MultiSportPlayers.model_validate()``.
@@ -157,16 +157,16 @@ class MultiSportPlayersParser:
         Raises:
             ParsingError: If the multisport table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        table = soup.find("table", id="multisport")
+        table = page_index(soup).find("table", id="multisport")
         if table is None:
             raise ParsingError(
                 "Could not find multisport table in the HTML.",
                 selector="multisport",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_table(table)
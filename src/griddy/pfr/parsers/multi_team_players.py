@@ -6,13 +6,13 @@ stat tables, and the all-players table.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_numeric
+from ._helpers import as_soup, page_index, safe_numeric
 
 
 class MultiTeamPlayersParser:
@@ -35,7 +35,7 @@ class MultiTeamPlayersParser:
     @staticmethod
     def _extract_total_players(soup: BeautifulSoup) -> Optional[int]:
         """Extract the total player count from the intro paragraph."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if not content:
             return None
 
@@ -58,9 +58,9 @@ class MultiTeamPlayersParser:
     def _extract_teams(soup: BeautifulSoup) -> List[str]:
         """Extract team names from the over_header row of the first table."""
         teams: List[str] = []
-        table = soup.find("table", id="multifranchise_stats_0")
+        table = page_index(soup).find("table", id="multifranchise_stats_0")
         if table is None:
-            table = soup.find("table", id="multifranchise_stats_3")
+            table = page_index(soup).find("table", id="multifranchise_stats_3")
         if table is None:
             return teams
 
@@ -76,7 +76,7 @@ class MultiTeamPlayersParser:
     def _extract_top_players(soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Extract the top 5 player summaries from h3/p pairs."""
         top_players: List[Dict[str, Any]] = []
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if not content:
             return top_players
 
@@ -120,7 +120,7 @@ class MultiTeamPlayersParser:
     @staticmethod
     def _extract_table_category(soup: BeautifulSoup, table_id: str) -> str:
         """Extract the category label (e.g. 'Passing') for a table."""
-        wrapper = soup.find("div", id=f"all_{table_id}")
+        wrapper = page_index(soup).find("div", id=f"all_{table_id}")
         if wrapper:
             heading = wrapper.find("h2")
             if heading:
@@ -175,11 +175,12 @@ class MultiTeamPlayersParser:
 
         return players
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the multi-team players results page.
 
         Args:
-            html: Raw HTML of the PFR multi-franchise players results page.
+            html: Raw HTML or parsed document of the PFR multi-franchise players
+                results page.
 
         Returns:
             A dict ready for ``MultiTeamPlayers.model_validate()``.
@@ -187,7 +188,7 @@ class MultiTeamPlayersParser:
         Raises:
             ParsingError: If no stats tables are found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
         total_players = self._extract_total_players(soup)
@@ -198,7 +199,7 @@ class MultiTeamPlayersParser:
         idx = 0
         while True:
             table_id = f"{self._TABLE_ID_PREFIX}{idx}"
-            table = soup.find("table", id=table_id)
+            table = page_index(soup).find("table", id=table_id)
             if table is None:
                 break
 
@@ -218,7 +219,7 @@ class MultiTeamPlayersParser:
             raise ParsingError(
                 "Could not find any multifranchise_stats tables in the HTML.",
                 selector="multi_team_stats",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         return {
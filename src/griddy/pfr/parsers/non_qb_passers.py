@@ -4,13 +4,13 @@ Parses ``/friv/nonqb.htm`` including the table listing non-QB players
 who have thrown a pass in the NFL (post-1960) with their passing stats.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_float, safe_int
+from ._helpers import as_soup, page_index, safe_float, safe_int
 
 # Columns that should be parsed as integers.
 _INT_COLS = frozenset(
@@ -57,7 +57,7 @@ class NonQBPassersParser:
         The page uses an ``<h2>`` rather than an ``<h1>`` for the main
         heading, so we fall back to the ``<title>`` tag.
         """
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -122,11 +122,11 @@ class NonQBPassersParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the non-quarterback passers page.
 
         Args:
-            html: Raw HTML of the PFR non-QB passers page.
+            html: Raw HTML or parsed document of the PFR non-QB passers page.
 
         Returns:
             A dict ready for ``NonQBPassers.model_validate()``.
@@ -134,16 +134,16 @@ class NonQBPassersParser:
         Raises:
             ParsingError: If the nonqb_passers table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        table = soup.find("table", id="nonqb_passers")
+        table = page_index(soup).find("table", id="nonqb_passers")
         if table is None:
             raise ParsingError(
                 "Could not find nonqb_passers table in the HTML.",
                 selector="nonqb_passers",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_table(table)
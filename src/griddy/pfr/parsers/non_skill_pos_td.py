@@ -4,13 +4,13 @@ Parses ``/friv/odd_td.htm`` including the table listing game-level
 instances of non-skill position players scoring an offensive touchdown.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_float, safe_int
+from ._helpers import as_soup, page_index, safe_float, safe_int
 
 # Columns that should be parsed as integers.
 _INT_COLS = frozenset(
@@ -54,7 +54,7 @@ class NonSkillPosTdParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from ``<h2>`` inside ``#content``."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -157,11 +157,11 @@ class NonSkillPosTdParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the non-skill position TD scorers page.
 
         Args:
-            html: Raw HTML of the PFR odd TD scorers page.
+            html: Raw HTML or parsed document of the PFR odd TD scorers page.
 
         Returns:
             A dict ready for ``NonSkillPosTdScorers.model_validate()``.
@@ -169,16 +169,16 @@ class NonSkillPosTdParser:
         Raises:
             ParsingError: If the odd_scorers table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        table = soup.find("table", id="odd_scorers")
+        table = page_index(soup).find("table", id="odd_scorers")
         if table is None:
             raise ParsingError(
                 "Could not find odd_scorers table in the HTML.",
                 selector="odd_scorers",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_table(table)
@@ -5,13 +5,13 @@ game-level instances of a player scoring both the TD and the two-point
 conversion on a single possession (since 1994).
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 # Columns that should be parsed as integers.
 _INT_COLS = frozenset(
@@ -39,7 +39,7 @@ class OctopusTrackerParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from ``<h2>`` inside ``#content``."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -135,11 +135,11 @@ class OctopusTrackerParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the octopus tracker page.
 
         Args:
-            html: Raw HTML of the PFR octopus tracker page.
+            html: Raw HTML or parsed document of the PFR octopus tracker page.
 
         Returns:
             A dict ready for ``OctopusTracker.model_validate()``.
@@ -147,16 +147,16 @@ class OctopusTrackerParser:
         Raises:
             ParsingError: If the octopus table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        table = soup.find("table", id="octopus")
+        table = page_index(soup).find("table", id="octopus")
         if table is None:
             raise ParsingError(
                 "Could not find octopus table in the HTML.",
                 selector="octopus",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_table(table)
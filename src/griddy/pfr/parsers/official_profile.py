@@ -5,12 +5,12 @@ containing official bio, season penalty stats, and individual game logs.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from ._column_registry import OFFICIAL_GAMES, OFFICIAL_STATS
-from ._helpers import safe_int, safe_pct
+from ._helpers import as_soup, page_index, safe_int, safe_pct, uncomment_all
 
 # Columns in games where we extract hrefs.
 _GAMES_LINK_COLUMNS = {
@@ -23,17 +23,17 @@ _GAMES_LINK_COLUMNS = {
 class OfficialProfileParser:
     """Parses PFR official profile pages into comprehensive data dicts."""
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR official profile page into a JSON-serializable dict.
 
         Args:
-            html: Raw HTML string of a PFR official profile page.
+            html: Raw HTML string or parsed document of a PFR official profile page.
 
         Returns:
             A dict with keys: bio, official_stats, games.
         """
-        cleaned = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        soup = BeautifulSoup(cleaned, "html.parser")
+        soup = as_soup(html)
+        uncomment_all(soup)
 
         result: Dict[str, Any] = {}
         result["bio"] = self._parse_bio(soup)
@@ -55,7 +55,7 @@ class OfficialProfileParser:
     @classmethod
     def _parse_bio(cls, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract official bio from the ``#meta`` div."""
-        meta_div = soup.find("div", id="meta")
+        meta_div = page_index(soup).find("div", id="meta")
         if meta_div is None:
             return {"name": ""}
 
@@ -87,7 +87,7 @@ class OfficialProfileParser:
 
     def _parse_official_stats(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the ``official_stats`` table."""
-        table = soup.find("table", id="official_stats")
+        table = page_index(soup).find("table", id="official_stats")
         if table is None:
             return []
 
@@ -103,7 +103,7 @@ class OfficialProfileParser:
 
     def _parse_games(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the ``games`` table."""
-        table = soup.find("table", id="games")
+        table = page_index(soup).find("table", id="games")
         if table is None:
             return []
 
@@ -4,13 +4,13 @@ Parses ``/friv/nfl-ties.htm`` which lists all tied games since
 sudden-death overtime was instituted in 1974.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 # Columns that should be parsed as integers.
 _INT_COLS = frozenset(
@@ -34,7 +34,7 @@ class OvertimeTiesParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from ``<h2>`` inside ``#content``."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -132,11 +132,11 @@ class OvertimeTiesParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the overtime ties page.
 
         Args:
-            html: Raw HTML of the PFR overtime ties page.
+            html: Raw HTML or parsed document of the PFR overtime ties page.
 
         Returns:
             A dict ready for ``OvertimeTies.model_validate()``.
@@ -144,16 +144,16 @@ class OvertimeTiesParser:
         Raises:
             ParsingError: If the overtime ties table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        table = soup.find("table", id="ot_ties")
+        table = page_index(soup).find("table", id="ot_ties")
         if table is None:
             raise ParsingError(
                 "Could not find ot_ties table in the HTML.",
                 selector="ot_ties",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_table(table)
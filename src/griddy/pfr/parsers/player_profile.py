@@ -9,13 +9,15 @@ import logging
 import re
 from collections import defaultdict
 from datetime import date, datetime
-from typing import Any, Dict, Mapping
+from typing import Any, Dict, Mapping, Union
 
 from bs4 import BeautifulSoup
 from bs4.element import ResultSet, Tag
 
 from griddy.core.utils.converters import multi_replace, safe_numberify, snakify
 
+from ._helpers import as_soup, page_index, uncomment_all
+
 logger = logging.getLogger(__name__)
 
 
@@ -168,6 +170,10 @@ class PlayerProfileParser:
     def _extract_pre_nfl(self, tag: Tag) -> dict:
         """Extract pre-NFL background (college, high school, draft info).
 
+        PFR leaves the college ``<p>`` unclosed. ``html.parser`` nests the
+        following paragraphs inside it while lxml closes it, so the text of
+        its sibling paragraphs is read too.
+
         Args:
             tag: The ``<p>`` tag containing college, high school, and draft
                 information.
@@ -175,8 +181,9 @@ class PlayerProfileParser:
         Returns:
             A dict with ``college``, ``high_school``, and ``draft`` keys.
         """
+        text = "\n".join(t.get_text() for t in [tag, *tag.find_next_siblings("p")])
         text_values = [
-            s.strip().replace(":", "") for s in tag.get_text().splitlines() if s.strip()
+            s.strip().replace(":", "") for s in text.splitlines() if s.strip()
         ]
         pre_nfl_info = {"college": "", "high_school": "", "draft": {}}
         for idx, value in enumerate(text_values):
@@ -602,7 +609,7 @@ class PlayerProfileParser:
 
         return leader_boards
 
-    def parse(self, html: str) -> PlayerProfile:
+    def parse(self, html: Union[str, BeautifulSoup]) -> PlayerProfile:
         """Parse a PFR player profile page into a structured dict.
 
         Uncomments hidden HTML tables, then extracts bio, jersey numbers,
@@ -610,37 +617,37 @@ class PlayerProfileParser:
         links, and leaderboard data.
 
         Args:
-            html: Raw HTML string of a PFR
+            html: Raw HTML string or parsed document of a PFR
                 ``/players/{letter}/{player_id}.htm`` page.
 
         Returns:
             A dict suitable for validation into a
             :class:`~griddy.pfr.models.PlayerProfile` model.
         """
-        cleaned_html = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        self.soup = BeautifulSoup(cleaned_html, features="html.parser")
-        bio = self._parse_meta_panel(panel=self.soup.find(id="meta"))
+        self.soup = as_soup(html)
+        uncomment_all(self.soup)
+        bio = self._parse_meta_panel(panel=page_index(self.soup).find(id="meta"))
         jersey_numbers = self._parse_jersey_numbers(
-            tag=self.soup.find(class_="uni_holder")
+            tag=page_index(self.soup).find(class_="uni_holder")
         )
         summary_stats = self._parse_stats_summary(
-            tag=self.soup.find(class_="stats_pullout")
+            tag=page_index(self.soup).find(class_="stats_pullout")
         )
 
-        stats_tables = self.soup.find_all("table", class_="stats_table")
+        stats_tables = page_index(self.soup).find_all("table", class_="stats_table")
         full_stats = self._extract_all_stats(stats_tables=stats_tables)
 
-        transactions_div = self.soup.find(id="div_transactions")
+        transactions_div = page_index(self.soup).find(id="div_transactions")
         transactions = (
             self._parse_transactions(tag=transactions_div) if transactions_div else []
         )
 
-        bottom_nav_div = self.soup.find(id="bottom_nav_container")
+        bottom_nav_div = page_index(self.soup).find(id="bottom_nav_container")
         player_links = (
             self._parse_bottom_nav(tag=bottom_nav_div) if bottom_nav_div else {}
         )
 
-        leaderboard_div = self.soup.find(id="div_leaderboard")
+        leaderboard_div = page_index(self.soup).find(id="div_leaderboard")
         leader_boards = (
             self._parse_leader_boards(tag=leaderboard_div) if leaderboard_div else {}
         )
@@ -6,13 +6,13 @@ Page (``/friv/age.cgi?month=...&day=...&year=...``):
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class PlayersBornBeforeParser:
@@ -49,7 +49,7 @@ class PlayersBornBeforeParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from h1 inside #content."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h1 = content.find("h1")
             if h1:
@@ -160,11 +160,12 @@ class PlayersBornBeforeParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the active players born before a date page.
 
         Args:
-            html: Raw HTML of the PFR active players born before page.
+            html: Raw HTML or parsed document of the PFR active players born before
+                page.
 
         Returns:
             A dict ready for ``PlayersBornBefore.model_validate()``.
@@ -172,17 +173,17 @@ class PlayersBornBeforeParser:
         Raises:
             ParsingError: If the players table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
         month, day, year = self._extract_month_day_year(title)
 
-        table = soup.find("table", id="players")
+        table = page_index(soup).find("table", id="players")
         if table is None:
             raise ParsingError(
                 "Could not find players table in the HTML.",
                 selector="players",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         players = self._parse_table(table)
@@ -6,12 +6,14 @@ frivolity pages, this one does **not** use a ``<table>``; the data lives
 in ``<li>`` elements inside the first ``<ul>`` within ``#content``.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
+from ._helpers import as_soup, page_index
+
 
 class PronunciationGuideParser:
     """Parses the PFR 'Pronunciation Guide' page."""
@@ -19,7 +21,7 @@ class PronunciationGuideParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from ``<h1>`` inside ``#content``."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h1 = content.find("h1")
             if h1:
@@ -69,11 +71,11 @@ class PronunciationGuideParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the pronunciation guide page.
 
         Args:
-            html: Raw HTML of the PFR pronunciation guide page.
+            html: Raw HTML or parsed document of the PFR pronunciation guide page.
 
         Returns:
             A dict ready for ``PronunciationGuide.model_validate()``.
@@ -81,16 +83,16 @@ class PronunciationGuideParser:
         Raises:
             ParsingError: If the pronunciation list is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content is None:
             raise ParsingError(
                 "Could not find #content div in the HTML.",
                 selector="content",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         ul = content.find("ul")
@@ -98,7 +100,7 @@ class PronunciationGuideParser:
             raise ParsingError(
                 "Could not find pronunciation list in the HTML.",
                 selector="content ul",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_list(ul)
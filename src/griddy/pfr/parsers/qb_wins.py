@@ -4,13 +4,13 @@ Parses ``/friv/qb-wins.htm`` including the table listing quarterbacks
 who have beaten every (or nearly every) NFL franchise.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class QBWinsParser:
@@ -23,7 +23,7 @@ class QBWinsParser:
         The page uses an ``<h2>`` rather than an ``<h1>`` for the main
         heading, so we fall back to the ``<title>`` tag.
         """
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h2 = content.find("h2")
             if h2:
@@ -87,11 +87,11 @@ class QBWinsParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the quarterback wins page.
 
         Args:
-            html: Raw HTML of the PFR quarterback wins page.
+            html: Raw HTML or parsed document of the PFR quarterback wins page.
 
         Returns:
             A dict ready for ``QBWins.model_validate()``.
@@ -99,16 +99,16 @@ class QBWinsParser:
         Raises:
             ParsingError: If the qb_wins table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
-        table = soup.find("table", id="qb_wins")
+        table = page_index(soup).find("table", id="qb_wins")
         if table is None:
             raise ParsingError(
                 "Could not find qb_wins table in the HTML.",
                 selector="qb_wins",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         entries = self._parse_table(table)
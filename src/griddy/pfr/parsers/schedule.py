@@ -3,46 +3,34 @@
 Parses the season-schedule table from PFR ``/years/{season}/games.htm`` pages.
 """
 
-from typing import Any, Dict, List
+from typing import List, Union
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import BeautifulSoup
 
 from griddy.pfr.errors import ParsingError
 
 from ._column_registry import SCHEDULE
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index
+from ._table_extractor import TableExtractor, cell
 
 # Columns where we also want to extract the ``href`` from a child ``<a>`` tag.
 _LINK_COLUMNS = {"winner", "loser", "boxscore_word"}
 
+_GAMES = TableExtractor(
+    SCHEDULE,
+    {
+        stat: cell(stat, href=f"{stat}_href", href_when="always")
+        for stat in _LINK_COLUMNS
+    },
+    default=str,
+    blank=("", "Playoffs"),
+)
+
 
 class ScheduleParser:
     """Parses the PFR season-schedule HTML table."""
 
-    @staticmethod
-    def _extract_cell(cell: Tag, stat: str) -> Dict[str, Any]:
-        """Extract text and optional href from a single ``<td>`` or ``<th>``.
-
-        Returns a dict with at least ``{stat: text_value}``.  For columns in
-        ``_LINK_COLUMNS``, an additional ``{stat}_href`` key is added when a
-        link is present.  For columns in ``_INT_COLUMNS`` the value is cast
-        to ``int | None``.
-        """
-        text = cell.get_text(strip=True)
-        result: Dict[str, Any] = {}
-
-        if stat in SCHEDULE.int_columns:
-            result[stat] = safe_int(text)
-        else:
-            result[stat] = text
-
-        if stat in _LINK_COLUMNS:
-            link = cell.find("a")
-            result[f"{stat}_href"] = link["href"] if link and link.get("href") else None
-
-        return result
-
-    def parse(self, html: str) -> List[ScheduleGame]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> List[ScheduleGame]:
         """Parse the PFR season-schedule table into a list of ScheduleGame models.
 
         Looks for ``<table id="games">``, iterates over ``<tbody> <tr>`` rows,
@@ -52,7 +40,8 @@ class ScheduleParser:
         * Rows where *all* data cells are empty (e.g. the "Playoffs" label row)
 
         Args:
-            html: Raw HTML string of a PFR ``/years/{season}/games.htm`` page.
+            html: Raw HTML string or parsed document of a PFR
+                ``/years/{season}/games.htm`` page.
 
         Returns:
             A list of ``ScheduleGame`` models, one per game.
@@ -60,13 +49,13 @@ class ScheduleParser:
         Raises:
             ParsingError: If ``<table id="games">`` is not found in the HTML.
         """
-        soup = BeautifulSoup(html, "html.parser")
-        table = soup.find("table", id="games")
+        soup = as_soup(html)
+        table = page_index(soup).find("table", id="games")
         if table is None:
             raise ParsingError(
                 "Could not find <table id='games'> in the HTML.",
                 selector="games",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         tbody = table.find("tbody")
@@ -74,35 +63,7 @@ class ScheduleParser:
             raise ParsingError(
                 "Could not find <tbody> inside the games table.",
                 selector="games tbody",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
-        games: List[ScheduleGame] = []
-
-        for row in tbody.find_all("tr"):
-            # Skip separator header rows that repeat column names mid-table.
-            if "thead" in (row.get("class") or []):
-                continue
-
-            game_data: Dict[str, Any] = {}
-            cells = row.find_all(["th", "td"])
-
-            all_empty = True
-            for cell in cells:
-                stat = cell.get("data-stat")
-                if not stat:
-                    continue
-                extracted = self._extract_cell(cell, stat)
-                game_data.update(extracted)
-                # Check if this cell has meaningful text content.
-                text = cell.get_text(strip=True)
-                if text and text != "Playoffs":
-                    all_empty = False
-
-            # Skip label-only rows (e.g. the "Playoffs" divider).
-            if all_empty:
-                continue
-
-            games.append(game_data)
-
-        return games
+        return _GAMES.rows(table)
@@ -5,11 +5,11 @@ Handles two page types:
 - ``/schools/high_schools.cgi`` — High Schools (table ``#high_schools``)
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from bs4 import BeautifulSoup, Tag
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class SchoolsParser:
@@ -19,15 +19,15 @@ class SchoolsParser:
     # Colleges — /schools/
     # ------------------------------------------------------------------
 
-    def parse_colleges(self, html: str) -> Dict[str, Any]:
+    def parse_colleges(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the colleges / universities index page.
 
         Returns:
             A dict with key ``colleges``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="college_stats_table")
+        table = page_index(soup).find("table", id="college_stats_table")
         if table is None:
             return {"colleges": []}
 
@@ -109,15 +109,15 @@ class SchoolsParser:
     # High Schools — /schools/high_schools.cgi
     # ------------------------------------------------------------------
 
-    def parse_high_schools(self, html: str) -> Dict[str, Any]:
+    def parse_high_schools(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the high schools index page.
 
         Returns:
             A dict with key ``schools``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="high_schools")
+        table = page_index(soup).find("table", id="high_schools")
         if table is None:
             return {"schools": []}
 
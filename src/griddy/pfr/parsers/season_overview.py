@@ -8,8 +8,7 @@ per-player stat dicts and ``/years/{year}/week_{number}.htm`` weekly
 summary pages into game results with stat leaders.
 """
 
-import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
@@ -18,11 +17,39 @@ from ._column_registry import (
     SEASON_PLAYOFF_STANDINGS,
     SEASON_STANDINGS,
 )
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int, uncomment_all
+from ._table_extractor import TableExtractor, cell, skip
 
 # Columns in playoff results with hrefs to extract.
 _PLAYOFF_RESULTS_LINK_COLS = {"winner", "loser", "boxscore_word"}
 
+_TEAM = cell("team", href="team_href", href_when="href")
+
+# Season tables keep every column (as text unless cast) and drop only rows
+# without a single ``data-stat`` cell.
+_SEASON_TABLE = dict(default=str, skip_classes=("thead", "over_header"), blank=None)
+
+_STANDINGS = TableExtractor(SEASON_STANDINGS, {"team": _TEAM}, **_SEASON_TABLE)
+
+_PLAYOFF_RESULTS = TableExtractor(
+    SEASON_PLAYOFF_RESULTS,
+    {
+        stat: cell(
+            stat,
+            href="boxscore_href" if stat == "boxscore_word" else f"{stat}_href",
+            href_when="href",
+        )
+        for stat in _PLAYOFF_RESULTS_LINK_COLS
+    },
+    **_SEASON_TABLE,
+)
+
+_PLAYOFF_STANDINGS = TableExtractor(
+    SEASON_PLAYOFF_STANDINGS, {"team": _TEAM}, **_SEASON_TABLE
+)
+
+_TEAM_STATS = TableExtractor(cells={"ranker": skip, "team": _TEAM}, **_SEASON_TABLE)
+
 # Team stat table IDs on the main season page.
 _TEAM_STAT_TABLE_IDS = (
     "team_stats",
@@ -55,18 +82,18 @@ _GAME_LEADER_MAP = {
 class SeasonOverviewParser:
     """Parses PFR season overview and stat category pages."""
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR season overview page into a JSON-serializable dict.
 
         Args:
-            html: Raw HTML string of a PFR ``/years/{year}/`` page.
+            html: Raw HTML string or parsed document of a PFR ``/years/{year}/`` page.
 
         Returns:
             A dict with keys: afc_standings, nfc_standings, playoff_results,
             afc_playoff_standings, nfc_playoff_standings, and team stat tables.
         """
-        cleaned = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        soup = BeautifulSoup(cleaned, "html.parser")
+        soup = as_soup(html)
+        uncomment_all(soup)
 
         result: Dict[str, Any] = {}
         result["afc_standings"] = self._parse_standings(soup, "AFC")
@@ -84,23 +111,24 @@ class SeasonOverviewParser:
 
         return result
 
-    def parse_stats(self, html: str) -> Dict[str, Any]:
+    def parse_stats(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR stat category page into a JSON-serializable dict.
 
         Args:
-            html: Raw HTML string of a PFR ``/years/{year}/{category}.htm`` page.
+            html: Raw HTML string or parsed document of a PFR
+                ``/years/{year}/{category}.htm`` page.
 
         Returns:
             A dict with keys: regular_season, postseason — each a list of
             per-player stat dicts.
         """
-        cleaned = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        soup = BeautifulSoup(cleaned, "html.parser")
+        soup = as_soup(html)
+        uncomment_all(soup)
 
         result: Dict[str, Any] = {"regular_season": [], "postseason": []}
 
         # Find all stat tables (they have data-stat columns in their rows).
-        for table in soup.find_all("table", id=True):
+        for table in page_index(soup).find_all("table", id=True):
             table_id = table.get("id", "")
             if not table_id:
                 continue
@@ -127,7 +155,7 @@ class SeasonOverviewParser:
         Division separator rows (class ``thead``) are used to assign a
         ``division`` field to each team row that follows them.
         """
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
@@ -155,22 +183,7 @@ class SeasonOverviewParser:
             if current_division:
                 row["division"] = current_division
 
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-
-                if stat == "team":
-                    row["team"] = text
-                    a = cell.find("a")
-                    if a and a.get("href"):
-                        row["team_href"] = a["href"]
-                elif stat in SEASON_STANDINGS.int_columns:
-                    row[stat] = safe_int(text)
-                else:
-                    row[stat] = text
+            row.update(_STANDINGS.extract_row(tr) or {})
 
             if row:
                 records.append(row)
@@ -184,48 +197,11 @@ class SeasonOverviewParser:
     @staticmethod
     def _parse_playoff_results(soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the ``playoff_results`` table."""
-        table = soup.find("table", id="playoff_results")
+        table = page_index(soup).find("table", id="playoff_results")
         if table is None:
             return []
 
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        records: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            classes = tr.get("class") or []
-            if "thead" in classes or "over_header" in classes:
-                continue
-
-            row: Dict[str, Any] = {}
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-
-                if stat in SEASON_PLAYOFF_RESULTS.int_columns:
-                    row[stat] = safe_int(text)
-                else:
-                    row[stat] = text
-
-                # Extract hrefs from link columns.
-                if stat in _PLAYOFF_RESULTS_LINK_COLS:
-                    a = cell.find("a")
-                    if a and a.get("href"):
-                        if stat == "boxscore_word":
-                            row["boxscore_href"] = a["href"]
-                        else:
-                            row[f"{stat}_href"] = a["href"]
-
-            if row:
-                records.append(row)
-
-        return records
+        return _PLAYOFF_RESULTS.rows(table)
 
     # ------------------------------------------------------------------
     # Playoff standings
@@ -236,44 +212,11 @@ class SeasonOverviewParser:
         soup: BeautifulSoup, table_id: str
     ) -> List[Dict[str, Any]]:
         """Parse an AFC or NFC playoff standings table."""
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        records: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            classes = tr.get("class") or []
-            if "thead" in classes or "over_header" in classes:
-                continue
-
-            row: Dict[str, Any] = {}
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat")
-                if not stat:
-                    continue
-
-                text = cell.get_text(strip=True)
-
-                if stat == "team":
-                    row["team"] = text
-                    a = cell.find("a")
-                    if a and a.get("href"):
-                        row["team_href"] = a["href"]
-                elif stat in SEASON_PLAYOFF_STANDINGS.int_columns:
-                    row[stat] = safe_int(text)
-                else:
-                    row[stat] = text
-
-            if row:
-                records.append(row)
-
-        return records
+        return _PLAYOFF_STANDINGS.rows(table)
 
     # ------------------------------------------------------------------
     # Generic team stat tables
@@ -285,41 +228,11 @@ class SeasonOverviewParser:
     ) -> List[Dict[str, Any]]:
         """Parse any team stat table generically, preserving all data-stat
         column values and extracting hrefs from the ``team`` column."""
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
-        tbody = table.find("tbody")
-        if tbody is None:
-            return []
-
-        records: List[Dict[str, Any]] = []
-
-        for tr in tbody.find_all("tr"):
-            classes = tr.get("class") or []
-            if "thead" in classes or "over_header" in classes:
-                continue
-
-            row: Dict[str, Any] = {}
-
-            for cell in tr.find_all(["th", "td"]):
-                stat = cell.get("data-stat")
-                if not stat or stat == "ranker":
-                    continue
-
-                text = cell.get_text(strip=True)
-                row[stat] = text
-
-                # Extract href from team column.
-                if stat == "team":
-                    a = cell.find("a")
-                    if a and a.get("href"):
-                        row["team_href"] = a["href"]
-
-            if row:
-                records.append(row)
-
-        return records
+        return _TEAM_STATS.rows(table)
 
     # ------------------------------------------------------------------
     # Player stat tables (for category pages)
@@ -378,18 +291,19 @@ class SeasonOverviewParser:
     # Week summary pages (/years/{year}/week_{number}.htm)
     # ------------------------------------------------------------------
 
-    def parse_week(self, html: str) -> Dict[str, Any]:
+    def parse_week(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR week summary page into a JSON-serializable dict.
 
         Args:
-            html: Raw HTML string of a PFR ``/years/{year}/week_{N}.htm`` page.
+            html: Raw HTML string or parsed document of a PFR
+                ``/years/{year}/week_{N}.htm`` page.
 
         Returns:
             A dict with keys: games, players_of_the_week, top_passers,
             top_receivers, top_rushers, top_defenders.
         """
-        cleaned = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        soup = BeautifulSoup(cleaned, "html.parser")
+        soup = as_soup(html)
+        uncomment_all(soup)
 
         result: Dict[str, Any] = {}
         result["games"] = self._parse_game_summaries(soup)
@@ -407,7 +321,7 @@ class SeasonOverviewParser:
         Each block contains a ``table.teams`` (date, teams, scores) and a
         ``table.stats`` (top passer, rusher, receiver for the game).
         """
-        container = soup.find("div", class_="game_summaries")
+        container = page_index(soup).find("div", class_="game_summaries")
         if container is None:
             return []
 
@@ -495,7 +409,7 @@ class SeasonOverviewParser:
     @staticmethod
     def _parse_potw(soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the ``potw`` (Players of the Week) table."""
-        table = soup.find("table", id="potw")
+        table = page_index(soup).find("table", id="potw")
         if table is None:
             return []
 
@@ -541,7 +455,7 @@ class SeasonOverviewParser:
         hrefs in the ``player``, ``team``, and ``opp`` columns and a boxscore
         link in the ``game_date`` column.
         """
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
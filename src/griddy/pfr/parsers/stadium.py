@@ -5,28 +5,28 @@ containing stadium bio, career leaders, best games, and notable game summaries.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int, uncomment_all
 
 
 class StadiumParser:
     """Parses PFR stadium pages into comprehensive data dicts."""
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR stadium page into a JSON-serializable dict.
 
         Args:
-            html: Raw HTML string of a PFR stadium page.
+            html: Raw HTML string or parsed document of a PFR stadium page.
 
         Returns:
             A dict with keys: bio, leaders, best_games, best_playoff_games,
             game_summaries.
         """
-        cleaned = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        soup = BeautifulSoup(cleaned, "html.parser")
+        soup = as_soup(html)
+        uncomment_all(soup)
 
         result: Dict[str, Any] = {}
         result["bio"] = self._parse_bio(soup)
@@ -52,7 +52,7 @@ class StadiumParser:
     @classmethod
     def _parse_bio(cls, soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract stadium bio from the ``#meta`` div."""
-        meta_div = soup.find("div", id="meta")
+        meta_div = page_index(soup).find("div", id="meta")
         if meta_div is None:
             return {"name": "", "teams": []}
 
@@ -170,7 +170,7 @@ class StadiumParser:
     @staticmethod
     def _parse_record_table(soup: BeautifulSoup, table_id: str) -> List[Dict[str, Any]]:
         """Parse a leaders-style table with player, g, stats columns."""
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
@@ -218,7 +218,7 @@ class StadiumParser:
     ) -> List[Dict[str, Any]]:
         """Parse a best-games-style table with player, team, stats,
         boxscore columns."""
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
@@ -273,7 +273,7 @@ class StadiumParser:
         """Parse all game_summaries sections with notable games."""
         summaries: List[Dict[str, Any]] = []
 
-        for summaries_div in soup.find_all("div", class_="game_summaries"):
+        for summaries_div in page_index(soup).find_all("div", class_="game_summaries"):
             for gs in summaries_div.find_all("div", class_="game_summary"):
                 summary = cls._parse_single_game_summary(gs)
                 if summary:
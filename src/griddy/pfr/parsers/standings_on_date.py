@@ -4,13 +4,13 @@ Parses ``/boxscores/standings.cgi`` which lists NFL standings as of a
 specified date or week, broken out by conference and division.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_float, safe_int
+from ._helpers import as_soup, page_index, safe_float, safe_int
 
 # Table IDs corresponding to each conference.
 _CONFERENCE_TABLES = ("AFC", "NFC")
@@ -38,7 +38,7 @@ class StandingsOnDateParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from ``<h1>`` inside ``#content``."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h1 = content.find("h1")
             if h1:
@@ -122,11 +122,11 @@ class StandingsOnDateParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the standings-on-date page.
 
         Args:
-            html: Raw HTML of the PFR standings page.
+            html: Raw HTML or parsed document of the PFR standings page.
 
         Returns:
             A dict ready for ``StandingsOnDate.model_validate()``.
@@ -134,13 +134,13 @@ class StandingsOnDateParser:
         Raises:
             ParsingError: If no conference standings tables are found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
 
         teams: List[Dict[str, Any]] = []
         for table_id in _CONFERENCE_TABLES:
-            table = soup.find("table", id=table_id)
+            table = page_index(soup).find("table", id=table_id)
             if table:
                 teams.extend(self._parse_table(table, table_id))
 
@@ -148,7 +148,7 @@ class StandingsOnDateParser:
             raise ParsingError(
                 "Could not find AFC or NFC standings tables in the HTML.",
                 selector="AFC_standings, NFC_standings",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         return {
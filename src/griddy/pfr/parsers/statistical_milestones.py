@@ -6,13 +6,13 @@ career leaders table.
 """
 
 import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class StatisticalMilestonesParser:
@@ -21,7 +21,7 @@ class StatisticalMilestonesParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from h1 inside #content."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h1 = content.find("h1")
             if h1:
@@ -154,11 +154,11 @@ class StatisticalMilestonesParser:
 
         return leaders
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the statistical milestones page.
 
         Args:
-            html: Raw HTML of the PFR milestones page.
+            html: Raw HTML or parsed document of the PFR milestones page.
 
         Returns:
             A dict ready for ``StatisticalMilestones.model_validate()``.
@@ -166,23 +166,23 @@ class StatisticalMilestonesParser:
         Raises:
             ParsingError: If the milestones table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
         stat = self._extract_stat(soup)
 
         # The milestones table is directly in the page
-        milestones_table = soup.find("table", id="milestones")
+        milestones_table = page_index(soup).find("table", id="milestones")
         if milestones_table is None:
             raise ParsingError(
                 "Could not find milestones table in the HTML.",
                 selector="milestones",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         milestones = self._parse_milestones_table(milestones_table)
 
-        leaders_table = soup.find("table", id="leaders")
+        leaders_table = page_index(soup).find("table", id="leaders")
         career_leaders = (
             self._parse_leaders_table(leaders_table) if leaders_table else []
         )
@@ -7,11 +7,11 @@ Handles three page types:
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class SuperBowlParser:
@@ -21,15 +21,15 @@ class SuperBowlParser:
     # History — /super-bowl/
     # ------------------------------------------------------------------
 
-    def parse_history(self, html: str) -> Dict[str, Any]:
+    def parse_history(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the Super Bowl history page.
 
         Returns:
             A dict with key ``games``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="super_bowls")
+        table = page_index(soup).find("table", id="super_bowls")
         if table is None:
             return {"games": []}
 
@@ -113,17 +113,17 @@ class SuperBowlParser:
     # Leaders — /super-bowl/leaders.htm
     # ------------------------------------------------------------------
 
-    def parse_leaders(self, html: str) -> Dict[str, Any]:
+    def parse_leaders(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the Super Bowl leaders page.
 
         Returns:
             A dict with key ``tables``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         tables_data: List[Dict[str, Any]] = []
 
-        for table in soup.find_all("table"):
+        for table in page_index(soup).find_all("table"):
             caption = table.find("caption")
             if caption is None:
                 continue
@@ -171,15 +171,15 @@ class SuperBowlParser:
     # Standings — /super-bowl/standings.htm
     # ------------------------------------------------------------------
 
-    def parse_standings(self, html: str) -> Dict[str, Any]:
+    def parse_standings(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the Super Bowl standings page.
 
         Returns:
             A dict with key ``teams``.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
-        table = soup.find("table", id="standings")
+        table = page_index(soup).find("table", id="standings")
         if table is None:
             return {"teams": []}
 
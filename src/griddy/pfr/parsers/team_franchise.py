@@ -4,13 +4,12 @@ Parses PFR ``/teams/{team_abbrev}/`` pages into structured dicts
 containing franchise metadata and year-by-year season records.
 """
 
-import re
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Union
 
 from bs4 import BeautifulSoup
 
 from ._column_registry import TEAM_FRANCHISE
-from ._helpers import safe_float, safe_int
+from ._helpers import as_soup, page_index, safe_float, safe_int, uncomment_all
 
 # Columns where we extract hrefs from links.
 _LINK_COLUMNS = {
@@ -48,17 +47,17 @@ _LEADER_LABELS: Dict[str, str] = {
 class FranchiseParser:
     """Parses PFR team franchise pages into comprehensive data dicts."""
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR team franchise page into a JSON-serializable dict.
 
         Args:
-            html: Raw HTML string of a PFR team franchise page.
+            html: Raw HTML string or parsed document of a PFR team franchise page.
 
         Returns:
             A dict with keys: meta, team_index.
         """
-        cleaned = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        soup = BeautifulSoup(cleaned, "html.parser")
+        soup = as_soup(html)
+        uncomment_all(soup)
 
         result: Dict[str, Any] = {}
         result["meta"] = self._parse_meta(soup)
@@ -73,7 +72,7 @@ class FranchiseParser:
     @staticmethod
     def _parse_meta(soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract franchise metadata from the ``#meta`` div."""
-        meta_div = soup.find("div", id="meta")
+        meta_div = page_index(soup).find("div", id="meta")
         if meta_div is None:
             return {}
 
@@ -120,7 +119,7 @@ class FranchiseParser:
 
     def _parse_team_index(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the ``team_index`` table of year-by-year season records."""
-        table = soup.find("table", id="team_index")
+        table = page_index(soup).find("table", id="team_index")
         if table is None:
             return []
 
@@ -10,7 +10,14 @@ from typing import Any, Dict, List, Optional, Union
 from bs4 import BeautifulSoup
 
 from ._column_registry import TEAM_SEASON_GAMES
-from ._helpers import safe_float, safe_int, safe_numeric
+from ._helpers import (
+    as_soup,
+    page_index,
+    safe_float,
+    safe_int,
+    safe_numeric,
+    uncomment_all,
+)
 
 # Columns where we extract hrefs.
 _GAME_LINK_COLUMNS = {"opp", "boxscore_word"}
@@ -44,18 +51,18 @@ _META_HREF_LABELS = {
 class TeamSeasonParser:
     """Parses PFR team season pages into comprehensive data dicts."""
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse a PFR team season page into a JSON-serializable dict.
 
         Args:
-            html: Raw HTML string of a PFR team season page.
+            html: Raw HTML string or parsed document of a PFR team season page.
 
         Returns:
             A dict with keys: meta, team_stats, games, team_conversions,
             passing, passing_post, rushing_and_receiving.
         """
-        cleaned = re.sub(r"<!--(.*?)-->", r"\1", html, flags=re.DOTALL)
-        soup = BeautifulSoup(cleaned, "html.parser")
+        soup = as_soup(html)
+        uncomment_all(soup)
 
         result: Dict[str, Any] = {}
         result["meta"] = self._parse_meta(soup)
@@ -77,7 +84,7 @@ class TeamSeasonParser:
     @staticmethod
     def _parse_meta(soup: BeautifulSoup) -> Dict[str, Any]:
         """Extract team metadata from the ``#meta`` div."""
-        meta_div = soup.find("div", id="meta")
+        meta_div = page_index(soup).find("div", id="meta")
         if meta_div is None:
             return {}
 
@@ -146,7 +153,7 @@ class TeamSeasonParser:
         Returns a dict keyed by the row label, with each value being a dict
         of ``{data_stat: value}`` for that row.
         """
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return {}
 
@@ -187,7 +194,7 @@ class TeamSeasonParser:
 
     def _parse_games(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
         """Parse the schedule/results ``games`` table."""
-        table = soup.find("table", id="games")
+        table = page_index(soup).find("table", id="games")
         if table is None:
             return []
 
@@ -251,7 +258,7 @@ class TeamSeasonParser:
         Extracts ``data-append-csv`` as ``player_id`` and ``name_display``
         link hrefs as ``player_href``.
         """
-        table = soup.find("table", id=table_id)
+        table = page_index(soup).find("table", id=table_id)
         if table is None:
             return []
 
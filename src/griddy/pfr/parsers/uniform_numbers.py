@@ -5,13 +5,13 @@ table listing all players who wore the specified uniform number.
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
-from ._helpers import safe_int
+from ._helpers import as_soup, page_index, safe_int
 
 
 class UniformNumbersParser:
@@ -20,7 +20,7 @@ class UniformNumbersParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from h1 inside #content."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h1 = content.find("h1")
             if h1:
@@ -103,11 +103,11 @@ class UniformNumbersParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the uniform numbers page.
 
         Args:
-            html: Raw HTML of the PFR uniform numbers page.
+            html: Raw HTML or parsed document of the PFR uniform numbers page.
 
         Returns:
             A dict ready for ``UniformNumbers.model_validate()``.
@@ -115,18 +115,18 @@ class UniformNumbersParser:
         Raises:
             ParsingError: If the uniform_number table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
         number = self._extract_number(title)
         team = self._extract_team(title)
 
-        table = soup.find("table", id="uniform_number")
+        table = page_index(soup).find("table", id="uniform_number")
         if table is None:
             raise ParsingError(
                 "Could not find uniform_number table in the HTML.",
                 selector="uniform_number",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         players = self._parse_table(table)
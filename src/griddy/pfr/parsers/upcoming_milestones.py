@@ -6,12 +6,14 @@ leaderboards table (players who may move up the career leaderboard).
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from bs4 import BeautifulSoup, Tag
 
 from griddy.pfr.errors import ParsingError
 
+from ._helpers import as_soup, page_index
+
 
 class UpcomingMilestonesParser:
     """Parses the PFR upcoming milestones page."""
@@ -19,7 +21,7 @@ class UpcomingMilestonesParser:
     @staticmethod
     def _extract_title(soup: BeautifulSoup) -> str:
         """Extract the page title from h1 inside #content."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             h1 = content.find("h1")
             if h1:
@@ -29,7 +31,7 @@ class UpcomingMilestonesParser:
     @staticmethod
     def _extract_description(soup: BeautifulSoup) -> str:
         """Extract the description paragraph from the page."""
-        content = soup.find("div", id="content")
+        content = page_index(soup).find("div", id="content")
         if content:
             p = content.find("p")
             if p:
@@ -126,11 +128,11 @@ class UpcomingMilestonesParser:
 
         return entries
 
-    def parse(self, html: str) -> Dict[str, Any]:
+    def parse(self, html: Union[str, BeautifulSoup]) -> Dict[str, Any]:
         """Parse the upcoming milestones page.
 
         Args:
-            html: Raw HTML of the PFR upcoming milestones page.
+            html: Raw HTML or parsed document of the PFR upcoming milestones page.
 
         Returns:
             A dict ready for ``UpcomingMilestones.model_validate()``.
@@ -138,22 +140,22 @@ class UpcomingMilestonesParser:
         Raises:
             ParsingError: If the milestones table is not found.
         """
-        soup = BeautifulSoup(html, "html.parser")
+        soup = as_soup(html)
 
         title = self._extract_title(soup)
         description = self._extract_description(soup)
 
-        milestones_table = soup.find("table", id="upcoming_milestones")
+        milestones_table = page_index(soup).find("table", id="upcoming_milestones")
         if milestones_table is None:
             raise ParsingError(
                 "Could not find upcoming milestones table in the HTML.",
                 selector="upcoming_milestones",
-                html_sample=html[:500],
+                html_sample=str(soup)[:500],
             )
 
         milestones = self._parse_table(milestones_table)
 
-        leaderboards_table = soup.find("table", id="upcoming_leaderboards")
+        leaderboards_table = page_index(soup).find("table", id="upcoming_leaderboards")
         leaderboards = (
             self._parse_table(leaderboards_table, extract_leader_href=True)
             if leaderboards_table
@@ -14,6 +14,9 @@ from typing import TYPE_CHECKING, Any, Dict, Optional
 from griddy.core._lazy_load import LazySubSDKMixin
 from griddy.core.base_griddy_sdk import BaseGriddySDK
 from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.htmlparser import ParserName, get_html_parser
+from griddy.core.pagecache import PageCache
+from griddy.core.transport import ConnectionPool, HttpOptions
 
 from ._hooks.registration import init_hooks
 from .backends import AsyncScrapingBackend, ScrapingBackend
@@ -110,6 +113,10 @@ class GriddyPFR(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
         browserless_config: Optional[BrowserlessConfig] = None,
         scraping_backend: Optional[ScrapingBackend] = None,
         async_scraping_backend: Optional[AsyncScrapingBackend] = None,
+        http_options: Optional[HttpOptions] = None,
+        connection_pool: Optional[ConnectionPool] = None,
+        html_parser: Optional[ParserName] = None,
+        page_cache: Optional[PageCache] = None,
     ) -> None:
         """Initialize the GriddyPFR client.
 
@@ -136,6 +143,18 @@ class GriddyPFR(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
                 satisfies the :class:`~griddy.pfr.backends.AsyncScrapingBackend`
                 protocol. When provided, this backend is used instead of the
                 default async Browserless client.
+            http_options: Pool limits, HTTP/2 and compression settings for
+                the clients this SDK creates. See
+                :class:`~griddy.core.transport.HttpOptions`.
+            connection_pool: A :class:`~griddy.core.transport.ConnectionPool`
+                whose transports are shared with other SDK instances.
+                Mutually exclusive with *http_options*.
+            html_parser: Tree builder used to parse scraped pages, such as
+                ``"lxml"`` or ``"auto"``. ``None`` uses the process default;
+                see :mod:`griddy.core.htmlparser`.
+            page_cache: A :class:`~griddy.core.pagecache.PageCache` that keeps
+                scraped pages on disk, so a page is only fetched again once
+                its TTL runs out.
         """
         # Pre-set so PFR BaseSDK.__init__ can pick it up via getattr
         # (MRO super().__init__ doesn't forward extra kwargs).
@@ -152,8 +171,12 @@ class GriddyPFR(LazySubSDKMixin, BaseGriddySDK, BaseSDK):
             retry_config=retry_config,
             timeout_ms=timeout_ms,
             debug_logger=debug_logger,
+            http_options=http_options,
+            connection_pool=connection_pool,
             scraping_backend=scraping_backend,
             async_scraping_backend=async_scraping_backend,
+            html_parser=None if html_parser is None else get_html_parser(html_parser),
+            page_cache=page_cache,
         )
 
     # ------------------------------------------------------------------
@@ -0,0 +1,21 @@
+"""Timing helpers shared by the benchmark tests."""
+
+import timeit
+from typing import Callable
+
+
+def per_call(fn: Callable[[], object], number: int = 100, repeat: int = 5) -> float:
+    """Best-of-*repeat* seconds per call of *fn*."""
+    fn()  # exclude one-off costs (imports, first compilation) from the timing
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def report(name: str, before: float, after: float, unit: str = "us") -> str:
+    """Format a before/after line and print it (visible with ``pytest -s``)."""
+    scale = {"s": 1, "ms": 1e3, "us": 1e6}[unit]
+    line = (
+        f"{name}: before {before * scale:.1f}{unit}, after {after * scale:.1f}{unit} "
+        f"({before / after:.1f}x)"
+    )
+    print(line)
+    return line
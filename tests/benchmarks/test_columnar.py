@@ -0,0 +1,101 @@
+"""Loading a season of weekly stats as columns versus per-row models.
+
+Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+import json
+import tracemalloc
+import typing
+from typing import Any, Callable
+
+import pytest
+from pydantic_core import from_json
+
+from griddy.core.columnar import to_columns
+from griddy.core.utils.serializers import unmarshal_json
+from griddy.nfl import models
+from griddy.nfl.models.entities.weekly_player_passing_stats import (
+    WeeklyPlayerPassingStats,
+)
+
+from ._timing import per_call, report
+
+
+def _value(annotation: Any, i: int) -> Any:
+    for arg in typing.get_args(annotation) or (annotation,):
+        if typing.get_origin(arg) is typing.Literal:
+            return typing.get_args(arg)[0]
+        if arg in (bool, int, float, str):
+            return {bool: i % 2 == 0, int: i, float: i / 7, str: f"s{i}"}[arg]
+    return None
+
+
+def _weekly_passing_pages(weeks: int = 18, passers: int = 100) -> list:
+    fields = WeeklyPlayerPassingStats.model_fields
+    return [
+        json.dumps(
+            {
+                "limit": passers,
+                "offset": 0,
+                "season": 2025,
+                "seasonType": "REG",
+                "total": passers,
+                "week": f"WEEK_{week}",
+                "passers": [
+                    {
+                        info.alias or name: _value(info.annotation, i)
+                        for name, info in fields.items()
+                    }
+                    for i in range(passers)
+                ],
+            }
+        ).encode()
+        for week in range(1, weeks + 1)
+    ]
+
+
+def _models_then_columns(pages: list) -> dict:
+    # What callers did before: validate every page, then pivot the rows.
+    rows = [
+        row
+        for body in pages
+        for row in unmarshal_json(body, models.WeeklyPassingStatsResponse).passers
+    ]
+    return {name: [getattr(row, name) for row in rows] for name in rows[0].__dict__}
+
+
+def _columns(pages: list) -> dict:
+    parts = [
+        to_columns(from_json(body), models.WeeklyPassingStatsResponse) for body in pages
+    ]
+    return {name: [v for part in parts for v in part[name]] for name in parts[0]}
+
+
+def _peak_bytes(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.benchmark
+class TestColumnarBenchmark:
+    def test_season_of_weekly_passing(self):
+        pages = _weekly_passing_pages()
+        assert list(_columns(pages)) == list(_models_then_columns(pages))
+
+        before = per_call(lambda: _models_then_columns(pages), number=3)
+        after = per_call(lambda: _columns(pages), number=3)
+        report("season of WeeklyPassingStatsResponse", before, after, unit="ms")
+
+        before_peak = _peak_bytes(lambda: _models_then_columns(pages))
+        after_peak = _peak_bytes(lambda: _columns(pages))
+        print(
+            f"peak traced allocations: before {before_peak / 2**20:.1f}MiB, "
+            f"after {after_peak / 2**20:.1f}MiB"
+        )
+
+        assert after < before
+        assert after_peak < before_peak
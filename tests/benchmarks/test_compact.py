@@ -0,0 +1,128 @@
+"""Memory held by a full season of play-by-play as models versus compact rows.
+
+Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+import gc
+import json
+import tracemalloc
+from typing import Callable, List
+
+import pytest
+
+from griddy.core.compact import compact_many
+from griddy.core.utils.serializers import unmarshal_json
+from griddy.nfl import models
+
+from ._timing import per_call
+
+_GAMES = 272
+
+
+def _game(drives: int = 24, plays_per_drive: int = 7) -> bytes:
+    return json.dumps(
+        {
+            "drives": [
+                {
+                    "plays": [
+                        {
+                            "playId": drive * 100 + i,
+                            "description": (
+                                "(9:12) (Shotgun) J.Allen pass deep left to "
+                                f"K.Shakir to BUF {i + 30} for 21 yards (M.Humphrey)."
+                            ),
+                            "down": i % 4 + 1,
+                            "distance": 10,
+                            "gameClock": f"{9 - i % 9}:12",
+                            "playNumber": drive * plays_per_drive + i,
+                            "playType": "PASS",
+                            "quarter": drive // 6 + 1,
+                            "result": "Complete",
+                            "yardLine": f"BUF {i + 30}",
+                            "yardsGained": i * 3,
+                            "players": [
+                                {
+                                    "player": {
+                                        "displayName": "Josh Allen",
+                                        "gsisId": "00-0034857",
+                                        "jerseyNumber": 17,
+                                    },
+                                    "role": "PASSER",
+                                },
+                                {
+                                    "player": {
+                                        "displayName": "Khalil Shakir",
+                                        "gsisId": "00-0037261",
+                                        "jerseyNumber": 10,
+                                    },
+                                    "role": "RECEIVER",
+                                },
+                            ],
+                        }
+                        for i in range(plays_per_drive)
+                    ]
+                }
+                for drive in range(drives)
+            ]
+        }
+    ).encode()
+
+
+def _season_plays(body: bytes) -> List[models.Play]:
+    return [
+        play
+        for _ in range(_GAMES)
+        for drive in unmarshal_json(body, models.PlayByPlayResponse).drives
+        for play in drive.plays
+    ]
+
+
+def _season_rows(body: bytes) -> list:
+    # Compact each game as it arrives so the models never pile up.
+    return [
+        row
+        for _ in range(_GAMES)
+        for row in compact_many(
+            play
+            for drive in unmarshal_json(body, models.PlayByPlayResponse).drives
+            for play in drive.plays
+        )
+    ]
+
+
+def _retained_bytes(build: Callable[[], list]) -> int:
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = build()
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    assert result
+    return retained
+
+
+@pytest.mark.benchmark
+class TestCompactBenchmark:
+    def test_season_of_play_by_play(self):
+        body = _game()
+        game = [
+            play
+            for drive in unmarshal_json(body, models.PlayByPlayResponse).drives
+            for play in drive.plays
+        ]
+        assert [row.to_model() for row in compact_many(game)] == game
+
+        before = _retained_bytes(lambda: _season_plays(body))
+        after = _retained_bytes(lambda: _season_rows(body))
+        print(
+            f"{len(game) * _GAMES} plays retained: models {before / 2**20:.1f}MiB, "
+            f"compact rows {after / 2**20:.1f}MiB ({before / after:.1f}x smaller)"
+        )
+        print(
+            "compacting one game of plays: "
+            f"{per_call(lambda: compact_many(game), number=10) * 1e3:.1f}ms"
+        )
+
+        assert after < before
@@ -0,0 +1,91 @@
+"""Cold-start cost of NFL models: importing them and their first validation.
+
+Each timing runs in a fresh interpreter. The "before" timings turn deferred
+model building off, as the models used to build their validators at import.
+Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+
+``-X importtime`` is not used: it only sees ``import`` statements, not the
+``importlib.import_module`` calls that load the response modules.
+"""
+
+import json
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+from ._timing import report
+
+_EAGER = """
+from griddy.nfl.types import BaseModel
+
+BaseModel.model_config["defer_build"] = False
+"""
+
+_IMPORT_ALL_RESPONSES = """
+import json, time, warnings
+from griddy.nfl._warmup import response_types
+{prelude}
+warnings.simplefilter("ignore")
+start = time.perf_counter()
+response_types()
+print(json.dumps([time.perf_counter() - start]))
+"""
+
+_FIRST_CALL = """
+import json, time
+from griddy.core.utils import unmarshal_json
+from griddy.nfl.types import BaseModel
+{prelude}
+start = time.perf_counter()
+from griddy.nfl.models.responses.boxscore_response import BoxscoreResponse
+imported = time.perf_counter()
+unmarshal_json(b"{{}}", BoxscoreResponse)
+print(json.dumps([imported - start, time.perf_counter() - imported]))
+"""
+
+
+def timings(code: str) -> List[float]:
+    """Run *code* in a fresh interpreter; return the seconds it prints."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=300,
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.benchmark
+class TestImportTimeBenchmark:
+    def test_import_response_models(self):
+        # Best of three to smooth out cold filesystem caches.
+        after = min(
+            timings(_IMPORT_ALL_RESPONSES.format(prelude=""))[0] for _ in range(3)
+        )
+        before = min(
+            timings(_IMPORT_ALL_RESPONSES.format(prelude=_EAGER))[0] for _ in range(3)
+        )
+
+        report("import all NFL response modules", before, after, unit="ms")
+        assert after < before
+
+    def test_first_boxscore_response(self):
+        after_import, after_call = min(
+            (timings(_FIRST_CALL.format(prelude="")) for _ in range(3)), key=sum
+        )
+        before_import, before_call = min(
+            (timings(_FIRST_CALL.format(prelude=_EAGER)) for _ in range(3)), key=sum
+        )
+
+        report("import BoxscoreResponse", before_import, after_import, unit="ms")
+        report("first BoxscoreResponse call", before_call, after_call, unit="ms")
+        report(
+            "import + first call",
+            before_import + before_call,
+            after_import + after_call,
+            unit="ms",
+        )
+        assert after_import < before_import
@@ -0,0 +1,52 @@
+"""Cost of fetching a PFR page through the on-disk page cache.
+
+The "before" timing fetches the box score from a backend that sleeps for
+50 ms, far less than the 5-20 s a Browserless render takes; the "after"
+timing reads the same page back from a :class:`PageCache`. Run with
+``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from griddy.core.pagecache import CachedScrapingBackend, PageCache
+
+from ._timing import per_call, report
+
+_BOXSCORE = Path(__file__).resolve().parents[2] / "PFR_boxscore_201509100nwe.htm"
+_URL = "https://www.pro-football-reference.com/boxscores/201509100nwe.htm"
+
+
+class _SlowBackend:
+    def __init__(self, html: str, latency: float = 0.05) -> None:
+        self.html = html
+        self.latency = latency
+
+    def get_page_content(self, url: str, wait_for_element: str) -> str:
+        time.sleep(self.latency)
+        return self.html
+
+
+@pytest.mark.benchmark
+def test_page_cache_hit(tmp_path):
+    html = _BOXSCORE.read_text()
+    backend = _SlowBackend(html)
+    cache = PageCache(tmp_path)
+    cached = CachedScrapingBackend(backend, cache)
+
+    def after():
+        return cached.get_page_content(_URL, wait_for_element="")
+
+    def before():
+        return backend.get_page_content(_URL, wait_for_element="")
+
+    assert after() == before() == html
+    after_time = per_call(after, number=5, repeat=3)
+    before_time = per_call(before, number=5, repeat=3)
+
+    report("fetch box score through page cache", before_time, after_time, unit="ms")
+    size = cache.stats().size_bytes
+    print(f"box score on disk: {size} bytes ({len(html.encode()) / size:.1f}x smaller)")
+    assert after_time < before_time
@@ -0,0 +1,212 @@
+"""Cost of parsing PFR pages: parsing once, with the lxml tree builder,
+looking tables up through the page index, and extracting table rows.
+
+The "before" timing of ``test_parse_once`` hands parsers ``str(soup)`` as
+``_parse_and_validate`` used to, so every parser builds a second tree from
+the re-serialized page; ``test_lxml_engine`` compares ``html.parser`` with
+lxml; the "before" timing of ``test_page_index`` answers each lookup with a
+``soup.find`` over the whole tree, as the parsers used to; the "before"
+timing of ``test_table_extractor`` reads and casts each cell as the parsers'
+row loops used to. Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from griddy.pfr.basesdk import BaseSDK
+from griddy.pfr.parsers import (
+    CoachProfileParser,
+    GameDetailsParser,
+    PlayerProfileParser,
+    SeasonOverviewParser,
+    TeamSeasonParser,
+    game_details,
+    season_overview,
+)
+from griddy.pfr.parsers._column_registry import (
+    COACH_RANKS,
+    DRAFT,
+    FANTASY_MATCHUPS,
+    FANTASY_TOP_PLAYERS,
+)
+from griddy.pfr.parsers._helpers import safe_float, safe_int, safe_pct
+from griddy.pfr.parsers._table_extractor import TableExtractor
+from griddy.settings import FIXTURE_DIR
+
+from ._timing import per_call, report
+
+_PFR = FIXTURE_DIR / "pfr"
+
+_CASES = {
+    "player_profile": (PlayerProfileParser().parse, _PFR / "BradTo00_QB.htm"),
+    "coach_profile": (CoachProfileParser().parse, _PFR / "coaches" / "BeliBi0.htm"),
+    "season_overview": (SeasonOverviewParser().parse, _PFR / "seasons" / "2024.htm"),
+    "season_stats": (
+        SeasonOverviewParser().parse_stats,
+        _PFR / "seasons" / "2024_passing.htm",
+    ),
+    "team_season": (
+        TeamSeasonParser().parse,
+        _PFR / "teams" / "nwe_2015_team_season.htm",
+    ),
+    "season_week": (
+        SeasonOverviewParser().parse_week,
+        _PFR / "seasons" / "2024_week_1.htm",
+    ),
+}
+
+
+@pytest.mark.benchmark
+class TestPfrParseBenchmark:
+    @pytest.mark.parametrize("name", list(_CASES))
+    def test_parse_once(self, name):
+        parser, path = _CASES[name]
+        html = path.read_text()
+
+        def after():
+            return parser(BaseSDK._preprocess_html(html))
+
+        def before():
+            return parser(str(BaseSDK._preprocess_html(html)))
+
+        assert after() == before()
+        after_time = per_call(after, number=1, repeat=3)
+        before_time = per_call(before, number=1, repeat=3)
+
+        report(f"parse {name}", before_time, after_time, unit="ms")
+        assert after_time < before_time
+
+    @pytest.mark.parametrize("name", list(_CASES))
+    def test_lxml_engine(self, name):
+        pytest.importorskip("lxml")
+        parser, path = _CASES[name]
+        html = path.read_text()
+
+        def parse_with(engine):
+            return lambda: parser(BaseSDK._preprocess_html(html, engine))
+
+        after, before = parse_with("lxml"), parse_with("html.parser")
+        assert after() == before()
+        after_time = per_call(after, number=1, repeat=3)
+        before_time = per_call(before, number=1, repeat=3)
+
+        report(f"parse {name} with lxml", before_time, after_time, unit="ms")
+        assert after_time < before_time
+
+
+class _TreeSearch:
+    """Stand-in for :class:`PageIndex` that searches the tree per lookup."""
+
+    def __init__(self, soup):
+        self._soup = soup
+
+    def find(self, name=None, **kwargs):
+        return self._soup.find(name, **kwargs)
+
+    def find_all(self, name=None, **kwargs):
+        return self._soup.find_all(name, **kwargs)
+
+
+_INDEX_CASES = {
+    "game_details": (
+        game_details,
+        GameDetailsParser().parse,
+        Path(__file__).resolve().parents[2] / "PFR_boxscore_201509100nwe.htm",
+    ),
+    "season_overview": (
+        season_overview,
+        SeasonOverviewParser().parse,
+        _PFR / "seasons" / "2024.htm",
+    ),
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", list(_INDEX_CASES))
+def test_page_index(name, monkeypatch):
+    module, parser, path = _INDEX_CASES[name]
+    soup = BaseSDK._preprocess_html(path.read_text())
+    indexed = module.page_index
+
+    def after():
+        vars(soup).pop("_page_index", None)
+        return parser(soup)
+
+    def before():
+        monkeypatch.setattr(module, "page_index", _TreeSearch)
+        try:
+            return parser(soup)
+        finally:
+            monkeypatch.setattr(module, "page_index", indexed)
+
+    assert after() == before()
+    after_time = per_call(after, number=3, repeat=5)
+    before_time = per_call(before, number=3, repeat=5)
+
+    report(f"parse {name} with page index", before_time, after_time, unit="ms")
+    assert after_time < before_time
+
+
+def _per_cell_rows(table, metadata):
+    """Rows of *table* the way the parsers' loops built them, cell by cell."""
+    rows = []
+    for tr in table.find("tbody").find_all("tr"):
+        if "thead" in (tr.get("class") or []):
+            continue
+        row = {}
+        for cell in tr.find_all(["th", "td"]):
+            stat = cell.get("data-stat")
+            if not stat:
+                continue
+            text = cell.get_text(strip=True)
+            if stat in metadata.int_columns:
+                row[stat] = safe_int(text)
+            elif stat in metadata.float_columns:
+                row[stat] = safe_float(text)
+            elif stat in metadata.pct_columns:
+                row[stat] = safe_pct(text)
+            else:
+                row[stat] = text
+        if row:
+            rows.append(row)
+    return rows
+
+
+_TABLE_CASES = {
+    "draft": (DRAFT, _PFR / "draft" / "2024_draft.htm", "drafts"),
+    "combine": (DRAFT, _PFR / "draft" / "2024_combine.htm", "combine"),
+    "fantasy": (
+        FANTASY_TOP_PLAYERS,
+        _PFR / "fantasy" / "top_players_2025.htm",
+        "fantasy",
+    ),
+    "matchups": (
+        FANTASY_MATCHUPS,
+        _PFR / "fantasy" / "wr_matchups.htm",
+        "fantasy_stats",
+    ),
+    "coach_ranks": (COACH_RANKS, _PFR / "coaches" / "BeliBi0.htm", "coaching_ranks"),
+}
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", list(_TABLE_CASES))
+def test_table_extractor(name):
+    metadata, path, table_id = _TABLE_CASES[name]
+    soup = BaseSDK._preprocess_html(path.read_text())
+    table = soup.find("table", id=table_id)
+    extractor = TableExtractor(metadata, default=str, blank=None)
+
+    def after():
+        return extractor.rows(table)
+
+    def before():
+        return _per_cell_rows(table, metadata)
+
+    assert after() == before()
+    after_time = per_call(after, number=3, repeat=5)
+    before_time = per_call(before, number=3, repeat=5)
+
+    report(f"extract {name} rows", before_time, after_time, unit="ms")
+    assert after_time < before_time
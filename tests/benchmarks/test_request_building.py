@@ -0,0 +1,92 @@
+"""Throughput of request building with per-class path/query param plans.
+
+The "before" timing recomputes the plans on every call, as the encoders
+used to. Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+from typing import Any
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from griddy.core.basesdk import BaseSDK
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.utils import queryparams, url
+from griddy.nfl.models.requests.get_play_by_play_op import GetPlayByPlayRequest
+from griddy.nfl.models.requests.get_player_passing_stats_by_week_op import (
+    GetPlayerPassingStatsByWeekRequest,
+)
+
+from ._timing import per_call, report
+
+_REQUESTS = {
+    "GetPlayerPassingStatsByWeekRequest": (
+        "/api/stats/passing/week",
+        GetPlayerPassingStatsByWeekRequest(
+            season=2025, season_type="REG", week="WEEK_1", team_offense=["a", "b"]
+        ),
+    ),
+    "GetPlayByPlayRequest": (
+        "/football/v2/pbp/{gameId}",
+        GetPlayByPlayRequest(game_id="10160000-0581-9f5d-2a09-8a9e1a0f6d4c"),
+    ),
+}
+
+
+def _uncached(plans: dict, compute: Any) -> Any:
+    def plan(cls: type) -> Any:
+        plans.pop(cls, None)
+        return compute(cls)
+
+    return plan
+
+
+@pytest.mark.benchmark
+class TestRequestBuildingBenchmark:
+    @pytest.mark.parametrize("name", list(_REQUESTS))
+    def test_build_request(self, name, monkeypatch):
+        path, request = _REQUESTS[name]
+        config = SDKConfiguration(
+            client=httpx.Client(),
+            client_supplied=False,
+            async_client=None,
+            async_client_supplied=True,
+            debug_logger=Mock(),
+            server_url="https://api.nfl.com",
+        )
+        sdk = BaseSDK(sdk_config=config)
+
+        def build() -> httpx.Request:
+            return sdk._build_request(
+                method="GET",
+                path=path,
+                base_url=None,
+                url_variables=None,
+                request=request,
+                request_body_required=False,
+                request_has_path_params=True,
+                request_has_query_params=True,
+                user_agent_header="user-agent",
+                accept_header_value="application/json",
+                security=Mock(return_value=None),
+            )
+
+        after_url = str(build().url)
+        after = per_call(build, number=500)
+
+        monkeypatch.setattr(
+            queryparams,
+            "_query_param_plan",
+            _uncached(queryparams._query_param_plans, queryparams._query_param_plan),
+        )
+        monkeypatch.setattr(
+            url,
+            "_path_param_plan",
+            _uncached(url._path_param_plans, url._path_param_plan),
+        )
+        assert str(build().url) == after_url
+        before = per_call(build, number=500)
+
+        report(f"_build_request {name}", before, after)
+        assert after < before
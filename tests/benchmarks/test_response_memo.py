@@ -0,0 +1,90 @@
+"""Repeat polls of a live endpoint with and without a ResponseMemo.
+
+Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+import json
+
+import httpx
+import pytest
+
+from griddy.core.basesdk import BaseSDK, EndpointConfig
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.memo import ResponseMemo
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.utils.logger import NoOpLogger
+from griddy.nfl import models
+from griddy.nfl.models.entities.live_stat_entries import LivePlayerStatEntry
+
+from ._timing import per_call, report
+
+
+def _live_player_statistics(players_per_team: int = 50) -> bytes:
+    def player(i: int) -> dict:
+        stats = {
+            info.alias or name: i
+            for name, info in LivePlayerStatEntry.model_fields.items()
+            if "int" in str(info.annotation)
+        }
+        return {**stats, "gsisPlayerId": f"00-00{i:05d}", "personId": str(i)}
+
+    def team(team_id: str, offset: int) -> dict:
+        return {
+            "teamId": team_id,
+            "players": [player(offset + i) for i in range(players_per_team)],
+        }
+
+    return json.dumps(
+        {
+            "gameId": "7d4016ee-1312-11ef-afd1-646009f18b2e",
+            "awayTeam": team("10402520-e4c8-b4a8-bbf7-3ce3b0fbac1c", 0),
+            "homeTeam": team("10403200-69ab-9ea6-5af5-e240fbc08bea", 100),
+        }
+    ).encode()
+
+
+def _make_sdk(body: bytes, memo) -> BaseSDK:
+    def handler(request):
+        return httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+
+    config = SDKConfiguration(
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        client_supplied=False,
+        async_client=None,
+        async_client_supplied=False,
+        debug_logger=NoOpLogger(),
+        server_url="https://example.com",
+        response_memo=memo,
+    )
+    config._hooks = SDKHooks()
+    return BaseSDK(sdk_config=config)
+
+
+_ENDPOINT = EndpointConfig(
+    method="GET",
+    path="/football/v2/stats/live/player-statistics/game",
+    operation_id="getLivePlayerStatistics",
+    request=None,
+    response_type=models.LivePlayerStatisticsResponse,
+    error_status_codes=["4XX", "5XX"],
+    request_has_query_params=False,
+)
+
+
+@pytest.mark.benchmark
+class TestResponseMemoBenchmark:
+    def test_unchanged_live_player_statistics(self):
+        body = _live_player_statistics()
+        plain = _make_sdk(body, None)
+        memoized = _make_sdk(body, ResponseMemo(operations=["getLive*"]))
+        assert plain._execute_endpoint(_ENDPOINT) == memoized._execute_endpoint(
+            _ENDPOINT
+        )
+
+        before = per_call(lambda: plain._execute_endpoint(_ENDPOINT), number=20)
+        after = per_call(lambda: memoized._execute_endpoint(_ENDPOINT), number=20)
+
+        report("poll getLivePlayerStatistics (unchanged body)", before, after, "ms")
+        assert after < before / 2
@@ -0,0 +1,79 @@
+"""Cost of ``model_dump`` on NFL entity models with a per-class field plan.
+
+The "before" timing recomputes the plan on every call, as the serializer
+used to. Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+import typing
+from typing import Any
+
+import pytest
+
+from griddy.core.types import basemodel
+from griddy.nfl import models
+
+from ._timing import per_call, report
+
+
+def _value(annotation: Any, i: int) -> Any:
+    for arg in (annotation, *typing.get_args(annotation)):
+        if typing.get_origin(arg) is typing.Literal:
+            return typing.get_args(arg)[0]
+        if arg in (bool, int, float, str):
+            return {bool: i % 2 == 0, int: i, float: i / 7, str: f"s{i}"}[arg]
+    return None
+
+
+def _rows(model: type, n: int = 1000) -> list:
+    # Fill every other scalar field so both the keep and the drop paths run.
+    return [
+        model.model_validate(
+            {
+                info.alias or name: _value(info.annotation, i)
+                for j, (name, info) in enumerate(model.model_fields.items())
+                if j % 2 == 0 or info.is_required()
+            }
+        )
+        for i in range(n)
+    ]
+
+
+def _uncached_plan(cls: type) -> tuple:
+    return tuple(
+        (
+            n,
+            f.alias or n,
+            f.is_required(),
+            not f.is_required() and isinstance(f.default, basemodel.Unset),
+        )
+        for n, f in cls.model_fields.items()
+    )
+
+
+@pytest.mark.benchmark
+class TestSerializeModelBenchmark:
+    @pytest.mark.parametrize(
+        "model",
+        [
+            models.LiveTeamStatEntry,
+            models.WeeklyPlayerPassingStats,
+            models.FilmroomPlay,
+        ],
+        ids=lambda model: model.__name__,
+    )
+    def test_model_dump_rows(self, model, monkeypatch):
+        rows = _rows(model)
+        after_dump = [row.model_dump() for row in rows]
+        after = per_call(lambda: [row.model_dump() for row in rows], number=5)
+
+        monkeypatch.setattr(basemodel, "_serialization_plan", _uncached_plan)
+        assert [row.model_dump() for row in rows] == after_dump
+        before = per_call(lambda: [row.model_dump() for row in rows], number=5)
+
+        report(
+            f"model_dump 1000 x {model.__name__} ({len(model.model_fields)} fields)",
+            before,
+            after,
+            unit="ms",
+        )
+        assert after < before
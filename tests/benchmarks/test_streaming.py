@@ -0,0 +1,130 @@
+"""Peak memory of streaming large responses row by row versus buffering them.
+
+Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+import json
+import tracemalloc
+from typing import Callable
+
+import httpx
+import pytest
+
+from griddy.core.basesdk import BaseSDK, EndpointConfig
+from griddy.core.decorators import sdk_endpoints
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.streaming import stream_rows
+from griddy.core.utils.logger import NoOpLogger
+from griddy.nfl import models
+
+from ._timing import per_call, report
+from .test_unmarshal_json_response import _film_room_plays, _play_by_play
+
+_CHUNK = 64 * 1024
+
+
+@sdk_endpoints
+class _Endpoints(BaseSDK):
+    @stream_rows("plays")
+    def _get_filmroom_plays_config(self) -> EndpointConfig:
+        return EndpointConfig(
+            method="GET",
+            path="/filmroom/plays",
+            operation_id="getFilmroomPlays",
+            request=None,
+            response_type=models.FilmroomPlaysResponse,
+            error_status_codes=["4XX", "5XX"],
+            request_has_query_params=False,
+        )
+
+    @stream_rows("drives.plays")
+    def _get_play_by_play_config(self) -> EndpointConfig:
+        return EndpointConfig(
+            method="GET",
+            path="/playbyplay",
+            operation_id="getPlayByPlay",
+            request=None,
+            response_type=models.PlayByPlayResponse,
+            error_status_codes=["4XX", "5XX"],
+            request_has_query_params=False,
+        )
+
+
+class _Chunks(httpx.SyncByteStream):
+    def __init__(self, body: bytes):
+        self.body = body
+
+    def __iter__(self):
+        for i in range(0, len(self.body), _CHUNK):
+            yield self.body[i : i + _CHUNK]
+
+
+def _make_sdk(body: bytes) -> _Endpoints:
+    def handler(request):
+        return httpx.Response(
+            200, headers={"content-type": "application/json"}, stream=_Chunks(body)
+        )
+
+    config = SDKConfiguration(
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        client_supplied=False,
+        async_client=None,
+        async_client_supplied=False,
+        debug_logger=NoOpLogger(),
+        server_url="https://example.com",
+    )
+    config._hooks = SDKHooks()
+    return _Endpoints(sdk_config=config)
+
+
+def _peak_bytes(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _count(rows) -> int:
+    return sum(1 for _ in rows)
+
+
+@pytest.mark.benchmark
+class TestStreamingBenchmark:
+    @pytest.mark.parametrize(
+        "name, payload, buffered",
+        [
+            (
+                "filmroom_plays",
+                _film_room_plays(),
+                lambda response: response.plays,
+            ),
+            (
+                "play_by_play",
+                _play_by_play(drives=200),
+                lambda response: [p for d in response.drives for p in d.plays],
+            ),
+        ],
+    )
+    def test_streamed_rows(self, name, payload, buffered):
+        sdk = _make_sdk(json.dumps(payload).encode())
+        get = getattr(sdk, f"get_{name}")
+        stream = getattr(sdk, f"iter_{name}")
+        assert _count(stream()) == len(buffered(get()))
+
+        before_peak = _peak_bytes(lambda: _count(buffered(get())))
+        after_peak = _peak_bytes(lambda: _count(stream()))
+        print(
+            f"{name} peak traced allocations: buffered "
+            f"{before_peak / 2**20:.1f}MiB, streamed {after_peak / 2**20:.2f}MiB"
+        )
+        report(
+            name,
+            per_call(lambda: _count(buffered(get())), number=5),
+            per_call(lambda: _count(stream()), number=5),
+            unit="ms",
+        )
+
+        assert after_peak * 4 < before_peak
@@ -0,0 +1,54 @@
+"""Per-call overhead of response unmarshalling.
+
+Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+from typing import Any
+
+import pytest
+from pydantic import ConfigDict, create_model
+
+from griddy.core.utils import serializers
+from griddy.nfl import models
+
+from ._timing import per_call, report
+
+_WEEKS = {
+    "season": "2025",
+    "weeks": [
+        {
+            "season": 2025,
+            "seasonType": "REG",
+            "week": week,
+            "byeTeams": [],
+            "dateBegin": "2025-09-03",
+            "dateEnd": "2025-09-10",
+            "weekType": "REG",
+            "text": f"Week {week}",
+        }
+        for week in range(1, 19)
+    ],
+}
+
+
+def _legacy_unmarshal(val: Any, typ: Any) -> Any:
+    # The previous implementation: a throwaway model per call.
+    unmarshaller = create_model(
+        "Unmarshaller",
+        body=(typ, ...),
+        __config__=ConfigDict(populate_by_name=True, arbitrary_types_allowed=True),
+    )
+    return unmarshaller(body=val).body
+
+
+@pytest.mark.benchmark
+class TestUnmarshalBenchmark:
+    def test_cached_type_adapter(self):
+        typ = models.SeasonWeeksResponse
+        assert _legacy_unmarshal(_WEEKS, typ) == serializers.unmarshal(_WEEKS, typ)
+
+        before = per_call(lambda: _legacy_unmarshal(_WEEKS, typ))
+        after = per_call(lambda: serializers.unmarshal(_WEEKS, typ))
+
+        report("unmarshal SeasonWeeksResponse", before, after)
+        assert after < before / 2
@@ -0,0 +1,130 @@
+"""Time and allocations of decoding large JSON responses.
+
+Payloads are synthesised at the size of a full game of Film Room plays and a
+play-by-play feed. Run with ``pytest tests/benchmarks -m benchmark -n 0 -s``.
+"""
+
+import json
+import tracemalloc
+from typing import Any, Callable
+
+import httpx
+import pytest
+from pydantic_core import from_json
+
+from griddy.core.utils.serializers import unmarshal
+from griddy.core.utils.unmarshal_json_response import unmarshal_json_response
+from griddy.nfl import models
+
+from ._timing import per_call, report
+
+
+def _film_room_plays(n: int = 5000) -> dict:
+    return {
+        "count": n,
+        "plays": [
+            {
+                "defenseTeamId": "10403800-517c-7b8c-65a3-c61b95d86123",
+                "down": i % 4 + 1,
+                "fapiGameId": "7d4016ee-1312-11ef-afd1-646009f18b2e",
+                "gameClock": "12:34",
+                "gameId": 2025090700,
+                "homeTeamAbbr": "NE",
+                "homeTeamId": "10403200-69ab-9ea6-5af5-e240fbc08bea",
+                "playDescription": (
+                    f"(12:34) D.Maye pass short right to H.Henry to NE {i % 50} "
+                    "for 7 yards (J.Doe)."
+                ),
+                "playId": i,
+                "playType": "play_type_pass",
+                "possessionTeamId": "10403200-69ab-9ea6-5af5-e240fbc08bea",
+                "quarter": i % 4 + 1,
+                "season": 2025,
+                "seasonType": "REG",
+                "sequence": i,
+                "visitorTeamAbbr": "LV",
+                "visitorTeamId": "10402520-e4c8-b4a8-bbf7-3ce3b0fbac1c",
+                "week": 1,
+                "weekSlug": "WEEK_1",
+                "yardline": "NE 35",
+                "yardsToGo": 10,
+            }
+            for i in range(n)
+        ],
+    }
+
+
+def _play_by_play(drives: int = 30, plays_per_drive: int = 12) -> dict:
+    return {
+        "drives": [
+            {
+                "plays": [
+                    {
+                        "playId": drive * 100 + i,
+                        "description": (
+                            "(9:12) (Shotgun) J.Allen pass deep left to K.Shakir "
+                            "to BUF 48 for 21 yards (M.Humphrey)."
+                        ),
+                        "down": i % 4 + 1,
+                        "distance": 10,
+                        "quarter": drive // 8 + 1,
+                        "gameClock": "9:12",
+                        "yardsGained": 21,
+                    }
+                    for i in range(plays_per_drive)
+                ],
+            }
+            for drive in range(drives)
+        ],
+    }
+
+
+def _legacy_decode(typ: Any, http_res: httpx.Response) -> Any:
+    # The previous implementation: bytes -> str -> dict -> model.
+    return unmarshal(from_json(http_res.text), typ)
+
+
+def _peak_bytes(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _fresh(payload: dict) -> Callable[[], httpx.Response]:
+    # httpx caches the decoded text on the response, so each run gets a new one.
+    body = json.dumps(payload).encode()
+    return lambda: httpx.Response(
+        200, content=body, headers={"content-type": "application/json"}
+    )
+
+
+@pytest.mark.benchmark
+class TestUnmarshalJsonResponseBenchmark:
+    @pytest.mark.parametrize(
+        "typ, payload",
+        [
+            (models.FilmroomPlaysResponse, _film_room_plays()),
+            (models.PlayByPlayResponse, _play_by_play()),
+        ],
+        ids=["film_room_plays", "play_by_play"],
+    )
+    def test_validate_json_from_bytes(self, typ, payload):
+        new = _fresh(payload)
+        assert _legacy_decode(typ, new()) == unmarshal_json_response(typ, new())
+
+        before = per_call(lambda: _legacy_decode(typ, new()), number=5)
+        after = per_call(lambda: unmarshal_json_response(typ, new()), number=5)
+        report(f"decode {typ.__name__}", before, after, unit="ms")
+
+        before_peak = _peak_bytes(lambda: _legacy_decode(typ, new()))
+        after_peak = _peak_bytes(lambda: unmarshal_json_response(typ, new()))
+        print(
+            f"peak traced allocations {typ.__name__}: before "
+            f"{before_peak / 1024:.0f}KiB, after {after_peak / 1024:.0f}KiB"
+        )
+
+        assert after < before
+        assert after_peak < before_peak
@@ -1,5 +1,6 @@
 """Tests for griddy.core.basesdk module."""
 
+import json
 from unittest.mock import AsyncMock, Mock, patch
 
 import httpx
@@ -11,6 +12,7 @@ from griddy.core.errors.defaultsdkerror import DefaultSDKError
 from griddy.core.errors.no_response_error import NoResponseError
 from griddy.core.hooks.sdkhooks import SDKHooks
 from griddy.core.hooks.types import HookContext
+from griddy.core.jsoncodec import JsonCodec
 from griddy.core.sdkconfiguration import SDKConfiguration
 from griddy.core.types import UNSET
 from griddy.core.utils import RetryConfig
@@ -66,6 +68,7 @@ def _make_httpx_response(status_code=200, json_data=None, text=""):
     resp.text = text or (str(json_data) if json_data else "")
     if json_data is not None:
         resp.json.return_value = json_data
+        resp.content = json.dumps(json_data).encode()
     return resp
 
 
@@ -1729,7 +1732,36 @@ class TestExecuteEndpoint:
             result = sdk._execute_endpoint(endpoint_config)
 
         assert result == {"raw": True}
-        mock_response.json.assert_called_once()
+
+    def test_return_raw_json_uses_configured_codec(self, mock_logger):
+        sdk, config, _ = _make_sdk_with_hooks(mock_logger)
+        config.json_codec = Mock(spec=JsonCodec)
+        config.json_codec.loads.return_value = {"decoded": True}
+        mock_response = _make_httpx_response(200, json_data={"raw": True})
+
+        endpoint_config = EndpointConfig(
+            method="GET",
+            path="/test",
+            operation_id="testOp",
+            request=None,
+            response_type=dict,
+            error_status_codes=["4XX", "5XX"],
+            return_raw_json=True,
+        )
+
+        with (
+            patch.object(
+                sdk,
+                "_build_request",
+                return_value=Mock(spec=httpx.Request),
+            ),
+            patch.object(sdk, "do_request", return_value=mock_response),
+            patch("griddy.core.basesdk.utils.match_response", return_value=True),
+        ):
+            result = sdk._execute_endpoint(endpoint_config)
+
+        assert result == {"decoded": True}
+        config.json_codec.loads.assert_called_once_with(mock_response.content)
 
     def test_return_raw_json_falls_through_on_non_200(self, mock_logger):
         sdk, config, _ = _make_sdk_with_hooks(mock_logger)
@@ -1837,7 +1869,6 @@ class TestExecuteEndpointAsync:
             result = await sdk._execute_endpoint_async(endpoint_config)
 
         assert result == {"raw": True}
-        mock_response.json.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_return_raw_json_falls_through_on_non_200(self, mock_logger):
@@ -0,0 +1,212 @@
+"""Tests for griddy.core.batch and BaseGriddySDK.gather()."""
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from typing_extensions import Annotated
+
+from griddy.core._lazy_load import LazySubSDKMixin
+from griddy.core.base_griddy_sdk import BaseGriddySDK
+from griddy.core.basesdk import BaseSDK as CoreBaseSDK
+from griddy.core.basesdk import EndpointConfig
+from griddy.core.batch import BatchCall, call, gather_async
+from griddy.core.decorators import sdk_endpoints
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.types import BaseModel
+from griddy.core.utils import FieldMetadata, QueryParamMetadata
+
+
+class _Request(BaseModel):
+    game_id: Annotated[
+        int, FieldMetadata(query=QueryParamMetadata(style="form", explode=True))
+    ]
+
+
+class _Payload(BaseModel):
+    game_id: int
+
+
+@sdk_endpoints
+class _Games(CoreBaseSDK):
+    def _get_box_score_config(self, *, game_id: int) -> EndpointConfig:
+        return EndpointConfig(
+            method="GET",
+            path="/games",
+            operation_id="getBoxScore",
+            request=_Request(game_id=game_id),
+            response_type=_Payload,
+            error_status_codes=["4XX", "5XX"],
+        )
+
+
+class _BatchTestSDK(LazySubSDKMixin, BaseGriddySDK, CoreBaseSDK):
+    _sub_sdk_map = {"games": ("tests.test_core.test_batch", "_Games")}
+
+    def _get_debug_logger_env_var(self) -> str:
+        return "TEST_DEBUG"
+
+    def _create_security(self, auth: Any) -> Any:
+        return None
+
+    def _create_sdk_configuration(self, **kwargs: Any) -> Any:
+        return SDKConfiguration(**kwargs)
+
+    def _create_hooks(self) -> Any:
+        return SDKHooks()
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._init_sdk(auth=None, **kwargs)
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    game_id = int(request.url.params["game_id"])
+    if game_id < 0:
+        return httpx.Response(404, json={"error": "missing"})
+    return httpx.Response(200, json={"game_id": game_id})
+
+
+@pytest.fixture
+def sdk():
+    transport = httpx.MockTransport(_handler)
+    sdk = _BatchTestSDK(
+        server_url="https://example.com",
+        client=httpx.Client(transport=transport),
+        async_client=httpx.AsyncClient(transport=transport),
+    )
+    yield sdk
+    sdk.close()
+
+
+class _Tracker:
+    """Records how many coroutines run at the same time."""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def run(self, value, delay=0.01):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self.active -= 1
+        if isinstance(value, Exception):
+            raise value
+        return value
+
+
+@pytest.mark.unit
+class TestCall:
+    def test_async_function_used_as_is(self):
+        async def fetch(x):
+            return x
+
+        item = call(fetch, 1)
+        assert item == BatchCall(fetch, (1,), {})
+
+    def test_sync_endpoint_resolved_to_async_twin(self, sdk):
+        item = call(sdk.games.get_box_score, game_id=1)
+        assert item.func == sdk.games.get_box_score_async
+        assert item.kwargs == {"game_id": 1}
+
+    def test_sync_function_without_twin_rejected(self):
+        with pytest.raises(TypeError, match="_async"):
+            call(len, [1])
+
+
+@pytest.mark.unit
+class TestGatherAsync:
+    @pytest.mark.asyncio
+    async def test_preserves_order(self):
+        tracker = _Tracker()
+        calls = [call(tracker.run, i, delay=0.001 * (5 - i)) for i in range(5)]
+        assert await gather_async(calls) == [0, 1, 2, 3, 4]
+
+    @pytest.mark.asyncio
+    async def test_bounded_concurrency(self):
+        tracker = _Tracker()
+        results = await gather_async(
+            [call(tracker.run, i) for i in range(20)], concurrency=3
+        )
+        assert results == list(range(20))
+        assert tracker.peak == 3
+
+    @pytest.mark.asyncio
+    async def test_exceptions_returned_in_place(self):
+        tracker = _Tracker()
+        boom = ValueError("boom")
+        results = await gather_async([call(tracker.run, 1), call(tracker.run, boom)])
+        assert results == [1, boom]
+
+    @pytest.mark.asyncio
+    async def test_exceptions_raised_when_requested(self):
+        tracker = _Tracker()
+        calls = [call(tracker.run, ValueError("boom"))] + [
+            call(tracker.run, i, delay=1) for i in range(3)
+        ]
+        with pytest.raises(ValueError, match="boom"):
+            await gather_async(calls, concurrency=2, return_exceptions=False)
+        assert tracker.active == 0
+
+    @pytest.mark.asyncio
+    async def test_accepts_coroutines_and_callables(self):
+        tracker = _Tracker()
+        results = await gather_async([tracker.run(1), lambda: tracker.run(2)])
+        assert results == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_empty(self):
+        assert await gather_async([]) == []
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_concurrency(self):
+        with pytest.raises(ValueError):
+            await gather_async([], concurrency=0)
+
+    @pytest.mark.asyncio
+    async def test_invalid_item_reported_per_item(self):
+        results = await gather_async([object()])
+        assert isinstance(results[0], TypeError)
+
+
+@pytest.mark.unit
+class TestSdkGather:
+    @pytest.mark.asyncio
+    async def test_gather_async_runs_endpoints(self, sdk):
+        results = await sdk.gather_async(
+            [call(sdk.games.get_box_score, game_id=g) for g in (3, -1, 7)]
+        )
+        assert results[0].game_id == 3
+        assert isinstance(results[1], Exception)
+        assert results[2].game_id == 7
+
+    def test_sync_facade(self, sdk):
+        results = sdk.gather(
+            [call(sdk.games.get_box_score, game_id=g) for g in range(12)],
+            concurrency=4,
+        )
+        assert [r.game_id for r in results] == list(range(12))
+
+    def test_sync_facade_reuses_loop(self, sdk):
+        sdk.gather([call(sdk.games.get_box_score, game_id=1)])
+        loop = sdk._batch_loop
+        sdk.gather([call(sdk.games.get_box_score, game_id=2)])
+        assert sdk._batch_loop is loop
+
+    def test_close_closes_batch_loop(self):
+        sdk = _BatchTestSDK(
+            server_url="https://example.com",
+            async_client=httpx.AsyncClient(transport=httpx.MockTransport(_handler)),
+        )
+        sdk.gather([call(sdk.games.get_box_score, game_id=1)])
+        sdk.close()
+        assert sdk._batch_loop.is_closed()
+
+    @pytest.mark.asyncio
+    async def test_sync_facade_rejected_inside_running_loop(self, sdk):
+        with pytest.raises(RuntimeError, match="gather_async"):
+            sdk.gather([])
@@ -0,0 +1,483 @@
+"""Tests for griddy.core.cache module and its BaseSDK integration."""
+
+import json
+import re
+from pathlib import Path
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from griddy.core import jsoncodec
+from griddy.core.basesdk import BaseSDK, EndpointConfig
+from griddy.core.cache import CacheStats, ResponseCache
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.jsoncodec import JsonCodec
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.types import BaseModel
+from griddy.core.utils.logger import Logger
+
+
+class _FakeClock:
+    def __init__(self, now: float = 1_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Request(BaseModel):
+    season: int
+    week: int
+
+
+class _Payload(BaseModel):
+    value: int
+
+
+@pytest.fixture
+def clock():
+    return _FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ResponseCache(max_entries=3, default_ttl=60, clock=clock)
+
+
+@pytest.mark.unit
+class TestCacheStats:
+    def test_hit_rate_zero_when_unused(self):
+        assert CacheStats().hit_rate == 0.0
+
+    def test_hit_rate(self):
+        stats = CacheStats(hits=3, misses=1)
+        assert stats.lookups == 4
+        assert stats.hit_rate == 0.75
+
+
+@pytest.mark.unit
+class TestMakeKey:
+    def test_equal_requests_share_key(self):
+        a = ResponseCache.make_key("op", _Request(season=2015, week=1))
+        b = ResponseCache.make_key("op", _Request(week=1, season=2015))
+        assert a == b
+
+    def test_different_requests_differ(self):
+        a = ResponseCache.make_key("op", _Request(season=2015, week=1))
+        b = ResponseCache.make_key("op", _Request(season=2015, week=2))
+        assert a != b
+
+    def test_operation_and_base_url_are_part_of_key(self):
+        req = _Request(season=2015, week=1)
+        assert ResponseCache.make_key("a", req) != ResponseCache.make_key("b", req)
+        assert ResponseCache.make_key("a", req, "https://x") != ResponseCache.make_key(
+            "a", req, "https://y"
+        )
+
+    def test_none_request(self):
+        assert ResponseCache.make_key("op", None).endswith("|op|null")
+
+    def test_key_does_not_depend_on_json_codec(self, monkeypatch):
+        class _Spaced(JsonCodec):
+            def dumps(self, obj, *, sort_keys=False, default=None):
+                return json.dumps(obj, sort_keys=sort_keys, default=default)
+
+        req = _Request(season=2015, week=1)
+        before = ResponseCache.make_key("op", req)
+        monkeypatch.setattr(jsoncodec, "_default_codec", _Spaced())
+        assert ResponseCache.make_key("op", req) == before
+        assert before.endswith('|op|{"season":2015,"week":1}')
+
+
+@pytest.mark.unit
+class TestTtlPolicies:
+    def test_default_ttl(self, cache):
+        assert cache.ttl_for("unknownOp") == 60
+
+    def test_builtin_live_policy(self, cache):
+        assert cache.ttl_for("getLiveGameScores") == 5
+
+    def test_every_live_operation_gets_live_ttl(self, cache):
+        source = Path(__file__).resolve().parents[2] / "src" / "griddy" / "nfl"
+        live_ops = {
+            op
+            for path in source.rglob("*.py")
+            for op in re.findall(r'operation_id="(\w*Live\w*)"', path.read_text())
+        }
+        assert {"getLiveGameStats", "getNgsLiveScores"} <= live_ops
+        for op in live_ops:
+            assert cache.ttl_for(op) == 5, op
+
+    def test_builtin_historical_pattern_never_expires(self, cache):
+        assert cache.ttl_for("getHistoricalTeamStats") is None
+
+    def test_user_policy_overrides_builtin(self):
+        cache = ResponseCache(ttl_policies={"getLiveGameScores": 0})
+        assert cache.ttl_for("getLiveGameScores") == 0
+        assert not cache.is_cacheable("getLiveGameScores")
+
+    def test_exact_match_beats_pattern(self):
+        cache = ResponseCache(
+            ttl_policies={"getFoo*": 10, "getFooBar": 99}, default_ttl=1
+        )
+        assert cache.ttl_for("getFooBar") == 99
+        assert cache.ttl_for("getFooBaz") == 10
+
+
+@pytest.mark.unit
+class TestMemoryTier:
+    def test_miss_then_hit(self, cache):
+        assert cache.get("k") == (False, None)
+        cache.set("k", "op", "value")
+        assert cache.get("k") == (True, "value")
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.memory_hits) == (1, 1, 1)
+
+    def test_expiry(self, cache, clock):
+        cache.set("k", "op", "value")
+        clock.now += 61
+        assert cache.get("k") == (False, None)
+        assert cache.stats().expirations == 1
+
+    def test_never_expires(self, cache, clock):
+        cache.set("k", "getHistoricalTeamStats", "value")
+        clock.now += 10**9
+        assert cache.get("k") == (True, "value")
+
+    def test_zero_ttl_not_stored(self, clock):
+        cache = ResponseCache(default_ttl=0, clock=clock)
+        cache.set("k", "op", "value")
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, cache):
+        for key in ("a", "b", "c"):
+            cache.set(key, "op", key)
+        cache.get("a")  # refresh "a"; "b" is now least recently used
+        cache.set("d", "op", "d")
+        assert cache.get("b") == (False, None)
+        assert cache.get("a") == (True, "a")
+        assert cache.stats().evictions == 1
+
+    def test_invalidate_and_clear(self, cache):
+        cache.set("a", "op", 1)
+        cache.set("b", "op", 2)
+        cache.invalidate("a")
+        assert cache.get("a") == (False, None)
+        cache.clear()
+        assert len(cache) == 0
+
+    def test_reset_stats(self, cache):
+        cache.get("k")
+        cache.reset_stats()
+        assert cache.stats() == CacheStats()
+
+    def test_stats_is_snapshot(self, cache):
+        snapshot = cache.stats()
+        cache.get("k")
+        assert snapshot.misses == 0
+
+    def test_rejects_non_positive_capacity(self):
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
+
+
+@pytest.mark.unit
+class TestDiskTier:
+    def test_disk_hit_survives_new_instance(self, tmp_path, clock):
+        first = ResponseCache(disk_path=tmp_path, clock=clock)
+        first.set("k", "op", {"value": 1}, body=b'{"value": 1}')
+
+        second = ResponseCache(disk_path=tmp_path, clock=clock)
+        hit, value = second.get("k", decode=lambda body: ("decoded", body))
+        assert hit
+        assert value == ("decoded", b'{"value": 1}')
+        assert second.stats().disk_hits == 1
+        # Promoted to memory: the next lookup does not touch disk.
+        assert second.get("k") == (True, value)
+        assert second.stats().memory_hits == 1
+
+    def test_disk_entry_expires(self, tmp_path, clock):
+        ResponseCache(disk_path=tmp_path, default_ttl=10, clock=clock).set(
+            "k", "op", 1, body=b"1"
+        )
+        clock.now += 11
+        fresh = ResponseCache(disk_path=tmp_path, clock=clock)
+        assert fresh.get("k", decode=lambda b: b) == (False, None)
+        assert not list(tmp_path.glob("*.json"))
+
+    def test_disk_skipped_without_decoder(self, tmp_path, clock):
+        ResponseCache(disk_path=tmp_path, clock=clock).set("k", "op", 1, body=b"1")
+        assert ResponseCache(disk_path=tmp_path, clock=clock).get("k") == (
+            False,
+            None,
+        )
+
+    def test_corrupt_file_is_a_miss(self, tmp_path, clock):
+        cache = ResponseCache(disk_path=tmp_path, clock=clock)
+        cache._disk_file("k").write_text("not json")
+        assert cache.get("k", decode=lambda b: b) == (False, None)
+
+    def test_non_utf8_body_stays_in_memory(self, tmp_path, clock):
+        cache = ResponseCache(disk_path=tmp_path, clock=clock)
+        cache.set("k", "op", 1, body=b"\xff\xfe")
+        assert cache.get("k") == (True, 1)
+        assert not list(tmp_path.iterdir())
+
+    def test_failed_write_leaves_no_temp_file(self, tmp_path, clock, monkeypatch):
+        cache = ResponseCache(disk_path=tmp_path, clock=clock)
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("griddy.core.cache.os.replace", fail)
+        cache.set("k", "op", 1, body=b"1")
+        assert not list(tmp_path.iterdir())
+
+    def test_clear_removes_files(self, tmp_path, clock):
+        cache = ResponseCache(disk_path=tmp_path, clock=clock)
+        cache.set("k", "op", 1, body=b"1")
+        cache.clear()
+        assert not list(tmp_path.glob("*.json"))
+
+
+# ---------------------------------------------------------------------------
+# BaseSDK integration
+# ---------------------------------------------------------------------------
+
+
+def _make_sdk(handler, response_cache):
+    transport = httpx.MockTransport(handler)
+    config = SDKConfiguration(
+        client=httpx.Client(transport=transport),
+        client_supplied=False,
+        async_client=httpx.AsyncClient(transport=transport),
+        async_client_supplied=False,
+        debug_logger=Mock(spec=Logger),
+        server_url="https://example.com",
+        response_cache=response_cache,
+    )
+    config._hooks = SDKHooks()
+    return BaseSDK(sdk_config=config)
+
+
+def _endpoint(method="GET", operation_id="getThing", week=1):
+    return EndpointConfig(
+        method=method,
+        path="/things",
+        operation_id=operation_id,
+        request=_Request(season=2015, week=week),
+        response_type=_Payload,
+        error_status_codes=["4XX", "5XX"],
+    )
+
+
+@pytest.fixture
+def counting_handler():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"value": len(calls)})
+
+    handler.calls = calls
+    return handler
+
+
+@pytest.mark.unit
+class TestExecuteEndpointCaching:
+    def test_no_cache_configured_always_fetches(self, counting_handler):
+        sdk = _make_sdk(counting_handler, None)
+        sdk._execute_endpoint(_endpoint())
+        sdk._execute_endpoint(_endpoint())
+        assert len(counting_handler.calls) == 2
+
+    def test_second_call_served_from_cache(self, counting_handler):
+        cache = ResponseCache()
+        sdk = _make_sdk(counting_handler, cache)
+        first = sdk._execute_endpoint(_endpoint())
+        second = sdk._execute_endpoint(_endpoint())
+        assert first is second
+        assert len(counting_handler.calls) == 1
+        assert cache.stats().hits == 1
+
+    def test_different_requests_not_shared(self, counting_handler):
+        sdk = _make_sdk(counting_handler, ResponseCache())
+        sdk._execute_endpoint(_endpoint(week=1))
+        sdk._execute_endpoint(_endpoint(week=2))
+        assert len(counting_handler.calls) == 2
+
+    def test_non_get_not_cached(self, counting_handler):
+        sdk = _make_sdk(counting_handler, ResponseCache())
+        sdk._execute_endpoint(_endpoint(method="POST"))
+        sdk._execute_endpoint(_endpoint(method="POST"))
+        assert len(counting_handler.calls) == 2
+
+    def test_zero_ttl_operation_not_cached(self, counting_handler):
+        sdk = _make_sdk(counting_handler, ResponseCache(ttl_policies={"getThing": 0}))
+        sdk._execute_endpoint(_endpoint())
+        sdk._execute_endpoint(_endpoint())
+        assert len(counting_handler.calls) == 2
+
+    def test_disk_tier_decodes_into_response_type(self, counting_handler, tmp_path):
+        sdk = _make_sdk(counting_handler, ResponseCache(disk_path=tmp_path))
+        sdk._execute_endpoint(_endpoint())
+
+        other = _make_sdk(counting_handler, ResponseCache(disk_path=tmp_path))
+        result = other._execute_endpoint(_endpoint())
+        assert isinstance(result, _Payload)
+        assert result.value == 1
+        assert len(counting_handler.calls) == 1
+
+    def test_errors_are_not_cached(self):
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(500, json={"error": "boom"})
+
+        cache = ResponseCache()
+        sdk = _make_sdk(handler, cache)
+        for _ in range(2):
+            with pytest.raises(Exception):
+                sdk._execute_endpoint(_endpoint())
+        assert len(calls) == 2
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_shares_cache_with_sync(self, counting_handler):
+        sdk = _make_sdk(counting_handler, ResponseCache())
+        first = await sdk._execute_endpoint_async(_endpoint())
+        second = sdk._execute_endpoint(_endpoint())
+        third = await sdk._execute_endpoint_async(_endpoint())
+        assert first is second is third
+        assert len(counting_handler.calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# Conditional revalidation
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestRevalidation:
+    def test_validators_are_stored(self, cache):
+        cache.set("k", "op", 1, headers={"ETag": '"abc"', "Last-Modified": "Mon"})
+        assert cache.conditional_headers("k") == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Mon",
+        }
+
+    def test_no_validators_no_headers(self, cache):
+        cache.set("k", "op", 1)
+        assert cache.conditional_headers("k") == {}
+
+    def test_stale_entry_kept_for_revalidation(self, cache, clock):
+        cache.set("k", "op", "value", headers={"ETag": '"abc"'})
+        clock.now += 61
+        assert cache.get("k") == (False, None)
+        assert cache.conditional_headers("k") == {"If-None-Match": '"abc"'}
+
+        assert cache.revalidated("k", "op", headers={"ETag": '"def"'}) == (
+            True,
+            "value",
+        )
+        assert cache.get("k") == (True, "value")
+        assert cache.conditional_headers("k") == {"If-None-Match": '"def"'}
+        assert cache.stats().revalidations == 1
+
+    def test_revalidated_unknown_key(self, cache):
+        assert cache.revalidated("missing", "op") == (False, None)
+
+    def test_disabled(self, clock):
+        cache = ResponseCache(revalidate=False, clock=clock)
+        cache.set("k", "op", 1, headers={"ETag": '"abc"'})
+        assert cache.conditional_headers("k") == {}
+
+    def test_stale_disk_entry_revalidated(self, tmp_path, clock):
+        ResponseCache(disk_path=tmp_path, default_ttl=10, clock=clock).set(
+            "k", "op", 1, body=b"1", headers={"ETag": '"abc"'}
+        )
+        clock.now += 11
+        fresh = ResponseCache(disk_path=tmp_path, default_ttl=10, clock=clock)
+        assert fresh.get("k", decode=lambda b: b) == (False, None)
+        assert fresh.conditional_headers("k") == {"If-None-Match": '"abc"'}
+        assert fresh.revalidated("k", "op", decode=lambda b: b) == (True, b"1")
+        # The envelope's expiry was refreshed on disk.
+        again = ResponseCache(disk_path=tmp_path, default_ttl=10, clock=clock)
+        assert again.get("k", decode=lambda b: b) == (True, b"1")
+
+
+@pytest.fixture
+def etag_handler():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"value": len(calls)}, headers={"ETag": '"v1"'})
+
+    handler.calls = calls
+    return handler
+
+
+@pytest.mark.unit
+class TestExecuteEndpointRevalidation:
+    def test_not_modified_returns_cached_model(self, etag_handler, clock):
+        cache = ResponseCache(default_ttl=10, clock=clock)
+        sdk = _make_sdk(etag_handler, cache)
+        first = sdk._execute_endpoint(_endpoint())
+        clock.now += 11
+
+        second = sdk._execute_endpoint(_endpoint())
+        assert second is first
+        assert len(etag_handler.calls) == 2
+        assert etag_handler.calls[1].headers["If-None-Match"] == '"v1"'
+        assert cache.stats().revalidations == 1
+
+        # Freshness was extended, so the next call never leaves the process.
+        sdk._execute_endpoint(_endpoint())
+        assert len(etag_handler.calls) == 2
+
+    def test_evicted_entry_refetched_unconditionally(self, etag_handler, clock):
+        cache = ResponseCache(default_ttl=10, clock=clock)
+        sdk = _make_sdk(etag_handler, cache)
+        sdk._execute_endpoint(_endpoint())
+        clock.now += 11
+
+        def evict_then_forward(request):
+            cache.clear()
+            return etag_handler(request)
+
+        sdk.sdk_configuration.client = httpx.Client(
+            transport=httpx.MockTransport(evict_then_forward)
+        )
+        result = sdk._execute_endpoint(_endpoint())
+        assert result.value == 3
+        assert "If-None-Match" not in etag_handler.calls[2].headers
+
+    def test_disk_tier_revalidation_decodes_body(self, etag_handler, clock, tmp_path):
+        sdk = _make_sdk(
+            etag_handler, ResponseCache(default_ttl=10, disk_path=tmp_path, clock=clock)
+        )
+        sdk._execute_endpoint(_endpoint())
+        clock.now += 11
+
+        other = _make_sdk(
+            etag_handler, ResponseCache(default_ttl=10, disk_path=tmp_path, clock=clock)
+        )
+        result = other._execute_endpoint(_endpoint())
+        assert isinstance(result, _Payload)
+        assert result.value == 1
+        assert len(etag_handler.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_not_modified(self, etag_handler, clock):
+        cache = ResponseCache(default_ttl=10, clock=clock)
+        sdk = _make_sdk(etag_handler, cache)
+        first = await sdk._execute_endpoint_async(_endpoint())
+        clock.now += 11
+        second = await sdk._execute_endpoint_async(_endpoint())
+        assert second is first
+        assert cache.stats().revalidations == 1
@@ -0,0 +1,250 @@
+"""Tests for griddy.core.coalesce and its BaseSDK integration."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import httpx
+import pytest
+from typing_extensions import Annotated
+
+from griddy.core.basesdk import BaseSDK, EndpointConfig
+from griddy.core.coalesce import RequestCoalescer
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.types import BaseModel
+from griddy.core.utils import FieldMetadata, QueryParamMetadata
+from griddy.core.utils.logger import NoOpLogger
+
+_QUERY = FieldMetadata(query=QueryParamMetadata(style="form", explode=True))
+
+
+class _Request(BaseModel):
+    season: Annotated[Optional[int], _QUERY] = None
+
+
+class _Week(BaseModel):
+    week: int
+
+
+class _Schedule(BaseModel):
+    weeks: List[_Week]
+
+
+class _Upstream:
+    """Fake API that counts requests and answers after a short delay."""
+
+    def __init__(self, delay: float = 0.05, status: int = 200):
+        self.delay = delay
+        self.status = status
+        self.requests: List[httpx.Request] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self.requests.append(request)
+        time.sleep(self.delay)
+        return self._response()
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        await asyncio.sleep(self.delay)
+        return self._response()
+
+    def _response(self) -> httpx.Response:
+        return httpx.Response(self.status, json={"weeks": [{"week": 1}]})
+
+
+def _make_sdk(upstream: _Upstream, coalescer: Optional[RequestCoalescer]) -> BaseSDK:
+    config = SDKConfiguration(
+        client=httpx.Client(transport=httpx.MockTransport(upstream)),
+        client_supplied=False,
+        async_client=httpx.AsyncClient(
+            transport=httpx.MockTransport(upstream.handle_async)
+        ),
+        async_client_supplied=False,
+        debug_logger=NoOpLogger(),
+        server_url="https://example.com",
+        request_coalescer=coalescer,
+    )
+    config._hooks = SDKHooks()
+    return BaseSDK(sdk_config=config)
+
+
+def _endpoint(season: int = 2025, method: str = "GET") -> EndpointConfig:
+    return EndpointConfig(
+        method=method,
+        path="/schedules/current",
+        operation_id="getCurrentSchedule",
+        request=_Request(season=season),
+        response_type=_Schedule,
+        error_status_codes=["4XX", "5XX"],
+    )
+
+
+def _in_threads(n: int, fn) -> list:
+    barrier = threading.Barrier(n)
+
+    def run(_):
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        return list(pool.map(run, range(n)))
+
+
+@pytest.mark.unit
+class TestMakeKey:
+    def test_same_request_same_key(self):
+        assert RequestCoalescer.make_key(
+            "op", _Request(season=1), "https://a"
+        ) == RequestCoalescer.make_key("op", _Request(season=1), "https://a")
+
+    def test_params_operation_and_url_distinguish(self):
+        base = RequestCoalescer.make_key("op", _Request(season=1), "https://a")
+        assert base != RequestCoalescer.make_key("op", _Request(season=2), "https://a")
+        assert base != RequestCoalescer.make_key("op2", _Request(season=1), "https://a")
+        assert base != RequestCoalescer.make_key("op", _Request(season=1), "https://b")
+
+    def test_headers_distinguish(self):
+        assert RequestCoalescer.make_key(
+            "op", None, http_headers={"X-A": "1"}
+        ) != RequestCoalescer.make_key("op", None, http_headers={"X-A": "2"})
+
+
+@pytest.mark.unit
+class TestRequestCoalescer:
+    def test_sync_followers_share_leader_result(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = _in_threads(8, lambda: coalescer.run("k", fetch))
+
+        assert len(calls) == 1
+        assert len({id(r) for r in results}) == 1
+        assert coalescer.stats().leaders == 1
+        assert coalescer.stats().coalesced == 7
+
+    def test_sync_exception_shared(self):
+        coalescer = RequestCoalescer()
+
+        def fetch():
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        def call():
+            try:
+                coalescer.run("k", fetch)
+            except ValueError as e:
+                return e
+
+        errors = _in_threads(4, call)
+        assert all(isinstance(e, ValueError) for e in errors)
+        assert coalescer.stats().leaders == 1
+
+    def test_sequential_calls_not_shared(self):
+        coalescer = RequestCoalescer()
+        assert coalescer.run("k", lambda: 1) == 1
+        assert coalescer.run("k", lambda: 2) == 2
+
+    @pytest.mark.asyncio
+    async def test_async_cancelled_follower_does_not_cancel_leader(self):
+        coalescer = RequestCoalescer()
+        started = asyncio.Event()
+
+        async def fetch():
+            started.set()
+            await asyncio.sleep(0.05)
+            return "done"
+
+        leader = asyncio.ensure_future(coalescer.run_async("k", fetch))
+        await started.wait()
+        follower = asyncio.ensure_future(coalescer.run_async("k", fetch))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == "done"
+
+
+# ---------------------------------------------------------------------------
+# BaseSDK integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestExecuteEndpointCoalescing:
+    def test_sync_identical_calls_share_one_request(self):
+        upstream = _Upstream()
+        sdk = _make_sdk(upstream, RequestCoalescer())
+
+        results = _in_threads(10, lambda: sdk._execute_endpoint(_endpoint()))
+
+        assert len(upstream.requests) == 1
+        assert all(r is results[0] for r in results)
+        assert results[0].weeks[0].week == 1
+
+    @pytest.mark.asyncio
+    async def test_async_identical_calls_share_one_request(self):
+        upstream = _Upstream()
+        sdk = _make_sdk(upstream, RequestCoalescer())
+
+        results = await asyncio.gather(
+            *(sdk._execute_endpoint_async(_endpoint()) for _ in range(50))
+        )
+
+        assert len(upstream.requests) == 1
+        assert all(r is results[0] for r in results)
+
+    @pytest.mark.asyncio
+    async def test_different_params_not_coalesced(self):
+        upstream = _Upstream()
+        sdk = _make_sdk(upstream, RequestCoalescer())
+
+        await asyncio.gather(
+            sdk._execute_endpoint_async(_endpoint(season=2024)),
+            sdk._execute_endpoint_async(_endpoint(season=2025)),
+        )
+
+        assert len(upstream.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_non_get_not_coalesced(self):
+        upstream = _Upstream()
+        sdk = _make_sdk(upstream, RequestCoalescer())
+
+        await asyncio.gather(
+            *(sdk._execute_endpoint_async(_endpoint(method="POST")) for _ in range(3))
+        )
+
+        assert len(upstream.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        upstream = _Upstream()
+        sdk = _make_sdk(upstream, None)
+
+        await asyncio.gather(
+            *(sdk._execute_endpoint_async(_endpoint()) for _ in range(3))
+        )
+
+        assert len(upstream.requests) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_error_raised_for_every_caller(self):
+        upstream = _Upstream(status=500)
+        sdk = _make_sdk(upstream, RequestCoalescer())
+
+        results = await asyncio.gather(
+            *(sdk._execute_endpoint_async(_endpoint()) for _ in range(5)),
+            return_exceptions=True,
+        )
+
+        assert len(upstream.requests) == 1
+        assert all(isinstance(r, Exception) for r in results)
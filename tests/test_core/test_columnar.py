@@ -0,0 +1,215 @@
+"""Tests for griddy.core.columnar."""
+
+import array
+import math
+from typing import List, Literal, Optional
+
+import httpx
+import pydantic
+import pytest
+from typing_extensions import Annotated
+
+from griddy.core.basesdk import BaseSDK, EndpointConfig
+from griddy.core.cache import ResponseCache
+from griddy.core.coalesce import RequestCoalescer
+from griddy.core.columnar import (
+    column_plan,
+    fetch_columns,
+    fetch_columns_async,
+    to_columns,
+)
+from griddy.core.decorators import sdk_endpoints
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.types import BaseModel, OptionalNullable
+from griddy.core.utils.logger import NoOpLogger
+
+
+class _Passer(BaseModel):
+    display_name: Annotated[str, pydantic.Field(alias="displayName")]
+    yds: int
+    int_: Annotated[Optional[int], pydantic.Field(alias="int")] = None
+    rating: Optional[float] = None
+    starter: Optional[bool] = None
+    season_type: Annotated[
+        Literal["REG", "POST"], pydantic.Field(alias="seasonType")
+    ] = "REG"
+    team_id: Annotated[OptionalNullable[str], pydantic.Field(alias="teamId")] = None
+    extra: Optional[dict] = None
+
+
+class _WeeklyPassing(BaseModel):
+    season: int
+    tags: Optional[List[str]] = None
+    passers: List[_Passer]
+
+
+class _Play(BaseModel):
+    play_id: Annotated[int, pydantic.Field(alias="playId")]
+
+
+class _Drive(BaseModel):
+    plays: Optional[List[_Play]] = None
+
+
+class _PlayByPlay(BaseModel):
+    drives: Optional[List[_Drive]] = None
+
+
+_BODY = {
+    "season": 2025,
+    "passers": [
+        {
+            "displayName": "Drake Maye",
+            "yds": 301,
+            "int": 1,
+            "rating": 104.2,
+            "starter": True,
+            "seasonType": "REG",
+            "teamId": "NE",
+            "extra": {"a": 1},
+        },
+        {"displayName": "Josh Allen", "yds": 255, "int": None, "starter": False},
+    ],
+}
+
+
+@pytest.mark.unit
+class TestColumnPlan:
+    def test_names_keys_and_scalar_types(self):
+        plan = {name: (key, scalar) for name, key, scalar in column_plan(_Passer)}
+        assert plan["display_name"] == ("displayName", str)
+        assert plan["int_"] == ("int", int)
+        assert plan["rating"] == ("rating", float)
+        assert plan["starter"] == ("starter", bool)
+        assert plan["season_type"] == ("seasonType", str)
+        assert plan["team_id"] == ("teamId", str)
+        assert plan["extra"] == ("extra", None)
+
+
+@pytest.mark.unit
+class TestToColumns:
+    def test_python_backend(self):
+        columns = to_columns(_BODY, _WeeklyPassing)
+
+        assert list(columns) == [name for name in _Passer.model_fields]
+        assert columns["display_name"] == ["Drake Maye", "Josh Allen"]
+        assert columns["yds"] == array.array("q", [301, 255])
+        assert columns["int_"] == [1, None]
+        assert columns["rating"][0] == 104.2
+        assert math.isnan(columns["rating"][1])
+        assert list(columns["starter"]) == [1, 0]
+        assert columns["season_type"] == ["REG", None]
+        assert columns["extra"] == [{"a": 1}, None]
+
+    def test_unexpected_values_kept_as_list(self):
+        body = {"season": 2025, "passers": [{"displayName": "X", "yds": "12"}]}
+        assert to_columns(body, _WeeklyPassing)["yds"] == ["12"]
+
+    def test_empty_rows(self):
+        columns = to_columns({"season": 2025, "passers": []}, _WeeklyPassing)
+        assert len(columns["yds"]) == 0
+
+    def test_nested_rows_path(self):
+        body = {
+            "drives": [
+                {"plays": [{"playId": 1}, {"playId": 2}]},
+                {"plays": None},
+                {"plays": [{"playId": 3}]},
+            ]
+        }
+        columns = to_columns(body, _PlayByPlay, rows="drives.plays")
+        assert list(columns["play_id"]) == [1, 2, 3]
+
+    def test_bad_rows_path(self):
+        with pytest.raises(ValueError, match="no field"):
+            to_columns(_BODY, _WeeklyPassing, rows="rushers")
+        with pytest.raises(TypeError, match="list of models"):
+            to_columns(_BODY, _WeeklyPassing, rows="tags")
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError, match="backend"):
+            to_columns(_BODY, _WeeklyPassing, backend="pandas")
+
+    def test_numpy_backend(self):
+        np = pytest.importorskip("numpy")
+        columns = to_columns(_BODY, _WeeklyPassing, backend="numpy")
+        assert columns["yds"].dtype == np.int64
+        assert columns["int_"].dtype == np.float64
+        assert np.isnan(columns["int_"][1])
+        assert columns["starter"].dtype == np.bool_
+        assert columns["display_name"].dtype == object
+
+    def test_arrow_backend(self):
+        pa = pytest.importorskip("pyarrow")
+        table = to_columns(_BODY, _WeeklyPassing, backend="arrow")
+        assert table.num_rows == 2
+        assert table.schema.field("yds").type == pa.int64()
+        assert table.column("int_").to_pylist() == [1, None]
+
+
+@sdk_endpoints
+class _Passing(BaseSDK):
+    def _get_weekly_summary_config(self, *, season: int) -> EndpointConfig:
+        """Get weekly passing stats."""
+        return EndpointConfig(
+            method="GET",
+            path=f"/stats/{season}",
+            operation_id="getWeeklyPassing",
+            request=None,
+            response_type=_WeeklyPassing,
+            error_status_codes=["4XX", "5XX"],
+            request_has_query_params=False,
+        )
+
+
+def _make_sdk(**options) -> _Passing:
+    def handler(request):
+        return httpx.Response(200, json=_BODY)
+
+    async def handle_async(request):
+        return handler(request)
+
+    config = SDKConfiguration(
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        client_supplied=False,
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handle_async)),
+        async_client_supplied=False,
+        debug_logger=NoOpLogger(),
+        server_url="https://example.com",
+        **options,
+    )
+    config._hooks = SDKHooks()
+    return _Passing(sdk_config=config)
+
+
+@pytest.mark.unit
+class TestFetchColumns:
+    def test_sync(self):
+        sdk = _make_sdk()
+        columns = fetch_columns(sdk.get_weekly_summary, season=2025)
+        assert columns["display_name"] == ["Drake Maye", "Josh Allen"]
+
+    @pytest.mark.asyncio
+    async def test_async(self):
+        sdk = _make_sdk()
+        columns = await fetch_columns_async(sdk.get_weekly_summary_async, season=2025)
+        assert list(columns["yds"]) == [301, 255]
+
+    def test_typed_and_raw_calls_do_not_share_cache_entries(self):
+        sdk = _make_sdk(
+            response_cache=ResponseCache(), request_coalescer=RequestCoalescer()
+        )
+        typed = sdk.get_weekly_summary(season=2025)
+        columns = fetch_columns(sdk.get_weekly_summary, season=2025)
+        again = sdk.get_weekly_summary(season=2025)
+
+        assert isinstance(typed, _WeeklyPassing)
+        assert columns["display_name"] == ["Drake Maye", "Josh Allen"]
+        assert again is typed
+        cached = fetch_columns(sdk.get_weekly_summary, season=2025)
+        assert cached["display_name"] == columns["display_name"]
+
+    def test_rejects_non_endpoint(self):
+        with pytest.raises(TypeError, match="sdk_endpoints"):
+            fetch_columns(print)
@@ -0,0 +1,84 @@
+"""Tests for griddy.core.compact."""
+
+import pickle
+import sys
+
+import pytest
+
+from griddy.core.compact import CompactRow, compact, compact_many, compact_type
+from griddy.nfl import models
+
+_PLAY = {
+    "playId": 40,
+    "description": "(9:12) J.Allen pass deep left to K.Shakir for 21 yards.",
+    "down": 2,
+    "distance": 8,
+    "gameClock": "9:12",
+    "penalties": [{"accepted": True, "type": "Holding", "yards": 10}],
+    "players": [
+        {"player": {"displayName": "Josh Allen", "draftClub": None}, "role": "PASSER"}
+    ],
+    "yardsGained": 21,
+}
+
+
+def _play() -> models.Play:
+    return models.Play.model_validate(_PLAY)
+
+
+@pytest.mark.unit
+class TestCompactRow:
+    def test_fields_read_as_attributes(self):
+        row = compact(_play())
+        assert isinstance(row, CompactRow)
+        assert row.play_id == "40"
+        assert row.yards_gained == 21
+        assert row.quarter is None
+        assert row.penalties[0].type == "Holding"
+        assert row.players[0].player.display_name == "Josh Allen"
+
+    def test_read_only(self):
+        row = compact(_play())
+        with pytest.raises(AttributeError):
+            row.down = 3
+        with pytest.raises(AttributeError):
+            row.new_attribute = 1
+        assert isinstance(row.penalties, tuple)
+
+    def test_round_trips_to_model(self):
+        play = _play()
+        rebuilt = compact(play).to_model()
+        assert type(rebuilt) is models.Play
+        assert rebuilt == play
+        assert rebuilt.model_dump() == play.model_dump()
+        # explicitly-null OptionalNullable fields stay in the dump
+        player = rebuilt.players[0].player.model_dump()
+        assert player == {"displayName": "Josh Allen", "draftClub": None}
+
+    def test_one_class_per_model(self):
+        assert compact_type(models.Play) is compact_type(models.Play)
+        assert compact_type(models.Play).__name__ == "CompactPlay"
+        assert compact_type(models.Play).__slots__ == ()
+
+    def test_equality_requires_same_model(self):
+        assert compact(_play()) == compact(_play())
+        assert compact(models.Penalty()) != compact(models.Play())
+
+    def test_fields_set_shared(self):
+        first, second = compact_many([_play(), _play()])
+        assert first[-1] is second[-1]
+
+    def test_pickle(self):
+        row = compact(_play())
+        assert pickle.loads(pickle.dumps(row)) == row
+
+    def test_smaller_than_model(self):
+        play = models.Play(play_id="1", down=1, quarter=1)
+        assert sys.getsizeof(compact(play)) < sys.getsizeof(play) + sys.getsizeof(
+            play.__dict__
+        )
+
+    def test_repr(self):
+        assert repr(compact(models.Penalty(yards=5))).startswith(
+            "CompactPenalty(accepted=None"
+        )
@@ -11,6 +11,9 @@ from griddy.core.hooks.types import (
     AfterErrorHook,
     AfterSuccessContext,
     AfterSuccessHook,
+    AsyncAfterErrorHook,
+    AsyncAfterSuccessHook,
+    AsyncBeforeRequestHook,
     BeforeRequestContext,
     BeforeRequestHook,
     HookContext,
@@ -184,3 +187,120 @@ class TestSDKHooks:
         r, e = hooks.after_error(AfterErrorContext(ctx), response, None)
         assert r is response
         assert e is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSDKHooksAsyncDispatch:
+    async def test_async_hook_awaited(self):
+        calls = []
+
+        class MyHook(BeforeRequestHook, AsyncBeforeRequestHook):
+            def before_request(self, hook_ctx, req):
+                calls.append("sync")
+                return req
+
+            async def before_request_async(self, hook_ctx, req):
+                calls.append("async")
+                return req
+
+        hooks = SDKHooks()
+        hooks.register_before_request_hook(MyHook())
+        request = Mock(spec=httpx.Request)
+
+        ctx = BeforeRequestContext(_make_hook_context())
+        assert await hooks.before_request_async(ctx, request) is request
+        assert calls == ["async"]
+
+    async def test_sync_only_hook_still_called(self):
+        modified_request = Mock(spec=httpx.Request)
+
+        class MyHook(BeforeRequestHook):
+            def before_request(self, hook_ctx, req):
+                return modified_request
+
+        hooks = SDKHooks()
+        hooks.register_before_request_hook(MyHook())
+
+        ctx = BeforeRequestContext(_make_hook_context())
+        result = await hooks.before_request_async(ctx, Mock(spec=httpx.Request))
+        assert result is modified_request
+
+    async def test_async_before_request_raises_on_exception_return(self):
+        class MyHook(BeforeRequestHook, AsyncBeforeRequestHook):
+            def before_request(self, hook_ctx, req):
+                return req
+
+            async def before_request_async(self, hook_ctx, req):
+                return ValueError("hook error")
+
+        hooks = SDKHooks()
+        hooks.register_before_request_hook(MyHook())
+
+        ctx = BeforeRequestContext(_make_hook_context())
+        with pytest.raises(ValueError, match="hook error"):
+            await hooks.before_request_async(ctx, Mock(spec=httpx.Request))
+
+    async def test_after_success_async(self):
+        modified_response = Mock(spec=httpx.Response)
+
+        class MyHook(AfterSuccessHook, AsyncAfterSuccessHook):
+            def after_success(self, hook_ctx, resp):
+                raise AssertionError("sync variant should not run")
+
+            async def after_success_async(self, hook_ctx, resp):
+                return modified_response
+
+        hooks = SDKHooks()
+        hooks.register_after_success_hook(MyHook())
+
+        ctx = AfterSuccessContext(_make_hook_context())
+        result = await hooks.after_success_async(ctx, Mock(spec=httpx.Response))
+        assert result is modified_response
+
+    async def test_after_error_async(self):
+        error = ValueError("test")
+
+        class MyHook(AfterErrorHook, AsyncAfterErrorHook):
+            def after_error(self, hook_ctx, resp, err):
+                raise AssertionError("sync variant should not run")
+
+            async def after_error_async(self, hook_ctx, resp, err):
+                return (None, RuntimeError("replaced"))
+
+        hooks = SDKHooks()
+        hooks.register_after_error_hook(MyHook())
+
+        ctx = AfterErrorContext(_make_hook_context())
+        _, result_err = await hooks.after_error_async(ctx, None, error)
+        assert isinstance(result_err, RuntimeError)
+
+    async def test_do_request_async_awaits_async_hooks(self):
+        from griddy.core.basesdk import BaseSDK
+        from griddy.core.sdkconfiguration import SDKConfiguration
+
+        seen = []
+
+        class MyHook(BeforeRequestHook, AsyncBeforeRequestHook):
+            def before_request(self, hook_ctx, req):
+                raise AssertionError("sync variant should not run")
+
+            async def before_request_async(self, hook_ctx, req):
+                seen.append(req.url.path)
+                return req
+
+        transport = httpx.MockTransport(lambda request: httpx.Response(200))
+        config = SDKConfiguration(
+            client=None,
+            client_supplied=False,
+            async_client=httpx.AsyncClient(transport=transport),
+            async_client_supplied=False,
+            debug_logger=Mock(),
+        )
+        config._hooks = SDKHooks()
+        config._hooks.register_before_request_hook(MyHook())
+
+        await BaseSDK(sdk_config=config).do_request_async(
+            _make_hook_context(), httpx.Request("GET", "https://example.com/x"), []
+        )
+        assert seen == ["/x"]
@@ -0,0 +1,106 @@
+"""Tests for griddy.core.htmlparser."""
+
+import importlib.util
+
+import pytest
+from bs4 import BeautifulSoup
+
+from griddy.core import htmlparser
+from griddy.core.htmlparser import (
+    get_html_parser,
+    make_soup,
+    parse_fragment,
+    set_html_parser,
+)
+
+
+def _engines():
+    engines = [pytest.param("html.parser", id="html.parser")]
+    for name in ("lxml",):
+        if importlib.util.find_spec(name) is None:
+            engines.append(
+                pytest.param(
+                    name, id=name, marks=pytest.mark.skip(f"{name} not installed")
+                )
+            )
+        else:
+            engines.append(pytest.param(name, id=name))
+    return engines
+
+
+@pytest.fixture
+def restore_default_parser():
+    previous = htmlparser._default_parser
+    yield
+    htmlparser._default_parser = previous
+
+
+@pytest.mark.unit
+class TestGetHtmlParser:
+    def test_none_returns_default(self):
+        assert get_html_parser() == htmlparser._default_parser
+
+    def test_html_parser_name(self):
+        assert get_html_parser("html.parser") == "html.parser"
+
+    def test_auto_falls_back_to_html_parser(self, monkeypatch):
+        monkeypatch.setattr(htmlparser, "_AUTO_ORDER", ())
+        assert get_html_parser("auto") == "html.parser"
+
+    def test_missing_builder_falls_back_to_html_parser(self, monkeypatch):
+        monkeypatch.setattr(htmlparser, "_installed", lambda name: False)
+        assert get_html_parser("lxml") == "html.parser"
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown HTML parser"):
+            get_html_parser("html5")
+
+    def test_set_html_parser(self, restore_default_parser):
+        assert set_html_parser("html.parser") == "html.parser"
+        assert get_html_parser() == "html.parser"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", _engines())
+class TestParsing:
+    def test_make_soup_uses_builder(self, engine):
+        soup = make_soup("<p id='x'>hi</p>", engine)
+        assert isinstance(soup, BeautifulSoup)
+        assert soup.builder.NAME == engine
+        assert soup.find(id="x").get_text() == "hi"
+
+    @pytest.mark.parametrize(
+        "markup",
+        [
+            '<table id="t"><tr><td>1</td></tr></table>',
+            " plain note ",
+            "Tom &amp; Jerry",
+            '\n<div id="a"></div>\n<div id="b">x</div>\n',
+            '<link rel="stylesheet" href="a.css"/><div>x</div>',
+            "<script>var a = 1;</script>note <b>bold</b>",
+            '<style>td { color: red; }</style><meta charset="utf-8"/>text',
+            "<!-- hidden -->leading text <i>tail</i>",
+        ],
+    )
+    def test_parse_fragment_matches_html_parser(self, engine, markup):
+        container = BeautifulSoup("<div></div>", "html.parser").div
+        container.extend(parse_fragment(markup, engine))
+        expected = BeautifulSoup(markup, "html.parser")
+        assert container.decode_contents().strip() == expected.decode().strip()
+
+    def test_fragment_splices_into_tree(self, engine):
+        soup = make_soup("<div id='outer'><span>old</span></div>", engine)
+        soup.find("span").replace_with(*parse_fragment("<b>new</b>", engine))
+        assert str(soup.find(id="outer")) == '<div id="outer"><b>new</b></div>'
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(
+    importlib.util.find_spec("lxml") is None, reason="lxml not installed"
+)
+def test_parse_fragment_unwraps_synthetic_paragraph(monkeypatch):
+    # Some libxml2 versions wrap leading bare text in <p>.
+    wrapped = BeautifulSoup("<html><body><p>Tom &amp; Jerry</p></body></html>", "lxml")
+    monkeypatch.setattr(htmlparser, "BeautifulSoup", lambda markup, features: wrapped)
+    nodes = parse_fragment("Tom &amp; Jerry", "lxml")
+    assert [str(node) for node in nodes] == ["Tom & Jerry"]
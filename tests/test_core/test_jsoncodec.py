@@ -0,0 +1,202 @@
+"""Tests for griddy.core.jsoncodec.
+
+Every installed codec runs the same conformance cases against the standard
+library, so swapping codecs never changes what the SDK reads or writes.
+"""
+
+import dataclasses
+import importlib.util
+import json
+from datetime import date, datetime, timezone
+
+import pytest
+
+from griddy.core import jsoncodec
+from griddy.core.jsoncodec import (
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    get_json_codec,
+    set_json_codec,
+)
+from griddy.core.utils.serializers import DateTimeEncoder, dump_json
+
+
+def _codecs():
+    codecs = [pytest.param(JsonCodec(), id="json")]
+    for name, cls in (("orjson", OrjsonCodec), ("msgspec", MsgspecCodec)):
+        if importlib.util.find_spec(name) is None:
+            codecs.append(
+                pytest.param(
+                    None, id=name, marks=pytest.mark.skip(f"{name} not installed")
+                )
+            )
+        else:
+            codecs.append(pytest.param(cls(), id=name))
+    return codecs
+
+
+_DOCUMENTS = [
+    None,
+    True,
+    0,
+    -(2**53),
+    "",
+    "Ja'Marr Chase",
+    "Amon-Ra St. Brown — Détroit \U0001f3c8",
+    'quote " backslash \\ newline \n tab \t',
+    1.5,
+    0.1,
+    123.456,
+    [],
+    {},
+    {"gameId": "10160000-0581-9f5d-2a09-8a9e1a0f6d4c", "week": 1},
+    {"plays": [{"yards": 12, "isTouchdown": False, "clock": None}] * 3},
+]
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+
+
+@pytest.fixture
+def restore_default_codec():
+    previous = jsoncodec._default_codec
+    yield
+    jsoncodec._default_codec = previous
+
+
+@pytest.mark.unit
+def test_stdlib_codec_escapes_non_ascii():
+    assert JsonCodec().dumps({"team": "Détroit"}) == '{"team":"D\\u00e9troit"}'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("codec", _codecs())
+class TestCodecConformance:
+    @pytest.mark.parametrize("document", _DOCUMENTS)
+    def test_dumps_matches_stdlib(self, codec, document):
+        expected = json.dumps(
+            document, separators=(",", ":"), ensure_ascii=codec.name == "json"
+        )
+        assert codec.dumps(document) == expected
+
+    @pytest.mark.parametrize("document", _DOCUMENTS)
+    def test_loads_matches_stdlib(self, codec, document):
+        text = json.dumps(document)
+        assert codec.loads(text) == json.loads(text)
+        assert codec.loads(text.encode()) == json.loads(text)
+
+    def test_loads_memoryview(self, codec):
+        assert codec.loads(memoryview(b'{"a":[1,2]}')) == {"a": [1, 2]}
+
+    def test_exponent_floats_round_trip(self, codec):
+        values = [1e-7, 1e16, 6.02e23, -2.5e-12]
+        assert codec.loads(codec.dumps(values)) == values
+
+    def test_sort_keys(self, codec):
+        document = {"week": 1, "season": 2025, "nested": {"b": 2, "a": 1}}
+        assert codec.dumps(document, sort_keys=True) == json.dumps(
+            document, sort_keys=True, separators=(",", ":")
+        )
+
+    def test_non_str_keys_become_strings(self, codec):
+        assert codec.loads(codec.dumps({1: "a"})) == {"1": "a"}
+
+    def test_default_sees_datetimes(self, codec):
+        document = {"at": datetime(2025, 9, 4, 20, 20, tzinfo=timezone.utc)}
+        assert codec.dumps(document, default=str) == json.dumps(
+            document, default=str, separators=(",", ":")
+        )
+
+    def test_default_sees_dataclasses(self, codec):
+        assert codec.dumps([_Point(1)], default=dataclasses.asdict) == '[{"x":1}]'
+
+    def test_unencodable_raises_type_error(self, codec):
+        with pytest.raises(TypeError):
+            codec.dumps({"value": object()})
+
+    def test_malformed_raises_value_error(self, codec):
+        with pytest.raises(ValueError):
+            codec.loads(b'{"season": ')
+
+
+@pytest.mark.unit
+class TestGetJsonCodec:
+    def test_none_returns_default(self):
+        assert get_json_codec() is jsoncodec._default_codec
+
+    def test_instance_returned_as_is(self):
+        codec = JsonCodec()
+        assert get_json_codec(codec) is codec
+
+    def test_json_name(self):
+        assert type(get_json_codec("json")) is JsonCodec
+
+    def test_auto_falls_back_to_stdlib(self, monkeypatch):
+        monkeypatch.setattr(jsoncodec, "_AUTO_ORDER", ())
+        assert type(get_json_codec("auto")) is JsonCodec
+
+    def test_missing_codec_falls_back_to_stdlib(self, monkeypatch):
+        def missing():
+            raise ImportError("orjson")
+
+        monkeypatch.setitem(jsoncodec._CODECS, "orjson", missing)
+        assert type(get_json_codec("orjson")) is JsonCodec
+
+    def test_unknown_name(self):
+        with pytest.raises(ValueError, match="Unknown JSON codec"):
+            get_json_codec("simplejson")
+
+    def test_set_json_codec(self, restore_default_codec):
+        codec = JsonCodec()
+        assert set_json_codec(codec) is codec
+        assert get_json_codec() is codec
+
+
+@pytest.mark.unit
+class TestDumpJson:
+    def test_matches_datetime_encoder(self):
+        document = {
+            "born": date(1996, 12, 29),
+            "updated": datetime(2025, 1, 2, 3, 4, 5),
+            "teams": ["CIN"],
+        }
+        assert dump_json(document) == json.dumps(
+            document, cls=DateTimeEncoder, separators=(",", ":")
+        )
+
+    @pytest.mark.parametrize("codec", _codecs())
+    def test_every_codec_writes_iso_dates(self, codec):
+        # msgspec falls back to the stdlib whenever a default hook is given.
+        document = {"born": date(1996, 12, 29), "at": datetime(2025, 1, 2, 3, 4)}
+        assert json.loads(dump_json(document, codec=codec)) == {
+            "born": "1996-12-29",
+            "at": "2025-01-02T03:04:00",
+        }
+
+    def test_unencodable_value_raises_type_error(self):
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            dump_json({"point": _Point(1)}, codec=JsonCodec())
+
+    def test_uses_process_default(self, restore_default_codec):
+        set_json_codec(JsonCodec())
+        assert dump_json({"team": "Détroit"}) == '{"team":"D\\u00e9troit"}'
+
+    def test_missing_codec_falls_back_to_stdlib(
+        self, monkeypatch, restore_default_codec
+    ):
+        def missing():
+            raise ImportError("orjson")
+
+        monkeypatch.setitem(jsoncodec._CODECS, "orjson", missing)
+        assert type(set_json_codec("orjson")) is JsonCodec
+        assert dump_json({"on": date(2025, 9, 7)}) == '{"on":"2025-09-07"}'
+
+    def test_uses_given_codec(self):
+        class Upper(JsonCodec):
+            def dumps(self, obj, *, sort_keys=False, default=None):
+                return super().dumps(obj, default=default).upper()
+
+        assert dump_json({"team": "cin"}, codec=Upper()) == '{"TEAM":"CIN"}'
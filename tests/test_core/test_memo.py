@@ -0,0 +1,198 @@
+"""Tests for griddy.core.memo and its BaseSDK integration."""
+
+from typing import List, Optional
+from unittest.mock import patch
+
+import httpx
+import pytest
+from typing_extensions import Annotated
+
+from griddy.core.basesdk import BaseSDK, EndpointConfig
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.memo import ResponseMemo
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.types import BaseModel
+from griddy.core.utils import FieldMetadata, QueryParamMetadata
+from griddy.core.utils.logger import NoOpLogger
+from griddy.core.utils.unmarshal_json_response import unmarshal_json_response
+
+_QUERY = FieldMetadata(query=QueryParamMetadata(style="form", explode=True))
+
+
+class _Request(BaseModel):
+    game: Annotated[Optional[str], _QUERY] = None
+
+
+class _Score(BaseModel):
+    home: int
+    away: int
+
+
+class _Feed:
+    """Fake live endpoint serving whatever body is currently set."""
+
+    def __init__(self, body: bytes = b'{"home": 7, "away": 3}'):
+        self.body = body
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(
+            200, content=self.body, headers={"content-type": "application/json"}
+        )
+
+
+def _make_sdk(feed: _Feed, memo: Optional[ResponseMemo]) -> BaseSDK:
+    async def handle_async(request):
+        return feed(request)
+
+    config = SDKConfiguration(
+        client=httpx.Client(transport=httpx.MockTransport(feed)),
+        client_supplied=False,
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handle_async)),
+        async_client_supplied=False,
+        debug_logger=NoOpLogger(),
+        server_url="https://example.com",
+        response_memo=memo,
+    )
+    config._hooks = SDKHooks()
+    return BaseSDK(sdk_config=config)
+
+
+def _endpoint(game: str = "g1", method: str = "GET") -> EndpointConfig:
+    return EndpointConfig(
+        method=method,
+        path="/scores/live",
+        operation_id="getLiveGameScores",
+        request=_Request(game=game),
+        response_type=_Score,
+        error_status_codes=["4XX", "5XX"],
+    )
+
+
+@pytest.mark.unit
+class TestResponseMemo:
+    def test_unchanged_body_reuses_result(self):
+        memo = ResponseMemo()
+        calls = []
+
+        def decode():
+            calls.append(1)
+            return object()
+
+        first = memo.decode("k", b"{}", decode)
+        assert memo.decode("k", b"{}", decode) is first
+        assert len(calls) == 1
+        assert memo.stats().hits == 1
+        assert memo.stats().misses == 1
+
+    def test_changed_body_decoded_again(self):
+        memo = ResponseMemo()
+        assert memo.decode("k", b"1", lambda: 1) == 1
+        assert memo.decode("k", b"2", lambda: 2) == 2
+        assert memo.decode("k", b"2", lambda: 3) == 2
+
+    def test_keys_are_independent(self):
+        memo = ResponseMemo()
+        memo.decode("a", b"{}", lambda: "a")
+        assert memo.decode("b", b"{}", lambda: "b") == "b"
+
+    def test_lru_bound(self):
+        memo = ResponseMemo(max_entries=2)
+        for key in "abc":
+            memo.decode(key, b"{}", lambda: key)
+        assert len(memo) == 2
+        assert memo.decode("a", b"{}", lambda: "new") == "new"
+
+    def test_decode_error_not_remembered(self):
+        memo = ResponseMemo()
+
+        def fail():
+            raise ValueError("invalid")
+
+        with pytest.raises(ValueError):
+            memo.decode("k", b"{}", fail)
+        assert len(memo) == 0
+
+    def test_applies_to_patterns(self):
+        memo = ResponseMemo(operations=["getLive*", "getNgsLiveScores"])
+        assert memo.applies_to("getLivePlayerStatistics")
+        assert memo.applies_to("getNgsLiveScores")
+        assert not memo.applies_to("getSeasonWeeks")
+        assert ResponseMemo().applies_to("anything")
+
+    def test_rejects_empty_size(self):
+        with pytest.raises(ValueError):
+            ResponseMemo(max_entries=0)
+
+
+# ---------------------------------------------------------------------------
+# BaseSDK integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+class TestExecuteEndpointMemo:
+    def test_repeat_poll_skips_validation(self):
+        feed = _Feed()
+        sdk = _make_sdk(feed, ResponseMemo())
+
+        with patch(
+            "griddy.core.basesdk.unmarshal_json_response",
+            wraps=unmarshal_json_response,
+        ) as unmarshal:
+            first = sdk._execute_endpoint(_endpoint())
+            second = sdk._execute_endpoint(_endpoint())
+
+        assert len(feed.requests) == 2
+        assert second is first
+        assert unmarshal.call_count == 1
+
+    def test_changed_body_returns_new_result(self):
+        feed = _Feed()
+        sdk = _make_sdk(feed, ResponseMemo())
+
+        first = sdk._execute_endpoint(_endpoint())
+        feed.body = b'{"home": 14, "away": 3}'
+        second = sdk._execute_endpoint(_endpoint())
+
+        assert (first.home, second.home) == (7, 14)
+
+    @pytest.mark.asyncio
+    async def test_async_repeat_poll_reuses_result(self):
+        memo = ResponseMemo()
+        sdk = _make_sdk(_Feed(), memo)
+
+        first = await sdk._execute_endpoint_async(_endpoint())
+        second = await sdk._execute_endpoint_async(_endpoint())
+
+        assert second is first
+        assert memo.stats().hits == 1
+
+    def test_different_requests_not_shared(self):
+        sdk = _make_sdk(_Feed(), ResponseMemo())
+        first = sdk._execute_endpoint(_endpoint(game="g1"))
+        assert sdk._execute_endpoint(_endpoint(game="g2")) is not first
+
+    def test_operation_filter(self):
+        memo = ResponseMemo(operations=["getSeasonWeeks"])
+        sdk = _make_sdk(_Feed(), memo)
+        sdk._execute_endpoint(_endpoint())
+        assert len(memo) == 0
+
+    def test_non_get_not_memoized(self):
+        memo = ResponseMemo()
+        sdk = _make_sdk(_Feed(), memo)
+        sdk._execute_endpoint(_endpoint(method="POST"))
+        assert len(memo) == 0
+
+    def test_error_response_not_memoized(self):
+        memo = ResponseMemo()
+        feed = _Feed()
+        sdk = _make_sdk(feed, memo)
+        sdk.sdk_configuration.client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(500))
+        )
+        with pytest.raises(Exception):
+            sdk._execute_endpoint(_endpoint())
+        assert len(memo) == 0
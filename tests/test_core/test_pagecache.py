@@ -0,0 +1,330 @@
+"""Tests for griddy.core.pagecache module."""
+
+import asyncio
+import calendar
+import gzip
+import os
+import threading
+
+import pytest
+
+from griddy.core.pagecache import (
+    AsyncCachedScrapingBackend,
+    CachedScrapingBackend,
+    PageCache,
+    PageCacheStats,
+    current_season,
+)
+
+_BASE = "https://www.pro-football-reference.com"
+
+# Mid-October 2025: the 2025 season is under way.
+_NOW = float(calendar.timegm((2025, 10, 15, 12, 0, 0)))
+
+
+class _FakeClock:
+    def __init__(self, now: float = _NOW):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Backend:
+    def __init__(self, html: str = "<html>page</html>"):
+        self.html = html
+        self.calls = []
+
+    def get_page_content(self, url: str, wait_for_element: str) -> str:
+        self.calls.append((url, wait_for_element))
+        return self.html
+
+
+class _AsyncBackend(_Backend):
+    async def get_page_content(self, url: str, wait_for_element: str) -> str:
+        self.calls.append((url, wait_for_element))
+        return self.html
+
+
+class _ThreadRecordingCache(PageCache):
+    """Records the thread every lookup and store runs on."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.threads = []
+
+    def get(self, url):
+        self.threads.append(threading.get_ident())
+        return super().get(url)
+
+    def set(self, url, html):
+        self.threads.append(threading.get_ident())
+        super().set(url, html)
+
+
+@pytest.fixture
+def clock():
+    return _FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return PageCache(tmp_path, clock=clock)
+
+
+@pytest.mark.unit
+class TestPageCacheStats:
+    def test_hit_rate_zero_when_unused(self):
+        assert PageCacheStats().hit_rate == 0.0
+
+    def test_hit_rate(self):
+        stats = PageCacheStats(hits=3, misses=1)
+        assert stats.lookups == 4
+        assert stats.hit_rate == 0.75
+
+
+@pytest.mark.unit
+class TestCurrentSeason:
+    @pytest.mark.parametrize(
+        "month, season",
+        [(1, 2024), (2, 2024), (3, 2025), (9, 2025), (12, 2025)],
+    )
+    def test_season_rolls_over_in_march(self, month, season):
+        now = calendar.timegm((2025, month, 1, 0, 0, 0))
+        assert current_season(now) == season
+
+
+@pytest.mark.unit
+class TestTtlRules:
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/boxscores/201509100nwe.htm",
+            "/years/2015/",
+            "/years/2024/week_1.htm",
+            "/teams/nwe/2015.htm",
+            "/draft/1995-combine.htm",
+            "/players/B/BradTo00/gamelog/2015/",
+        ],
+    )
+    def test_immutable_pages_never_expire(self, cache, path):
+        assert cache.ttl_for(_BASE + path) is None
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/years/2025/",
+            "/teams/nwe/2025.htm",
+            "/players/B/BradTo00.htm",
+            "/boxscores/standings.cgi",
+            "/",
+        ],
+    )
+    def test_live_pages_use_default_ttl(self, cache, path):
+        assert cache.ttl_for(_BASE + path) == 3600
+
+    def test_query_string_is_ignored(self, cache):
+        assert cache.ttl_for(_BASE + "/friv/age.cgi?year=2001") == 3600
+
+    def test_user_rule_beats_builtin_rules(self, tmp_path, clock):
+        cache = PageCache(
+            tmp_path,
+            ttl_rules={"/boxscores/*": 60, "/players/*": None},
+            clock=clock,
+        )
+        assert cache.ttl_for(_BASE + "/boxscores/201509100nwe.htm") == 60
+        assert cache.ttl_for(_BASE + "/players/B/BradTo00.htm") is None
+
+    def test_season_rule_can_be_disabled(self, tmp_path, clock):
+        cache = PageCache(tmp_path, freeze_past_seasons=False, clock=clock)
+        assert cache.ttl_for(_BASE + "/years/2015/") == 3600
+
+    def test_rejects_non_positive_size(self, tmp_path):
+        with pytest.raises(ValueError):
+            PageCache(tmp_path, max_bytes=0)
+
+
+@pytest.mark.unit
+class TestPageCache:
+    def test_miss_then_hit(self, cache):
+        url = _BASE + "/years/2015/"
+        assert cache.get(url) is None
+        cache.set(url, "<html>2015</html>")
+        assert cache.get(url) == "<html>2015</html>"
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+        assert stats.entries == 1
+        assert stats.size_bytes > 0
+
+    def test_pages_are_compressed(self, cache, tmp_path):
+        html = "<tr><td>row</td></tr>" * 1000
+        cache.set(_BASE + "/years/2015/", html)
+        (path,) = tmp_path.glob("*.html.gz")
+        assert path.stat().st_size < len(html) // 10
+        assert html in gzip.decompress(path.read_bytes()).decode("utf-8")
+
+    def test_unicode_round_trip(self, cache):
+        url = _BASE + "/players/V/VasqFe00.htm"
+        cache.set(url, "<p>Félix – “quoted”</p>")
+        assert cache.get(url) == "<p>Félix – “quoted”</p>"
+
+    def test_expiry(self, cache, clock):
+        url = _BASE + "/years/2025/"
+        cache.set(url, "<html>week 6</html>")
+        clock.now += 3599
+        assert cache.get(url) == "<html>week 6</html>"
+        clock.now += 2
+        assert cache.get(url) is None
+        assert cache.stats().expirations == 1
+        assert len(cache) == 0
+
+    def test_season_freezes_once_over(self, cache, clock):
+        url = _BASE + "/years/2025/"
+        cache.set(url, "<html>final</html>")
+        clock.now = float(calendar.timegm((2026, 6, 1, 0, 0, 0)))
+        assert cache.get(url) == "<html>final</html>"
+
+    def test_zero_ttl_and_empty_pages_not_stored(self, tmp_path, clock):
+        cache = PageCache(tmp_path, ttl_rules={"/friv/*": 0}, clock=clock)
+        cache.set(_BASE + "/friv/coffee.htm", "<html></html>")
+        cache.set(_BASE + "/years/2015/", "")
+        assert len(cache) == 0
+        assert cache.stats().stores == 0
+
+    def test_survives_new_instance(self, cache, tmp_path, clock):
+        url = _BASE + "/boxscores/201509100nwe.htm"
+        cache.set(url, "<html>box</html>")
+        reopened = PageCache(tmp_path, clock=clock)
+        assert len(reopened) == 1
+        assert reopened.get(url) == "<html>box</html>"
+
+    def test_lru_eviction(self, tmp_path, clock):
+        html = os.urandom(600).hex()
+        probe = PageCache(tmp_path / "probe", clock=clock)
+        probe.set(_BASE + "/years/2000/", html)
+        page_size = probe.stats().size_bytes
+
+        cache = PageCache(tmp_path / "lru", max_bytes=page_size * 2 + 16, clock=clock)
+        first, second, third = (_BASE + f"/years/200{i}/" for i in range(3))
+        cache.set(first, html)
+        cache.set(second, html)
+        clock.now += 1
+        assert cache.get(first) == html  # second is now least recently used
+        cache.set(third, html)
+
+        assert cache.get(second) is None
+        assert cache.get(first) == html
+        assert cache.get(third) == html
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.size_bytes <= cache.max_bytes
+
+    def test_lru_order_survives_new_instance(self, tmp_path, clock):
+        html = os.urandom(600).hex()
+        cache = PageCache(tmp_path, clock=clock)
+        first, second, third = (_BASE + f"/years/200{i}/" for i in range(3))
+        cache.set(first, html)
+        clock.now += 1
+        cache.set(second, html)
+        clock.now += 1
+        cache.get(first)
+        two_pages = cache.stats().size_bytes
+
+        reopened = PageCache(tmp_path, max_bytes=two_pages + 16, clock=clock)
+        reopened.set(third, html)
+        assert reopened.get(second) is None
+        assert reopened.get(first) == html
+
+    def test_page_larger_than_cap_not_stored(self, tmp_path, clock):
+        cache = PageCache(tmp_path, max_bytes=64, clock=clock)
+        cache.set(_BASE + "/years/2015/", os.urandom(256).hex())
+        assert len(cache) == 0
+
+    def test_overwrite_keeps_size_accurate(self, cache):
+        url = _BASE + "/years/2015/"
+        cache.set(url, "<html>a</html>")
+        cache.set(url, "<html>b</html>")
+        assert len(cache) == 1
+        assert cache.get(url) == "<html>b</html>"
+        assert cache.stats().size_bytes == sum(
+            path.stat().st_size for path in cache.directory.glob("*.html.gz")
+        )
+
+    def test_corrupt_file_is_a_miss(self, cache):
+        url = _BASE + "/years/2015/"
+        cache.set(url, "<html>ok</html>")
+        (path,) = cache.directory.glob("*.html.gz")
+        path.write_bytes(b"not gzip")
+        assert cache.get(url) is None
+
+    def test_failed_write_leaves_no_temp_file(self, cache, monkeypatch):
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("griddy.core.pagecache.os.replace", fail)
+        cache.set(_BASE + "/years/2015/", "<html></html>")
+        assert list(cache.directory.iterdir()) == []
+        assert len(cache) == 0
+
+    def test_invalidate_and_clear(self, cache):
+        urls = [_BASE + "/years/2014/", _BASE + "/years/2015/"]
+        for url in urls:
+            cache.set(url, "<html></html>")
+        cache.invalidate(urls[0])
+        assert cache.get(urls[0]) is None
+        assert len(cache) == 1
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.stats().size_bytes == 0
+        assert list(cache.directory.glob("*.html.gz")) == []
+
+    def test_reset_stats(self, cache):
+        cache.get(_BASE + "/years/2015/")
+        cache.reset_stats()
+        assert cache.stats().misses == 0
+
+
+@pytest.mark.unit
+class TestCachedScrapingBackend:
+    def test_fetches_once(self, cache):
+        backend = _Backend()
+        cached = CachedScrapingBackend(backend, cache)
+        url = _BASE + "/boxscores/201509100nwe.htm"
+
+        assert cached.get_page_content(url, wait_for_element="#box") == backend.html
+        assert cached.get_page_content(url, wait_for_element="#box") == backend.html
+        assert backend.calls == [(url, "#box")]
+        assert cache.stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_async_fetches_once(self, cache):
+        backend = _AsyncBackend()
+        cached = AsyncCachedScrapingBackend(backend, cache)
+        url = _BASE + "/boxscores/201509100nwe.htm"
+
+        assert await cached.get_page_content(url, "#box") == backend.html
+        assert await cached.get_page_content(url, "#box") == backend.html
+        assert len(backend.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_cache_io_runs_off_the_event_loop(self, tmp_path, clock):
+        cache = _ThreadRecordingCache(tmp_path, clock=clock)
+        cached = AsyncCachedScrapingBackend(_AsyncBackend(), cache)
+
+        await cached.get_page_content(_BASE + "/years/2015/", "")
+        await cached.get_page_content(_BASE + "/years/2015/", "")
+        assert len(cache.threads) == 3
+        assert threading.get_ident() not in cache.threads
+
+    def test_sync_and_async_share_pages(self, cache):
+        url = _BASE + "/years/2015/"
+        CachedScrapingBackend(_Backend("<html>sync</html>"), cache).get_page_content(
+            url, ""
+        )
+        backend = _AsyncBackend()
+        html = asyncio.run(
+            AsyncCachedScrapingBackend(backend, cache).get_page_content(url, "")
+        )
+        assert html == "<html>sync</html>"
+        assert backend.calls == []
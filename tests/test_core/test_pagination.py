@@ -0,0 +1,197 @@
+"""Tests for griddy.core.pagination and the generated iter_*/aiter_* methods."""
+
+import inspect
+import threading
+from typing import List, Optional
+
+import httpx
+import pytest
+from typing_extensions import Annotated
+
+from griddy.core.basesdk import BaseSDK, EndpointConfig
+from griddy.core.decorators import sdk_endpoints
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.pagination import is_paginated, rows_field
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.types import BaseModel
+from griddy.core.utils import FieldMetadata, QueryParamMetadata
+from griddy.core.utils.logger import NoOpLogger
+
+_QUERY = FieldMetadata(query=QueryParamMetadata(style="form", explode=True))
+
+
+class _Request(BaseModel):
+    limit: Annotated[Optional[int], _QUERY] = None
+    offset: Annotated[Optional[int], _QUERY] = None
+    page: Annotated[Optional[int], _QUERY] = None
+
+
+class _Row(BaseModel):
+    rank: int
+
+
+class _Response(BaseModel):
+    limit: int
+    offset: int
+    tags: Optional[List[str]] = None
+    rows: List[_Row]
+    total: int
+
+
+@sdk_endpoints
+class _Stats(BaseSDK):
+    def _get_weekly_summary_config(
+        self,
+        *,
+        limit: Optional[int] = 10,
+        offset: Optional[int] = 0,
+        page: Optional[int] = 1,
+    ) -> EndpointConfig:
+        """Get weekly stats."""
+        return EndpointConfig(
+            method="GET",
+            path="/stats",
+            operation_id="getStats",
+            request=_Request(limit=limit, offset=offset, page=page),
+            response_type=_Response,
+            error_status_codes=["4XX", "5XX"],
+        )
+
+    def _get_leaders_config(self, *, season: int) -> EndpointConfig:
+        """Not paginated."""
+        raise NotImplementedError
+
+
+class _League:
+    """Fake stats API over ``total`` ranked rows."""
+
+    def __init__(self, total: int):
+        self.total = total
+        self.requests: List[httpx.Request] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params["offset"])
+        rows = [{"rank": i} for i in range(offset, min(offset + limit, self.total))]
+        return httpx.Response(
+            200,
+            json={"limit": limit, "offset": offset, "rows": rows, "total": self.total},
+        )
+
+
+def _make_stats(handler) -> _Stats:
+    transport = httpx.MockTransport(handler)
+    config = SDKConfiguration(
+        client=httpx.Client(transport=transport),
+        client_supplied=False,
+        async_client=httpx.AsyncClient(transport=transport),
+        async_client_supplied=False,
+        debug_logger=NoOpLogger(),
+        server_url="https://example.com",
+    )
+    config._hooks = SDKHooks()
+    return _Stats(sdk_config=config)
+
+
+@pytest.mark.unit
+class TestGeneration:
+    def test_iterators_generated_for_limit_offset_endpoints(self):
+        assert hasattr(_Stats, "iter_weekly_summary")
+        assert hasattr(_Stats, "aiter_weekly_summary")
+
+    def test_no_iterators_without_pagination_params(self):
+        assert not hasattr(_Stats, "iter_leaders")
+        assert not is_paginated(_Stats._get_leaders_config)
+
+    def test_aiter_returns_async_generator(self):
+        stats = _make_stats(_League(0))
+        agen = stats.aiter_weekly_summary()
+        assert inspect.isasyncgen(agen)
+
+    def test_real_stats_endpoints_get_iterators(self):
+        from griddy.nfl.endpoints.pro.stats.fantasy import Fantasy
+        from griddy.nfl.endpoints.pro.stats.passing import PlayerPassingStats
+        from griddy.nfl.endpoints.pro.stats.team_offense import TeamOffenseStats
+
+        assert hasattr(PlayerPassingStats, "iter_weekly_summary")
+        assert hasattr(Fantasy, "aiter_stats_by_season")
+        assert hasattr(TeamOffenseStats, "iter_season_overview")
+
+
+@pytest.mark.unit
+class TestRowsField:
+    def test_first_list_of_models_field(self):
+        assert rows_field(_Response) == "rows"
+
+    def test_real_responses(self):
+        from griddy.nfl import models
+
+        assert rows_field(models.PassingStatsResponse) == "passers"
+        assert rows_field(models.FantasyStatsResponse) == "players"
+        assert rows_field(models.TeamDefenseStatsResponse) == "defense"
+
+    def test_rejects_model_without_rows(self):
+        with pytest.raises(TypeError):
+            rows_field(_Row)
+
+
+@pytest.mark.unit
+class TestIterRows:
+    def test_walks_all_pages_in_order(self):
+        league = _League(95)
+        stats = _make_stats(league)
+        ranks = [row.rank for row in stats.iter_weekly_summary(limit=10)]
+        assert ranks == list(range(95))
+        assert len(league.requests) == 10
+
+    def test_page_numbers_follow_offsets(self):
+        league = _League(30)
+        list(_make_stats(league).iter_weekly_summary(limit=10, prefetch=1))
+        pages = [
+            (int(r.url.params["offset"]), int(r.url.params["page"]))
+            for r in league.requests
+        ]
+        assert pages == [(0, 1), (10, 2), (20, 3)]
+
+    def test_single_page(self):
+        league = _League(5)
+        assert len(list(_make_stats(league).iter_weekly_summary())) == 5
+        assert len(league.requests) == 1
+
+    def test_starts_from_given_offset(self):
+        league = _League(25)
+        ranks = [r.rank for r in _make_stats(league).iter_weekly_summary(offset=20)]
+        assert ranks == list(range(20, 25))
+
+    def test_early_exit_stops_fetching(self):
+        league = _League(1000)
+        rows = _make_stats(league).iter_weekly_summary(limit=10, prefetch=2)
+        for _ in range(15):
+            next(rows)
+        rows.close()
+        assert len(league.requests) <= 5
+
+    def test_rejects_invalid_prefetch(self):
+        with pytest.raises(ValueError):
+            next(_make_stats(_League(1)).iter_weekly_summary(prefetch=0))
+
+    @pytest.mark.asyncio
+    async def test_async_walks_all_pages(self):
+        league = _League(42)
+        stats = _make_stats(league)
+        ranks = [row.rank async for row in stats.aiter_weekly_summary(limit=5)]
+        assert ranks == list(range(42))
+        assert len(league.requests) == 9
+
+    @pytest.mark.asyncio
+    async def test_async_early_exit_cancels_prefetch(self):
+        league = _League(1000)
+        rows = _make_stats(league).aiter_weekly_summary(limit=10, prefetch=3)
+        async for row in rows:
+            if row.rank == 12:
+                break
+        await rows.aclose()
+        assert len(league.requests) <= 5
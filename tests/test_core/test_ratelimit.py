@@ -0,0 +1,162 @@
+"""Tests for griddy.core.ratelimit and its BaseSDK integration."""
+
+import asyncio
+import time
+from unittest.mock import Mock
+
+import httpx
+import pytest
+
+from griddy.core.basesdk import BaseSDK
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.hooks.types import HookContext
+from griddy.core.ratelimit import RateLimit, RateLimiter, TokenBucket
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.utils.logger import Logger
+
+
+class _FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.unit
+class TestRateLimit:
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            RateLimit(rate=0)
+
+    def test_rejects_zero_burst(self):
+        with pytest.raises(ValueError):
+            RateLimit(rate=1, burst=0)
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    def test_burst_is_free(self):
+        bucket = TokenBucket(RateLimit(rate=1, burst=3), clock=_FakeClock())
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_waiters_get_successive_slots(self):
+        bucket = TokenBucket(RateLimit(rate=2, burst=1), clock=_FakeClock())
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == 0.5
+        assert bucket.reserve() == 1.0
+
+    def test_refills_over_time(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(RateLimit(rate=10, burst=2), clock=clock)
+        bucket.reserve()
+        bucket.reserve()
+        clock.now += 0.1
+        assert bucket.reserve() == 0.0
+
+    def test_refill_capped_at_burst(self):
+        clock = _FakeClock()
+        bucket = TokenBucket(RateLimit(rate=10, burst=2), clock=clock)
+        clock.now += 100
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, pytest.approx(0.1)]
+
+    @pytest.mark.asyncio
+    async def test_async_waiters_queue(self):
+        bucket = TokenBucket(RateLimit(rate=50, burst=1))
+        start = time.monotonic()
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(5)))
+        assert time.monotonic() - start >= 0.07
+
+
+@pytest.mark.unit
+class TestRateLimiter:
+    def test_unlisted_host_unthrottled(self):
+        assert RateLimiter({"a.com": (1, 1)}).bucket_for("b.com") is None
+
+    def test_default_limit(self):
+        limiter = RateLimiter(default=RateLimit(rate=1))
+        assert limiter.bucket_for("b.com").limit == RateLimit(rate=1)
+
+    def test_tuple_limits(self):
+        limiter = RateLimiter({"a.com": (5, 10)})
+        assert limiter.bucket_for("a.com").limit == RateLimit(rate=5, burst=10)
+
+    def test_exact_host_beats_pattern(self):
+        limiter = RateLimiter({"*.nfl.com": (1, 1), "pro.nfl.com": (5, 5)})
+        assert limiter.bucket_for("pro.nfl.com").limit.rate == 5
+        assert limiter.bucket_for("api.nfl.com").limit.rate == 1
+
+    def test_bucket_per_host(self):
+        limiter = RateLimiter({"*.nfl.com": (1, 1)})
+        assert limiter.bucket_for("a.nfl.com") is limiter.bucket_for("a.nfl.com")
+        assert limiter.bucket_for("a.nfl.com") is not limiter.bucket_for("b.nfl.com")
+
+
+# ---------------------------------------------------------------------------
+# BaseSDK integration
+# ---------------------------------------------------------------------------
+
+
+class _RecordingLimiter(RateLimiter):
+    def __init__(self):
+        super().__init__()
+        self.hosts = []
+
+    def acquire(self, host):
+        self.hosts.append(("sync", host))
+
+    async def acquire_async(self, host):
+        self.hosts.append(("async", host))
+
+
+def _make_sdk(rate_limiter, status=200):
+    transport = httpx.MockTransport(lambda request: httpx.Response(status))
+    config = SDKConfiguration(
+        client=httpx.Client(transport=transport),
+        client_supplied=False,
+        async_client=httpx.AsyncClient(transport=transport),
+        async_client_supplied=False,
+        debug_logger=Mock(spec=Logger),
+        rate_limiter=rate_limiter,
+    )
+    config._hooks = SDKHooks()
+    return BaseSDK(sdk_config=config)
+
+
+def _hook_ctx():
+    return HookContext(
+        config=None,
+        base_url="https://pro.nfl.com",
+        operation_id="op",
+        oauth2_scopes=None,
+        security_source=None,
+    )
+
+
+@pytest.mark.unit
+class TestDoRequestRateLimiting:
+    def test_sync_acquires_for_request_host(self):
+        limiter = _RecordingLimiter()
+        sdk = _make_sdk(limiter)
+        sdk.do_request(_hook_ctx(), httpx.Request("GET", "https://pro.nfl.com/x"), [])
+        assert limiter.hosts == [("sync", "pro.nfl.com")]
+
+    @pytest.mark.asyncio
+    async def test_async_acquires_for_request_host(self):
+        limiter = _RecordingLimiter()
+        sdk = _make_sdk(limiter)
+        await sdk.do_request_async(
+            _hook_ctx(), httpx.Request("GET", "https://api.nfl.com/x"), []
+        )
+        assert limiter.hosts == [("async", "api.nfl.com")]
+
+    def test_no_limiter_configured(self):
+        sdk = _make_sdk(None)
+        res = sdk.do_request(_hook_ctx(), httpx.Request("GET", "https://a.com"), [])
+        assert res.status_code == 200
+
+    def test_sub_sdks_share_limiter(self):
+        limiter = RateLimiter({"pro.nfl.com": (1, 1)})
+        parent = _make_sdk(limiter)
+        child = BaseSDK(parent.sdk_configuration, parent_ref=parent)
+        assert child.sdk_configuration.rate_limiter is limiter
@@ -33,6 +33,7 @@ class TestSDKConfiguration:
         assert config.user_agent == "griddy-sdk-python"
         assert config.retry_config == UNSET
         assert config.timeout_ms is None
+        assert config.retry_budget is None
 
     def test_get_server_details_with_url(self, mock_logger):
         config = SDKConfiguration(
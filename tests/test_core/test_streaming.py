@@ -0,0 +1,209 @@
+"""Tests for griddy.core.streaming and the generated streaming iterators."""
+
+import json
+from typing import List, Optional
+
+import httpx
+import pydantic
+import pytest
+from typing_extensions import Annotated
+
+from griddy.core.basesdk import BaseSDK, EndpointConfig
+from griddy.core.decorators import sdk_endpoints
+from griddy.core.errors import DefaultSDKError
+from griddy.core.hooks.sdkhooks import SDKHooks
+from griddy.core.sdkconfiguration import SDKConfiguration
+from griddy.core.streaming import JsonItemScanner, stream_rows, streamed_rows
+from griddy.core.types import BaseModel
+from griddy.core.utils.logger import NoOpLogger
+
+_BODY = {
+    "game": {"id": "g1", "plays": [{"playId": -1}]},
+    "drives": [
+        {
+            "result": "Punt",
+            "plays": [
+                {"playId": 1, "description": 'He said "go" {not a brace} [ok]\\'},
+                {"playId": 2, "players": [{"name": "A"}, {"name": "B"}]},
+            ],
+        },
+        {"plays": None},
+        {"plays": []},
+        {"plays": [{"playId": 3, "description": "café — \\u00e9"}]},
+    ],
+    "trailer": [1, 2, {"plays": [{"playId": -2}]}],
+}
+
+
+def _scan(body: bytes, keys, chunk_size: int) -> List[dict]:
+    scanner = JsonItemScanner(keys)
+    items = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(scanner.feed(body[i : i + chunk_size]))
+    scanner.close()
+    return items
+
+
+@pytest.mark.unit
+class TestJsonItemScanner:
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64, 1 << 20])
+    def test_nested_items_at_any_chunk_size(self, chunk_size):
+        body = json.dumps(_BODY, ensure_ascii=False).encode()
+        expected = [play for drive in _BODY["drives"] for play in drive["plays"] or ()]
+        assert _scan(body, ("drives", "plays"), chunk_size) == expected
+
+    def test_top_level_array(self):
+        body = json.dumps(_BODY).encode()
+        assert _scan(body, ("drives",), 5) == _BODY["drives"]
+
+    def test_missing_key_yields_nothing(self):
+        assert _scan(json.dumps(_BODY).encode(), ("plays",), 3) == []
+
+    def test_whitespace_between_tokens(self):
+        body = json.dumps(_BODY, indent=4).encode()
+        assert len(_scan(body, ("drives", "plays"), 3)) == 3
+
+    def test_buffer_holds_only_current_item(self):
+        scanner = JsonItemScanner(("plays",))
+        scanner.feed(b'{"plays": [' + b'{"a": 1},' * 1000)
+        scanner.feed(b'{"a": ')
+        assert len(scanner._text) < 16
+
+    def test_split_multibyte_character(self):
+        body = json.dumps({"plays": [{"name": "Ré"}]}, ensure_ascii=False).encode()
+        split = body.index("é".encode()) + 1
+        scanner = JsonItemScanner(("plays",))
+        assert scanner.feed(body[:split]) == []
+        assert scanner.feed(body[split:]) == [{"name": "Ré"}]
+        scanner.close()
+
+    def test_truncated_body_raises(self):
+        scanner = JsonItemScanner(("plays",))
+        scanner.feed(b'{"plays": [{"a": 1}, {"a"')
+        with pytest.raises(ValueError, match="truncated"):
+            scanner.close()
+
+
+class _Play(BaseModel):
+    play_id: Annotated[int, pydantic.Field(alias="playId")]
+    description: Optional[str] = None
+
+
+class _Drive(BaseModel):
+    plays: Optional[List[_Play]] = None
+
+
+class _PlayByPlay(BaseModel):
+    drives: Optional[List[_Drive]] = None
+
+
+@sdk_endpoints
+class _Games(BaseSDK):
+    @stream_rows("drives.plays")
+    def _get_play_by_play_config(self, *, game_id: str) -> EndpointConfig:
+        """Get play-by-play."""
+        return EndpointConfig(
+            method="GET",
+            path=f"/games/{game_id}/playbyplay",
+            operation_id="getPlayByPlay",
+            request=None,
+            response_type=_PlayByPlay,
+            error_status_codes=["4XX", "5XX"],
+            request_has_query_params=False,
+        )
+
+
+class _ChunkedBody(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, body: bytes, chunk_size: int = 10):
+        self.chunks = [
+            body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+        ]
+        self.closed = False
+
+    def __iter__(self):
+        yield from self.chunks
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            yield chunk
+
+    def close(self):
+        self.closed = True
+
+    async def aclose(self):
+        self.closed = True
+
+
+def _make_sdk(status: int = 200, body: Optional[bytes] = None):
+    stream = _ChunkedBody(json.dumps(_BODY).encode() if body is None else body)
+
+    def handler(request):
+        return httpx.Response(
+            status, headers={"content-type": "application/json"}, stream=stream
+        )
+
+    async def handle_async(request):
+        return handler(request)
+
+    config = SDKConfiguration(
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+        client_supplied=False,
+        async_client=httpx.AsyncClient(transport=httpx.MockTransport(handle_async)),
+        async_client_supplied=False,
+        debug_logger=NoOpLogger(),
+        server_url="https://example.com",
+    )
+    config._hooks = SDKHooks()
+    return _Games(sdk_config=config), stream
+
+
+@pytest.mark.unit
+class TestStreamedEndpoints:
+    def test_marker(self):
+        assert streamed_rows(_Games._get_play_by_play_config) == "drives.plays"
+
+    def test_iter_yields_validated_rows(self):
+        sdk, stream = _make_sdk()
+        plays = list(sdk.iter_play_by_play(game_id="g1"))
+        assert [type(play) for play in plays] == [_Play] * 3
+        assert [play.play_id for play in plays] == [1, 2, 3]
+        assert stream.closed
+
+    def test_early_break_closes_response(self):
+        sdk, stream = _make_sdk()
+        for play in sdk.iter_play_by_play(game_id="g1"):
+            break
+        assert play.play_id == 1
+        assert stream.closed
+
+    @pytest.mark.asyncio
+    async def test_aiter_yields_validated_rows(self):
+        sdk, stream = _make_sdk()
+        plays = [play async for play in sdk.aiter_play_by_play(game_id="g1")]
+        assert [play.play_id for play in plays] == [1, 2, 3]
+        assert stream.closed
+
+    def test_error_status_raises(self):
+        sdk, _ = _make_sdk(status=404, body=b'{"error": "missing"}')
+        with pytest.raises(DefaultSDKError) as excinfo:
+            list(sdk.iter_play_by_play(game_id="g1"))
+        assert "missing" in excinfo.value.body
+
+    @pytest.mark.asyncio
+    async def test_async_error_status_raises(self):
+        sdk, _ = _make_sdk(status=500, body=b"boom")
+        with pytest.raises(DefaultSDKError):
+            [play async for play in sdk.aiter_play_by_play(game_id="g1")]
+
+    def test_invalid_row_raises(self):
+        sdk, _ = _make_sdk(body=b'{"drives": [{"plays": [{"playId": "x"}]}]}')
+        with pytest.raises(pydantic.ValidationError):
+            list(sdk.iter_play_by_play(game_id="g1"))
+
+    def test_nfl_endpoints_generated(self):
+        from griddy.nfl.endpoints.pro.content import Content
+        from griddy.nfl.endpoints.regular.football.games import Games
+
+        for cls, name in ((Games, "play_by_play"), (Content, "filmroom_plays")):
+            assert callable(getattr(cls, f"iter_{name}"))
+            assert callable(getattr(cls, f"aiter_{name}"))
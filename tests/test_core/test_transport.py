@@ -0,0 +1,168 @@
+"""Tests for griddy.core.transport and its BaseGriddySDK integration."""
+
+import importlib.util
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from griddy.core.transport import ConnectionPool, HttpOptions
+from griddy.draftbuzz import GriddyDraftBuzz
+from griddy.nfl import GriddyNFL
+from griddy.pfr import GriddyPFR
+
+from .test_base_griddy_sdk import ConcreteTestSDK
+
+_HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+def _pool_of(client):
+    # httpx.Client -> HTTPTransport -> httpcore.ConnectionPool
+    transport = client._transport
+    transport = getattr(transport, "_transport", transport)
+    return transport._pool
+
+
+@pytest.mark.unit
+class TestHttpOptions:
+    def test_limits(self):
+        options = HttpOptions(
+            max_connections=200, max_keepalive_connections=80, keepalive_expiry=60
+        )
+        assert options.limits == httpx.Limits(
+            max_connections=200, max_keepalive_connections=80, keepalive_expiry=60
+        )
+
+    def test_accept_encoding_lists_decodable_codings_best_first(self):
+        codings = HttpOptions().accept_encoding.split(", ")
+        assert "gzip" in codings
+        assert codings.index("gzip") < codings.index("deflate")
+        if "br" in codings:
+            assert codings[0] == "br"
+
+    def test_accept_encoding_follows_installed_decoders(self, monkeypatch):
+        from griddy.core import transport
+
+        transport._decodable_encodings.cache_clear()
+        monkeypatch.setattr(transport, "find_spec", lambda name: None)
+        try:
+            assert HttpOptions().accept_encoding == "gzip, deflate"
+        finally:
+            transport._decodable_encodings.cache_clear()
+
+    def test_compression_disabled(self):
+        assert HttpOptions(compression=False).accept_encoding == "identity"
+
+    def test_client_sends_accept_encoding(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers["accept-encoding"])
+            return httpx.Response(200)
+
+        options = HttpOptions(compression=False)
+        with options.create_client(httpx.MockTransport(handler)) as client:
+            client.get("https://example.com")
+        assert seen == ["identity"]
+
+    def test_client_uses_pool_limits(self):
+        with HttpOptions(max_connections=7).create_client() as client:
+            assert _pool_of(client)._max_connections == 7
+
+    @pytest.mark.skipif(_HAS_H2, reason="h2 is installed")
+    def test_http2_requires_h2(self):
+        with pytest.raises(ImportError):
+            HttpOptions(http2=True).create_client()
+
+
+@pytest.mark.unit
+class TestConnectionPool:
+    def test_clients_share_transport(self):
+        with ConnectionPool() as pool:
+            first, second = pool.create_client(), pool.create_client()
+            assert _pool_of(first) is _pool_of(second)
+
+    def test_closing_client_leaves_pool_open(self):
+        requests = []
+        pool = ConnectionPool()
+        pool._transport = httpx.MockTransport(
+            lambda request: requests.append(request) or httpx.Response(200)
+        )
+
+        pool.create_client().close()
+        with pool.create_client() as client:
+            assert client.get("https://example.com").status_code == 200
+        assert len(requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_clients_share_transport(self):
+        async with ConnectionPool() as pool:
+            first = pool.create_async_client()
+            second = pool.create_async_client()
+            assert _pool_of(first) is _pool_of(second)
+            await first.aclose()
+            await second.aclose()
+
+    def test_close_leaves_async_transport_to_aclose(self):
+        pool = ConnectionPool()
+        pool._async_transport = Mock()
+        with pool:
+            pass
+        pool._async_transport.aclose.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_both_transports(self):
+        pool = ConnectionPool()
+        pool._transport = Mock()
+        pool._async_transport = Mock(aclose=AsyncMock())
+        async with pool:
+            pass
+        pool._transport.close.assert_called_once_with()
+        pool._async_transport.aclose.assert_awaited_once_with()
+
+
+@pytest.mark.unit
+class TestSDKIntegration:
+    def test_default_clients_use_default_options(self):
+        sdk = ConcreteTestSDK()
+        defaults = HttpOptions()
+        pool = _pool_of(sdk.sdk_configuration.client)
+        assert pool._max_connections == defaults.max_connections
+        assert pool._max_keepalive_connections == defaults.max_keepalive_connections
+        assert (
+            sdk.sdk_configuration.client.headers["accept-encoding"]
+            == defaults.accept_encoding
+        )
+        sdk.close()
+
+    def test_http_options(self):
+        sdk = ConcreteTestSDK(http_options=HttpOptions(max_connections=3))
+        assert _pool_of(sdk.sdk_configuration.client)._max_connections == 3
+        assert _pool_of(sdk.sdk_configuration.async_client)._max_connections == 3
+        sdk.close()
+
+    def test_rejects_options_and_pool_together(self):
+        with ConnectionPool() as pool:
+            with pytest.raises(ValueError, match="connection_pool"):
+                ConcreteTestSDK(http_options=HttpOptions(), connection_pool=pool)
+
+    def test_pool_shared_across_providers(self, nfl_auth_info_valid):
+        with ConnectionPool() as pool:
+            sdks = [
+                GriddyNFL(nfl_auth=nfl_auth_info_valid, connection_pool=pool),
+                GriddyPFR(
+                    connection_pool=pool,
+                    scraping_backend=Mock(),
+                    async_scraping_backend=Mock(),
+                ),
+                GriddyDraftBuzz(
+                    connection_pool=pool,
+                    scraping_backend=Mock(),
+                    async_scraping_backend=Mock(),
+                ),
+            ]
+            pools = {id(_pool_of(sdk.sdk_configuration.client)) for sdk in sdks}
+            assert pools == {id(pool._transport._pool)}
+            for sdk in sdks:
+                assert sdk.sdk_configuration.client_supplied is False
+                sdk.close()
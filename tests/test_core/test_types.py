@@ -1,11 +1,18 @@
 """Tests for griddy.core.types and griddy.core.utils.logger modules."""
 
+from typing import Optional
 from unittest.mock import patch
 
+import pydantic
 import pytest
+from typing_extensions import Annotated
 
-from griddy.core.types import UNSET, BaseModel
-from griddy.core.types.basemodel import UNSET_SENTINEL, Unset
+from griddy.core.types import UNSET, BaseModel, Nullable, OptionalNullable
+from griddy.core.types.basemodel import (
+    UNSET_SENTINEL,
+    Unset,
+    _serialization_plan,
+)
 
 
 @pytest.mark.unit
@@ -56,6 +63,39 @@ class TestBaseModel:
         assert m.model_type == "test"
 
 
+class _Serialized(BaseModel):
+    required: Nullable[str]
+    team_id: Annotated[Optional[str], pydantic.Field(alias="teamId")] = None
+    draft_club: Annotated[OptionalNullable[str], pydantic.Field(alias="draftClub")] = (
+        UNSET
+    )
+
+
+@pytest.mark.unit
+class TestSerializeModel:
+    def test_values_keyed_by_alias(self):
+        m = _Serialized(required="a", team_id="NE", draft_club="BUF")
+        assert m.model_dump() == {"required": "a", "teamId": "NE", "draftClub": "BUF"}
+
+    def test_none_kept_only_when_required_or_set_nullable(self):
+        assert _Serialized(required=None).model_dump() == {"required": None}
+        assert _Serialized(
+            required=None, team_id=None, draft_club=None
+        ).model_dump() == {
+            "required": None,
+            "draftClub": None,
+        }
+
+    def test_plan_computed_once_per_class(self):
+        plan = _serialization_plan(_Serialized)
+        assert _serialization_plan(_Serialized) is plan
+        assert plan == (
+            ("required", "required", True, False),
+            ("team_id", "teamId", False, False),
+            ("draft_club", "draftClub", False, True),
+        )
+
+
 @pytest.mark.unit
 class TestGetDefaultLogger:
     def test_returns_noop_logger_by_default(self):
@@ -0,0 +1,55 @@
+"""Tests for griddy.core.utils.queryparams."""
+
+import pytest
+
+from griddy.core.utils import queryparams
+from griddy.core.utils.queryparams import get_query_params
+from griddy.nfl.models.requests.get_play_by_play_op import GetPlayByPlayRequest
+from griddy.nfl.models.requests.get_player_passing_stats_by_week_op import (
+    GetPlayerPassingStatsByWeekRequest,
+)
+
+
+def _passing_request(**kwargs):
+    return GetPlayerPassingStatsByWeekRequest(
+        season=2025,
+        season_type="REG",
+        week="WEEK_1",
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestGetQueryParams:
+    def test_uses_aliases_and_skips_unset(self):
+        params = get_query_params(_passing_request(team_offense=["a", "b"]))
+        assert params["season"] == ["2025"]
+        assert params["seasonType"] == ["REG"]
+        assert params["week"] == ["WEEK_1"]
+        assert params["qualifiedPasser"] == ["false"]
+        assert params["teamOffense"] == ["a", "b"]
+        assert "sortKey" not in params
+
+    def test_skips_path_params(self):
+        params = get_query_params(GetPlayByPlayRequest(game_id="g1"))
+        assert params == {
+            "includePenalties": ["true"],
+            "includeFormations": ["false"],
+        }
+
+    def test_none_request(self):
+        assert get_query_params(None) == {}
+
+
+@pytest.mark.unit
+class TestQueryParamPlan:
+    def test_plan_is_computed_once_per_class(self):
+        plan = queryparams._query_param_plan(GetPlayerPassingStatsByWeekRequest)
+        assert queryparams._query_param_plan(GetPlayerPassingStatsByWeekRequest) is plan
+
+    def test_plan_lists_only_query_fields(self):
+        plan = queryparams._query_param_plan(GetPlayByPlayRequest)
+        assert [(name, key) for name, key, _, _ in plan] == [
+            ("include_penalties", "includePenalties"),
+            ("include_formations", "includeFormations"),
+        ]
@@ -0,0 +1,207 @@
+"""Tests for Retry-After handling, jitter and retry budgets in core retries."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from griddy.core.utils.retries import (
+    RetryBudget,
+    TemporaryError,
+    _next_delay,
+    parse_retry_after,
+    retry_with_backoff,
+    retry_with_backoff_async,
+)
+
+
+class _FakeClock:
+    def __init__(self, now: float = 0.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _response(status, retry_after=None):
+    headers = {} if retry_after is None else {"Retry-After": retry_after}
+    return httpx.Response(status, headers=headers)
+
+
+@pytest.mark.unit
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert parse_retry_after(_response(429, "7")) == 7.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(_response(503, format_datetime(when, usegmt=True)))
+        assert 28 <= delay <= 30
+
+    def test_past_date_is_zero(self):
+        when = datetime.now(timezone.utc) - timedelta(seconds=30)
+        assert (
+            parse_retry_after(_response(503, format_datetime(when, usegmt=True))) == 0
+        )
+
+    def test_ignored_for_other_statuses(self):
+        assert parse_retry_after(_response(500, "7")) is None
+
+    def test_missing_or_malformed(self):
+        assert parse_retry_after(_response(429)) is None
+        assert parse_retry_after(_response(429, "soon")) is None
+
+
+@pytest.mark.unit
+class TestNextDelay:
+    def test_retry_after_wins(self):
+        error = TemporaryError(_response(429, "12"))
+        assert _next_delay(error, 0.5, 500, 1000) == 12.0
+
+    def test_jitter_bounds(self):
+        for previous in (0.5, 0.75, 4.0):
+            for _ in range(100):
+                delay = _next_delay(RuntimeError(), previous, 500, 60000)
+                assert 0.5 <= delay <= previous * 3
+
+    def test_capped_at_max_interval(self):
+        assert _next_delay(RuntimeError(), 100.0, 500, 2000) <= 2.0
+
+
+@pytest.mark.unit
+class TestRetryBudget:
+    def test_floor_allows_min_retries(self):
+        budget = RetryBudget(ratio=0.1, min_retries=2, clock=_FakeClock())
+        assert [budget.try_spend() for _ in range(3)] == [True, True, False]
+
+    def test_ratio_of_requests(self):
+        budget = RetryBudget(ratio=0.1, min_retries=0, clock=_FakeClock())
+        for _ in range(50):
+            budget.record_request()
+        assert sum(budget.try_spend() for _ in range(10)) == 5
+
+    def test_window_slides(self):
+        clock = _FakeClock()
+        budget = RetryBudget(ratio=0.0, window=10, min_retries=1, clock=clock)
+        assert budget.try_spend()
+        assert not budget.try_spend()
+        clock.now += 11
+        assert budget.try_spend()
+
+
+@pytest.mark.unit
+class TestRetryWithBackoff:
+    def test_sleeps_for_retry_after(self):
+        responses = iter([_response(429, "3"), _response(200)])
+
+        def func():
+            res = next(responses)
+            if res.status_code == 429:
+                raise TemporaryError(res)
+            return res
+
+        with patch("griddy.core.utils.retries.time.sleep") as sleep:
+            result = retry_with_backoff(func, max_elapsed_time=60000)
+        assert result.status_code == 200
+        sleep.assert_called_once_with(3.0)
+
+    def test_retry_after_beyond_deadline_returns_response(self):
+        res = _response(503, "120")
+
+        def func():
+            raise TemporaryError(res)
+
+        with patch("griddy.core.utils.retries.time.sleep") as sleep:
+            assert retry_with_backoff(func, max_elapsed_time=60000) is res
+        sleep.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "exponent, expected", [(1.5, [1.5, 3.0, 3.0]), (1.0, [1.0, 2.0, 3.0])]
+    )
+    def test_exponent_sets_delay_growth(self, exponent, expected):
+        res = _response(500)
+        attempts = iter(range(len(expected)))
+
+        def func():
+            if next(attempts, None) is None:
+                return _response(200)
+            raise TemporaryError(res)
+
+        with (
+            patch("griddy.core.utils.retries.time.sleep") as sleep,
+            patch(
+                "griddy.core.utils.retries.random.uniform", side_effect=lambda a, b: b
+            ),
+        ):
+            retry_with_backoff(
+                func, initial_interval=500, max_interval=3000, exponent=exponent
+            )
+        assert [call.args[0] for call in sleep.call_args_list] == expected
+
+    def test_delay_bound_follows_previous_delay(self):
+        res = _response(500)
+        attempts = iter(range(6))
+
+        def func():
+            if next(attempts, None) is None:
+                return _response(200)
+            raise TemporaryError(res)
+
+        with (
+            patch("griddy.core.utils.retries.time.sleep") as sleep,
+            patch(
+                "griddy.core.utils.retries.random.uniform",
+                side_effect=[0.9, 0.6, 1.7, 0.5, 1.2, 2.0],
+            ) as uniform,
+        ):
+            retry_with_backoff(func, initial_interval=500, max_interval=60000)
+
+        sleeps = [call.args[0] for call in sleep.call_args_list]
+        bounds = [call.args[1] for call in uniform.call_args_list]
+        assert sleeps == [0.9, 0.6, 1.7, 0.5, 1.2, 2.0]
+        assert bounds == pytest.approx([1.5] + [3 * s for s in sleeps[:-1]])
+
+    def test_exhausted_budget_stops_retrying(self):
+        res = _response(500)
+        calls = []
+
+        def func():
+            calls.append(1)
+            raise TemporaryError(res)
+
+        budget = RetryBudget(ratio=0.0, min_retries=2)
+        with patch("griddy.core.utils.retries.time.sleep"):
+            assert retry_with_backoff(func, budget=budget) is res
+        assert len(calls) == 3
+
+    def test_budget_exhaustion_reraises_errors(self):
+        def func():
+            raise httpx.ConnectError("down")
+
+        budget = RetryBudget(ratio=0.0, min_retries=0)
+        with pytest.raises(httpx.ConnectError):
+            retry_with_backoff(func, budget=budget)
+
+    def test_records_requests(self):
+        budget = RetryBudget(ratio=0.5, min_retries=0)
+        retry_with_backoff(lambda: _response(200), budget=budget)
+        retry_with_backoff(lambda: _response(200), budget=budget)
+        assert budget.try_spend()
+        assert not budget.try_spend()
+
+    @pytest.mark.asyncio
+    async def test_async_honours_retry_after(self):
+        responses = iter([_response(503, "2"), _response(200)])
+
+        async def func():
+            res = next(responses)
+            if res.status_code == 503:
+                raise TemporaryError(res)
+            return res
+
+        with patch("griddy.core.utils.retries.asyncio.sleep") as sleep:
+            result = await retry_with_backoff_async(func, max_elapsed_time=60000)
+        assert result.status_code == 200
+        sleep.assert_awaited_once_with(2.0)
@@ -0,0 +1,149 @@
+"""Tests for the cached (un)marshallers in griddy.core.utils.serializers."""
+
+from typing import Dict, List, Optional
+
+import pydantic
+import pytest
+from typing_extensions import Annotated
+
+from griddy.core.types import BaseModel
+from griddy.core.utils import FieldMetadata, QueryParamMetadata, serializers
+from griddy.core.utils.serializers import (
+    get_type_adapter,
+    marshal_json,
+    unmarshal,
+    unmarshal_json,
+    warmup,
+)
+
+
+class _Player(BaseModel):
+    display_name: Annotated[Optional[str], pydantic.Field(alias="displayName")] = None
+    jersey: Optional[int] = None
+
+
+@pytest.mark.unit
+class TestGetTypeAdapter:
+    def test_cached_per_type(self):
+        assert get_type_adapter(_Player) is get_type_adapter(_Player)
+        assert get_type_adapter(List[_Player]) is get_type_adapter(List[_Player])
+
+    def test_unhashable_type_not_cached(self):
+        unhashable = Annotated[
+            int, FieldMetadata(query=QueryParamMetadata(style="form", explode=True))
+        ]
+        adapter = get_type_adapter(unhashable)
+        assert adapter.validate_python(3) == 3
+
+    def test_arbitrary_types_allowed(self):
+        class Opaque:
+            pass
+
+        value = Opaque()
+        assert unmarshal([value], List[Opaque]) == [value]
+
+
+@pytest.mark.unit
+class TestUnmarshal:
+    def test_model_by_alias(self):
+        player = unmarshal({"displayName": "Tom Brady", "jersey": 12}, _Player)
+        assert player == _Player(display_name="Tom Brady", jersey=12)
+
+    def test_container_of_models(self):
+        result = unmarshal({"a": [{"jersey": "12"}]}, Dict[str, List[_Player]])
+        assert result["a"][0].jersey == 12
+
+    def test_json(self):
+        assert unmarshal_json(b'{"jersey": 87}', _Player).jersey == 87
+
+    def test_validation_error(self):
+        with pytest.raises(pydantic.ValidationError):
+            unmarshal({"jersey": "twelve"}, _Player)
+
+
+@pytest.mark.unit
+class TestMarshalJson:
+    def test_wrapper_model_cached_per_type(self, monkeypatch):
+        built = []
+        build = serializers._build_marshaller
+        monkeypatch.setattr(
+            serializers,
+            "_build_marshaller",
+            lambda typ: built.append(typ) or build(typ),
+        )
+        monkeypatch.setattr(serializers, "_marshallers", {})
+
+        assert marshal_json([1, 2], List[int]) == "[1,2]"
+        assert marshal_json([3], List[int]) == "[3]"
+        assert built == [List[int]]
+
+    def test_none_body_is_empty(self):
+        assert marshal_json(None, Optional[int]) == ""
+
+    def test_nfl_serializers_use_core_functions(self):
+        from griddy.nfl.utils import serializers as nfl_serializers
+
+        assert nfl_serializers.unmarshal is unmarshal
+        assert nfl_serializers.marshal_json is marshal_json
+
+
+@pytest.mark.unit
+class TestWarmup:
+    def test_counts_newly_compiled_types(self):
+        class _Fresh(BaseModel):
+            x: int
+
+        assert warmup([_Fresh, List[_Fresh]]) == 2
+        assert warmup([_Fresh]) == 0
+        assert _Fresh in serializers._type_adapters
+
+    @pytest.mark.filterwarnings("ignore:Skipping griddy.nfl.models.responses")
+    def test_nfl_warmup_covers_responses(self):
+        from griddy.nfl import models
+        from griddy.nfl import warmup as nfl_warmup
+        from griddy.nfl._warmup import response_types
+
+        types = response_types()
+        assert models.SeasonWeeksResponse in types
+        assert models.BoxscoreResponse in types
+        nfl_warmup()
+        assert all(typ in serializers._type_adapters for typ in types)
+
+    @pytest.mark.filterwarnings("ignore:Skipping griddy.nfl.models")
+    def test_nfl_warmup_builds_requests(self):
+        from griddy.nfl import models
+        from griddy.nfl import warmup as nfl_warmup
+        from griddy.nfl._warmup import request_types
+
+        types = request_types()
+        assert models.GetPlayerPassingStatsByWeekRequest in types
+        nfl_warmup()
+        assert all(typ.__pydantic_complete__ for typ in types)
+        assert nfl_warmup() == 0
+
+    def test_nfl_warmup_skips_broken_models(self, monkeypatch):
+        from griddy.nfl import _warmup
+        from griddy.nfl.types import BaseModel as NFLBaseModel
+
+        class _Good(NFLBaseModel):
+            x: int
+
+        class _Broken(NFLBaseModel):
+            x: "_Undefined"  # noqa: F821
+
+        monkeypatch.setattr(_warmup, "response_types", lambda: [])
+        monkeypatch.setattr(_warmup, "request_types", lambda: [_Broken, _Good])
+        with pytest.warns(RuntimeWarning, match="Skipping .*_Broken"):
+            assert _warmup.warmup() == 1
+        assert _Good.__pydantic_complete__
+
+    @pytest.mark.filterwarnings("ignore:Skipping griddy.nfl.models")
+    def test_nfl_warmup_in_background(self):
+        from griddy.nfl import warmup_in_background
+        from griddy.nfl._warmup import response_types
+
+        thread = warmup_in_background()
+        assert thread.daemon
+        thread.join(timeout=60)
+        assert not thread.is_alive()
+        assert all(typ in serializers._type_adapters for typ in response_types())
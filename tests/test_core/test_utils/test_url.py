@@ -2,7 +2,9 @@
 
 import pytest
 
-from griddy.core.utils.url import build_url
+from griddy.core.utils import url
+from griddy.core.utils.url import build_url, generate_url
+from griddy.nfl.models.requests.get_play_by_play_op import GetPlayByPlayRequest
 
 
 @pytest.mark.unit
@@ -34,3 +36,23 @@ class TestBuildUrl:
     def test_no_params(self):
         result = build_url("https://api.nfl.com", "games")
         assert "?" not in result
+
+
+@pytest.mark.unit
+class TestGenerateUrl:
+    def test_interpolates_aliased_path_param(self):
+        result = generate_url(
+            "https://api.nfl.com/",
+            "/football/v2/pbp/{gameId}",
+            GetPlayByPlayRequest(game_id="g1"),
+        )
+        assert result == "https://api.nfl.com/football/v2/pbp/g1"
+
+    def test_none_path_params(self):
+        result = generate_url("https://api.nfl.com", "/games", None)
+        assert result == "https://api.nfl.com/games"
+
+    def test_plan_lists_only_path_fields(self):
+        plan = url._path_param_plan(GetPlayByPlayRequest)
+        assert [(name, key) for name, key, _, _ in plan] == [("game_id", "gameId")]
+        assert url._path_param_plan(GetPlayByPlayRequest) is plan
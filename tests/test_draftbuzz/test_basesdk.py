@@ -1,8 +1,12 @@
 """Tests for griddy.draftbuzz.basesdk module."""
 
+import threading
+
 import httpx
+import pydantic
 import pytest
 
+from griddy.core.pagecache import PageCache
 from griddy.core.utils.logger import get_default_logger
 from griddy.draftbuzz.basesdk import BaseSDK, EndpointConfig
 from griddy.draftbuzz.sdkconfiguration import SDKConfiguration
@@ -80,3 +84,92 @@ class TestBaseSDKBuildUrl:
         )
         url = self.sdk._build_url(endpoint)
         assert url == "https://www.nfldraftbuzz.com"
+
+
+class _StubBackend:
+    def __init__(self):
+        self.calls = []
+
+    def get_page_content(self, url, wait_for_element):
+        self.calls.append(url)
+        return "<html></html>"
+
+
+class _Prospects(pydantic.BaseModel):
+    position: str
+
+
+@pytest.mark.unit
+class TestBaseSDKPageCache:
+    def test_only_valid_pages_are_cached(self, tmp_path):
+        backend = _StubBackend()
+        cache = PageCache(tmp_path)
+        sdk = BaseSDK(
+            sdk_config=_make_config(
+                scraping_backend=backend,
+                async_scraping_backend=object(),
+                page_cache=cache,
+            )
+        )
+        assert sdk.scraper is backend
+
+        config = EndpointConfig(
+            path_template="/positions/QB/1/2020",
+            operation_id="get_prospects",
+            parser=lambda soup: {},
+            response_type=_Prospects,
+        )
+        with pytest.raises(pydantic.ValidationError):
+            sdk._execute_endpoint(config)
+        assert len(cache) == 0
+
+        config.parser = lambda soup: {"position": "QB"}
+        sdk._execute_endpoint(config)
+        sdk._execute_endpoint(config)
+        assert len(backend.calls) == 2
+        assert cache.stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_async_cache_io_runs_off_the_event_loop(self, tmp_path, monkeypatch):
+        class AsyncBackend(_StubBackend):
+            async def get_page_content(self, url, wait_for_element):
+                return super().get_page_content(url, wait_for_element)
+
+        cache = PageCache(tmp_path)
+        threads = []
+        for name in ("get", "set"):
+            method = getattr(cache, name)
+            monkeypatch.setattr(
+                cache,
+                name,
+                lambda *args, _method=method: (
+                    threads.append(threading.get_ident()) or _method(*args)
+                ),
+            )
+        sdk = BaseSDK(
+            sdk_config=_make_config(
+                scraping_backend=object(),
+                async_scraping_backend=AsyncBackend(),
+                page_cache=cache,
+            )
+        )
+        config = EndpointConfig(
+            path_template="/positions/QB/1/2020",
+            operation_id="get_prospects",
+            parser=lambda soup: {"position": "QB"},
+            response_type=_Prospects,
+        )
+
+        await sdk._execute_endpoint_async(config)
+        await sdk._execute_endpoint_async(config)
+        assert len(threads) == 3
+        assert threading.get_ident() not in threads
+
+    def test_no_cache_by_default(self):
+        backend = _StubBackend()
+        sdk = BaseSDK(
+            sdk_config=_make_config(
+                scraping_backend=backend, async_scraping_backend=object()
+            )
+        )
+        assert sdk.scraper is backend
@@ -0,0 +1,93 @@
+"""Conformance of every DraftBuzz parser across HTML tree builders.
+
+Each parser runs against each page fixture under every installed builder
+(see :mod:`griddy.core.htmlparser`) and must produce exactly the output it
+produces under the default ``html.parser``.
+"""
+
+import importlib.util
+import inspect
+
+import pytest
+
+from griddy.core.htmlparser import make_soup
+from griddy.draftbuzz import parsers
+
+from .test_parsers import (
+    PROSPECT_PROFILE_HTML,
+    RANKINGS_HTML,
+    RANKINGS_SINGLE_PAGE_HTML,
+    STATS_HTML_DEFENSE,
+    STATS_HTML_QB,
+)
+
+_RANKINGS_KWARGS = {"position": "QB", "year": 2026, "page": 1}
+
+# (fixture, parser class, method, kwargs)
+_CASES = {
+    "profile": (
+        PROSPECT_PROFILE_HTML,
+        "ProspectProfileParser",
+        "parse_profile",
+        {"position": "QB"},
+    ),
+    "stats_qb": (
+        STATS_HTML_QB,
+        "ProspectProfileParser",
+        "parse_stats",
+        {"position": "QB"},
+    ),
+    "stats_defense": (
+        STATS_HTML_DEFENSE,
+        "ProspectProfileParser",
+        "parse_stats",
+        {"position": "LB"},
+    ),
+    "rankings": (
+        RANKINGS_HTML,
+        "RankingsParser",
+        "parse_position_rankings",
+        _RANKINGS_KWARGS,
+    ),
+    "rankings_single_page": (
+        RANKINGS_SINGLE_PAGE_HTML,
+        "RankingsParser",
+        "parse_position_rankings",
+        _RANKINGS_KWARGS,
+    ),
+}
+
+
+def _engines():
+    engines = []
+    for name in ("lxml",):
+        if importlib.util.find_spec(name) is None:
+            engines.append(
+                pytest.param(name, marks=pytest.mark.skip(f"{name} not installed"))
+            )
+        else:
+            engines.append(name)
+    return engines
+
+
+def _parse(case, engine: str):
+    html, parser_name, method, kwargs = case
+    parser = getattr(parsers, parser_name)()
+    return getattr(parser, method)(make_soup(html, engine), **kwargs)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", _engines())
+@pytest.mark.parametrize("name", list(_CASES))
+def test_parser_output_matches_html_parser(name, engine):
+    case = _CASES[name]
+    assert _parse(case, engine) == _parse(case, "html.parser")
+
+
+@pytest.mark.unit
+def test_every_parse_method_is_covered():
+    covered = {(c[1], c[2]) for c in _CASES.values()}
+    for name in parsers.__all__:
+        for method, _ in inspect.getmembers(getattr(parsers, name), inspect.isfunction):
+            if method.startswith("parse"):
+                assert (name, method) in covered, f"{name}.{method}"
@@ -58,6 +58,18 @@ class TestGriddyDraftBuzzInit:
         )
         assert db.sdk_configuration.server_url == "https://us-east.draftbuzz.com"
 
+    def test_html_parser_defaults_to_process_default(self):
+        db = GriddyDraftBuzz()
+        assert db.sdk_configuration.html_parser is None
+
+    def test_html_parser_is_resolved(self):
+        db = GriddyDraftBuzz(html_parser="html.parser")
+        assert db.sdk_configuration.html_parser == "html.parser"
+
+    def test_unknown_html_parser_raises(self):
+        with pytest.raises(ValueError, match="Unknown HTML parser"):
+            GriddyDraftBuzz(html_parser="html5")
+
     def test_draftbuzz_auth_without_access_token_key(self):
         db = GriddyDraftBuzz(draftbuzz_auth={"refreshToken": "abc"})
         assert db.sdk_configuration.security is None
@@ -0,0 +1,48 @@
+"""Cold-start guards for griddy.nfl.
+
+Each check runs in a fresh interpreter so models built by other tests in this
+process cannot hide a regression.
+"""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+_UNBUILT_RESPONSES = """
+import json
+from griddy.nfl._warmup import response_types
+
+types = response_types()
+print(json.dumps([t.__name__ for t in types if t.__pydantic_complete__]))
+"""
+
+
+def _run(code: str) -> str:
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    )
+    return result.stdout
+
+
+@pytest.mark.unit
+class TestColdStart:
+    def test_importing_models_builds_no_validators(self):
+        built = json.loads(_run(_UNBUILT_RESPONSES))
+        assert built == []
+
+    def test_import_griddy_nfl_stays_lazy(self):
+        modules = json.loads(
+            _run(
+                "import json, sys\n"
+                "import griddy.nfl\n"
+                "print(json.dumps(sorted(sys.modules)))\n"
+            )
+        )
+        responses = [m for m in modules if m.startswith("griddy.nfl.models.responses.")]
+        assert responses == []
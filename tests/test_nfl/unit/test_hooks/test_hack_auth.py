@@ -1,5 +1,9 @@
+import asyncio
+import threading
 import time
-from unittest.mock import MagicMock, patch
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+from urllib.parse import parse_qs
 from uuid import uuid4
 
 import httpx
@@ -450,60 +454,87 @@ fake_sched_resp = {
 }
 
 
+def _fresh_auth(access_token):
+    return {
+        "expiresIn": time.time() + 3600,
+        "refreshToken": str(uuid4()),
+        "accessToken": access_token,
+    }
+
+
+class _TokenEndpoint:
+    """Fake NFL token endpoint recording every refresh POST."""
+
+    def __init__(self, payload, status=200, delay=0.0):
+        self.payload = payload
+        self.status = status
+        self.delay = delay
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request):
+        with self._lock:
+            self.requests.append(request)
+        time.sleep(self.delay)
+        return httpx.Response(self.status, json=self.payload, request=request)
+
+
+def _before_request_ctx(nfl):
+    return BeforeRequestContext(
+        hook_ctx=HookContext(
+            config=nfl.sdk_configuration,
+            base_url="https://pro.nfl.com/api",
+            operation_id="getTestOperation",
+            oauth2_scopes=[],
+            security_source=nfl.sdk_configuration.security,
+        )
+    )
+
+
 @pytest.mark.unit
 class TestHackAuthHook:
-    @patch("griddy.nfl._hooks.hack_auth.httpx.post")
-    def test_do_refresh_token_makes_correct_request(self, mock_post):
+    def test_do_refresh_token_makes_correct_request(self):
         test_refresh_token = str(uuid4())
         fake_auth_response = {
             "expiresIn": time.time() + 3600,
             "refreshToken": str(uuid4()),
             "accessToken": "TEST_ACCESS_TOKEN",
         }
+        handler = _TokenEndpoint(fake_auth_response)
 
-        # Configure the mock
-        mock_response = MagicMock()
-        mock_response.json.return_value = fake_auth_response
-        mock_post.return_value = mock_response
-
-        # Create hook and call _do_refresh_token
         hook = HackAuthHook()
-        result = hook._do_refresh_token(refresh_token=test_refresh_token)
-
-        # Verify httpx.post was called with correct parameters
-        mock_post.assert_called_once()
-        call_args = mock_post.call_args
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            result = hook._do_refresh_token(
+                refresh_token=test_refresh_token, client=client
+            )
 
-        # Verify URL
-        assert "url" in call_args.kwargs
-        assert call_args.kwargs["url"].endswith("/refresh")
+        # Verify the refresh was sent once on the supplied client
+        assert len(handler.requests) == 1
+        sent = handler.requests[0]
+        assert sent.method == "POST"
+        assert sent.url.path.endswith("/refresh")
 
         # Verify data includes refresh token and base request data
-        assert "data" in call_args.kwargs
-        assert call_args.kwargs["data"]["refreshToken"] == test_refresh_token
-        assert "clientKey" in call_args.kwargs["data"]
-        assert "clientSecret" in call_args.kwargs["data"]
-        assert "deviceId" in call_args.kwargs["data"]
+        data = parse_qs(sent.content.decode())
+        assert data["refreshToken"] == [test_refresh_token]
+        assert data["deviceId"] == [HackAuthHook.refresh_req_data["deviceId"]]
+        assert data["networkType"] == ["other"]
 
-        # Verify the result matches the mocked response
         assert result == fake_auth_response
 
-        # Verify raise_for_status was called
-        mock_response.raise_for_status.assert_called_once()
+    def test_do_refresh_token_raises_for_status(self):
+        handler = _TokenEndpoint({}, status=401)
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                HackAuthHook()._do_refresh_token(refresh_token="x", client=client)
 
-    @patch("griddy.nfl._hooks.hack_auth.httpx.post")
-    def test_before_request_calls_refresh_when_inside_window(
-        self, mock_post, nfl_auth_info
-    ):
+    def test_before_request_calls_refresh_when_inside_window(self, nfl_auth_info):
         fake_auth_response = {
             "expiresIn": time.time() + 3600,
             "refreshToken": str(uuid4()),
             "accessToken": "FUBAR",
         }
-
-        mock_response = MagicMock()
-        mock_response.json.return_value = fake_auth_response
-        mock_post.return_value = mock_response
+        handler = _TokenEndpoint(fake_auth_response)
 
         # Use a real httpx.Request so we can verify the Authorization header is updated
         request = httpx.Request(
@@ -512,25 +543,20 @@ class TestHackAuthHook:
             headers={"Authorization": f"Bearer {nfl_auth_info['accessToken']}"},
         )
 
-        nfl = GriddyNFL(nfl_auth=nfl_auth_info)
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
 
         hook = HackAuthHook()
         returned_request = hook.before_request(
-            hook_ctx=BeforeRequestContext(
-                hook_ctx=HookContext(
-                    config=nfl.sdk_configuration,
-                    base_url="https://pro.nfl.com/api",
-                    operation_id="getTestOperation",
-                    oauth2_scopes=[],
-                    security_source=nfl.sdk_configuration.security,
-                )
-            ),
-            request=request,
+            hook_ctx=_before_request_ctx(nfl), request=request
         )
 
         post_hook_custom_auth_info = nfl.sdk_configuration.custom_auth_info
         post_hook_security_obj = nfl.sdk_configuration.security
 
+        assert len(handler.requests) == 1
         assert post_hook_custom_auth_info == models.NFLAuth.model_validate(
             fake_auth_response
         )
@@ -544,6 +570,190 @@ class TestHackAuthHook:
             == f"Bearer {fake_auth_response['accessToken']}"
         )
 
+    def test_before_request_skips_refresh_for_fresh_token(self, nfl_auth_info_valid):
+        handler = _TokenEndpoint({})
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info_valid,
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        request = httpx.Request("GET", "https://pro.nfl.com/api/test")
+
+        HackAuthHook().before_request(_before_request_ctx(nfl), request)
+
+        assert handler.requests == []
+
+    def test_concurrent_threads_share_one_refresh(self, nfl_auth_info):
+        handler = _TokenEndpoint(_fresh_auth("SHARED"), delay=0.05)
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        hook = HackAuthHook()
+        requests = [
+            httpx.Request("GET", "https://pro.nfl.com/api/test") for _ in range(20)
+        ]
+
+        barrier = threading.Barrier(len(requests))
+
+        def send(request):
+            barrier.wait()
+            return hook.before_request(_before_request_ctx(nfl), request)
+
+        with ThreadPoolExecutor(max_workers=len(requests)) as pool:
+            list(pool.map(send, requests))
+
+        assert len(handler.requests) == 1
+        assert nfl.sdk_configuration.security == models.Security(nfl_auth="SHARED")
+
+    def test_refreshes_in_background_ahead_of_expiry(self, nfl_auth_info):
+        nfl_auth_info = {**nfl_auth_info, "expiresIn": time.time() + 120}
+        handler = _TokenEndpoint(_fresh_auth("AHEAD"))
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        hook = HackAuthHook()
+        request = httpx.Request(
+            "GET",
+            "https://pro.nfl.com/api/test",
+            headers={"Authorization": "Bearer CURRENT"},
+        )
+
+        hook.before_request(_before_request_ctx(nfl), request)
+
+        # The request goes out with the still-valid token ...
+        assert request.headers["Authorization"] == "Bearer CURRENT"
+        # ... while the refresh completes on a background thread.
+        for _ in range(100):
+            if nfl.sdk_configuration.security == models.Security(nfl_auth="AHEAD"):
+                break
+            time.sleep(0.01)
+        assert nfl.sdk_configuration.security == models.Security(nfl_auth="AHEAD")
+        assert len(handler.requests) == 1
+
+    def test_failed_background_refresh_backs_off(self, nfl_auth_info):
+        nfl_auth_info = {**nfl_auth_info, "expiresIn": time.time() + 120}
+        handler = _TokenEndpoint({}, status=500)
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            client=httpx.Client(transport=httpx.MockTransport(handler)),
+        )
+        hook = HackAuthHook()
+
+        def send():
+            request = httpx.Request("GET", "https://pro.nfl.com/api/test")
+            hook.before_request(_before_request_ctx(nfl), request)
+            for _ in range(100):
+                if not hook._refresh_lock.locked():
+                    break
+                time.sleep(0.01)
+
+        for _ in range(5):
+            send()
+            time.sleep(0.02)
+        assert len(handler.requests) == 1
+
+        # Once the retry interval has passed, the next request tries again.
+        hook._next_background_attempt = 0.0
+        send()
+        for _ in range(100):
+            if len(handler.requests) == 2:
+                break
+            time.sleep(0.01)
+        assert len(handler.requests) == 2
+
+    @pytest.mark.asyncio
+    async def test_before_request_async_refreshes_on_async_client(self, nfl_auth_info):
+        handler = _TokenEndpoint(_fresh_auth("ASYNC_TOKEN"))
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        request = httpx.Request("GET", "https://pro.nfl.com/api/test")
+
+        returned_request = await HackAuthHook().before_request_async(
+            hook_ctx=_before_request_ctx(nfl), request=request
+        )
+
+        assert len(handler.requests) == 1
+        assert handler.requests[0].method == "POST"
+        assert handler.requests[0].url.path.endswith("/refresh")
+        assert nfl.sdk_configuration.security == models.Security(nfl_auth="ASYNC_TOKEN")
+        assert returned_request.headers["Authorization"] == "Bearer ASYNC_TOKEN"
+        assert returned_request.headers["referer"] == "https://nextgenstats.nfl.com/"
+
+    @pytest.mark.asyncio
+    async def test_concurrent_coroutines_share_one_refresh(self, nfl_auth_info):
+        calls = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json=_fresh_auth("SHARED"))
+
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        hook = HackAuthHook()
+        requests = [
+            httpx.Request("GET", "https://pro.nfl.com/api/test") for _ in range(50)
+        ]
+
+        await asyncio.gather(
+            *(hook.before_request_async(_before_request_ctx(nfl), r) for r in requests)
+        )
+
+        assert len(calls) == 1
+        assert {r.headers["Authorization"] for r in requests} == {"Bearer SHARED"}
+
+    @pytest.mark.asyncio
+    async def test_async_refreshes_in_background_ahead_of_expiry(self, nfl_auth_info):
+        nfl_auth_info = {**nfl_auth_info, "expiresIn": time.time() + 120}
+        handler = _TokenEndpoint(_fresh_auth("AHEAD"))
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        hook = HackAuthHook()
+        request = httpx.Request("GET", "https://pro.nfl.com/api/test")
+
+        await hook.before_request_async(_before_request_ctx(nfl), request)
+        assert "Authorization" not in request.headers
+
+        await hook._refresh_task
+        assert nfl.sdk_configuration.security == models.Security(nfl_auth="AHEAD")
+        assert len(handler.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_failed_background_refresh_backs_off(self, nfl_auth_info):
+        nfl_auth_info = {**nfl_auth_info, "expiresIn": time.time() + 120}
+        handler = _TokenEndpoint({}, status=500)
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        hook = HackAuthHook()
+
+        for _ in range(5):
+            request = httpx.Request("GET", "https://pro.nfl.com/api/test")
+            await hook.before_request_async(_before_request_ctx(nfl), request)
+            with pytest.raises(httpx.HTTPStatusError):
+                await hook._refresh_task
+        assert len(handler.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_refresh_propagates_to_waiters(self, nfl_auth_info):
+        handler = _TokenEndpoint({}, status=500)
+        nfl = GriddyNFL(
+            nfl_auth=nfl_auth_info,
+            async_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        )
+        request = httpx.Request("GET", "https://pro.nfl.com/api/test")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await HackAuthHook().before_request_async(_before_request_ctx(nfl), request)
+
     @patch("griddy.nfl._hooks.hack_auth.HackAuthHook.before_request")
     def test_hook_invoked_before_sdk_request(
         self, mock_before_request, nfl_auth_info_valid, httpx_mock
@@ -11,7 +11,15 @@ class TestNflInitExports:
         assert isinstance(nfl_pkg.__all__, list)
 
     def test_all_contains_expected_names(self):
-        expected = {"GriddyNFL", "SDKConfiguration", "SERVERS", "VERSION", "USER_AGENT"}
+        expected = {
+            "GriddyNFL",
+            "SDKConfiguration",
+            "SERVERS",
+            "VERSION",
+            "USER_AGENT",
+            "warmup",
+            "warmup_in_background",
+        }
         assert set(nfl_pkg.__all__) == expected
 
     def test_griddy_nfl_importable(self):
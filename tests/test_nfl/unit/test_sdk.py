@@ -8,6 +8,7 @@ import pytest
 from pydantic import ValidationError
 
 from griddy.core.base_griddy_sdk import BaseGriddySDK
+from griddy.core.utils import RetryBudget
 from griddy.nfl import GriddyNFL
 from griddy.nfl.endpoints.ngs import NextGenStats
 from griddy.nfl.endpoints.pro.stats import StatsSDK
@@ -44,6 +45,15 @@ class TestGriddyNFLInit:
         with pytest.raises(ValidationError):
             GriddyNFL(nfl_auth={"wrong_key": "value"})
 
+    def test_init_sets_retry_budget(self, nfl_auth_info_valid):
+        budget = RetryBudget()
+        nfl = GriddyNFL(nfl_auth=nfl_auth_info_valid, retry_budget=budget)
+        assert nfl.sdk_configuration.retry_budget is budget
+        assert (
+            GriddyNFL(nfl_auth=nfl_auth_info_valid).sdk_configuration.retry_budget
+            is None
+        )
+
     def test_init_preserves_optional_fields(self, nfl_auth_info_valid):
         nfl = GriddyNFL(nfl_auth=nfl_auth_info_valid)
         auth = nfl.sdk_configuration.custom_auth_info
@@ -76,6 +76,17 @@ class TestBaseModel:
         assert config["arbitrary_types_allowed"] is True
         assert config["protected_namespaces"] == ()
 
+    def test_base_model_defers_build(self):
+        """Test that NFL models build their validator on first use"""
+
+        class TestModel(BaseModel):
+            name: str
+
+        assert BaseModel.model_config["defer_build"] is True
+        assert TestModel.__pydantic_complete__ is False
+        assert TestModel(name="example").name == "example"
+        assert TestModel.__pydantic_complete__ is True
+
     def test_base_model_creation(self):
         """Test creating a simple BaseModel subclass"""
 
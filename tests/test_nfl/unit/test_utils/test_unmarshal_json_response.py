@@ -33,6 +33,7 @@ class TestUnmarshalJsonResponse:
     def _make_response(self, text=""):
         resp = MagicMock(spec=httpx.Response)
         resp.text = text
+        resp.content = text.encode()
         resp.status_code = 200
         resp.headers = {"content-type": "application/json"}
         return resp
@@ -45,11 +46,18 @@ class TestUnmarshalJsonResponse:
         assert result.name == "test"
         assert result.value == 42
 
-    def test_uses_response_text_when_body_none(self):
+    def test_uses_response_content_when_body_none(self):
         http_res = self._make_response(text='{"name": "from_response"}')
+        http_res.text = None
         result = unmarshal_json_response(SimpleModel, http_res)
         assert result.name == "from_response"
 
+    def test_validation_error_from_content_carries_text_body(self):
+        http_res = self._make_response(text='{"name": [1, 2, 3]}')
+        with pytest.raises(errors.ResponseValidationError) as exc_info:
+            unmarshal_json_response(SimpleModel, http_res)
+        assert exc_info.value.body == '{"name": [1, 2, 3]}'
+
     def test_validation_error_raises_response_validation_error(self):
         http_res = self._make_response()
         # Invalid JSON that will fail validation
@@ -73,7 +73,7 @@ class TestPFRBaseSDKAsync:
     ):
         def bad_parser(html):
             raise ParsingError(
-                "Could not find table", selector="games", html_sample=html[:500]
+                "Could not find table", selector="games", html_sample=str(html)[:500]
             )
 
         config = EndpointConfig(
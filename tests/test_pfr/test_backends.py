@@ -1,14 +1,18 @@
 """Tests for griddy.pfr.backends module — pluggable scraping backend protocols."""
 
+import threading
 from unittest.mock import Mock, patch
 
 import httpx
+import pydantic
 import pytest
 
+from griddy.core.pagecache import PageCache
 from griddy.core.utils.logger import Logger
 from griddy.pfr import GriddyPFR
 from griddy.pfr.backends import AsyncScrapingBackend, ScrapingBackend
 from griddy.pfr.basesdk import BaseSDK, EndpointConfig
+from griddy.pfr.errors import ParsingError
 from griddy.pfr.sdkconfiguration import SDKConfiguration
 from griddy.pfr.utils.browserless import AsyncBrowserless, Browserless
 
@@ -230,3 +234,157 @@ class TestGriddyPFRWithCustomBackend:
         # Custom backend takes priority — browserless_config is ignored
         assert pfr.browserless is backend
         assert not isinstance(pfr.browserless, Browserless)
+
+
+# ---------------------------------------------------------------------------
+# Page cache
+# ---------------------------------------------------------------------------
+
+
+class _GameDetails(pydantic.BaseModel):
+    game_id: str
+
+
+@pytest.mark.unit
+class TestGriddyPFRWithPageCache:
+    def test_backends_are_not_wrapped(self, tmp_path):
+        sync_be = StubSyncBackend()
+        async_be = StubAsyncBackend()
+        pfr = GriddyPFR(
+            scraping_backend=sync_be,
+            async_scraping_backend=async_be,
+            page_cache=PageCache(tmp_path),
+        )
+        assert pfr.schedule.browserless is sync_be
+        assert pfr.schedule.async_browserless is async_be
+
+    def test_repeat_call_served_from_cache(self, tmp_path):
+        backend = StubSyncBackend(html="<html><body></body></html>")
+        cache = PageCache(tmp_path)
+        pfr = GriddyPFR(scraping_backend=backend, page_cache=cache)
+
+        with patch.object(pfr.schedule, "_parse_and_validate", return_value=[]):
+            pfr.schedule.get_season_schedule(season=2015)
+            pfr.schedule.get_season_schedule(season=2015)
+
+        assert len(backend.calls) == 1
+        assert cache.stats().hits == 1
+
+    def test_page_that_fails_to_parse_is_dropped(self, tmp_path, mock_logger):
+        cache = PageCache(tmp_path)
+        config = _make_sdk_config(mock_logger, scraping_backend=StubSyncBackend())
+        config.page_cache = cache
+        sdk = BaseSDK(sdk_config=config)
+
+        def bad_parser(html):
+            raise ParsingError("Could not find table", selector="games")
+
+        ep_config = EndpointConfig(
+            path_template="/years/2015/games.htm",
+            operation_id="get_schedule",
+            parser=bad_parser,
+            response_type=dict,
+        )
+
+        with pytest.raises(ParsingError):
+            sdk._execute_endpoint(ep_config)
+        assert len(cache) == 0
+
+    def test_page_that_fails_validation_is_not_stored(self, tmp_path, mock_logger):
+        # A challenge page parses to nothing useful and fails validation.
+        backend = StubSyncBackend(html="<html>Just a moment...</html>")
+        cache = PageCache(tmp_path)
+        config = _make_sdk_config(mock_logger, scraping_backend=backend)
+        config.page_cache = cache
+        sdk = BaseSDK(sdk_config=config)
+        ep_config = EndpointConfig(
+            path_template="/boxscores/201509100nwe.htm",
+            operation_id="get_game_details",
+            parser=lambda soup: {},
+            response_type=_GameDetails,
+        )
+
+        for _ in range(2):
+            with pytest.raises(pydantic.ValidationError):
+                sdk._execute_endpoint(ep_config)
+        assert len(cache) == 0
+        assert len(backend.calls) == 2
+
+        backend.html = "<html>box score</html>"
+        ep_config.parser = lambda soup: {"game_id": "201509100nwe"}
+        sdk._execute_endpoint(ep_config)
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_async_page_that_fails_validation_is_not_stored(
+        self, tmp_path, mock_logger
+    ):
+        cache = PageCache(tmp_path)
+        config = _make_sdk_config(
+            mock_logger, async_scraping_backend=StubAsyncBackend()
+        )
+        config.page_cache = cache
+        sdk = BaseSDK(sdk_config=config)
+        ep_config = EndpointConfig(
+            path_template="/boxscores/201509100nwe.htm",
+            operation_id="get_game_details",
+            parser=lambda soup: {},
+            response_type=_GameDetails,
+        )
+
+        with pytest.raises(pydantic.ValidationError):
+            await sdk._execute_endpoint_async(ep_config)
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_async_cache_io_runs_off_the_event_loop(
+        self, tmp_path, mock_logger, monkeypatch
+    ):
+        cache = PageCache(tmp_path)
+        threads = []
+        for name in ("get", "set", "invalidate"):
+            method = getattr(cache, name)
+            monkeypatch.setattr(
+                cache,
+                name,
+                lambda *args, _method=method: (
+                    threads.append(threading.get_ident()) or _method(*args)
+                ),
+            )
+        config = _make_sdk_config(
+            mock_logger, async_scraping_backend=StubAsyncBackend()
+        )
+        config.page_cache = cache
+        sdk = BaseSDK(sdk_config=config)
+        ep_config = EndpointConfig(
+            path_template="/boxscores/201509100nwe.htm",
+            operation_id="get_game_details",
+            parser=lambda soup: {"game_id": "201509100nwe"},
+            response_type=_GameDetails,
+        )
+
+        await sdk._execute_endpoint_async(ep_config)  # miss, then store
+        ep_config.parser = lambda soup: {}
+        with pytest.raises(pydantic.ValidationError):
+            await sdk._execute_endpoint_async(ep_config)  # hit, then invalidate
+        assert len(threads) == 4
+        assert threading.get_ident() not in threads
+
+    def test_cached_page_that_no_longer_parses_is_dropped(self, tmp_path, mock_logger):
+        backend = StubSyncBackend()
+        cache = PageCache(tmp_path)
+        config = _make_sdk_config(mock_logger, scraping_backend=backend)
+        config.page_cache = cache
+        sdk = BaseSDK(sdk_config=config)
+        ep_config = EndpointConfig(
+            path_template="/boxscores/201509100nwe.htm",
+            operation_id="get_game_details",
+            parser=lambda soup: {},
+            response_type=_GameDetails,
+        )
+        cache.set(sdk._build_url(ep_config), "<html>stale</html>")
+
+        with pytest.raises(pydantic.ValidationError):
+            sdk._execute_endpoint(ep_config)
+        assert backend.calls == []
+        assert len(cache) == 0
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 
 import httpx
 import pytest
+from bs4 import BeautifulSoup
 
 from griddy.core.basesdk import BaseSDK as CoreBaseSDK
 from griddy.core.utils.logger import Logger
@@ -13,6 +14,13 @@ from griddy.pfr.errors import ParsingError
 from griddy.pfr.errors.griddypfrdefaulterror import GriddyPFRDefaultError
 from griddy.pfr.errors.no_response_error import NoResponseError
 from griddy.pfr.models.entities.security import Security
+from griddy.pfr.parsers._helpers import (
+    PageIndex,
+    as_soup,
+    page_index,
+    uncomment_all,
+    uncomment_tables,
+)
 from griddy.pfr.sdkconfiguration import SDKConfiguration
 
 
@@ -53,7 +61,7 @@ class TestPFRBaseSDK:
     def test_execute_endpoint_enriches_parsing_error_with_url(self, pfr_base_sdk):
         def bad_parser(html):
             raise ParsingError(
-                "Could not find table", selector="games", html_sample=html[:500]
+                "Could not find table", selector="games", html_sample=str(html)[:500]
             )
 
         config = EndpointConfig(
@@ -88,18 +96,18 @@ class TestPreprocessHtml:
             '<!--<table id="hidden"><tr><td>data</td></tr></table>-->'
             "</body></html>"
         )
-        result = BaseSDK._preprocess_html(html)
+        result = str(BaseSDK._preprocess_html(html))
         assert '<table id="hidden">' in result
         assert "<!--" not in result
 
     def test_leaves_html_without_comments_unchanged(self):
         html = '<html><body><table id="visible"><tr><td>data</td></tr></table></body></html>'
-        result = BaseSDK._preprocess_html(html)
+        result = str(BaseSDK._preprocess_html(html))
         assert '<table id="visible">' in result
 
     def test_preserves_non_table_comments(self):
         html = "<html><body><!-- just a comment --><p>text</p></body></html>"
-        result = BaseSDK._preprocess_html(html)
+        result = str(BaseSDK._preprocess_html(html))
         assert "<!-- just a comment -->" in result
 
     def test_uncomments_multiple_tables(self):
@@ -109,12 +117,12 @@ class TestPreprocessHtml:
             '<!--<table id="t2"><tr><td>b</td></tr></table>-->'
             "</body></html>"
         )
-        result = BaseSDK._preprocess_html(html)
+        result = str(BaseSDK._preprocess_html(html))
         assert '<table id="t1">' in result
         assert '<table id="t2">' in result
 
     def test_execute_endpoint_preprocesses_before_parsing(self, pfr_base_sdk):
-        """Verify _execute_endpoint passes preprocessed HTML to the parser."""
+        """Verify _execute_endpoint passes the preprocessed document to the parser."""
         received_html = []
 
         def capturing_parser(html):
@@ -138,8 +146,116 @@ class TestPreprocessHtml:
         pfr_base_sdk._execute_endpoint(config)
 
         assert len(received_html) == 1
-        assert '<table id="hidden">' in received_html[0]
-        assert "<!--" not in received_html[0]
+        assert isinstance(received_html[0], BeautifulSoup)
+        assert received_html[0].find("table", id="hidden") is not None
+        assert "<!--" not in str(received_html[0])
+
+    def test_returns_parsed_document(self):
+        html = '<html><body><table id="t"><tr><td>x</td></tr></table></body></html>'
+        soup = BaseSDK._preprocess_html(html)
+        assert isinstance(soup, BeautifulSoup)
+        assert soup.find("table", id="t").get_text() == "x"
+
+    def test_parses_each_page_once(self, pfr_base_sdk, monkeypatch):
+        """The endpoint parser reuses the preprocessed tree instead of re-parsing."""
+        calls = []
+        real_init = BeautifulSoup.__init__
+
+        def counting_init(self, *args, **kwargs):
+            calls.append(args)
+            real_init(self, *args, **kwargs)
+
+        monkeypatch.setattr(BeautifulSoup, "__init__", counting_init)
+
+        config = EndpointConfig(
+            path_template="/test.htm",
+            operation_id="test_op",
+            parser=lambda html: {"found": as_soup(html).find(id="t") is not None},
+            response_type=Mock(),
+        )
+        config.response_type.model_validate = lambda d: d
+        pfr_base_sdk.browserless = Mock()
+        pfr_base_sdk.browserless.get_page_content.return_value = '<p id="t"></p>'
+
+        assert pfr_base_sdk._execute_endpoint(config) == {"found": True}
+        assert len(calls) == 1
+
+
+@pytest.mark.unit
+class TestParserHelpers:
+    def test_as_soup_parses_string(self):
+        soup = as_soup("<p id='x'>hi</p>")
+        assert isinstance(soup, BeautifulSoup)
+        assert soup.find(id="x").get_text() == "hi"
+
+    def test_as_soup_returns_tree_unchanged(self):
+        soup = BeautifulSoup("<p/>", "html.parser")
+        assert as_soup(soup) is soup
+
+    def test_uncomment_all_matches_stripping_markers(self):
+        html = (
+            "<div id='meta'><!--<div id='bio'><p>Born</p></div>--></div>"
+            "<!-- plain note --><p>after</p>"
+        )
+        soup = as_soup(html)
+        uncomment_all(soup)
+        stripped = BeautifulSoup(
+            html.replace("<!--", "").replace("-->", ""), "html.parser"
+        )
+        assert str(soup) == str(stripped)
+        assert soup.find(id="meta").find(id="bio") is not None
+
+
+_INDEXED_HTML = (
+    "<div id='content' class='box wide'>"
+    "<table id='a' class='stats_table'><tr><td>1</td></tr></table>"
+    "<div id='a'>dup</div>"
+    "<table class='stats_table linescore'><tr><td>2</td></tr></table>"
+    "<table id=''><tr><td>3</td></tr></table>"
+    "</div>"
+)
+
+
+@pytest.mark.unit
+class TestPageIndex:
+    @pytest.mark.parametrize(
+        "name, kwargs",
+        [
+            ("table", {"id": "a"}),
+            ("div", {"id": "a"}),
+            (None, {"id": "a"}),
+            ("div", {"id": "content"}),
+            ("table", {"id": "missing"}),
+            ("table", {"class_": "stats_table"}),
+            ("table", {"class_": "linescore"}),
+            (None, {"class_": "wide"}),
+            ("table", {"id": "a", "class_": "stats_table"}),
+            ("div", {"id": "a", "class_": "stats_table"}),
+            ("table", {"id": True}),
+            ("table", {}),
+        ],
+    )
+    def test_matches_soup_lookups(self, name, kwargs):
+        soup = as_soup(_INDEXED_HTML)
+        index = PageIndex(soup)
+        args = (name,) if name else ()
+        assert index.find_all(name, **kwargs) == soup.find_all(*args, **kwargs)
+        assert index.find(name, **kwargs) is soup.find(*args, **kwargs)
+
+    def test_lookup_needs_a_key(self):
+        with pytest.raises(ValueError):
+            PageIndex(as_soup(_INDEXED_HTML)).find(id=True)
+
+    def test_page_index_is_cached(self):
+        soup = as_soup(_INDEXED_HTML)
+        assert page_index(soup) is page_index(soup)
+
+    @pytest.mark.parametrize("uncomment", [uncomment_all, uncomment_tables])
+    def test_uncommenting_rebuilds_index(self, uncomment):
+        soup = as_soup("<div><!--<table id='hidden'></table>--></div>")
+        assert page_index(soup).find("table", id="hidden") is None
+        uncomment(soup)
+        assert page_index(soup).find("table", id="hidden") is not None
 
 
 @pytest.mark.unit
@@ -0,0 +1,185 @@
+"""Conformance of every PFR parser across HTML tree builders.
+
+Each parser runs against each saved page under every installed builder
+(see :mod:`griddy.core.htmlparser`) and must produce exactly the output it
+produces under the default ``html.parser``.
+"""
+
+import functools
+import importlib.util
+import inspect
+from pathlib import Path
+
+import pytest
+
+from griddy.core import htmlparser
+from griddy.pfr import parsers
+from griddy.pfr.basesdk import BaseSDK
+from griddy.settings import FIXTURE_DIR
+
+PFR_FIXTURES = FIXTURE_DIR / "pfr"
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# (fixture path relative to tests/fixtures/pfr, parser class, method, kwargs)
+_CASES = [
+    *[
+        (name, "PlayerProfileParser", "parse", {})
+        for name in sorted(p.name for p in PFR_FIXTURES.glob("*.htm"))
+    ],
+    (
+        "awards/ap_nfl_mvp_award.htm",
+        "AwardsParser",
+        "parse_award",
+        {"award": "ap-nfl-mvp-award"},
+    ),
+    ("awards/hof.htm", "AwardsParser", "parse_hof", {}),
+    ("awards/2024_probowl.htm", "AwardsParser", "parse_probowl", {"year": 2024}),
+    ("coaches/BeliBi0.htm", "CoachProfileParser", "parse", {}),
+    ("draft/2024_draft.htm", "DraftParser", "parse_year_draft", {"year": 2024}),
+    ("draft/2024_combine.htm", "DraftParser", "parse_combine", {"year": 2024}),
+    ("draft/phi_draft.htm", "DraftParser", "parse_team_draft", {"team": "phi"}),
+    ("executives/bud_adams.htm", "ExecutiveProfileParser", "parse", {}),
+    ("executives/scott_pioli.htm", "ExecutiveProfileParser", "parse", {}),
+    ("fantasy/top_players_2025.htm", "FantasyParser", "parse_top_players", {}),
+    *[
+        (f"fantasy/{pos}_matchups.htm", "FantasyParser", "parse_matchups", {})
+        for pos in ("qb", "rb", "wr", "te")
+    ],
+    *[
+        (
+            f"fantasy/{pos}_points_allowed.htm",
+            "FantasyParser",
+            "parse_points_allowed",
+            {},
+        )
+        for pos in ("qb", "rb", "wr", "te")
+    ],
+    ("fantasy/redzone_passing.htm", "FantasyParser", "parse_redzone_passing", {}),
+    ("fantasy/redzone_receiving.htm", "FantasyParser", "parse_redzone_receiving", {}),
+    ("fantasy/redzone_rushing.htm", "FantasyParser", "parse_redzone_rushing", {}),
+    ("frivolities/birthdays.html", "BirthdaysParser", "parse", {}),
+    ("frivolities/birthplaces_landing.html", "BirthplacesParser", "parse_landing", {}),
+    (
+        "frivolities/birthplaces_filtered_pa.html",
+        "BirthplacesParser",
+        "parse_filtered",
+        {},
+    ),
+    ("frivolities/cups_of_coffee.html", "CupsOfCoffeeParser", "parse", {}),
+    ("frivolities/last_undefeated.html", "LastUndefeatedParser", "parse", {}),
+    ("frivolities/multi_sport_players.html", "MultiSportPlayersParser", "parse", {}),
+    (
+        "frivolities/multi_team_players_crd_atl.html",
+        "MultiTeamPlayersParser",
+        "parse",
+        {},
+    ),
+    ("frivolities/non_qb_passers.html", "NonQBPassersParser", "parse", {}),
+    ("frivolities/non_skill_pos_td.html", "NonSkillPosTdParser", "parse", {}),
+    ("frivolities/octopus_tracker.html", "OctopusTrackerParser", "parse", {}),
+    ("frivolities/overtime_ties.html", "OvertimeTiesParser", "parse", {}),
+    ("frivolities/players_born_before.html", "PlayersBornBeforeParser", "parse", {}),
+    ("frivolities/pronunciation_guide.html", "PronunciationGuideParser", "parse", {}),
+    ("frivolities/qb_wins.html", "QBWinsParser", "parse", {}),
+    ("frivolities/standings_on_date.html", "StandingsOnDateParser", "parse", {}),
+    (
+        "frivolities/statistical_milestones_pass_td.html",
+        "StatisticalMilestonesParser",
+        "parse",
+        {},
+    ),
+    ("frivolities/uniform_numbers.html", "UniformNumbersParser", "parse", {}),
+    ("frivolities/upcoming_milestones.html", "UpcomingMilestonesParser", "parse", {}),
+    (
+        "leaders/pass_yds_career.htm",
+        "LeadersParser",
+        "parse",
+        {"stat": "pass_yds", "scope": "career"},
+    ),
+    (
+        "leaders/rush_td_single_season.htm",
+        "LeadersParser",
+        "parse",
+        {"stat": "rush_td", "scope": "single_season"},
+    ),
+    ("officials/ChefCa0r.htm", "OfficialProfileParser", "parse", {}),
+    ("schools/colleges.htm", "SchoolsParser", "parse_colleges", {}),
+    ("schools/high_schools.htm", "SchoolsParser", "parse_high_schools", {}),
+    ("seasons/2024.htm", "SeasonOverviewParser", "parse", {}),
+    ("seasons/2024_passing.htm", "SeasonOverviewParser", "parse_stats", {}),
+    ("seasons/2024_week_1.htm", "SeasonOverviewParser", "parse_week", {}),
+    ("stadiums/BOS00.htm", "StadiumParser", "parse", {}),
+    ("super_bowl/history.htm", "SuperBowlParser", "parse_history", {}),
+    ("super_bowl/leaders.htm", "SuperBowlParser", "parse_leaders", {}),
+    ("super_bowl/standings.htm", "SuperBowlParser", "parse_standings", {}),
+    ("teams/nwe_2015_team_season.htm", "TeamSeasonParser", "parse", {}),
+    ("teams/nwe_franchise.htm", "FranchiseParser", "parse", {}),
+    (REPO_ROOT / "pfr_2015_sked.html", "ScheduleParser", "parse", {}),
+    (REPO_ROOT / "PFR_boxscore_201509100nwe.htm", "GameDetailsParser", "parse", {}),
+]
+
+
+def _engines():
+    engines = []
+    for name in ("lxml",):
+        if importlib.util.find_spec(name) is None:
+            engines.append(
+                pytest.param(name, marks=pytest.mark.skip(f"{name} not installed"))
+            )
+        else:
+            engines.append(name)
+    return engines
+
+
+def _case_id(case) -> str:
+    return f"{case[1]}.{case[2]}-{Path(case[0]).stem}"
+
+
+@functools.lru_cache(maxsize=None)
+def _html(path: str) -> str:
+    return (PFR_FIXTURES / path).read_text()
+
+
+def _parse(case, engine: str):
+    path, parser_name, method, kwargs = case
+    parser = getattr(parsers, parser_name)()
+    soup = BaseSDK._preprocess_html(_html(str(path)), engine)
+    return getattr(parser, method)(soup, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _expected(index: int):
+    return _parse(_CASES[index], "html.parser")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", _engines())
+@pytest.mark.parametrize("index", range(len(_CASES)), ids=[_case_id(c) for c in _CASES])
+def test_parser_output_matches_html_parser(index, engine):
+    assert _parse(_CASES[index], engine) == _expected(index)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("engine", _engines())
+def test_string_input_uses_default_engine(engine, monkeypatch):
+    monkeypatch.setattr(htmlparser, "_default_parser", engine)
+    path, parser_name, method, kwargs = _CASES[0]
+    result = getattr(getattr(parsers, parser_name)(), method)(_html(path), **kwargs)
+    assert result == _expected(0)
+
+
+@pytest.mark.unit
+class TestCoverage:
+    def test_every_parse_method_is_covered(self):
+        covered = {(c[1], c[2]) for c in _CASES}
+        for name in parsers.__all__:
+            for method, _ in inspect.getmembers(
+                getattr(parsers, name), inspect.isfunction
+            ):
+                if method.startswith("parse"):
+                    assert (name, method) in covered, f"{name}.{method}"
+
+    def test_every_fixture_is_covered(self):
+        covered = {str(c[0]) for c in _CASES}
+        for path in PFR_FIXTURES.rglob("*.htm*"):
+            assert str(path.relative_to(PFR_FIXTURES)) in covered, path
@@ -58,6 +58,18 @@ class TestGriddyPFRInit:
         )
         assert pfr.sdk_configuration.server_url == "https://us-east.pfr.com"
 
+    def test_html_parser_defaults_to_process_default(self):
+        pfr = GriddyPFR()
+        assert pfr.sdk_configuration.html_parser is None
+
+    def test_html_parser_is_resolved(self):
+        pfr = GriddyPFR(html_parser="html.parser")
+        assert pfr.sdk_configuration.html_parser == "html.parser"
+
+    def test_unknown_html_parser_raises(self):
+        with pytest.raises(ValueError, match="Unknown HTML parser"):
+            GriddyPFR(html_parser="html5")
+
     def test_pfr_auth_without_access_token_key(self):
         pfr = GriddyPFR(pfr_auth={"refreshToken": "abc"})
         assert pfr.sdk_configuration.security is None
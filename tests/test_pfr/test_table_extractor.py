@@ -0,0 +1,218 @@
+"""Tests for the compiled PFR table extractor."""
+
+import pytest
+from bs4 import BeautifulSoup
+
+from griddy.pfr.parsers._column_registry import ColumnMetadata
+from griddy.pfr.parsers._helpers import safe_float, safe_int, safe_numeric, safe_pct
+from griddy.pfr.parsers._table_extractor import (
+    TableExtractor,
+    cell,
+    cell_text,
+    column_converters,
+    or_none,
+    skip,
+    to_float,
+    to_int,
+)
+
+_META = ColumnMetadata(
+    int_columns=frozenset({"g", "yds"}),
+    float_columns=frozenset({"avg"}),
+    pct_columns=frozenset({"pct"}),
+)
+
+_TABLE_HTML = """
+<table id="t">
+<thead>
+  <tr class="over_header"><th colspan="5"></th></tr>
+  <tr>
+    <th data-stat="player">Player</th><th data-stat="g">G</th>
+    <th data-stat="yds">Yds</th><th data-stat="avg">Avg</th>
+    <th data-stat="pct">Pct</th><th data-stat="note">Note</th>
+  </tr>
+</thead>
+<tbody>
+  <tr>
+    <th data-stat="player" data-append-csv="BradTo00">
+      <a href="/players/B/BradTo00.htm">Tom Brady</a>
+    </th>
+    <td data-stat="g">16</td><td data-stat="yds">4,577</td>
+    <td data-stat="avg">7.6</td><td data-stat="pct">66.4%</td>
+    <td data-stat="note"><b>MVP</b></td>
+  </tr>
+  <tr class="thead"><th data-stat="player">Player</th></tr>
+  <tr>
+    <th data-stat="player">Nobody</th><td data-stat="g"></td>
+    <td data-stat="avg">8</td>
+  </tr>
+  <tr><th data-stat="player"></th><td data-stat="g"></td></tr>
+</tbody>
+</table>
+"""
+
+
+def _table():
+    return BeautifulSoup(_TABLE_HTML, "html.parser").find("table")
+
+
+def _extractor(**kwargs):
+    return TableExtractor(
+        _META,
+        {"player": cell("player", href="player_href", csv_id="player_id")},
+        **kwargs,
+    )
+
+
+@pytest.mark.unit
+class TestConverters:
+    @pytest.mark.parametrize(
+        "text", ["", "0", "42", "-3", "+7", "1,234", "4.5", "abc", "٣", "²"]
+    )
+    def test_to_int_matches_safe_int(self, text):
+        assert to_int(text) == safe_int(text)
+
+    @pytest.mark.parametrize("text", ["", "0", "4.5", "-0.25", "1e3", "abc", "nan"])
+    def test_to_float_matches_safe_float(self, text):
+        expected = safe_float(text)
+        result = to_float(text)
+        assert result == expected or (result != result and expected != expected)
+
+    def test_or_none(self):
+        assert or_none("") is None
+        assert or_none("x") == "x"
+
+    def test_column_converters_precedence(self):
+        meta = ColumnMetadata(
+            int_columns=frozenset({"a"}),
+            float_columns=frozenset({"a", "b"}),
+            pct_columns=frozenset({"b", "c"}),
+        )
+        plan = column_converters(meta)
+        assert plan == {"a": to_int, "b": to_float, "c": safe_pct}
+
+    def test_column_converters_are_cached_and_read_only(self):
+        plan = column_converters(_META, safe_numeric)
+        assert column_converters(_META, safe_numeric) is plan
+        assert plan["avg"] is safe_numeric
+        with pytest.raises(TypeError):
+            plan["g"] = str  # type: ignore[index]
+
+    @pytest.mark.parametrize(
+        "html",
+        [
+            "<td></td>",
+            "<td>  12 </td>",
+            "<td><a href='/x'> Team </a></td>",
+            "<td>A <b>B</b> C</td>",
+            "<td><!-- hidden -->7</td>",
+        ],
+    )
+    def test_cell_text_matches_get_text(self, html):
+        tag = BeautifulSoup(html, "html.parser").td
+        assert cell_text(tag) == tag.get_text(strip=True)
+
+
+@pytest.mark.unit
+class TestCellHandlers:
+    @pytest.mark.parametrize(
+        "html, when, expected",
+        [
+            ("<td><a href='/x'>x</a></td>", "link", {"k_href": "/x"}),
+            ("<td><a>x</a></td>", "link", {"k_href": None}),
+            ("<td>x</td>", "link", {}),
+            ("<td><a href='/x'>x</a></td>", "href", {"k_href": "/x"}),
+            ("<td><a href=''>x</a></td>", "href", {}),
+            ("<td>x</td>", "href", {}),
+            ("<td><a href='/x'>x</a></td>", "always", {"k_href": "/x"}),
+            ("<td><a>x</a></td>", "always", {"k_href": None}),
+            ("<td>x</td>", "always", {"k_href": None}),
+        ],
+    )
+    def test_href_when(self, html, when, expected):
+        tag = BeautifulSoup(html, "html.parser").td
+        row = {}
+        cell(None, href="k_href", href_when=when)(tag, "x", row)
+        assert row == expected
+
+    def test_key_convert_and_csv_id(self):
+        tag = BeautifulSoup("<td data-append-csv='Id01'>12</td>", "html.parser").td
+        row = {}
+        cell("n", to_int, csv_id="id")(tag, "12", row)
+        assert row == {"n": 12, "id": "Id01"}
+
+    def test_skip(self):
+        row = {}
+        skip(None, "x", row)
+        assert row == {}
+
+
+@pytest.mark.unit
+class TestTableExtractor:
+    def test_rows(self):
+        rows = _extractor().rows(_table())
+        assert rows == [
+            {
+                "player": "Tom Brady",
+                "player_id": "BradTo00",
+                "player_href": "/players/B/BradTo00.htm",
+                "g": 16,
+                "yds": None,
+                "avg": 7.6,
+                "pct": 66.4,
+            },
+            {"player": "Nobody", "g": None, "avg": 8.0},
+        ]
+
+    def test_default_keeps_other_columns(self):
+        rows = _extractor(default=str).rows(_table())
+        assert rows[0]["note"] == "MVP"
+        assert "note" not in rows[1]
+
+    def test_float_converter(self):
+        rows = _extractor(float_converter=safe_numeric).rows(_table())
+        assert rows[1]["avg"] == 8 and isinstance(rows[1]["avg"], int)
+
+    def test_blank_none_keeps_rows_with_cells(self):
+        rows = _extractor(blank=None).rows(_table())
+        assert len(rows) == 3
+        assert rows[2] == {"player": "", "g": None}
+
+    def test_custom_blank_and_skip_classes(self):
+        extractor = _extractor(blank=("", "Nobody", "8"), skip_classes=())
+        players = [row["player"] for row in extractor.rows(_table())]
+        assert players == ["Tom Brady", "Player"]
+
+    def test_normalize(self):
+        rows = _extractor(normalize=str.upper).rows(_table())
+        assert rows[0]["player"] == "TOM BRADY"
+
+    def test_columns_align_with_rows(self):
+        extractor = _extractor(default=str)
+        table = _table()
+        rows = extractor.rows(table)
+        columns = extractor.columns(table)
+        assert {len(values) for values in columns.values()} == {len(rows)}
+        for index, row in enumerate(rows):
+            assert {k: v[index] for k, v in columns.items() if k in row} == row
+            assert all(v[index] is None for k, v in columns.items() if k not in row)
+
+    def test_compile_resolves_header_columns(self):
+        extractor = _extractor()
+        extractor.compile(_table())
+        assert set(extractor._plan) == {"player", "g", "yds", "avg", "pct", "note"}
+
+    def test_missing_tbody(self):
+        table = BeautifulSoup("<table></table>", "html.parser").table
+        assert _extractor().rows(table) == []
+        assert _extractor().columns(table) == {}
+
+    def test_extract_row(self):
+        tr = _table().find("tbody").find_all("tr")[2]
+        assert _extractor().extract_row(tr) == {
+            "player": "Nobody",
+            "g": None,
+            "avg": 8.0,
+        }
+        blank_tr = _table().find("tbody").find_all("tr")[3]
+        assert _extractor().extract_row(blank_tr) is None